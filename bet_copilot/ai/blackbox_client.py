@@ -10,6 +10,7 @@ from typing import Dict, List, Optional
 
 import aiohttp
 
+from bet_copilot.api.transport import HttpTransport, get_transport
 from bet_copilot.config import BLACKBOX_API_KEY
 from bet_copilot.ai.types import ContextualAnalysis
 
@@ -29,7 +30,12 @@ class BlackboxClient:
     # Official Blackbox API endpoint (OpenAI-compatible)
     API_URL = "https://api.blackbox.ai/chat/completions"
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "blackboxai/anthropic/claude-sonnet-4"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "blackboxai/anthropic/claude-sonnet-4",
+        transport: Optional[HttpTransport] = None,
+    ):
         """
         Initialize Blackbox client.
         
@@ -37,10 +43,11 @@ class BlackboxClient:
             api_key: Blackbox API key (get from https://www.blackbox.ai/)
             model: Model to use (default: blackboxai-pro)
                 Options: blackboxai-pro, blackboxai, or any OpenAI/Anthropic model
+            transport: Pooled HTTP transport (default: shared transport)
         """
         self.api_key = api_key or BLACKBOX_API_KEY
         self.model = model
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.transport = transport or get_transport()
         
         if self.api_key:
             logger.info(f"Blackbox client initialized with model {model} (authenticated)")
@@ -52,16 +59,9 @@ class BlackboxClient:
         # Blackbox can work without API key (with limitations)
         return True
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
-    
     async def close(self):
-        """Close the client session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Clean up resources."""
+        pass
     
     async def analyze_match_context(
         self,
@@ -112,8 +112,6 @@ class BlackboxClient:
     
     async def _generate_response(self, prompt: str) -> str:
         """Generate response from Blackbox API using OpenAI-compatible format."""
-        session = await self._get_session()
-        
         # OpenAI-compatible payload
         payload = {
             "model": self.model,
@@ -137,11 +135,11 @@ class BlackboxClient:
             headers["Authorization"] = f"Bearer {self.api_key}"
         
         try:
-            async with session.post(
+            async with self.transport.post(
                 self.API_URL,
                 json=payload,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=30
             ) as response:
                 
                 if response.status == 200:
@@ -12,6 +12,8 @@ from typing import Dict, List, Optional
 import aiohttp
 
 from bet_copilot.api.circuit_breaker import CircuitBreaker, CircuitBreakerError
+from bet_copilot.api.single_flight import SingleFlight, get_single_flight, request_key
+from bet_copilot.api.transport import HttpTransport, get_transport
 from bet_copilot.config import API_FOOTBALL_KEY, API_FOOTBALL_BASE_URL
 
 logger = logging.getLogger(__name__)
@@ -154,6 +156,7 @@ class FixtureInfo:
 class FootballAPIClient:
     """
     Client for API-Football with circuit breaker and rate limiting.
+    Identical concurrent requests are coalesced into one call (SingleFlight).
     
     Rate limits (free plan):
     - 30 requests per minute
@@ -166,6 +169,8 @@ class FootballAPIClient:
         base_url: str = API_FOOTBALL_BASE_URL,
         timeout: int = 10,
         circuit_breaker: Optional[CircuitBreaker] = None,
+        transport: Optional[HttpTransport] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.api_key = api_key or API_FOOTBALL_KEY
         self.base_url = base_url
@@ -173,6 +178,8 @@ class FootballAPIClient:
         self.circuit_breaker = circuit_breaker or CircuitBreaker(
             timeout=60, failure_threshold=3
         )
+        self.transport = transport or get_transport()
+        self.single_flight = single_flight or get_single_flight()
 
         if not self.api_key:
             logger.warning("API-Football key not configured")
@@ -188,53 +195,55 @@ class FootballAPIClient:
 
             url = f"{self.base_url}/{endpoint}"
 
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.get(
-                        url, headers=headers, params=params, timeout=self.timeout
-                    ) as response:
-                        # Check rate limit
-                        if response.status == 429:
-                            retry_after = int(response.headers.get("Retry-After", 60))
-                            logger.error(
-                                f"Rate limit exceeded. Retry after {retry_after}s"
-                            )
-                            raise RateLimitError(
-                                "API-Football rate limit exceeded", retry_after
-                            )
-
-                        # Check other errors
-                        if response.status >= 400:
-                            error_text = await response.text()
-                            logger.error(
-                                f"API error {response.status}: {error_text[:200]}"
-                            )
-                            raise FootballAPIError(
-                                f"API error: {error_text[:200]}", response.status
-                            )
-
-                        data = await response.json()
-
-                        # API-Football wraps response
-                        if "errors" in data and data["errors"]:
-                            error_msg = str(data["errors"])
-                            logger.error(f"API returned errors: {error_msg}")
-                            raise FootballAPIError(f"API error: {error_msg}")
-
-                        logger.info(
-                            f"Successfully fetched {endpoint} with params {params}"
+            try:
+                async with self.transport.get(
+                    url, headers=headers, params=params, timeout=self.timeout
+                ) as response:
+                    # Check rate limit
+                    if response.status == 429:
+                        retry_after = int(response.headers.get("Retry-After", 60))
+                        logger.error(
+                            f"Rate limit exceeded. Retry after {retry_after}s"
+                        )
+                        raise RateLimitError(
+                            "API-Football rate limit exceeded", retry_after
+                        )
+
+                    # Check other errors
+                    if response.status >= 400:
+                        error_text = await response.text()
+                        logger.error(
+                            f"API error {response.status}: {error_text[:200]}"
+                        )
+                        raise FootballAPIError(
+                            f"API error: {error_text[:200]}", response.status
                         )
-                        return data
 
-                except asyncio.TimeoutError:
-                    logger.error(f"Request timeout for {endpoint}")
-                    raise FootballAPIError("Request timeout")
-                except aiohttp.ClientError as e:
-                    logger.error(f"Client error: {str(e)}")
-                    raise FootballAPIError(f"Client error: {str(e)}")
+                    data = await response.json()
+
+                    # API-Football wraps response
+                    if "errors" in data and data["errors"]:
+                        error_msg = str(data["errors"])
+                        logger.error(f"API returned errors: {error_msg}")
+                        raise FootballAPIError(f"API error: {error_msg}")
+
+                    logger.info(
+                        f"Successfully fetched {endpoint} with params {params}"
+                    )
+                    return data
+
+            except asyncio.TimeoutError:
+                logger.error(f"Request timeout for {endpoint}")
+                raise FootballAPIError("Request timeout")
+            except aiohttp.ClientError as e:
+                logger.error(f"Client error: {str(e)}")
+                raise FootballAPIError(f"Client error: {str(e)}")
 
         try:
-            return await self.circuit_breaker.call(request_func)
+            return await self.single_flight.do(
+                request_key(f"{self.base_url}/{endpoint}", params),
+                lambda: self.circuit_breaker.call(request_func),
+            )
         except CircuitBreakerError:
             logger.error("Circuit breaker is open")
             raise FootballAPIError("Service temporarily unavailable", status=503)
@@ -10,6 +10,8 @@ from typing import Dict, List, Optional
 
 import aiohttp
 
+from bet_copilot.api.single_flight import SingleFlight, get_single_flight, request_key
+from bet_copilot.api.transport import HttpTransport, get_transport
 from bet_copilot.config import FOOTBALLDATA_API_KEY, FOOTBALLDATA_BASE_URL
 
 logger = logging.getLogger(__name__)
@@ -29,6 +31,7 @@ class FootballDataClient:
     - Match fixtures and results
     - Head-to-head data
     - Free tier: 10 requests/minute
+    - Identical concurrent requests coalesced into one call (SingleFlight)
     """
     
     def __init__(
@@ -36,11 +39,14 @@ class FootballDataClient:
         api_key: Optional[str] = None,
         base_url: str = FOOTBALLDATA_BASE_URL,
         timeout: int = 10,
+        transport: Optional[HttpTransport] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.api_key = api_key or FOOTBALLDATA_API_KEY
         self.base_url = base_url
         self.timeout = timeout
-        self.session = None
+        self.transport = transport or get_transport()
+        self.single_flight = single_flight or get_single_flight()
         
         if not self.api_key:
             logger.warning("Football-Data API key not configured")
@@ -51,21 +57,19 @@ class FootballDataClient:
         """Check if API is available."""
         return bool(self.api_key)
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
-    
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make HTTP request to Football-Data API."""
+        return await self.single_flight.do(
+            request_key(f"{self.base_url}/{endpoint}", params), lambda: self._send_request(endpoint, params)
+        )
+    
+    async def _send_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """Send one HTTP request to Football-Data API."""
         url = f"{self.base_url}/{endpoint}"
         headers = {"X-Auth-Token": self.api_key}
         
-        session = await self._get_session()
-        
         try:
-            async with session.get(
+            async with self.transport.get(
                 url, headers=headers, params=params, timeout=self.timeout
             ) as response:
                 if response.status == 429:
@@ -243,10 +247,8 @@ class FootballDataClient:
             return []
     
     async def close(self):
-        """Close the client session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            logger.info("Football-Data client session closed")
+        """Clean up resources."""
+        pass
 
 
 # Competition ID mappings (most popular)
@@ -0,0 +1,403 @@
+"""
+Credit budget and polling scheduler for The Odds API.
+
+The Odds API bills every /odds request regions × markets credits against
+a monthly quota (/sports is free) and reports the balance in the
+x-requests-remaining and x-requests-used headers. OddsBudget:
+
+- tracks that balance from the headers (persisted in the api_quota table
+  of OddsRepository, so restarts keep it)
+- admits, downgrades (one region × one market) or refuses requests by
+  priority, comparing the balance with a linear spend of the monthly
+  quota, so background polling stops long before the quota runs out
+- spreads polling across sports: each sport gets a share of the credit
+  rate weighted by kickoff proximity and value-bet density
+
+Quota periods are calendar months (UTC).
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bet_copilot.config import (
+    CACHE_TTL_HISTORICAL,
+    CACHE_TTL_MIN,
+    ODDS_API_MONTHLY_CREDITS,
+    ODDS_BUDGET_LOW_PACE,
+    ODDS_BUDGET_NORMAL_PACE,
+    ODDS_BUDGET_RESERVE,
+    ODDS_POLL_HORIZON_HOURS,
+)
+from bet_copilot.db.odds_repository import OddsRepository
+from bet_copilot.models.odds import OddsEvent
+
+logger = logging.getLogger(__name__)
+
+QUOTA_KEY = "the-odds-api"
+
+
+class Priority(IntEnum):
+    """Request priorities."""
+
+    LOW = 0  # Background polling
+    NORMAL = 1  # Match analysis
+    HIGH = 2  # Explicit user request
+
+
+class Admission(Enum):
+    """Budget decisions."""
+
+    ALLOW = "allow"
+    DOWNGRADE = "downgrade"  # Cheapest variant: one region, one market
+    REFUSE = "refuse"
+
+
+def _split(value: str) -> List[str]:
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def request_cost(regions: str, markets: str) -> int:
+    """
+    Credits of an /odds request.
+
+    Example:
+        >>> request_cost("us,uk,eu", "h2h,totals")
+        6
+    """
+    return max(1, len(_split(regions))) * max(1, len(_split(markets)))
+
+
+def downgrade(regions: str, markets: str) -> Tuple[str, str]:
+    """One-credit variant of a request: first region, h2h (or first) market."""
+    region_list = _split(regions) or [regions]
+    market_list = _split(markets) or [markets]
+    market = "h2h" if "h2h" in market_list else market_list[0]
+    return region_list[0], market
+
+
+def month_bounds(now: float) -> Tuple[float, float]:
+    """Unix start and end of the calendar month (UTC) containing now."""
+    moment = datetime.fromtimestamp(now, tz=timezone.utc)
+    start = moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if start.month == 12:
+        end = start.replace(year=start.year + 1, month=1)
+    else:
+        end = start.replace(month=start.month + 1)
+    return start.timestamp(), end.timestamp()
+
+
+@dataclass
+class SportActivity:
+    """What the scheduler knows about a sport."""
+
+    sport_key: str
+    next_kickoff: Optional[float] = None  # unix time, None = nothing scheduled
+    events: int = 0
+    value_bets: Dict[str, int] = field(default_factory=dict)  # event id -> value bets found
+    last_polled: Optional[float] = None  # unix time of the last API fetch
+
+    @property
+    def value_density(self) -> float:
+        """Share of the sport's events with at least one value bet."""
+        hits = sum(1 for count in self.value_bets.values() if count > 0)
+        return min(1.0, hits / self.events) if self.events else 0.0
+
+
+class OddsBudget:
+    """
+    Monthly credit budget shared by every OddsAPIClient request.
+
+    Example:
+        >>> budget = OddsBudget(repository=repo)
+        >>> await budget.load()
+        >>> budget.admit(request_cost("us,uk", "h2h"), Priority.LOW)
+        <Admission.ALLOW: 'allow'>
+    """
+
+    def __init__(
+        self,
+        monthly_credits: int = ODDS_API_MONTHLY_CREDITS,
+        reserve: int = ODDS_BUDGET_RESERVE,
+        repository: Optional[OddsRepository] = None,
+        clock=time.time,
+    ):
+        """
+        Initialize budget.
+
+        Args:
+            monthly_credits: Plan quota per month
+            reserve: Credits only high-priority requests may spend
+            repository: Persists the balance (None = memory only)
+            clock: Unix time source
+        """
+        if monthly_credits < 1:
+            raise ValueError("monthly_credits must be at least 1")
+        if not 0 <= reserve < monthly_credits:
+            raise ValueError("reserve must be between 0 and monthly_credits")
+
+        self.monthly_credits = monthly_credits
+        self.reserve = reserve
+        self.repository = repository
+        self.clock = clock
+
+        self.used = 0
+        self._remaining: Optional[int] = None  # None = no header seen this month
+        self._period = month_bounds(clock())[0]
+        self._loaded = False
+        self.activity: Dict[str, SportActivity] = {}
+        self.decisions = {admission.value: 0 for admission in Admission}
+
+    # ------------------------------------------------------------------
+    # Balance
+    # ------------------------------------------------------------------
+
+    def _rollover(self, now: float):
+        """Start a fresh balance when a new month begins."""
+        period = month_bounds(now)[0]
+        if period != self._period:
+            logger.info("New Odds API quota period, balance reset")
+            self._period = period
+            self.used = 0
+            self._remaining = None
+
+    def remaining(self, now: Optional[float] = None) -> int:
+        """Credits left this month (reported by the API, or estimated)."""
+        self._rollover(self.clock() if now is None else now)
+        if self._remaining is not None:
+            return self._remaining
+        return max(0, self.monthly_credits - self.used)
+
+    def pace(self, now: Optional[float] = None) -> float:
+        """
+        Remaining credits over the credits a linear spend would have left.
+
+        1.0 means on schedule, below 1.0 means ahead of schedule.
+        """
+        now = self.clock() if now is None else now
+        start, end = month_bounds(now)
+        left = max((end - now) / (end - start), 1e-6)
+        return self.remaining(now) / (self.monthly_credits * left)
+
+    async def load(self):
+        """Restore this month's balance from the repository (once)."""
+        if self._loaded or self.repository is None:
+            return
+        self._loaded = True
+        try:
+            await self.repository.initialize()
+            row = await self.repository.get_quota(QUOTA_KEY)
+        except Exception as e:
+            logger.warning(f"Could not load Odds API quota: {str(e)}")
+            return
+        if row is None:
+            return
+
+        remaining, used, updated_at = row
+        if month_bounds(updated_at)[0] == month_bounds(self.clock())[0]:
+            self._period = month_bounds(updated_at)[0]
+            self._remaining = remaining
+            self.used = used or 0
+
+    async def record(
+        self, cost: int, remaining: Optional[str] = None, used: Optional[str] = None
+    ):
+        """
+        Account for a completed request.
+
+        Args:
+            cost: Credits the request was expected to spend
+            remaining: x-requests-remaining header, if sent
+            used: x-requests-used header, if sent
+        """
+        now = self.clock()
+        self._rollover(now)
+
+        if remaining is not None:
+            self._remaining = int(float(remaining))
+        elif self._remaining is not None:
+            self._remaining = max(0, self._remaining - cost)
+        if used is not None:
+            self.used = int(float(used))
+        elif remaining is None:
+            self.used += cost
+
+        if self.repository is not None and (cost or remaining is not None):
+            try:
+                await self.repository.initialize()
+                await self.repository.put_quota(QUOTA_KEY, self.remaining(now), self.used, now)
+            except Exception as e:
+                logger.warning(f"Could not persist Odds API quota: {str(e)}")
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def admit(self, cost: int, priority: Priority = Priority.NORMAL) -> Admission:
+        """
+        Decide whether a request of `cost` credits may run.
+
+        Low-priority requests run at full size while the balance is on
+        schedule (pace >= ODDS_BUDGET_LOW_PACE), are downgraded down to
+        ODDS_BUDGET_NORMAL_PACE and refused below it. Normal-priority
+        requests are downgraded below ODDS_BUDGET_NORMAL_PACE. Only
+        high-priority requests may spend the reserve.
+
+        Args:
+            cost: Credits of the request (see request_cost)
+            priority: Request priority
+
+        Returns:
+            Admission decision
+        """
+        if cost <= 0:
+            return Admission.ALLOW
+
+        now = self.clock()
+        remaining = self.remaining(now)
+        pace = self.pace(now)
+        floor = 0 if priority >= Priority.HIGH else self.reserve
+
+        if priority >= Priority.HIGH:
+            wanted = Admission.ALLOW
+        elif priority == Priority.NORMAL:
+            wanted = Admission.ALLOW if pace >= ODDS_BUDGET_NORMAL_PACE else Admission.DOWNGRADE
+        elif pace >= ODDS_BUDGET_LOW_PACE:
+            wanted = Admission.ALLOW
+        elif pace >= ODDS_BUDGET_NORMAL_PACE:
+            wanted = Admission.DOWNGRADE
+        else:
+            wanted = Admission.REFUSE
+
+        if wanted is Admission.ALLOW and remaining - cost >= floor:
+            decision = Admission.ALLOW
+        elif wanted is not Admission.REFUSE and remaining - 1 >= floor:
+            decision = Admission.ALLOW if cost == 1 else Admission.DOWNGRADE
+        else:
+            decision = Admission.REFUSE
+
+        self.decisions[decision.value] += 1
+        if decision is not Admission.ALLOW:
+            logger.info(
+                f"Odds API budget: {decision.value} {priority.name} request "
+                f"({cost} credits, {remaining} left, pace {pace:.2f})"
+            )
+        return decision
+
+    # ------------------------------------------------------------------
+    # Polling schedule
+    # ------------------------------------------------------------------
+
+    def watch(self, sport_key: str) -> SportActivity:
+        """Add a sport to the polling schedule (no-op if already there)."""
+        if sport_key not in self.activity:
+            self.activity[sport_key] = SportActivity(sport_key)
+        return self.activity[sport_key]
+
+    def observe(self, sport_key: str, events: Iterable[OddsEvent]):
+        """Update a sport's schedule after an API fetch of its odds."""
+        now = self.clock()
+        activity = self.watch(sport_key)
+        events = list(events)
+        kickoffs = [e.commence_time.timestamp() for e in events]
+
+        activity.events = len(events)
+        activity.next_kickoff = min(kickoffs) if kickoffs else None
+        activity.last_polled = now
+        ids = {e.id for e in events}
+        activity.value_bets = {k: v for k, v in activity.value_bets.items() if k in ids}
+
+    def record_value_bets(self, sport_key: str, event_id: str, count: int):
+        """Record how many value bets an analysis found for an event."""
+        self.watch(sport_key).value_bets[event_id] = count
+
+    def weight(self, sport_key: str, now: Optional[float] = None) -> float:
+        """
+        Polling weight of a sport.
+
+        Kickoff proximity (1.0 for started or imminent events, halving at
+        ODDS_POLL_HORIZON_HOURS) times 1 + value-bet density.
+        """
+        activity = self.activity.get(sport_key)
+        if activity is None or activity.next_kickoff is None:
+            return 0.0
+        now = self.clock() if now is None else now
+        hours = max(0.0, activity.next_kickoff - now) / 3600
+        proximity = 1.0 / (1.0 + hours / ODDS_POLL_HORIZON_HOURS)
+        return proximity * (1.0 + activity.value_density)
+
+    def poll_interval(self, sport_key: str, cost: int = 1, now: Optional[float] = None) -> float:
+        """
+        Seconds between background polls of a sport.
+
+        The credits left above the reserve are spread evenly over the rest
+        of the month; each sport gets the share of that rate given by its
+        weight. Clamped to [CACHE_TTL_MIN, CACHE_TTL_HISTORICAL].
+        """
+        now = self.clock() if now is None else now
+        weights = {key: self.weight(key, now) for key in self.activity}
+        total = sum(weights.values())
+        spendable = self.remaining(now) - self.reserve
+        seconds_left = month_bounds(now)[1] - now
+
+        share = weights.get(sport_key, 0.0) / total if total else 0.0
+        if spendable <= 0 or share <= 0:
+            return float(CACHE_TTL_HISTORICAL)
+        rate = spendable / seconds_left * share  # credits per second
+        return float(min(CACHE_TTL_HISTORICAL, max(CACHE_TTL_MIN, cost / rate)))
+
+    def due_sports(self, cost: int = 1, now: Optional[float] = None) -> List[str]:
+        """
+        Sports whose next background poll is due, highest weight first.
+
+        Args:
+            cost: Credits of one poll
+            now: Unix time (default: clock)
+
+        Returns:
+            Sport keys
+        """
+        now = self.clock() if now is None else now
+        due = [
+            key for key, activity in self.activity.items()
+            if activity.last_polled is None
+            or now - activity.last_polled >= self.poll_interval(key, cost, now)
+        ]
+        return sorted(due, key=lambda key: self.weight(key, now), reverse=True)
+
+    def next_poll_in(self, cost: int = 1, now: Optional[float] = None) -> float:
+        """
+        Seconds until the next background poll is due (0 if one is due now).
+
+        Args:
+            cost: Credits of one poll
+            now: Unix time (default: clock)
+        """
+        now = self.clock() if now is None else now
+        waits = [
+            0.0 if activity.last_polled is None
+            else activity.last_polled + self.poll_interval(key, cost, now) - now
+            for key, activity in self.activity.items()
+        ]
+        return max(0.0, min(waits)) if waits else float(CACHE_TTL_HISTORICAL)
+
+    def stats(self) -> Dict:
+        """
+        Get budget statistics.
+
+        Returns:
+            Dictionary with monthly_credits, remaining, used, pace, reserve
+            and the allow/downgrade/refuse decision counts
+        """
+        now = self.clock()
+        return {
+            "monthly_credits": self.monthly_credits,
+            "remaining": self.remaining(now),
+            "used": self.used,
+            "pace": round(self.pace(now), 3),
+            "reserve": self.reserve,
+            **self.decisions,
+        }
@@ -0,0 +1,272 @@
+"""
+Two-tier TTL cache for The Odds API responses.
+
+Responses are cached raw (decoded JSON), keyed by endpoint and request
+parameters, i.e. (sport, regions, markets, format) for odds:
+
+- tier 1: in-process LRU of ODDS_CACHE_SIZE entries
+- tier 2: the api_cache table of OddsRepository (config.DB_PATH), so a
+  restart within the TTL does not spend API quota
+
+Odds TTLs shrink as kickoff approaches: CACHE_TTL_KICKOFF_FRACTION of the
+time left to the nearest kickoff, clamped to [CACHE_TTL_MIN,
+CACHE_TTL_LIVE]. The sports list uses CACHE_TTL_HISTORICAL. An expired
+entry is still served for CACHE_STALE_FACTOR more TTLs while a background
+task refreshes it (stale-while-revalidate).
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from bet_copilot.api.single_flight import request_key
+from bet_copilot.config import (
+    CACHE_STALE_FACTOR,
+    CACHE_TTL_HISTORICAL,
+    CACHE_TTL_KICKOFF_FRACTION,
+    CACHE_TTL_LIVE,
+    CACHE_TTL_MIN,
+    ODDS_CACHE_SIZE,
+)
+from bet_copilot.db.odds_repository import OddsRepository
+
+logger = logging.getLogger(__name__)
+
+Fetch = Callable[[], Awaitable[Any]]
+TTLPolicy = Callable[[Any, float], float]
+
+
+def odds_ttl(events: Any, now: float) -> float:
+    """
+    TTL of an odds response from its nearest kickoff.
+
+    Args:
+        events: Decoded /odds response (list of event dicts)
+        now: Current unix time
+
+    Returns:
+        Seconds; CACHE_TTL_MIN once any event has started
+
+    Example:
+        >>> kickoff = "2024-05-04T14:00:00Z"
+        >>> now = datetime.fromisoformat("2024-05-04T13:50:00+00:00").timestamp()
+        >>> odds_ttl([{"commence_time": kickoff}], now)
+        60.0
+    """
+    kickoffs = []
+    for event in events if isinstance(events, list) else []:
+        try:
+            kickoffs.append(
+                datetime.fromisoformat(event["commence_time"].replace("Z", "+00:00")).timestamp()
+            )
+        except (KeyError, TypeError, AttributeError, ValueError):
+            continue
+
+    if not kickoffs:
+        return float(CACHE_TTL_LIVE)
+    lead = min(kickoffs) - now
+    return float(min(CACHE_TTL_LIVE, max(CACHE_TTL_MIN, lead * CACHE_TTL_KICKOFF_FRACTION)))
+
+
+def static_ttl(_payload: Any, _now: float) -> float:
+    """TTL of slowly changing responses (sports list)."""
+    return float(CACHE_TTL_HISTORICAL)
+
+
+@dataclass
+class CacheEntry:
+    """Cached response."""
+
+    payload: Any
+    fetched_at: float  # unix time
+    ttl: float  # seconds
+
+
+class OddsCache:
+    """
+    In-process LRU in front of an optional SQLite tier.
+
+    Example:
+        >>> cache = OddsCache(repository=repo)
+        >>> key = OddsCache.make_key("sports/soccer_epl/odds", params)
+        >>> data = await cache.get_or_fetch(key, fetch, odds_ttl)
+    """
+
+    def __init__(
+        self,
+        repository: Optional[OddsRepository] = None,
+        max_entries: int = ODDS_CACHE_SIZE,
+        stale_factor: float = CACHE_STALE_FACTOR,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            repository: On-disk tier (None = memory only)
+            max_entries: Responses kept in memory
+            stale_factor: Extra TTLs an expired entry is served while refreshing
+            clock: Unix time source
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if stale_factor < 0:
+            raise ValueError("stale_factor must be non-negative")
+
+        self.repository = repository
+        self.max_entries = max_entries
+        self.stale_factor = stale_factor
+        self.clock = clock
+
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """Cache key: endpoint plus sorted parameters (never include the API key)."""
+        return request_key(endpoint, params)
+
+    def _remember(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _lookup(self, key: str) -> Optional[CacheEntry]:
+        """Memory tier, then disk tier (promoted to memory on a hit)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+
+        if self.repository is None:
+            return None
+        try:
+            await self.repository.initialize()
+            row = await self.repository.get_cached_response(key)
+        except Exception as e:
+            logger.warning(f"Odds cache disk tier unavailable: {str(e)}")
+            return None
+        if row is None:
+            return None
+
+        payload, fetched_at, ttl = row
+        entry = CacheEntry(json.loads(payload), fetched_at, ttl)
+        self._remember(key, entry)
+        self.disk_hits += 1
+        return entry
+
+    async def _refresh(self, key: str, fetch: Fetch, ttl: TTLPolicy) -> Any:
+        """Fetch, store in both tiers and return the payload."""
+        payload = await fetch()
+        now = self.clock()
+        entry = CacheEntry(payload, now, ttl(payload, now))
+        self._remember(key, entry)
+
+        if self.repository is not None:
+            try:
+                await self.repository.put_cached_response(
+                    key, json.dumps(payload), entry.fetched_at, entry.ttl
+                )
+            except Exception as e:
+                logger.warning(f"Could not persist cached response: {str(e)}")
+        return payload
+
+    def _revalidate(self, key: str, fetch: Fetch, ttl: TTLPolicy):
+        """Refresh an entry in the background (at most one task per key)."""
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self._refresh(key, fetch, ttl)
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {str(e)}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    async def get_or_fetch(self, key: str, fetch: Fetch, ttl: TTLPolicy = odds_ttl) -> Any:
+        """
+        Cached payload for a key, fetching it when missing or too old.
+
+        Args:
+            key: Cache key (see make_key)
+            fetch: Coroutine function performing the request
+            ttl: TTL policy applied to each fetched payload
+
+        Returns:
+            Decoded response
+        """
+        entry = await self._lookup(key)
+        if entry is not None:
+            age = self.clock() - entry.fetched_at
+            if age <= entry.ttl:
+                self.hits += 1
+                return entry.payload
+            if age <= entry.ttl * (1 + self.stale_factor):
+                self.stale_hits += 1
+                self._revalidate(key, fetch, ttl)
+                return entry.payload
+
+        self.misses += 1
+        return await self._refresh(key, fetch, ttl)
+
+    async def peek(self, key: str) -> Optional[Any]:
+        """
+        Cached payload for a key, without fetching or refreshing.
+
+        Returns:
+            Decoded response while it is fresh or stale, else None
+        """
+        entry = await self._lookup(key)
+        if entry is None:
+            return None
+        age = self.clock() - entry.fetched_at
+        if age <= entry.ttl:
+            self.hits += 1
+            return entry.payload
+        if age <= entry.ttl * (1 + self.stale_factor):
+            self.stale_hits += 1
+            return entry.payload
+        return None
+
+    def invalidate(self, key: Optional[str] = None):
+        """Drop one key (or everything) from the memory tier."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def wait_for_refreshes(self):
+        """Wait for background refreshes in flight."""
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, disk_hits, stale_hits, misses and hit_rate
+        """
+        served = self.hits + self.stale_hits
+        total = served + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": served / total if total else 0.0,
+        }
@@ -4,13 +4,30 @@ The Odds API client with circuit breaker and rate limiting.
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import aiohttp
 
 from bet_copilot.api.circuit_breaker import CircuitBreaker, CircuitBreakerError
-from bet_copilot.config import ODDS_API_KEY, ODDS_API_BASE_URL
+from bet_copilot.api.odds_budget import (
+    Admission,
+    OddsBudget,
+    Priority,
+    downgrade,
+    request_cost,
+)
+from bet_copilot.api.odds_cache import Fetch, OddsCache, TTLPolicy, odds_ttl, static_ttl
+from bet_copilot.api.single_flight import SingleFlight, get_single_flight, request_key
+from bet_copilot.api.transport import HttpTransport, get_transport
+from bet_copilot.config import (
+    ODDS_API_KEY,
+    ODDS_API_BASE_URL,
+    ODDS_CACHE_ENABLED,
+    ODDS_DENSE_MATRICES,
+)
+from bet_copilot.db.odds_repository import OddsRepository
 from bet_copilot.models.odds import OddsEvent, Bookmaker, Market
 
 logger = logging.getLogger(__name__)
@@ -32,6 +49,12 @@ class RateLimitError(OddsAPIError):
         self.retry_after = retry_after
 
 
+class QuotaExceededError(OddsAPIError):
+    """Request refused by the credit budget (no API call was made)."""
+
+    pass
+
+
 class OddsAPIClient:
     """
     Client for The Odds API.
@@ -40,6 +63,12 @@ class OddsAPIClient:
     - Circuit breaker for resilience
     - Automatic retry with backoff
     - Rate limit handling
+    - Pooled keep-alive connections (shared HttpTransport)
+    - Optional dense price matrices per market (OddsMatrix) on parsed events
+    - Optional persistence of snapshots and request logs (OddsRepository)
+    - TTL response cache (OddsCache; on disk too when a repository is set)
+    - Identical concurrent requests coalesced into one call (SingleFlight)
+    - Monthly credit budget with request priorities (OddsBudget)
     """
 
     def __init__(
@@ -48,6 +77,13 @@ class OddsAPIClient:
         base_url: str = ODDS_API_BASE_URL,
         timeout: int = 10,
         circuit_breaker: Optional[CircuitBreaker] = None,
+        dense_odds: bool = ODDS_DENSE_MATRICES,
+        transport: Optional[HttpTransport] = None,
+        repository: Optional[OddsRepository] = None,
+        cache: Optional[OddsCache] = None,
+        use_cache: bool = ODDS_CACHE_ENABLED,
+        single_flight: Optional[SingleFlight] = None,
+        budget: Optional[OddsBudget] = None,
     ):
         self.api_key = api_key or ODDS_API_KEY
         self.base_url = base_url
@@ -55,54 +91,73 @@ class OddsAPIClient:
         self.circuit_breaker = circuit_breaker or CircuitBreaker(
             timeout=60, failure_threshold=3
         )
+        self.dense_odds = dense_odds
+        self.transport = transport or get_transport()
+        self.repository = repository
+        if cache is None and use_cache:
+            cache = OddsCache(repository=repository)
+        self.cache = cache
+        self.single_flight = single_flight or get_single_flight()
+        self.budget = budget or OddsBudget(repository=repository)
 
         if not self.api_key:
             logger.warning("Odds API key not configured")
 
-    async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make HTTP request with circuit breaker."""
+    async def _make_request(
+        self, endpoint: str, params: Optional[Dict] = None, cost: int = 0
+    ) -> Dict:
+        """Make HTTP request with circuit breaker, charging `cost` credits to the budget."""
 
         async def request_func():
             url = f"{self.base_url}/{endpoint}"
             request_params = {"apiKey": self.api_key, **(params or {})}
+            started = time.perf_counter()
+            status = remaining = used = None
 
-            async with aiohttp.ClientSession() as session:
-                try:
-                    async with session.get(
-                        url, params=request_params, timeout=self.timeout
-                    ) as response:
-                        # Check rate limit
-                        if response.status == 429:
-                            retry_after = int(response.headers.get("Retry-After", 60))
-                            logger.error(
-                                f"Rate limit exceeded. Retry after {retry_after}s"
-                            )
-                            raise RateLimitError(
-                                "The Odds API rate limit exceeded", retry_after
-                            )
-
-                        # Check other errors
-                        if response.status >= 400:
-                            error_text = await response.text()
-                            logger.error(
-                                f"API error {response.status}: {error_text[:200]}"
-                            )
-                            raise OddsAPIError(
-                                f"API error: {error_text[:200]}", response.status
-                            )
-
-                        data = await response.json()
-                        logger.info(
-                            f"Successfully fetched {endpoint} with params {params}"
+            try:
+                async with self.transport.get(
+                    url, params=request_params, timeout=self.timeout
+                ) as response:
+                    status = response.status
+                    remaining = response.headers.get("x-requests-remaining")
+                    used = response.headers.get("x-requests-used")
+
+                    # Check rate limit
+                    if response.status == 429:
+                        retry_after = int(response.headers.get("Retry-After", 60))
+                        logger.error(
+                            f"Rate limit exceeded. Retry after {retry_after}s"
+                        )
+                        raise RateLimitError(
+                            "The Odds API rate limit exceeded", retry_after
                         )
-                        return data
 
-                except asyncio.TimeoutError:
-                    logger.error(f"Request timeout for {endpoint}")
-                    raise OddsAPIError("Request timeout")
-                except aiohttp.ClientError as e:
-                    logger.error(f"Client error: {str(e)}")
-                    raise OddsAPIError(f"Client error: {str(e)}")
+                    # Check other errors
+                    if response.status >= 400:
+                        error_text = await response.text()
+                        logger.error(
+                            f"API error {response.status}: {error_text[:200]}"
+                        )
+                        raise OddsAPIError(
+                            f"API error: {error_text[:200]}", response.status
+                        )
+
+                    data = await response.json()
+                    logger.info(
+                        f"Successfully fetched {endpoint} with params {params}"
+                    )
+                    return data
+
+            except asyncio.TimeoutError:
+                logger.error(f"Request timeout for {endpoint}")
+                raise OddsAPIError("Request timeout")
+            except aiohttp.ClientError as e:
+                logger.error(f"Client error: {str(e)}")
+                raise OddsAPIError(f"Client error: {str(e)}")
+            finally:
+                await self._log_request(endpoint, status, started, remaining)
+                if status is not None:
+                    await self.budget.record(cost if status < 400 else 0, remaining, used)
 
         try:
             return await self.circuit_breaker.call(request_func)
@@ -110,9 +165,48 @@ class OddsAPIClient:
             logger.error("Circuit breaker is open")
             raise OddsAPIError("Service temporarily unavailable", status=503)
 
+    async def _log_request(
+        self, endpoint: str, status: Optional[int], started: float, remaining: Optional[str]
+    ):
+        """Record a request in the repository, if one is attached."""
+        if self.repository is None:
+            return
+        try:
+            await self.repository.initialize()
+            await self.repository.log_request(
+                endpoint,
+                status,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                requests_remaining=int(float(remaining)) if remaining else None,
+            )
+        except Exception as e:
+            logger.warning(f"Could not log request: {str(e)}")
+
+    async def _cached_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        ttl: TTLPolicy = odds_ttl,
+        fetch: Optional[Fetch] = None,
+    ):
+        """
+        Request through the response cache (or straight through without one).
+
+        Concurrent callers with the same endpoint and parameters share one
+        lookup, so a cold cache costs a single API credit.
+        """
+        fetch = fetch or (lambda: self._make_request(endpoint, params))
+
+        async def call():
+            if self.cache is None:
+                return await fetch()
+            return await self.cache.get_or_fetch(OddsCache.make_key(endpoint, params), fetch, ttl)
+
+        return await self.single_flight.do(request_key(f"{self.base_url}/{endpoint}", params), call)
+
     async def get_sports(self) -> List[Dict]:
         """Get list of available sports."""
-        return await self._make_request("sports")
+        return await self._cached_request("sports", ttl=static_ttl)
 
     async def get_odds(
         self,
@@ -120,41 +214,91 @@ class OddsAPIClient:
         regions: str = "us",
         markets: str = "h2h",
         odds_format: str = "decimal",
+        priority: Priority = Priority.NORMAL,
     ) -> List[OddsEvent]:
         """
         Get odds for a sport.
         
+        The request costs regions × markets credits. When the budget is
+        short it is downgraded to one region and one market; a refused
+        request is still served from the cache, otherwise it raises
+        QuotaExceededError.
+        
         Args:
             sport_key: Sport identifier (e.g., "soccer_epl")
             regions: Bookmaker regions
             markets: Market types
             odds_format: Odds format
+            priority: Budget priority (LOW for background polling)
             
         Returns:
             List of OddsEvent objects
         """
+        await self.budget.load()
+        cost = request_cost(regions, markets)
+        admission = self.budget.admit(cost, priority)
+        if admission is Admission.DOWNGRADE:
+            regions, markets = downgrade(regions, markets)
+            cost = 1
+
         params = {
             "regions": regions,
             "markets": markets,
             "oddsFormat": odds_format,
         }
 
-        data = await self._make_request(f"sports/{sport_key}/odds", params)
-
+        endpoint = f"sports/{sport_key}/odds"
+        if admission is Admission.REFUSE:
+            # Checked outside the coalesced call so the refusal never reaches
+            # allowed callers sharing it
+            data = None
+            if self.cache is not None:
+                data = await self.cache.peek(OddsCache.make_key(endpoint, params))
+            if data is None:
+                raise QuotaExceededError(
+                    f"Credit budget refused {priority.name} odds request for {sport_key}"
+                )
+            return self._parse_events(data)
+
+        fetched: Dict[str, List[OddsEvent]] = {}
+
+        async def fetch():
+            # Only responses that really came from the API are persisted
+            data = await self._make_request(endpoint, params, cost=cost)
+            events = fetched["events"] = self._parse_events(data)
+            self.budget.observe(sport_key, events)
+            if self.repository is not None and events:
+                # Queued for the repository's writer task; not awaited here
+                await self.repository.initialize()
+                await self.repository.save_events(events, wait=False)
+            return data
+
+        data = await self._cached_request(endpoint, params, ttl=odds_ttl, fetch=fetch)
+        if "events" in fetched:
+            return fetched["events"]
+        return self._parse_events(data)
+
+    def _parse_events(self, data) -> List[OddsEvent]:
+        """Parse an /odds response, skipping malformed events."""
         if not isinstance(data, list):
             return []
 
         events = []
         for event_data in data:
             try:
-                events.append(self._parse_event(event_data))
+                events.append(self._parse_event(event_data, dense=self.dense_odds))
             except Exception as e:
                 logger.warning(f"Failed to parse event: {str(e)}")
-
         return events
 
-    def _parse_event(self, data: Dict) -> OddsEvent:
-        """Parse event data into OddsEvent object."""
+    def _parse_event(self, data: Dict, dense: bool = False) -> OddsEvent:
+        """
+        Parse event data into OddsEvent object.
+
+        Args:
+            data: Event JSON from The Odds API
+            dense: Also build the per-market OddsMatrix lookups
+        """
         bookmakers = []
         for bm_data in data.get("bookmakers", []):
             markets = []
@@ -184,7 +328,7 @@ class OddsAPIClient:
                 )
             )
 
-        return OddsEvent(
+        event = OddsEvent(
             id=data.get("id"),
             sport_key=data.get("sport_key"),
             home_team=data.get("home_team"),
@@ -194,7 +338,11 @@ class OddsAPIClient:
             ),
             bookmakers=bookmakers,
         )
+        if dense:
+            event.build_matrices()
+        return event
 
     async def close(self):
-        """Clean up resources."""
-        pass
+        """Wait for background cache refreshes."""
+        if self.cache is not None:
+            await self.cache.wait_for_refreshes()
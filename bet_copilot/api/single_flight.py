@@ -0,0 +1,109 @@
+"""
+Single-flight coalescing of identical in-flight API calls.
+
+When several coroutines ask for the same resource at once (e.g. five
+analyze_match calls fetching the same sport's odds), only the first one
+goes upstream; the others await the same future and get the same result
+or exception. Nothing is cached: once the call finishes, the next caller
+starts a new one (see OddsCache for caching).
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+from urllib.parse import urlencode
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def request_key(url: str, params: Optional[Dict] = None) -> str:
+    """Key of a GET request: URL plus sorted query parameters."""
+    return f"{url}?{urlencode(sorted((params or {}).items()))}"
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls that share a key.
+
+    Example:
+        >>> flight = get_single_flight()
+        >>> data = await flight.do(request_key(url, params), lambda: fetch(url, params))
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0  # do() invocations
+        self.executions = 0  # upstream calls actually made
+
+    @property
+    def saved(self) -> int:
+        """Upstream calls avoided by sharing an in-flight one."""
+        return self.calls - self.executions
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently running."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run fn, or join the call already running under the same key.
+
+        The shared call is shielded: a cancelled caller stops waiting, but
+        the call keeps running for the others.
+
+        Args:
+            key: Request identity (see request_key)
+            fn: Coroutine function making the upstream call
+
+        Returns:
+            Result of the shared call (its exception is raised to every caller)
+        """
+        self.calls += 1
+        loop = asyncio.get_running_loop()
+
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not loop:
+            self.executions += 1
+            task = loop.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            logger.debug(f"Joined in-flight call {key}")
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with calls, executions, saved, in_flight and saved_rate
+        """
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "saved": self.saved,
+            "in_flight": self.in_flight,
+            "saved_rate": self.saved / self.calls if self.calls else 0.0,
+        }
+
+
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Process-wide SingleFlight shared by clients that are not given one."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional
 
 import aiohttp
 
+from bet_copilot.api.single_flight import SingleFlight, get_single_flight, request_key
+from bet_copilot.api.transport import HttpTransport, get_transport
 from bet_copilot.config import SPORTSDATA_API_KEY, SPORTSDATA_BASE_URL
 
 logger = logging.getLogger(__name__)
@@ -28,6 +30,7 @@ class SportsDataClient:
     - Player statistics and props
     - Advanced metrics
     - Real-time data
+    - Identical concurrent requests coalesced into one call (SingleFlight)
     """
     
     def __init__(
@@ -35,11 +38,14 @@ class SportsDataClient:
         api_key: Optional[str] = None,
         base_url: str = SPORTSDATA_BASE_URL,
         timeout: int = 10,
+        transport: Optional[HttpTransport] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.api_key = api_key or SPORTSDATA_API_KEY
         self.base_url = base_url
         self.timeout = timeout
-        self.session = None
+        self.transport = transport or get_transport()
+        self.single_flight = single_flight or get_single_flight()
         
         if not self.api_key:
             logger.warning("SportsData API key not configured")
@@ -50,14 +56,14 @@ class SportsDataClient:
         """Check if API is available."""
         return bool(self.api_key)
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
-    
     async def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         """Make HTTP request to SportsData API."""
+        return await self.single_flight.do(
+            request_key(f"{self.base_url}/{endpoint}", params), lambda: self._send_request(endpoint, params)
+        )
+    
+    async def _send_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """Send one HTTP request to SportsData API."""
         url = f"{self.base_url}/{endpoint}"
         
         # API key as query parameter
@@ -65,10 +71,8 @@ class SportsDataClient:
         if params:
             request_params.update(params)
         
-        session = await self._get_session()
-        
         try:
-            async with session.get(
+            async with self.transport.get(
                 url, params=request_params, timeout=self.timeout
             ) as response:
                 if response.status == 401:
@@ -267,10 +271,8 @@ class SportsDataClient:
         }
     
     async def close(self):
-        """Close the client session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            logger.info("SportsData client session closed")
+        """Clean up resources."""
+        pass
 
 
 # Competition code mappings
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional
 
 import aiohttp
 
+from bet_copilot.api.single_flight import SingleFlight, get_single_flight, request_key
+from bet_copilot.api.transport import HttpTransport, get_transport
 from bet_copilot.config import THESPORTSDB_API_KEY, THESPORTSDB_BASE_URL
 
 logger = logging.getLogger(__name__)
@@ -29,6 +31,7 @@ class TheSportsDBClient:
     - Match results
     - Player data
     - Free tier available
+    - Identical concurrent requests coalesced into one call (SingleFlight)
     """
     
     def __init__(
@@ -36,11 +39,14 @@ class TheSportsDBClient:
         api_key: Optional[str] = None,
         base_url: str = THESPORTSDB_BASE_URL,
         timeout: int = 10,
+        transport: Optional[HttpTransport] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.api_key = api_key or THESPORTSDB_API_KEY
         self.base_url = base_url
         self.timeout = timeout
-        self.session = None
+        self.transport = transport or get_transport()
+        self.single_flight = single_flight or get_single_flight()
         
         if not self.api_key:
             logger.warning("TheSportsDB API key not configured")
@@ -51,20 +57,18 @@ class TheSportsDBClient:
         """Check if API is available."""
         return bool(self.api_key)
     
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
-    
     async def _make_request(self, endpoint: str) -> Dict:
         """Make HTTP request to TheSportsDB API."""
+        return await self.single_flight.do(
+            request_key(f"{self.base_url}/{endpoint}"), lambda: self._send_request(endpoint)
+        )
+    
+    async def _send_request(self, endpoint: str) -> Dict:
+        """Send one HTTP request to TheSportsDB API."""
         url = f"{self.base_url}/{self.api_key}/{endpoint}"
         
-        session = await self._get_session()
-        
         try:
-            async with session.get(url, timeout=self.timeout) as response:
+            async with self.transport.get(url, timeout=self.timeout) as response:
                 if response.status >= 400:
                     error_text = await response.text()
                     logger.error(f"API error {response.status}: {error_text[:200]}")
@@ -262,10 +266,8 @@ class TheSportsDBClient:
         }
     
     async def close(self):
-        """Close the client session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
-            logger.info("TheSportsDB client session closed")
+        """Clean up resources."""
+        pass
 
 
 # League ID mappings (most popular)
@@ -0,0 +1,176 @@
+"""
+Pooled HTTP transport shared by all API clients.
+
+Every client used to open its own aiohttp.ClientSession (some per request),
+paying a TCP + TLS handshake on each call. HttpTransport keeps one
+long-lived session per host instead, with:
+
+- keep-alive connections reused across requests and clients
+- DNS results cached for HTTP_DNS_CACHE_TTL seconds
+- gzip/deflate negotiated and decoded transparently
+- at most HTTP_POOL_LIMIT_PER_HOST open connections per host
+
+Sessions belong to the event loop that created them; a transport used from
+a new loop (e.g. a second asyncio.run) opens fresh sessions for it.
+Call close_transport() once on shutdown to release the shared pool; the
+clients' own close() methods no longer hold connections and leave it open.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Tuple, Union
+
+import aiohttp
+from yarl import URL
+
+from bet_copilot.config import (
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_POOL_LIMIT_PER_HOST,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+
+class HttpTransport:
+    """
+    Per-host pool of keep-alive aiohttp sessions.
+
+    Example:
+        >>> transport = get_transport()
+        >>> async with transport.get(url, params=params, timeout=10) as response:
+        ...     data = await response.json()
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: int = HTTP_DNS_CACHE_TTL,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize transport.
+
+        Args:
+            limit_per_host: Max simultaneous connections per host
+            keepalive_timeout: Seconds an idle connection is kept open
+            dns_cache_ttl: Seconds a resolved host is cached
+            headers: Default headers sent with every request
+        """
+        if limit_per_host < 1:
+            raise ValueError("limit_per_host must be at least 1")
+
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self._sessions: Dict[Tuple[asyncio.AbstractEventLoop, str], aiohttp.ClientSession] = {}
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=self.limit_per_host,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        return aiohttp.ClientSession(
+            connector=connector, headers=self.headers, auto_decompress=True
+        )
+
+    async def session(self, url: Union[str, URL]) -> aiohttp.ClientSession:
+        """
+        Pooled session for the host of a URL.
+
+        Args:
+            url: Any URL on the host (only scheme, host and port are used)
+
+        Returns:
+            Open ClientSession bound to the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        origin = str(URL(str(url)).origin())
+
+        # Sessions of finished loops can no longer be used or closed cleanly
+        for key in [key for key in self._sessions if key[0].is_closed()]:
+            self._sessions.pop(key).detach()
+
+        session = self._sessions.get((loop, origin))
+        if session is None or session.closed:
+            session = self._new_session()
+            self._sessions[(loop, origin)] = session
+            logger.debug(f"Opened pooled session for {origin}")
+        return session
+
+    @asynccontextmanager
+    async def request(
+        self, method: str, url: str, timeout: Union[None, float, aiohttp.ClientTimeout] = None, **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a request through the pooled session of its host.
+
+        Args:
+            method: HTTP method
+            url: Full URL
+            timeout: Total seconds or a ClientTimeout (None = session default)
+            **kwargs: Passed to aiohttp (params, headers, json, ...)
+
+        Yields:
+            ClientResponse; the connection returns to the pool on exit
+        """
+        if isinstance(timeout, (int, float)):
+            timeout = aiohttp.ClientTimeout(total=timeout)
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        session = await self.session(url)
+        async with session.request(method, url, **kwargs) as response:
+            yield response
+
+    def get(self, url: str, **kwargs):
+        """GET request (see request())."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        """POST request (see request())."""
+        return self.request("POST", url, **kwargs)
+
+    @property
+    def open_sessions(self) -> int:
+        """Number of open pooled sessions."""
+        return sum(1 for session in self._sessions.values() if not session.closed)
+
+    async def close(self):
+        """Close the sessions of the running loop and drop those of other loops."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        sessions, self._sessions = self._sessions, {}
+        for (owner, origin), session in sessions.items():
+            if owner is not loop:
+                session.detach()
+            elif not session.closed:
+                await session.close()
+                logger.debug(f"Closed pooled session for {origin}")
+
+
+_transport: Optional[HttpTransport] = None
+
+
+def get_transport() -> HttpTransport:
+    """Process-wide transport used by clients that are not given one."""
+    global _transport
+    if _transport is None:
+        _transport = HttpTransport()
+    return _transport
+
+
+async def close_transport():
+    """Shutdown hook: close every pooled connection of the shared transport."""
+    if _transport is not None:
+        await _transport.close()
@@ -16,10 +16,14 @@ from rich.box import MINIMAL
 from rich.pager import Pager
 from rich import print as rprint
 
+from bet_copilot.api.odds_budget import Priority
 from bet_copilot.api.odds_client import OddsAPIClient
+from bet_copilot.api.transport import close_transport
+from bet_copilot.db.odds_repository import OddsRepository
 from bet_copilot.api.football_client_with_fallback import create_football_client
 from bet_copilot.ai.ai_client import create_ai_client
 from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+from bet_copilot.math_engine.market_cache import MarketCache
 from bet_copilot.math_engine.kelly import KellyCriterion
 from bet_copilot.services.match_analyzer import MatchAnalyzer
 from bet_copilot.ui.dashboard import Dashboard
@@ -43,10 +47,12 @@ class BetCopilotCLI:
         self.dashboard = Dashboard()
 
         # Initialize clients
-        self.odds_client = OddsAPIClient()
+        # Odds responses are cached in memory and in SQLite (config.DB_PATH)
+        self.odds_repository = OddsRepository()
+        self.odds_client = OddsAPIClient(repository=self.odds_repository)
         self.football_client = create_football_client()  # With fallback to SimpleProvider
         self.ai_client = create_ai_client()  # Unified AI with fallback
-        self.soccer_predictor = SoccerPredictor()
+        self.soccer_predictor = SoccerPredictor(cache=MarketCache())
         self.kelly = KellyCriterion()
         
         # MatchAnalyzer creates its own Gemini and Blackbox clients for collaborative analysis
@@ -174,7 +180,7 @@ Para uso en producción, integre estadísticas de API-Football y predicciones Po
         self.console.print(f"\n[bold]Obteniendo mercados para {sport_key}...[/bold]\n")
 
         try:
-            events = await self.odds_client.get_odds(sport_key)
+            events = await self.odds_client.get_odds(sport_key, priority=Priority.HIGH)
 
             if not events:
                 self.console.print("No se encontraron eventos", style="yellow")
@@ -589,8 +595,10 @@ Para uso en producción, integre estadísticas de API-Football y predicciones Po
         finally:
             # Limpieza
             await self.odds_client.close()
+            await self.odds_repository.close()
             await self.football_client.close()
             await self.ai_client.close()
+            await close_transport()
 
 
 def main():
@@ -19,6 +19,8 @@ except ImportError:
 # Base paths
 BASE_DIR = Path(__file__).parent.parent
 DB_PATH = BASE_DIR / "bet_copilot.db"
+DB_WRITE_QUEUE_SIZE = 256  # Pending write jobs before OddsRepository callers wait
+DATA_DIR = BASE_DIR / "data"
 
 # API Keys
 ODDS_API_KEY = os.getenv("ODDS_API_KEY", "")
@@ -46,23 +48,63 @@ CIRCUIT_BREAKER_FAILURE_THRESHOLD = 3
 # Cache TTLs (seconds)
 CACHE_TTL_LIVE = 300  # 5 minutes for live/upcoming events
 CACHE_TTL_HISTORICAL = 86400  # 24 hours for historical data
+CACHE_TTL_MIN = 30  # Floor for odds TTLs close to (or after) kickoff
+CACHE_TTL_KICKOFF_FRACTION = 0.1  # Odds TTL = this share of the time left to the next kickoff
+CACHE_STALE_FACTOR = 1.0  # Serve expired entries for this many more TTLs while refreshing
+ODDS_CACHE_ENABLED = True  # Cache The Odds API responses (memory + SQLite when a repository is set)
+ODDS_CACHE_SIZE = 128  # Max responses in the in-process tier
+
+# The Odds API credit budget (see bet_copilot.api.odds_budget)
+ODDS_API_MONTHLY_CREDITS = int(os.getenv("ODDS_API_MONTHLY_CREDITS", "500"))  # Plan quota (free tier: 500)
+ODDS_BUDGET_RESERVE = 25  # Credits only high-priority (user) requests may spend
+ODDS_BUDGET_LOW_PACE = 1.0  # Background polls run at full size while remaining / pro-rata quota >= this
+ODDS_BUDGET_NORMAL_PACE = 0.5  # Below this, normal requests are downgraded and background polls refused
+ODDS_POLL_HORIZON_HOURS = 24  # Kickoff distance at which a sport's polling weight halves
 
 # Rate Limiting
 MAX_CONCURRENT_REQUESTS = 3
 REQUEST_DELAY = 0.5  # seconds between requests
 
+# HTTP transport (shared connection pool, see bet_copilot.api.transport)
+HTTP_POOL_LIMIT_PER_HOST = 10  # Max open connections per host
+HTTP_KEEPALIVE_TIMEOUT = 30  # Seconds an idle connection stays open
+HTTP_DNS_CACHE_TTL = 300  # Seconds a resolved host is cached
+
+# Odds parsing
+ODDS_DENSE_MATRICES = True  # Build per-market price matrices (OddsMatrix) when parsing events
+
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 # Math Engine Settings
 POISSON_MAX_GOALS = 10  # Maximum goals to calculate in Poisson
+POISSON_TAIL_EPSILON = 1e-6  # Max truncated tail mass per team in adaptive grids
 HOME_ADVANTAGE_FACTOR = 1.1  # 10% boost for home team
+MARKET_CACHE_SIZE = 4096  # Max cached (λ_home, λ_away, max_goals) market vectors
+MARKET_CACHE_DECIMALS = 2  # Lambda quantization for market cache keys
+LAMBDA_TABLE_PATH = DATA_DIR / "lambda_table.npy"  # Precomputed market table
+TEAM_RATINGS_PATH = DATA_DIR / "team_ratings.json"  # Fitted attack/defence ratings
+MONTE_CARLO_SAMPLES = 100_000  # Default simulated outcomes per estimate
+MONTE_CARLO_CHUNK_SIZE = 50_000  # Samples per chunk (unit of work for process pools)
+FORM_HALF_LIFE_DAYS = 60.0  # Half-life of exponentially time-weighted form features
 
 # Kelly Criterion Settings
 KELLY_FRACTION = 0.25  # 1/4 Kelly (conservative)
 MAX_STAKE_PERCENT = 5.0  # Maximum 5% of bankroll per bet
 MIN_EV_THRESHOLD = 0.05  # Minimum 5% EV to consider
+MAX_PORTFOLIO_EXPOSURE = 25.0  # Maximum 25% of bankroll staked across open bets
+PORTFOLIO_SCENARIOS = 4096  # Joint outcomes used by the portfolio optimizer
+
+# Bookmaker margins
+MARGIN_METHOD = "shin"  # multiplicative, additive, power or shin
+ESTIMATED_BOOK_MARGIN = 0.08  # Overround assumed when no real odds are available
+
+# Backtesting
+BACKTEST_MIN_HISTORY = 5  # Matches each team needs before its fixtures are bet
+BACKTEST_BANKROLL = 1000.0  # Bankroll at the start of every backtested season
+SWEEP_RUNGS = 3  # Season chunks between early-stopping checks in parameter sweeps
+CALIBRATION_BINS = 10  # Reliability-diagram bins per outcome
 
 # UI Settings
 UI_REFRESH_RATE = 1.0  # seconds
@@ -0,0 +1,478 @@
+"""
+Persistent SQLite store for odds snapshots, API request logs and the
+on-disk tier of the odds response cache.
+
+The database runs in WAL mode so readers never wait for the writer. All
+writes go through one queue drained by a single writer task, each job in
+its own transaction; callers may await the commit or fire and forget.
+aiosqlite runs every connection on its own thread, so neither side
+blocks the event loop.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+import aiosqlite
+
+from bet_copilot.config import CACHE_TTL_LIVE, DB_PATH, DB_WRITE_QUEUE_SIZE
+from bet_copilot.models.odds import Bookmaker, Market, OddsEvent
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_PATH = Path(__file__).parent / "schema.sql"
+
+WriteJob = Callable[[aiosqlite.Connection], Awaitable[object]]
+
+
+def _timestamp(moment: Optional[datetime] = None) -> str:
+    """Naive local ISO timestamp, the format every *_at column uses."""
+    return (moment or datetime.now()).replace(tzinfo=None).isoformat(timespec="seconds")
+
+
+class OddsRepository:
+    """
+    Async repository for events, prices and API request statistics.
+
+    Example:
+        >>> repo = OddsRepository()
+        >>> await repo.initialize()
+        >>> await repo.save_events(events)
+        >>> stored = await repo.get_events("soccer_epl")
+        >>> await repo.close()
+    """
+
+    def __init__(self, db_path: Path = DB_PATH, queue_size: int = DB_WRITE_QUEUE_SIZE):
+        """
+        Initialize repository.
+
+        Args:
+            db_path: SQLite database file
+            queue_size: Max pending write jobs before writers wait
+        """
+        self.db_path = Path(db_path)
+        self.queue_size = queue_size
+        self._writer: Optional[aiosqlite.Connection] = None
+        self._reader: Optional[aiosqlite.Connection] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Dictionary encoding of bookmaker / market keys (owned by the writer task)
+        self._bookmaker_ids: Dict[str, int] = {}
+        self._market_ids: Dict[str, int] = {}
+
+    @property
+    def is_open(self) -> bool:
+        """Whether initialize() has run and close() has not."""
+        return self._task is not None
+
+    async def initialize(self):
+        """Create the schema and start the writer task (idempotent)."""
+        if self.is_open:
+            return
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer = await aiosqlite.connect(self.db_path)
+        await self._writer.execute("PRAGMA journal_mode=WAL")
+        await self._writer.execute("PRAGMA synchronous=NORMAL")
+        await self._writer.execute("PRAGMA foreign_keys=ON")
+        await self._writer.executescript(SCHEMA_PATH.read_text())
+        await self._writer.executescript(
+            f"""
+            DROP VIEW IF EXISTS odds_data;
+            CREATE VIEW odds_data AS
+            SELECT
+                id AS event_id,
+                sport_key,
+                fetched_at,
+                (julianday('now', 'localtime') - julianday(fetched_at)) * 86400 > {CACHE_TTL_LIVE}
+                    AS is_stale
+            FROM events;
+            """
+        )
+        await self._writer.commit()
+
+        self._reader = await aiosqlite.connect(self.db_path)
+        self._reader.row_factory = aiosqlite.Row
+
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._drain())
+        logger.info(f"Odds repository ready at {self.db_path}")
+
+    async def close(self):
+        """Flush pending writes and close both connections."""
+        if not self.is_open:
+            return
+
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+        await self._writer.close()
+        await self._reader.close()
+        self._writer = self._reader = None
+
+    async def __aenter__(self) -> "OddsRepository":
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    async def _drain(self):
+        """Single writer: run queued jobs one transaction at a time."""
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                break
+
+            job, done = item
+            try:
+                result = await job(self._writer)
+                await self._writer.commit()
+            except Exception as e:
+                await self._writer.rollback()
+                # Ids cached during the failed transaction may not exist
+                self._bookmaker_ids.clear()
+                self._market_ids.clear()
+                if done is None:
+                    logger.error(f"Background write failed: {str(e)}")
+                elif not done.cancelled():
+                    done.set_exception(e)
+            else:
+                if done is not None and not done.cancelled():
+                    done.set_result(result)
+
+    async def _submit(self, job: WriteJob, wait: bool = True):
+        """Queue a write job; with wait=True return its result once committed."""
+        if not self.is_open:
+            raise RuntimeError("OddsRepository is not initialized")
+
+        done = asyncio.get_running_loop().create_future() if wait else None
+        await self._queue.put((job, done))
+        return await done if wait else None
+
+    async def _encode(
+        self, db: aiosqlite.Connection, table: str, cache: Dict[str, int], rows: Dict[str, Tuple]
+    ) -> Dict[str, int]:
+        """Ids of bookmaker / market keys, inserting the unknown ones."""
+        missing = {key: values for key, values in rows.items() if key not in cache}
+        if missing:
+            if table == "bookmakers":
+                sql = (
+                    "INSERT INTO bookmakers (key, title) VALUES (?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET title = excluded.title"
+                )
+            else:
+                sql = f"INSERT INTO {table} (key) VALUES (?) ON CONFLICT (key) DO NOTHING"
+            await db.executemany(sql, [(key, *values) for key, values in missing.items()])
+            keys = list(missing)
+            cursor = await db.execute(
+                f"SELECT key, id FROM {table} WHERE key IN ({', '.join('?' * len(keys))})", keys
+            )
+            cache.update(await cursor.fetchall())
+        return cache
+
+    async def save_events(
+        self,
+        events: Iterable[OddsEvent],
+        fetched_at: Optional[datetime] = None,
+        wait: bool = True,
+    ) -> int:
+        """
+        Upsert a snapshot of events and all their prices.
+
+        For every (event, market, bookmaker) in the snapshot, stored prices
+        that are missing from it (e.g. the bookmaker pulled an outcome) are
+        removed. Other markets and bookmakers of the event are left alone,
+        so snapshots of different regions do not overwrite each other.
+
+        Args:
+            events: Parsed events
+            fetched_at: Snapshot time (default: now)
+            wait: Wait for the commit; False queues the write and returns 0
+
+        Returns:
+            Number of price rows written
+        """
+        events = list(events)
+        stamp = _timestamp(fetched_at)
+
+        async def job(db: aiosqlite.Connection) -> int:
+            bookmakers = {b.key: (b.title,) for e in events for b in e.bookmakers}
+            markets = {m.key: () for e in events for b in e.bookmakers for m in b.markets}
+            bookmaker_ids = await self._encode(db, "bookmakers", self._bookmaker_ids, bookmakers)
+            market_ids = await self._encode(db, "markets", self._market_ids, markets)
+
+            await db.executemany(
+                "INSERT INTO events (id, sport_key, home_team, away_team, commence_time, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET sport_key = excluded.sport_key, "
+                "home_team = excluded.home_team, away_team = excluded.away_team, "
+                "commence_time = excluded.commence_time, fetched_at = excluded.fetched_at",
+                [
+                    (e.id, e.sport_key, e.home_team, e.away_team, e.commence_time.isoformat(), stamp)
+                    for e in events
+                ],
+            )
+
+            prices = [
+                (
+                    event.id,
+                    market_ids[market.key],
+                    bookmaker_ids[bookmaker.key],
+                    outcome,
+                    price,
+                    market.last_update.isoformat(),
+                    stamp,
+                )
+                for event in events
+                for bookmaker in event.bookmakers
+                for market in bookmaker.markets
+                for outcome, price in market.outcomes.items()
+                if price is not None
+            ]
+            await db.executemany(
+                "INSERT INTO prices "
+                "(event_id, market_id, bookmaker_id, outcome, price, last_update, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (event_id, market_id, bookmaker_id, outcome) DO UPDATE SET "
+                "price = excluded.price, last_update = excluded.last_update, "
+                "fetched_at = excluded.fetched_at",
+                prices,
+            )
+            await db.executemany(
+                "DELETE FROM prices WHERE event_id = ? AND market_id = ? AND bookmaker_id = ? "
+                "AND fetched_at <> ?",
+                list(dict.fromkeys(
+                    (event.id, market_ids[market.key], bookmaker_ids[bookmaker.key], stamp)
+                    for event in events
+                    for bookmaker in event.bookmakers
+                    for market in bookmaker.markets
+                )),
+            )
+            return len(prices)
+
+        if not events:
+            return 0
+        return await self._submit(job, wait) or 0
+
+    async def log_request(
+        self,
+        endpoint: str,
+        status: Optional[int],
+        latency_ms: Optional[float] = None,
+        requests_remaining: Optional[int] = None,
+        wait: bool = False,
+    ):
+        """
+        Record one API request (queued without waiting by default).
+
+        Args:
+            endpoint: API endpoint
+            status: HTTP status, None if no response arrived
+            latency_ms: Round-trip time
+            requests_remaining: Quota left, when the API reports it
+            wait: Wait for the commit
+        """
+        row = (endpoint, status, latency_ms, requests_remaining, _timestamp())
+
+        async def job(db: aiosqlite.Connection):
+            await db.execute(
+                "INSERT INTO api_requests (endpoint, status, latency_ms, requests_remaining, requested_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                row,
+            )
+
+        await self._submit(job, wait)
+
+    async def put_cached_response(
+        self, key: str, payload: str, fetched_at: float, ttl: float, wait: bool = False
+    ):
+        """
+        Store a raw API response for the on-disk cache tier.
+
+        Args:
+            key: Cache key (endpoint + sorted params)
+            payload: JSON body
+            fetched_at: Unix time of the fetch
+            ttl: Seconds the response stays fresh
+            wait: Wait for the commit
+        """
+        async def job(db: aiosqlite.Connection):
+            await db.execute(
+                "INSERT INTO api_cache (key, payload, fetched_at, ttl) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET payload = excluded.payload, "
+                "fetched_at = excluded.fetched_at, ttl = excluded.ttl",
+                (key, payload, fetched_at, ttl),
+            )
+
+        await self._submit(job, wait)
+
+    async def put_quota(
+        self, api: str, remaining: int, used: int, updated_at: float, wait: bool = False
+    ):
+        """
+        Store an API credit balance.
+
+        Args:
+            api: API name
+            remaining: Credits left
+            used: Credits used this period
+            updated_at: Unix time of the balance
+            wait: Wait for the commit
+        """
+        async def job(db: aiosqlite.Connection):
+            await db.execute(
+                "INSERT INTO api_quota (api, remaining, used, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (api) DO UPDATE SET remaining = excluded.remaining, "
+                "used = excluded.used, updated_at = excluded.updated_at",
+                (api, remaining, used, updated_at),
+            )
+
+        await self._submit(job, wait)
+
+    async def flush(self):
+        """Wait until every write queued so far is committed."""
+        async def job(db: aiosqlite.Connection):
+            return None
+
+        await self._submit(job)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def _load(self, where: str, params: Tuple) -> List[OddsEvent]:
+        """Rebuild events (with bookmakers and markets) matching a filter on `events`."""
+        cursor = await self._reader.execute(
+            f"SELECT id, sport_key, home_team, away_team, commence_time FROM events e "
+            f"WHERE {where} ORDER BY commence_time, id",
+            params,
+        )
+        events = {
+            row["id"]: OddsEvent(
+                id=row["id"],
+                sport_key=row["sport_key"],
+                home_team=row["home_team"],
+                away_team=row["away_team"],
+                commence_time=datetime.fromisoformat(row["commence_time"]),
+                bookmakers=[],
+            )
+            for row in await cursor.fetchall()
+        }
+        if not events:
+            return []
+
+        cursor = await self._reader.execute(
+            "SELECT p.event_id, b.key AS bookmaker, b.title, m.key AS market, "
+            "p.outcome, p.price, p.last_update "
+            "FROM events e "
+            "JOIN prices p ON p.event_id = e.id "
+            "JOIN bookmakers b ON b.id = p.bookmaker_id "
+            "JOIN markets m ON m.id = p.market_id "
+            f"WHERE {where} "
+            "ORDER BY p.event_id, p.bookmaker_id, p.market_id",
+            params,
+        )
+
+        bookmakers: Dict[Tuple[str, str], Bookmaker] = {}
+        markets: Dict[Tuple[str, str, str], Market] = {}
+        for row in await cursor.fetchall():
+            last_update = datetime.fromisoformat(row["last_update"])
+            bookmaker = bookmakers.get((row["event_id"], row["bookmaker"]))
+            if bookmaker is None:
+                bookmaker = Bookmaker(row["bookmaker"], row["title"], [], last_update)
+                bookmakers[(row["event_id"], row["bookmaker"])] = bookmaker
+                events[row["event_id"]].bookmakers.append(bookmaker)
+            bookmaker.last_update = max(bookmaker.last_update, last_update)
+
+            key = (row["event_id"], row["bookmaker"], row["market"])
+            market = markets.get(key)
+            if market is None:
+                market = markets[key] = Market(row["market"], {}, last_update)
+                bookmaker.markets.append(market)
+            market.outcomes[row["outcome"]] = row["price"]
+            market.last_update = max(market.last_update, last_update)
+
+        return list(events.values())
+
+    async def get_event(self, event_id: str) -> Optional[OddsEvent]:
+        """Latest stored snapshot of one event."""
+        events = await self._load("e.id = ?", (event_id,))
+        return events[0] if events else None
+
+    async def get_events(
+        self,
+        sport_key: str,
+        fetched_since: Optional[datetime] = None,
+        commence_after: Optional[datetime] = None,
+    ) -> List[OddsEvent]:
+        """
+        Stored events of a sport, ordered by kickoff.
+
+        Args:
+            sport_key: Sport identifier (e.g., "soccer_epl")
+            fetched_since: Only snapshots taken at or after this time
+            commence_after: Only events starting at or after this time
+
+        Returns:
+            List of OddsEvent objects
+        """
+        where = ["e.sport_key = ?"]
+        params: List = [sport_key]
+        if fetched_since is not None:
+            where.append("e.fetched_at >= ?")
+            params.append(_timestamp(fetched_since))
+        if commence_after is not None:
+            where.append("e.commence_time >= ?")
+            params.append(commence_after.isoformat())
+        return await self._load(" AND ".join(where), tuple(params))
+
+    async def get_cached_response(self, key: str) -> Optional[Tuple[str, float, float]]:
+        """(payload, fetched_at, ttl) of a cached API response, or None."""
+        cursor = await self._reader.execute(
+            "SELECT payload, fetched_at, ttl FROM api_cache WHERE key = ?", (key,)
+        )
+        row = await cursor.fetchone()
+        return tuple(row) if row else None
+
+    async def get_quota(self, api: str) -> Optional[Tuple[int, int, float]]:
+        """(remaining, used, updated_at) of an API credit balance, or None."""
+        cursor = await self._reader.execute(
+            "SELECT remaining, used, updated_at FROM api_quota WHERE api = ?", (api,)
+        )
+        row = await cursor.fetchone()
+        return tuple(row) if row else None
+
+    async def get_request_stats(self, hours: int = 24) -> Dict:
+        """
+        API request counts over the last hours.
+
+        Returns:
+            Dict with total_requests, successful, rate_limited, failed,
+            avg_latency_ms and requests_remaining (latest reported quota)
+        """
+        cutoff = _timestamp(datetime.now() - timedelta(hours=hours))
+        cursor = await self._reader.execute(
+            "SELECT COUNT(*) AS total_requests, "
+            "COALESCE(SUM(status < 400), 0) AS successful, "
+            "COALESCE(SUM(status = 429), 0) AS rate_limited, "
+            "COALESCE(SUM(status IS NULL OR status >= 400), 0) AS failed, "
+            "AVG(latency_ms) AS avg_latency_ms "
+            "FROM api_requests WHERE requested_at >= ?",
+            (cutoff,),
+        )
+        stats = dict(await cursor.fetchone())
+
+        cursor = await self._reader.execute(
+            "SELECT requests_remaining FROM api_requests "
+            "WHERE requests_remaining IS NOT NULL ORDER BY requested_at DESC, id DESC LIMIT 1"
+        )
+        row = await cursor.fetchone()
+        stats["requests_remaining"] = row[0] if row else None
+        return stats
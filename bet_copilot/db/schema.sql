@@ -0,0 +1,73 @@
+-- Bet-Copilot odds store (SQLite, WAL mode).
+--
+-- Prices are normalized: bookmakers and markets are stored once and
+-- referenced by integer id. The prices primary key doubles as the covering
+-- index for lookups by (event, market, bookmaker); the odds_data view used
+-- by health checks is created by OddsRepository.initialize() because its
+-- staleness cut-off comes from config.CACHE_TTL_LIVE.
+
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    sport_key TEXT NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    commence_time TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_events_sport
+    ON events (sport_key, commence_time);
+
+CREATE TABLE IF NOT EXISTS bookmakers (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS markets (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS prices (
+    event_id TEXT NOT NULL REFERENCES events (id) ON DELETE CASCADE,
+    market_id INTEGER NOT NULL REFERENCES markets (id),
+    bookmaker_id INTEGER NOT NULL REFERENCES bookmakers (id),
+    outcome TEXT NOT NULL,
+    price REAL NOT NULL,
+    last_update TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (event_id, market_id, bookmaker_id, outcome)
+) WITHOUT ROWID;
+
+-- Market-wide scans (e.g. every h2h price of a bookmaker) without touching the table
+CREATE INDEX IF NOT EXISTS idx_prices_market
+    ON prices (market_id, bookmaker_id, event_id, outcome, price);
+
+CREATE TABLE IF NOT EXISTS api_requests (
+    id INTEGER PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    status INTEGER,  -- HTTP status, NULL when no response arrived
+    latency_ms REAL,
+    requests_remaining INTEGER,  -- quota header, when the API sends it
+    requested_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_api_requests_time
+    ON api_requests (requested_at, status);
+
+-- Raw API responses for the on-disk tier of OddsCache
+CREATE TABLE IF NOT EXISTS api_cache (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,  -- JSON body
+    fetched_at REAL NOT NULL,  -- unix time
+    ttl REAL NOT NULL  -- seconds
+);
+
+-- The Odds API credit balance, as last reported (see OddsBudget)
+CREATE TABLE IF NOT EXISTS api_quota (
+    api TEXT PRIMARY KEY,
+    remaining INTEGER NOT NULL,
+    used INTEGER NOT NULL,
+    updated_at REAL NOT NULL  -- unix time
+);
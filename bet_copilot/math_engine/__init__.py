@@ -1,7 +1,54 @@
 """
 Mathematical engines for sports prediction
 """
-from bet_copilot.math_engine.poisson import PoissonCalculator, MatchSimulator
-from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+from bet_copilot.math_engine.poisson import (
+    PoissonCalculator,
+    MatchSimulator,
+    ScorelineGrid,
+)
+from bet_copilot.math_engine.goal_models import (
+    GoalModel,
+    IndependentPoisson,
+    DixonColes,
+    BivariatePoisson,
+    get_goal_model,
+)
+from bet_copilot.math_engine.lambda_table import LambdaTable, TABLE_MAX_ERROR
+from bet_copilot.math_engine.market_cache import MarketCache, MarketVector
+from bet_copilot.math_engine.team_ratings import RatingEngine, TeamRatings
+from bet_copilot.math_engine.monte_carlo import MonteCarloEstimate, MonteCarloSimulator
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor, BatchPrediction
+from bet_copilot.math_engine.backtest import Backtester, BacktestResult
+from bet_copilot.math_engine.sweep import HyperparameterSweep, SweepResult
+from bet_copilot.math_engine.calibration import CalibrationEvaluator, MarketCalibration
+from bet_copilot.math_engine.margins import NoVigConsensus, no_vig_consensus, remove_margin
 
-__all__ = ["PoissonCalculator", "MatchSimulator", "SoccerPredictor"]
+__all__ = [
+    "PoissonCalculator",
+    "MatchSimulator",
+    "ScorelineGrid",
+    "GoalModel",
+    "IndependentPoisson",
+    "DixonColes",
+    "BivariatePoisson",
+    "get_goal_model",
+    "SoccerPredictor",
+    "BatchPrediction",
+    "MarketCache",
+    "MarketVector",
+    "LambdaTable",
+    "TABLE_MAX_ERROR",
+    "RatingEngine",
+    "TeamRatings",
+    "MonteCarloSimulator",
+    "MonteCarloEstimate",
+    "Backtester",
+    "BacktestResult",
+    "HyperparameterSweep",
+    "SweepResult",
+    "CalibrationEvaluator",
+    "MarketCalibration",
+    "NoVigConsensus",
+    "no_vig_consensus",
+    "remove_margin",
+]
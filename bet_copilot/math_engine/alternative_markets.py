@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from statistics import mean, stdev
 
+import numpy as np
+
 from bet_copilot.models.soccer import TeamForm
 from bet_copilot.math_engine.poisson import PoissonCalculator
 
@@ -293,16 +295,23 @@ class AlternativeMarketsPredictor:
         """
         Calculate over/under probabilities for given thresholds.
         
-        Uses Poisson distribution.
+        Uses Poisson distribution. The CDF is filled once up to the
+        highest threshold and read for every line.
         """
         result = {}
         
+        if not thresholds:
+            return result
+        
+        cdf = self.poisson.cdf_into(
+            expected_value,
+            np.empty(max(max(int(threshold) for threshold in thresholds), 0) + 1)
+        )
+        
         for threshold in thresholds:
             # P(X > threshold) = 1 - P(X <= threshold)
-            cumulative = self.poisson.cumulative_probability(
-                k=int(threshold),
-                lambda_=expected_value
-            )
+            k = int(threshold)
+            cumulative = float(cdf[k]) if k >= 0 else 0.0
             
             over_prob = 1 - cumulative
             under_prob = cumulative
@@ -322,8 +331,9 @@ class AlternativeMarketsPredictor:
         """Calculate probability distribution for values 0 to max_value."""
         distribution = {}
         
-        for k in range(max_value + 1):
-            prob = self.poisson.probability(k, expected_value)
+        pmf = self.poisson.pmf_into(expected_value, np.empty(max_value + 1))
+        
+        for k, prob in enumerate(pmf.tolist()):
             if prob > 0.001:  # Only include meaningful probabilities
                 distribution[k] = round(prob, 4)
         
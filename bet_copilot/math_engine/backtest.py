@@ -0,0 +1,669 @@
+"""
+Historical backtesting of SoccerPredictor + KellyCriterion.
+
+Past seasons are replayed from local CSV files in kickoff order. Before
+each kickoff, lambdas are computed from TeamForm objects that only hold
+matches already played (no lookahead); after it, the result is added to
+both teams' forms. Probabilities and stakes then come from the same code
+used live (SoccerPredictor.predict_many, KellyCriterion.calculate_batch),
+once per season instead of once per fixture.
+
+Each (league, season) is replayed independently with its own bankroll,
+so seasons run in parallel on a process pool. Bets placed at the same
+kickoff are sized from the same bankroll.
+
+CSV columns (first alias found is used; football-data.co.uk names work):
+- date [time], home_team, away_team, home_goals, away_goals
+- optional home_xg / away_xg (goals are used as a proxy when missing)
+- optional league / season (default: parent directory / file stem)
+- odds per market (B365H, PSH, ...) and closing odds (PSCH, ...)
+"""
+
+import csv
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from bet_copilot.config import BACKTEST_BANKROLL, BACKTEST_MIN_HISTORY
+from bet_copilot.math_engine.kelly import KellyCriterion
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+from bet_copilot.models.soccer import MatchResult, PredictionInput, TeamForm
+
+logger = logging.getLogger(__name__)
+
+# Markets priced by the backtest (same names as monte_carlo legs)
+MARKETS = ("home_win", "draw", "away_win", "over_2.5", "under_2.5")
+
+# Mutually exclusive market groups (closing margin is removed per group)
+MARKET_GROUPS = (("home_win", "draw", "away_win"), ("over_2.5", "under_2.5"))
+
+COLUMN_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "date": ("date", "Date"),
+    "time": ("time", "Time"),
+    "home_team": ("home_team", "HomeTeam", "Home"),
+    "away_team": ("away_team", "AwayTeam", "Away"),
+    "home_goals": ("home_goals", "FTHG", "HG"),
+    "away_goals": ("away_goals", "FTAG", "AG"),
+    "home_xg": ("home_xg", "HomeXG", "xg_home"),
+    "away_xg": ("away_xg", "AwayXG", "xg_away"),
+    "league": ("league", "Div", "League"),
+    "season": ("season", "Season"),
+}
+
+ODDS_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "home_win": ("odds_home", "B365H", "PSH", "AvgH"),
+    "draw": ("odds_draw", "B365D", "PSD", "AvgD"),
+    "away_win": ("odds_away", "B365A", "PSA", "AvgA"),
+    "over_2.5": ("odds_over_2.5", "B365>2.5", "P>2.5", "Avg>2.5"),
+    "under_2.5": ("odds_under_2.5", "B365<2.5", "P<2.5", "Avg<2.5"),
+}
+
+CLOSING_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "home_win": ("closing_home", "PSCH", "B365CH", "AvgCH"),
+    "draw": ("closing_draw", "PSCD", "B365CD", "AvgCD"),
+    "away_win": ("closing_away", "PSCA", "B365CA", "AvgCA"),
+    "over_2.5": ("closing_over_2.5", "PC>2.5", "B365C>2.5", "AvgC>2.5"),
+    "under_2.5": ("closing_under_2.5", "PC<2.5", "B365C<2.5", "AvgC<2.5"),
+}
+
+DATE_FORMATS = ("%d/%m/%Y", "%d/%m/%y", "%Y-%m-%d")
+
+
+@dataclass
+class HistoricalFixture:
+    """One past match with the odds available before and at kickoff."""
+
+    kickoff: datetime
+    league: str
+    season: str
+    home_team: str
+    away_team: str
+    home_goals: int
+    away_goals: int
+    home_xg: float
+    away_xg: float
+    odds: Dict[str, float] = field(default_factory=dict)
+    closing_odds: Dict[str, float] = field(default_factory=dict)
+
+    def won(self, market: str) -> bool:
+        """Whether a market from MARKETS won."""
+        if market == "home_win":
+            return self.home_goals > self.away_goals
+        if market == "draw":
+            return self.home_goals == self.away_goals
+        if market == "away_win":
+            return self.home_goals < self.away_goals
+        if market == "over_2.5":
+            return self.home_goals + self.away_goals > 2.5
+        if market == "under_2.5":
+            return self.home_goals + self.away_goals < 2.5
+        raise ValueError(f"Unknown market: {market}")
+
+
+@dataclass
+class BetRecord:
+    """One settled bet in the backtest ledger."""
+
+    kickoff: datetime
+    league: str
+    season: str
+    home_team: str
+    away_team: str
+    market: str
+    model_prob: float
+    odds: float
+    closing_odds: Optional[float]
+    stake_percent: float  # % of bankroll at kickoff
+    stake: float
+    won: bool
+    profit: float
+    bankroll: float  # after every bet of this kickoff settled
+    clv: Optional[float]  # odds × margin-free closing probability - 1
+
+
+@dataclass
+class BacktestMetrics:
+    """Aggregate performance of a set of bets."""
+
+    fixtures: int
+    bets: int
+    wins: int
+    turnover: float
+    profit: float
+    roi: float  # profit / initial bankroll, %
+    yield_percent: float  # profit / turnover, %
+    max_drawdown: float  # largest peak-to-trough bankroll fall, %
+    mean_clv: Optional[float]  # %, over bets with closing odds
+    average_odds: float
+    initial_bankroll: float
+    final_bankroll: float
+    flat_yield: float = 0.0  # profit per unit staked on every bet, %
+    predictions: int = 0  # fixtures with a pre-kickoff prediction
+    log_loss: Optional[float] = None  # 1X2 log-loss over predictions
+    brier: Optional[float] = None  # 1X2 multi-class Brier score
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of bets won."""
+        return self.wins / self.bets if self.bets else 0.0
+
+
+@dataclass
+class SeasonResult:
+    """Backtest of one (league, season)."""
+
+    league: str
+    season: str
+    metrics: BacktestMetrics
+    ledger: List[BetRecord]
+
+
+@dataclass
+class BacktestResult:
+    """Backtest of several seasons."""
+
+    seasons: List[SeasonResult]
+    metrics: BacktestMetrics
+
+    @property
+    def ledger(self) -> List[BetRecord]:
+        """Every bet, ordered by season then kickoff."""
+        return [bet for season in self.seasons for bet in season.ledger]
+
+    def to_csv(self, path: Union[str, Path]):
+        """
+        Write the per-bet ledger as CSV.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        columns = list(BetRecord.__dataclass_fields__)
+        with path.open("w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(columns)
+            for bet in self.ledger:
+                writer.writerow([getattr(bet, name) for name in columns])
+
+
+def _resolve(header: Sequence[str], aliases: Dict[str, Tuple[str, ...]]) -> Dict[str, str]:
+    """Map canonical names to the first alias present in a CSV header."""
+    present = set(header)
+    resolved = {}
+    for name, options in aliases.items():
+        for option in options:
+            if option in present:
+                resolved[name] = option
+                break
+    return resolved
+
+
+def _parse_kickoff(date: str, time: str = "") -> datetime:
+    date = date.strip()
+    try:
+        kickoff = datetime.fromisoformat(date)
+    except ValueError:
+        for fmt in DATE_FORMATS:
+            try:
+                kickoff = datetime.strptime(date, fmt)
+                break
+            except ValueError:
+                continue
+        else:
+            raise ValueError(f"Unrecognized date: {date!r}") from None
+
+    if time and time.strip():
+        hours, minutes = time.strip().split(":")[:2]
+        kickoff = kickoff.replace(hour=int(hours), minute=int(minutes))
+    return kickoff
+
+
+def _odds(row: Dict[str, str], columns: Dict[str, str]) -> Dict[str, float]:
+    odds = {}
+    for market, column in columns.items():
+        value = row.get(column)
+        try:
+            price = float(value)
+        except (TypeError, ValueError):
+            continue
+        if price > 1.0:
+            odds[market] = price
+    return odds
+
+
+def load_fixtures(path: Union[str, Path]) -> Iterator[HistoricalFixture]:
+    """
+    Stream fixtures from a CSV file in kickoff order.
+
+    Rows without teams, goals or a parseable date are skipped with a
+    warning. Files are normally already chronological; otherwise rows are
+    sorted (stable) before being yielded.
+
+    Args:
+        path: CSV file
+
+    Yields:
+        HistoricalFixture
+    """
+    path = Path(path)
+    with path.open(newline="", encoding="utf-8-sig") as handle:
+        reader = csv.DictReader(handle)
+        header = reader.fieldnames or []
+        columns = _resolve(header, COLUMN_ALIASES)
+        missing = [
+            name for name in ("date", "home_team", "away_team", "home_goals", "away_goals")
+            if name not in columns
+        ]
+        if missing:
+            raise ValueError(f"{path}: missing columns {missing}")
+
+        odds_columns = _resolve(header, ODDS_ALIASES)
+        closing_columns = _resolve(header, CLOSING_ALIASES)
+        default_league = path.parent.name
+        default_season = path.stem
+
+        fixtures = []
+        skipped = 0
+        for row in reader:
+            try:
+                home_goals = int(row[columns["home_goals"]])
+                away_goals = int(row[columns["away_goals"]])
+                home_xg = row.get(columns.get("home_xg", ""), "")
+                away_xg = row.get(columns.get("away_xg", ""), "")
+                fixture = HistoricalFixture(
+                    kickoff=_parse_kickoff(row[columns["date"]], row.get(columns.get("time", ""), "")),
+                    league=row.get(columns.get("league", ""), "") or default_league,
+                    season=row.get(columns.get("season", ""), "") or default_season,
+                    home_team=row[columns["home_team"]].strip(),
+                    away_team=row[columns["away_team"]].strip(),
+                    home_goals=home_goals,
+                    away_goals=away_goals,
+                    home_xg=float(home_xg) if home_xg else float(home_goals),
+                    away_xg=float(away_xg) if away_xg else float(away_goals),
+                    odds=_odds(row, odds_columns),
+                    closing_odds=_odds(row, closing_columns),
+                )
+            except (TypeError, ValueError, KeyError):
+                skipped += 1
+                continue
+            if not fixture.home_team or not fixture.away_team:
+                skipped += 1
+                continue
+            fixtures.append(fixture)
+
+    if skipped:
+        logger.warning(f"{path}: skipped {skipped} unparseable rows")
+
+    if any(a.kickoff > b.kickoff for a, b in zip(fixtures, fixtures[1:])):
+        fixtures.sort(key=lambda fixture: fixture.kickoff)
+
+    yield from fixtures
+
+
+def load_seasons(paths: Sequence[Union[str, Path]]) -> List[List[HistoricalFixture]]:
+    """
+    Load CSV files and split them into (league, season) groups.
+
+    A file may hold several seasons and a season may span several files;
+    groups keep first-appearance order and are in kickoff order.
+
+    Args:
+        paths: CSV files (see load_fixtures)
+
+    Returns:
+        Fixtures of each (league, season)
+    """
+    seasons: Dict[Tuple[str, str], List[HistoricalFixture]] = {}
+    for path in paths:
+        for fixture in load_fixtures(path):
+            seasons.setdefault((fixture.league, fixture.season), []).append(fixture)
+
+    for fixtures in seasons.values():
+        if any(a.kickoff > b.kickoff for a, b in zip(fixtures, fixtures[1:])):
+            fixtures.sort(key=lambda fixture: fixture.kickoff)
+    return list(seasons.values())
+
+
+def _closing_fair_probabilities(fixture: HistoricalFixture) -> Dict[str, float]:
+    """Margin-free closing probabilities (proportional) per market group."""
+    fair = {}
+    for group in MARKET_GROUPS:
+        prices = [fixture.closing_odds.get(market) for market in group]
+        if any(price is None for price in prices):
+            continue
+        overround = sum(1 / price for price in prices)
+        for market, price in zip(group, prices):
+            fair[market] = 1 / price / overround
+    return fair
+
+
+def _max_drawdown(bankroll: np.ndarray) -> float:
+    """Largest peak-to-trough fall of a bankroll path, in %."""
+    if bankroll.size == 0:
+        return 0.0
+    peaks = np.maximum.accumulate(bankroll)
+    return float(np.max(1 - bankroll / peaks) * 100)
+
+
+def _outcome_scores(fixtures: Sequence[HistoricalFixture], indices: Sequence[int], batch) -> Tuple[float, float]:
+    """1X2 log-loss and multi-class Brier score of a season's predictions."""
+    probs = np.column_stack([batch.home_win, batch.draw, batch.away_win])
+    probs = probs / probs.sum(axis=1, keepdims=True)
+    goals = np.array([(fixtures[i].home_goals, fixtures[i].away_goals) for i in indices])
+    outcome = np.where(goals[:, 0] > goals[:, 1], 0, np.where(goals[:, 0] == goals[:, 1], 1, 2))
+
+    actual = np.zeros_like(probs)
+    actual[np.arange(len(outcome)), outcome] = 1
+    observed = np.clip(probs[np.arange(len(outcome)), outcome], 1e-15, 1.0)
+
+    log_loss = float(-np.mean(np.log(observed)))
+    brier = float(np.mean(np.sum((probs - actual) ** 2, axis=1)))
+    return log_loss, brier
+
+
+def _metrics(
+    ledger: Sequence[BetRecord],
+    fixtures: int,
+    initial_bankroll: float,
+    final_bankroll: float,
+    max_drawdown: float,
+    predictions: int = 0,
+    log_loss: Optional[float] = None,
+    brier: Optional[float] = None,
+) -> BacktestMetrics:
+    turnover = sum(bet.stake for bet in ledger)
+    profit = sum(bet.profit for bet in ledger)
+    flat_profit = sum(bet.odds - 1 if bet.won else -1.0 for bet in ledger)
+    clv = [bet.clv for bet in ledger if bet.clv is not None]
+
+    return BacktestMetrics(
+        fixtures=fixtures,
+        bets=len(ledger),
+        wins=sum(bet.won for bet in ledger),
+        turnover=round(turnover, 2),
+        profit=round(profit, 2),
+        roi=round(profit / initial_bankroll * 100, 2) if initial_bankroll else 0.0,
+        yield_percent=round(profit / turnover * 100, 2) if turnover else 0.0,
+        max_drawdown=round(max_drawdown, 2),
+        mean_clv=round(float(np.mean(clv)) * 100, 2) if clv else None,
+        average_odds=round(float(np.mean([bet.odds for bet in ledger])), 3) if ledger else 0.0,
+        initial_bankroll=initial_bankroll,
+        final_bankroll=round(final_bankroll, 2),
+        flat_yield=round(flat_profit / len(ledger) * 100, 2) if ledger else 0.0,
+        predictions=predictions,
+        log_loss=round(log_loss, 4) if log_loss is not None else None,
+        brier=round(brier, 4) if brier is not None else None,
+    )
+
+
+class Backtester:
+    """
+    Replays historical fixtures through SoccerPredictor and KellyCriterion.
+
+    Example:
+        >>> backtester = Backtester(min_history=3)
+        >>> result = backtester.run(["data/E0/2023.csv", "data/E0/2024.csv"], workers=2)
+        >>> result.metrics.bets, result.metrics.yield_percent
+        (412, -1.8)
+    """
+
+    def __init__(
+        self,
+        predictor: Optional[SoccerPredictor] = None,
+        kelly: Optional[KellyCriterion] = None,
+        markets: Sequence[str] = MARKETS,
+        min_history: int = BACKTEST_MIN_HISTORY,
+        initial_bankroll: float = BACKTEST_BANKROLL,
+    ):
+        """
+        Initialize backtester.
+
+        Args:
+            predictor: Predictor under test (default SoccerPredictor())
+            kelly: Stake sizing (default KellyCriterion())
+            markets: Markets to bet, subset of MARKETS
+            min_history: Matches each team needs before its fixtures are bet
+            initial_bankroll: Bankroll at the start of every season
+        """
+        unknown = [market for market in markets if market not in MARKETS]
+        if unknown:
+            raise ValueError(f"Unknown markets: {unknown} (expected a subset of {MARKETS})")
+        if initial_bankroll <= 0:
+            raise ValueError("initial_bankroll must be positive")
+
+        self.predictor = predictor or SoccerPredictor()
+        self.kelly = kelly or KellyCriterion()
+        self.markets = tuple(markets)
+        self.min_history = min_history
+        self.initial_bankroll = initial_bankroll
+
+    def _lambdas(self, fixtures: Sequence[HistoricalFixture]) -> Tuple[List[int], List[float], List[float]]:
+        """
+        Pre-kickoff lambdas for every fixture with enough history.
+
+        Fixtures sharing a kickoff are all priced before any of their
+        results is added to the forms.
+        """
+        predictor = self.predictor
+        forms: Dict[str, TeamForm] = {}
+        indices, lambda_home, lambda_away = [], [], []
+
+        start = 0
+        while start < len(fixtures):
+            end = start
+            while end < len(fixtures) and fixtures[end].kickoff == fixtures[start].kickoff:
+                end += 1
+
+            for i in range(start, end):
+                fixture = fixtures[i]
+                home, away = forms.get(fixture.home_team), forms.get(fixture.away_team)
+                if home is None or away is None:
+                    continue
+                if len(home.matches) < self.min_history or len(away.matches) < self.min_history:
+                    continue
+
+                prediction_input = PredictionInput(
+                    home_team=home,
+                    away_team=away,
+                    matches_to_consider=predictor.matches_to_consider,
+                    home_advantage_factor=predictor.home_advantage_factor,
+                    half_life_days=predictor.half_life_days,
+                )
+                indices.append(i)
+                lambda_home.append(prediction_input.get_home_lambda())
+                lambda_away.append(prediction_input.get_away_lambda())
+
+            for fixture in fixtures[start:end]:
+                for is_home, team in ((True, fixture.home_team), (False, fixture.away_team)):
+                    if team not in forms:
+                        forms[team] = TeamForm(team_name=team)
+                    forms[team].add_match(MatchResult(
+                        date=fixture.kickoff,
+                        home_team=fixture.home_team,
+                        away_team=fixture.away_team,
+                        home_goals=fixture.home_goals,
+                        away_goals=fixture.away_goals,
+                        home_xg=fixture.home_xg,
+                        away_xg=fixture.away_xg,
+                        is_home=is_home,
+                    ))
+            start = end
+
+        return indices, lambda_home, lambda_away
+
+    def run_season(self, fixtures: Iterable[HistoricalFixture]) -> SeasonResult:
+        """
+        Backtest one season.
+
+        Args:
+            fixtures: Fixtures of one (league, season), in kickoff order
+
+        Returns:
+            SeasonResult with metrics and ledger
+        """
+        fixtures = list(fixtures)
+        league = fixtures[0].league if fixtures else ""
+        season = fixtures[0].season if fixtures else ""
+
+        indices, lambda_home, lambda_away = self._lambdas(fixtures)
+        if not indices:
+            metrics = _metrics([], len(fixtures), self.initial_bankroll, self.initial_bankroll, 0.0)
+            return SeasonResult(league, season, metrics, [])
+
+        batch = self.predictor.predict_many(
+            lambda_home, lambda_away, total_lines=(2.5,), keep_scorelines=False
+        )
+        over, under = batch.over_under(2.5)
+        probabilities = {
+            "home_win": batch.home_win,
+            "draw": batch.draw,
+            "away_win": batch.away_win,
+            "over_2.5": over,
+            "under_2.5": under,
+        }
+
+        # Candidate (fixture, market) pairs with odds, in kickoff order
+        rows, markets, probs, odds = [], [], [], []
+        for k, i in enumerate(indices):
+            for market in self.markets:
+                price = fixtures[i].odds.get(market)
+                if price is not None:
+                    rows.append(i)
+                    markets.append(market)
+                    probs.append(probabilities[market][k])
+                    odds.append(price)
+
+        ledger: List[BetRecord] = []
+        path = [self.initial_bankroll]
+        if rows:
+            kelly = self.kelly.calculate_batch(probs, odds)
+            bets = np.flatnonzero(kelly.is_value_bet)
+            ledger, path = self._settle(fixtures, rows, markets, kelly, bets)
+
+        log_loss, brier = _outcome_scores(fixtures, indices, batch)
+        metrics = _metrics(
+            ledger, len(fixtures), self.initial_bankroll, path[-1], _max_drawdown(np.asarray(path)),
+            predictions=len(indices), log_loss=log_loss, brier=brier,
+        )
+        logger.info(
+            f"Backtest {league} {season}: {len(fixtures)} fixtures, {metrics.bets} bets, "
+            f"yield {metrics.yield_percent}%, ROI {metrics.roi}%"
+        )
+        return SeasonResult(league, season, metrics, ledger)
+
+    def _settle(self, fixtures, rows, markets, kelly, bets) -> Tuple[List[BetRecord], List[float]]:
+        """Size bets from the bankroll at each kickoff and settle them."""
+        ledger: List[BetRecord] = []
+        bankroll = self.initial_bankroll
+        path = [bankroll]
+        fair_cache: Dict[int, Dict[str, float]] = {}
+
+        start = 0
+        while start < len(bets):
+            kickoff = fixtures[rows[bets[start]]].kickoff
+            end = start
+            while end < len(bets) and fixtures[rows[bets[end]]].kickoff == kickoff:
+                end += 1
+
+            # Never stake more than the whole bankroll on one kickoff
+            percents = kelly.recommended_stake[bets[start:end]]
+            scale = min(1.0, 100.0 / percents.sum()) if percents.sum() > 0 else 1.0
+
+            group: List[BetRecord] = []
+            settled_profit = 0.0
+            for j in bets[start:end]:
+                fixture, market = fixtures[rows[j]], markets[j]
+                stake_percent = float(kelly.recommended_stake[j]) * scale
+                stake = bankroll * stake_percent / 100
+                price = float(kelly.odds[j])
+                won = fixture.won(market)
+                profit = stake * (price - 1) if won else -stake
+                settled_profit += profit
+
+                if rows[j] not in fair_cache:
+                    fair_cache[rows[j]] = _closing_fair_probabilities(fixture)
+                fair = fair_cache[rows[j]].get(market)
+
+                group.append(BetRecord(
+                    kickoff=fixture.kickoff,
+                    league=fixture.league,
+                    season=fixture.season,
+                    home_team=fixture.home_team,
+                    away_team=fixture.away_team,
+                    market=market,
+                    model_prob=round(float(kelly.model_prob[j]), 4),
+                    odds=price,
+                    closing_odds=fixture.closing_odds.get(market),
+                    stake_percent=round(stake_percent, 4),
+                    stake=round(stake, 2),
+                    won=won,
+                    profit=round(profit, 2),
+                    bankroll=0.0,
+                    clv=round(price * fair - 1, 4) if fair is not None else None,
+                ))
+
+            bankroll += settled_profit
+            for bet in group:
+                bet.bankroll = round(bankroll, 2)
+            ledger.extend(group)
+            path.append(bankroll)
+            start = end
+
+        return ledger, path
+
+    def run(self, paths: Sequence[Union[str, Path]], workers: int = 1) -> BacktestResult:
+        """
+        Backtest several season files.
+
+        Args:
+            paths: CSV files (one or more seasons each)
+            workers: Processes used, one season per task (1 = in-process)
+
+        Returns:
+            BacktestResult with per-season results and aggregate metrics
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        groups = load_seasons(paths)
+        if workers > 1 and len(groups) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(groups))) as pool:
+                seasons = list(pool.map(self.run_season, groups))
+        else:
+            seasons = [self.run_season(fixtures) for fixtures in groups]
+
+        return BacktestResult(seasons=seasons, metrics=self.aggregate(seasons))
+
+    @staticmethod
+    def aggregate(seasons: Sequence[SeasonResult]) -> BacktestMetrics:
+        """
+        Combine season metrics (bankrolls are independent per season).
+
+        ROI is relative to the sum of initial bankrolls; drawdown is the
+        worst season's; log-loss and Brier are weighted by predictions.
+        """
+        ledger = [bet for season in seasons for bet in season.ledger]
+        scored = [season.metrics for season in seasons if season.metrics.predictions]
+        predictions = sum(metrics.predictions for metrics in scored)
+
+        def weighted(name: str) -> Optional[float]:
+            if not predictions:
+                return None
+            return sum(getattr(metrics, name) * metrics.predictions for metrics in scored) / predictions
+
+        return _metrics(
+            ledger,
+            fixtures=sum(season.metrics.fixtures for season in seasons),
+            initial_bankroll=sum(season.metrics.initial_bankroll for season in seasons),
+            final_bankroll=sum(season.metrics.final_bankroll for season in seasons),
+            max_drawdown=max((season.metrics.max_drawdown for season in seasons), default=0.0),
+            predictions=predictions,
+            log_loss=weighted("log_loss"),
+            brier=weighted("brier"),
+        )
@@ -0,0 +1,564 @@
+"""
+Streaming calibration and scoring rules for predicted probabilities.
+
+(prediction, result) pairs are consumed one at a time and folded into
+fixed-size accumulators per market: sums for log-loss, Brier score and
+ranked probability score (RPS), plus reliability-diagram bins per outcome.
+Memory does not grow with the number of predictions, and accumulators from
+several workers (or files) are merged by adding them.
+
+Markets and their outcomes (ordered, for RPS):
+- "1x2": home_win, draw, away_win
+- "over_under_2.5": under, over
+- "btts": no, yes
+- "corners_<line>" / "cards_<line>": under, over
+"""
+
+import json
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from bet_copilot.config import CALIBRATION_BINS
+from bet_copilot.math_engine.alternative_markets import AlternativeMarketPrediction
+from bet_copilot.models.soccer import MatchPrediction, MatchResult
+
+logger = logging.getLogger(__name__)
+
+OUTCOMES_1X2 = ("home_win", "draw", "away_win")
+OUTCOMES_TOTALS = ("under", "over")
+OUTCOMES_BTTS = ("no", "yes")
+
+# Alternative markets scored from over/under lines
+COUNT_MARKETS = ("corners", "cards")
+
+EPSILON = 1e-15  # Probability floor for log-loss
+
+
+@dataclass
+class ReliabilityBin:
+    """One bin of a reliability diagram."""
+
+    lower: float
+    upper: float
+    count: int
+    mean_predicted: float
+    observed_frequency: float
+
+
+class MarketCalibration:
+    """
+    Constant-memory accumulator of scores for one market.
+
+    Example:
+        >>> scores = MarketCalibration(("under", "over"), bins=5)
+        >>> scores.update([0.4, 0.6], 1)
+        >>> scores.update([0.7, 0.3], 0)
+        >>> scores.count, scores.brier
+        (2, 0.25)
+    """
+
+    def __init__(self, outcomes: Sequence[str], bins: int = CALIBRATION_BINS):
+        """
+        Initialize accumulator.
+
+        Args:
+            outcomes: Outcome names, in order (RPS uses the cumulative order)
+            bins: Equal-width reliability bins on [0, 1]
+        """
+        if len(outcomes) < 2:
+            raise ValueError("A market needs at least two outcomes")
+        if bins < 1:
+            raise ValueError("bins must be at least 1")
+
+        self.outcomes = tuple(outcomes)
+        self.bins = bins
+        self.count = 0
+        self.log_loss_sum = 0.0
+        self.brier_sum = 0.0
+        self.rps_sum = 0.0
+        shape = (len(self.outcomes), bins)
+        self.bin_count = np.zeros(shape, dtype=np.int64)
+        self.bin_predicted = np.zeros(shape)
+        self.bin_observed = np.zeros(shape)
+
+    def update(self, probabilities: Sequence[float], outcome: Union[int, Sequence[int]]):
+        """
+        Add one prediction, or a batch of them.
+
+        Probabilities are renormalized to sum to 1 (grids are truncated and
+        published probabilities are rounded).
+
+        Args:
+            probabilities: (K,) or (N, K) probabilities in outcome order
+            outcome: Index of the observed outcome, or (N,) indices
+        """
+        if isinstance(outcome, (int, np.integer)) and len(probabilities) == len(self.outcomes):
+            try:
+                self._update_one([float(prob) for prob in probabilities], int(outcome))
+                return
+            except TypeError:
+                pass  # a (1, K) batch; handled below
+
+        probs = np.atleast_2d(np.asarray(probabilities, dtype=float))
+        observed = np.atleast_1d(np.asarray(outcome, dtype=np.int64))
+        k = len(self.outcomes)
+        if probs.shape[1] != k or probs.shape[0] != observed.shape[0]:
+            raise ValueError(f"Expected ({observed.shape[0]}, {k}) probabilities, got {probs.shape}")
+        if np.any((observed < 0) | (observed >= k)):
+            raise ValueError(f"Outcome index out of range for {self.outcomes}")
+        if np.any(probs < 0):
+            raise ValueError("Probabilities must be non-negative")
+        totals = probs.sum(axis=1, keepdims=True)
+        if np.any(totals <= 0):
+            raise ValueError("Probabilities must not all be zero")
+        probs = probs / totals
+
+        rows = np.arange(len(observed))
+        actual = np.zeros_like(probs)
+        actual[rows, observed] = 1.0
+
+        self.count += len(observed)
+        self.log_loss_sum += float(-np.log(np.clip(probs[rows, observed], EPSILON, 1.0)).sum())
+        self.brier_sum += float(((probs - actual) ** 2).sum())
+        cumulative = np.cumsum(probs - actual, axis=1)[:, :-1]
+        self.rps_sum += float((cumulative ** 2).sum() / (k - 1))
+
+        index = np.minimum((probs * self.bins).astype(np.int64), self.bins - 1)
+        for j in range(k):
+            self.bin_count[j] += np.bincount(index[:, j], minlength=self.bins)
+            self.bin_predicted[j] += np.bincount(index[:, j], probs[:, j], minlength=self.bins)
+            self.bin_observed[j] += np.bincount(index[:, j], actual[:, j], minlength=self.bins)
+
+    def _update_one(self, probs: List[float], outcome: int):
+        """Scalar path of update() for a single prediction (the streaming case)."""
+        k = len(probs)
+        if not 0 <= outcome < k:
+            raise ValueError(f"Outcome index out of range for {self.outcomes}")
+        if min(probs) < 0:
+            raise ValueError("Probabilities must be non-negative")
+        total = sum(probs)
+        if total <= 0:
+            raise ValueError("Probabilities must not all be zero")
+        probs = [prob / total for prob in probs]
+
+        self.count += 1
+        self.log_loss_sum -= math.log(min(max(probs[outcome], EPSILON), 1.0))
+        cumulative = rps = brier = 0.0
+        for j, prob in enumerate(probs):
+            hit = 1.0 if j == outcome else 0.0
+            brier += (prob - hit) ** 2
+            if j < k - 1:
+                cumulative += prob - hit
+                rps += cumulative ** 2
+
+            b = min(int(prob * self.bins), self.bins - 1)
+            self.bin_count[j, b] += 1
+            self.bin_predicted[j, b] += prob
+            self.bin_observed[j, b] += hit
+        self.brier_sum += brier
+        self.rps_sum += rps / (k - 1)
+
+    def merge(self, other: "MarketCalibration") -> "MarketCalibration":
+        """
+        Add another accumulator of the same market into this one.
+
+        Returns:
+            self
+        """
+        if other.outcomes != self.outcomes or other.bins != self.bins:
+            raise ValueError(
+                f"Cannot merge {other.outcomes}/{other.bins} bins into {self.outcomes}/{self.bins} bins"
+            )
+        self.count += other.count
+        self.log_loss_sum += other.log_loss_sum
+        self.brier_sum += other.brier_sum
+        self.rps_sum += other.rps_sum
+        self.bin_count += other.bin_count
+        self.bin_predicted += other.bin_predicted
+        self.bin_observed += other.bin_observed
+        return self
+
+    @property
+    def log_loss(self) -> Optional[float]:
+        """Mean negative log-likelihood of the observed outcomes."""
+        return round(self.log_loss_sum / self.count, 6) if self.count else None
+
+    @property
+    def brier(self) -> Optional[float]:
+        """Mean multi-class Brier score (0 = perfect, 2 = worst)."""
+        return round(self.brier_sum / self.count, 6) if self.count else None
+
+    @property
+    def rps(self) -> Optional[float]:
+        """Mean ranked probability score (0 = perfect, 1 = worst)."""
+        return round(self.rps_sum / self.count, 6) if self.count else None
+
+    @property
+    def calibration_error(self) -> Optional[float]:
+        """Expected calibration error over every outcome's bins."""
+        if not self.count:
+            return None
+        gap = np.abs(self.bin_predicted - self.bin_observed).sum()
+        return round(float(gap / (self.count * len(self.outcomes))), 6)
+
+    def reliability(self, outcome: Optional[str] = None) -> List[ReliabilityBin]:
+        """
+        Reliability-diagram bins.
+
+        Args:
+            outcome: One outcome's bins (default: pooled over outcomes)
+
+        Returns:
+            Non-empty bins, lowest probability first
+        """
+        if outcome is None:
+            count = self.bin_count.sum(axis=0)
+            predicted = self.bin_predicted.sum(axis=0)
+            observed = self.bin_observed.sum(axis=0)
+        elif outcome in self.outcomes:
+            j = self.outcomes.index(outcome)
+            count, predicted, observed = self.bin_count[j], self.bin_predicted[j], self.bin_observed[j]
+        else:
+            raise ValueError(f"Unknown outcome: {outcome} (expected one of {self.outcomes})")
+
+        width = 1.0 / self.bins
+        return [
+            ReliabilityBin(
+                lower=round(b * width, 6),
+                upper=round((b + 1) * width, 6),
+                count=int(count[b]),
+                mean_predicted=round(float(predicted[b] / count[b]), 4),
+                observed_frequency=round(float(observed[b] / count[b]), 4),
+            )
+            for b in range(self.bins)
+            if count[b]
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable state (see from_dict)."""
+        return {
+            "outcomes": list(self.outcomes),
+            "bins": self.bins,
+            "count": self.count,
+            "log_loss_sum": self.log_loss_sum,
+            "brier_sum": self.brier_sum,
+            "rps_sum": self.rps_sum,
+            "bin_count": self.bin_count.tolist(),
+            "bin_predicted": self.bin_predicted.tolist(),
+            "bin_observed": self.bin_observed.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "MarketCalibration":
+        """Rebuild an accumulator written by to_dict."""
+        scores = cls(data["outcomes"], data["bins"])
+        scores.count = data["count"]
+        scores.log_loss_sum = data["log_loss_sum"]
+        scores.brier_sum = data["brier_sum"]
+        scores.rps_sum = data["rps_sum"]
+        scores.bin_count = np.asarray(data["bin_count"], dtype=np.int64)
+        scores.bin_predicted = np.asarray(data["bin_predicted"], dtype=float)
+        scores.bin_observed = np.asarray(data["bin_observed"], dtype=float)
+        return scores
+
+
+def _get(obj: Any, name: str, default: Any = None) -> Any:
+    """Attribute or key lookup (dataclasses and parsed JSON alike)."""
+    if isinstance(obj, Mapping):
+        return obj.get(name, default)
+    return getattr(obj, name, default)
+
+
+def _observed_totals(result: Any) -> Tuple[int, int, Optional[int], Optional[int]]:
+    """Goals, total corners and total cards (yellow + 2 × red) of a result."""
+    home_goals, away_goals = int(_get(result, "home_goals")), int(_get(result, "away_goals"))
+
+    corners = _get(result, "corners")
+    if corners is None:
+        home_corners, away_corners = _get(result, "home_corners"), _get(result, "away_corners")
+        if home_corners is not None and away_corners is not None:
+            corners = home_corners + away_corners
+
+    cards = _get(result, "cards")
+    if cards is None and (
+        _get(result, "home_yellow_cards") is not None or _get(result, "away_yellow_cards") is not None
+    ):
+        cards = (
+            (_get(result, "home_yellow_cards") or 0) + (_get(result, "home_red_cards") or 0) * 2
+            + (_get(result, "away_yellow_cards") or 0) + (_get(result, "away_red_cards") or 0) * 2
+        )
+    return home_goals, away_goals, corners, cards
+
+
+def _checked(probabilities: Sequence[Any]) -> List[float]:
+    """Probabilities as floats, rejecting what MarketCalibration.update would."""
+    probs = [float(prob) for prob in probabilities]
+    if not all(math.isfinite(prob) and prob >= 0 for prob in probs):
+        raise ValueError("Probabilities must be finite and non-negative")
+    if sum(probs) <= 0:
+        raise ValueError("Probabilities must not all be zero")
+    return probs
+
+
+def _lines(predictions: Any) -> Dict[float, Mapping[str, float]]:
+    """Over/under probabilities by line, from a prediction or a JSON mapping."""
+    if predictions is None:
+        return {}
+    if isinstance(predictions, AlternativeMarketPrediction):
+        predictions = predictions.over_under_predictions
+    return {float(line): probs for line, probs in predictions.items()}
+
+
+class CalibrationEvaluator:
+    """
+    Online log-loss, Brier, RPS and reliability bins per market.
+
+    Example:
+        >>> evaluator = CalibrationEvaluator()
+        >>> evaluator.consume_jsonl("predictions.jsonl")
+        >>> evaluator.markets["1x2"].log_loss, evaluator.markets["1x2"].rps
+        (0.9843, 0.2011)
+    """
+
+    def __init__(self, bins: int = CALIBRATION_BINS):
+        """
+        Initialize evaluator.
+
+        Args:
+            bins: Reliability bins per outcome
+        """
+        if bins < 1:
+            raise ValueError("bins must be at least 1")
+        self.bins = bins
+        self.markets: Dict[str, MarketCalibration] = {}
+        self.skipped = 0  # JSONL records that could not be scored
+
+    def update(
+        self,
+        market: str,
+        outcomes: Sequence[str],
+        probabilities: Sequence[float],
+        outcome: Union[int, Sequence[int]],
+    ):
+        """
+        Score one prediction (or a batch) of any market.
+
+        Args:
+            market: Market name
+            outcomes: Outcome names in order
+            probabilities: (K,) or (N, K) probabilities
+            outcome: Observed outcome index, or (N,) indices
+        """
+        scores = self.markets.get(market)
+        if scores is None:
+            # Registered only once it holds a row
+            scores = MarketCalibration(outcomes, self.bins)
+            scores.update(probabilities, outcome)
+            self.markets[market] = scores
+            return
+        if scores.outcomes != tuple(outcomes):
+            raise ValueError(f"{market}: outcomes {tuple(outcomes)} do not match {scores.outcomes}")
+        scores.update(probabilities, outcome)
+
+    def add(
+        self,
+        prediction: Union[MatchPrediction, Mapping[str, Any]],
+        result: Union[MatchResult, Mapping[str, Any]],
+        alternatives: Sequence[AlternativeMarketPrediction] = (),
+    ):
+        """
+        Score every market a prediction covers against the final result.
+
+        Args:
+            prediction: MatchPrediction, or a mapping with its field names
+                        (or the layout of MatchPrediction.to_dict or
+                        SoccerPredictor.predict_match_summary)
+                        plus optional "corners" / "cards" {line: {over, under}}
+            result: MatchResult, or a mapping with home_goals, away_goals and
+                    optional corners / cards totals (or per-team counts)
+            alternatives: Corners / cards predictions for the same match
+        """
+        home_goals, away_goals, corners, cards = _observed_totals(result)
+        goal_total = home_goals + away_goals
+        scored: List[Tuple[str, Sequence[str], List[float], int]] = []
+
+        summary = _get(prediction, "outcome_probabilities")
+        if summary is None and isinstance(prediction, Mapping):
+            summary = prediction.get("probabilities")  # MatchPrediction.to_dict()
+        if summary is not None:
+            probs_1x2 = [summary[name] for name in OUTCOMES_1X2]
+        else:
+            probs_1x2 = [
+                _get(prediction, "home_win_prob"), _get(prediction, "draw_prob"), _get(prediction, "away_win_prob")
+            ]
+        if all(prob is not None for prob in probs_1x2):
+            outcome = 0 if home_goals > away_goals else 1 if home_goals == away_goals else 2
+            scored.append(("1x2", OUTCOMES_1X2, probs_1x2, outcome))
+
+        over_under = _get(prediction, "over_under_2_5")
+        if over_under:
+            scored.append(
+                ("over_under_2.5", OUTCOMES_TOTALS, [over_under["under"], over_under["over"]], int(goal_total > 2.5))
+            )
+
+        btts = _get(prediction, "btts")
+        if btts:
+            scored.append(("btts", OUTCOMES_BTTS, [btts["no"], btts["yes"]], int(home_goals > 0 and away_goals > 0)))
+
+        observed = {"corners": corners, "cards": cards}
+        lines = {market: _lines(_get(prediction, market)) for market in COUNT_MARKETS}
+        for alternative in alternatives:
+            if alternative.market_type in lines:
+                lines[alternative.market_type].update(_lines(alternative))
+        for market in COUNT_MARKETS:
+            if observed[market] is None:
+                continue
+            for line, probs in sorted(lines[market].items()):
+                scored.append(
+                    (f"{market}_{line}", OUTCOMES_TOTALS, [probs["under"], probs["over"]], int(observed[market] > line))
+                )
+
+        # Validate every market first: nothing is recorded for a pair with
+        # an unreadable market
+        checked = []
+        for market, outcomes, probabilities, outcome in scored:
+            known = self.markets.get(market)
+            if known is not None and known.outcomes != tuple(outcomes):
+                raise ValueError(f"{market}: outcomes {tuple(outcomes)} do not match {known.outcomes}")
+            checked.append((market, outcomes, _checked(probabilities), outcome))
+        for market, outcomes, probabilities, outcome in checked:
+            self.update(market, outcomes, probabilities, outcome)
+
+    def consume(self, pairs: Iterable[Tuple[Any, Any]]) -> "CalibrationEvaluator":
+        """
+        Score a stream of (prediction, result) pairs.
+
+        Returns:
+            self
+        """
+        for prediction, result in pairs:
+            self.add(prediction, result)
+        return self
+
+    def consume_jsonl(self, path: Union[str, Path]) -> "CalibrationEvaluator":
+        """
+        Score a JSONL file line by line.
+
+        Each line is {"prediction": {...}, "result": {...}} (see add).
+        Unparseable or incomplete lines are counted in `skipped`.
+
+        Args:
+            path: JSONL file
+
+        Returns:
+            self
+        """
+        path = Path(path)
+        skipped = 0
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    self.add(record["prediction"], record["result"])
+                except (KeyError, TypeError, ValueError):
+                    skipped += 1
+        if skipped:
+            logger.warning(f"{path}: skipped {skipped} unscorable records")
+        self.skipped += skipped
+        return self
+
+    def merge(self, other: "CalibrationEvaluator") -> "CalibrationEvaluator":
+        """
+        Add another evaluator's partial results into this one.
+
+        Returns:
+            self
+        """
+        if other.bins != self.bins:
+            raise ValueError(f"Cannot merge {other.bins} bins into {self.bins} bins")
+        for market, scores in other.markets.items():
+            if market in self.markets:
+                self.markets[market].merge(scores)
+            else:
+                self.markets[market] = MarketCalibration.from_dict(scores.to_dict())
+        self.skipped += other.skipped
+        return self
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Scores per market: count, log_loss, brier, rps, calibration_error."""
+        return {
+            market: {
+                "count": scores.count,
+                "log_loss": scores.log_loss,
+                "brier": scores.brier,
+                "rps": scores.rps,
+                "calibration_error": scores.calibration_error,
+            }
+            for market, scores in sorted(self.markets.items())
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable state, e.g. to merge partial results later."""
+        return {
+            "bins": self.bins,
+            "skipped": self.skipped,
+            "markets": {market: scores.to_dict() for market, scores in self.markets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "CalibrationEvaluator":
+        """Rebuild an evaluator written by to_dict."""
+        evaluator = cls(data["bins"])
+        evaluator.skipped = data.get("skipped", 0)
+        evaluator.markets = {
+            market: MarketCalibration.from_dict(scores) for market, scores in data["markets"].items()
+        }
+        return evaluator
+
+    @classmethod
+    def from_jsonl(
+        cls,
+        paths: Sequence[Union[str, Path]],
+        workers: int = 1,
+        bins: int = CALIBRATION_BINS,
+    ) -> "CalibrationEvaluator":
+        """
+        Score several JSONL files, one per process, and merge the results.
+
+        Args:
+            paths: JSONL files
+            workers: Processes used (1 = in-process)
+            bins: Reliability bins per outcome
+
+        Returns:
+            Merged CalibrationEvaluator
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        paths = [Path(path) for path in paths]
+        tasks = [(path, bins) for path in paths]
+        if workers > 1 and len(paths) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+                partials = list(pool.map(_evaluate_file, tasks))
+        else:
+            partials = [_evaluate_file(task) for task in tasks]
+
+        evaluator = cls(bins)
+        for partial in partials:
+            evaluator.merge(partial)
+        return evaluator
+
+
+def _evaluate_file(task: Tuple[Path, int]) -> CalibrationEvaluator:
+    """Score one JSONL file (pool worker)."""
+    path, bins = task
+    return CalibrationEvaluator(bins).consume_jsonl(path)
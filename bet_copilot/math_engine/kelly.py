@@ -4,17 +4,27 @@ Uses fractional Kelly for conservative approach.
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from bet_copilot.config import (
     KELLY_FRACTION,
+    MAX_PORTFOLIO_EXPOSURE,
     MAX_STAKE_PERCENT,
     MIN_EV_THRESHOLD,
+    PORTFOLIO_SCENARIOS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Risk level names indexed by the codes returned in KellyBatch.risk_code
+RISK_LEVELS = ("LOW", "MEDIUM", "HIGH")
+
+# Stake (%) boundaries between risk levels
+RISK_THRESHOLDS = (1.0, 3.0)
+
 
 @dataclass
 class KellyRecommendation:
@@ -30,6 +40,194 @@ class KellyRecommendation:
     risk_level: str  # "LOW", "MEDIUM", "HIGH"
 
 
+@dataclass
+class KellyBatch:
+    """
+    Struct-of-arrays Kelly recommendations for N (probability, odds) pairs.
+
+    Stakes are in % of bankroll like KellyRecommendation. risk_code
+    indexes RISK_LEVELS. diagnostics counts the rows that the scalar
+    path would have logged individually.
+    """
+
+    model_prob: np.ndarray
+    odds: np.ndarray
+    ev: np.ndarray
+    full_kelly: np.ndarray
+    fractional_kelly: np.ndarray
+    recommended_stake: np.ndarray
+    is_value_bet: np.ndarray
+    risk_code: np.ndarray
+    diagnostics: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return self.ev.shape[0]
+
+    @property
+    def risk_levels(self) -> List[str]:
+        """Risk level names per row."""
+        return [RISK_LEVELS[code] for code in self.risk_code.tolist()]
+
+    def to_recommendation(self, index: int) -> KellyRecommendation:
+        """
+        Build the KellyRecommendation for one row.
+
+        Args:
+            index: Row index
+
+        Returns:
+            KellyRecommendation
+        """
+        return KellyRecommendation(
+            model_prob=float(self.model_prob[index]),
+            odds=float(self.odds[index]),
+            ev=float(self.ev[index]),
+            full_kelly=float(self.full_kelly[index]),
+            fractional_kelly=float(self.fractional_kelly[index]),
+            recommended_stake=float(self.recommended_stake[index]),
+            is_value_bet=bool(self.is_value_bet[index]),
+            risk_level=RISK_LEVELS[int(self.risk_code[index])],
+        )
+
+
+@dataclass
+class BetOpportunity:
+    """
+    One open bet for portfolio sizing.
+
+    Opportunities sharing (match_id, market) are mutually exclusive
+    outcomes; the same (match_id, market, selection) offered by several
+    bookmakers is the same outcome. Different markets of one match (e.g.
+    1X2 and totals) are treated as independent.
+    """
+
+    match_id: str
+    selection: str  # e.g. "home_win", "draw"; "over" in a "totals_2.5" market
+    model_prob: float
+    odds: float
+    market: str = "1x2"  # Market family the selection belongs to
+
+
+@dataclass
+class PortfolioAllocation:
+    """Result of KellyCriterion.optimize_portfolio."""
+
+    opportunities: List[BetOpportunity]
+    stakes: np.ndarray  # % of bankroll per opportunity
+    expected_growth: float  # Expected log growth of the bankroll per round
+    total_exposure: float  # % of bankroll staked in total
+    iterations: int
+    converged: bool
+    exact: bool  # True if every joint outcome was enumerated (no sampling)
+
+    def positions(self) -> List[Tuple[BetOpportunity, float]]:
+        """Opportunities with a positive stake, largest first."""
+        order = np.argsort(-self.stakes, kind="stable")
+        return [
+            (self.opportunities[i], float(self.stakes[i]))
+            for i in order.tolist()
+            if self.stakes[i] > 0
+        ]
+
+
+def _project_capped_simplex(x: np.ndarray, upper: np.ndarray, total: float) -> np.ndarray:
+    """
+    Euclidean projection onto {0 <= y <= upper, sum(y) <= total}.
+
+    The solution is clip(x - τ, 0, upper) with τ = 0 when the clipped
+    vector already fits, otherwise τ solves sum = total. The sum is
+    piecewise linear and non-increasing in τ, with slope changes at x - upper
+    (-1) and x (+1), so it is evaluated at every breakpoint with
+    cumulative sums and τ is interpolated exactly.
+    """
+    clipped = np.clip(x, 0.0, upper)
+    if clipped.sum() <= total:
+        return clipped
+
+    breakpoints = np.concatenate([x - upper, x])
+    slope_changes = np.concatenate([-np.ones(x.shape[0]), np.ones(x.shape[0])])
+    order = np.argsort(breakpoints, kind="stable")
+    breakpoints = breakpoints[order]
+
+    # Slope of the sum on (b_k, b_k+1), then its value at each b_k (0 at the last)
+    slopes = np.cumsum(slope_changes[order])[:-1]
+    drops = -slopes * np.diff(breakpoints)
+    sums = np.append(np.cumsum(drops[::-1])[::-1], 0.0)
+
+    # First breakpoint at or below the budget (index >= 1 since sum(0) > total)
+    idx = int(np.argmax(sums <= total))
+    lo, hi = breakpoints[idx - 1], breakpoints[idx]
+    tau = lo + (sums[idx - 1] - total) * (hi - lo) / (sums[idx - 1] - sums[idx])
+
+    return np.clip(x - tau, 0.0, upper)
+
+
+def _portfolio_scenarios(
+    opportunities: Sequence[BetOpportunity],
+    n_scenarios: int,
+    seed: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Joint outcomes of all matches as a net-return matrix.
+
+    Returns:
+        (returns, weights, exact): returns[s, j] = odds_j - 1 if bet j wins
+        in scenario s else -1 (float32); weights sum to 1. Scenarios are enumerated
+        exactly when there are at most n_scenarios of them, otherwise
+        sampled with a seeded generator.
+    """
+    # One group of exclusive outcomes per (match, market)
+    matches: Dict[Tuple[str, str], Dict[str, float]] = {}
+    bet_match = np.empty(len(opportunities), dtype=np.intp)
+    bet_outcome = np.empty(len(opportunities), dtype=np.intp)
+
+    for j, opp in enumerate(opportunities):
+        group = (opp.match_id, opp.market)
+        outcomes = matches.setdefault(group, {})
+        if opp.selection in outcomes and abs(outcomes[opp.selection] - opp.model_prob) > 1e-9:
+            raise ValueError(
+                f"Inconsistent probabilities for {opp.match_id} {opp.market} {opp.selection}"
+            )
+        outcomes[opp.selection] = opp.model_prob
+        bet_match[j] = list(matches).index(group)
+        bet_outcome[j] = list(outcomes).index(opp.selection)
+
+    # Per-group outcome probabilities, last entry = none of the selections
+    distributions = []
+    for (match_id, market), outcomes in matches.items():
+        probs = np.array(list(outcomes.values()))
+        remainder = 1.0 - probs.sum()
+        if remainder < -1e-9:
+            raise ValueError(f"Exclusive outcome probabilities exceed 1 for {match_id} {market}")
+        distributions.append(np.append(probs, max(remainder, 0.0)))
+
+    n_joint = np.prod([len(d) for d in distributions], dtype=np.float64)
+    exact = n_joint <= n_scenarios
+
+    if exact:
+        shape = tuple(len(d) for d in distributions)
+        outcome = np.indices(shape, dtype=np.int8).reshape(len(shape), -1).T
+        weights = np.ones(outcome.shape[0])
+        for m, dist in enumerate(distributions):
+            weights *= dist[outcome[:, m]]
+    else:
+        # Inverse-CDF sampling of every match at once
+        width = max(len(d) for d in distributions)
+        cdf = np.ones((len(distributions), width))
+        for m, dist in enumerate(distributions):
+            cdf[m, :len(dist) - 1] = np.cumsum(dist[:-1]) / dist.sum()
+        uniforms = np.random.default_rng(seed).random((n_scenarios, len(distributions)))
+        outcome = (uniforms[:, :, None] >= cdf[None, :, :]).sum(axis=2, dtype=np.int8)
+        weights = np.full(n_scenarios, 1.0 / n_scenarios)
+
+    # float32 halves the memory traffic of the solver's matrix-vector products
+    odds = np.array([opp.odds for opp in opportunities], dtype=np.float32)
+    wins = outcome[:, bet_match] == bet_outcome
+    returns = wins * odds - np.float32(1.0)
+
+    return returns, weights, bool(exact)
+
+
 class KellyCriterion:
     """
     Kelly Criterion calculator for bet sizing.
@@ -123,9 +321,9 @@ class KellyCriterion:
         Returns:
             Risk level: "LOW", "MEDIUM", "HIGH"
         """
-        if stake_percent < 1.0:
+        if stake_percent < RISK_THRESHOLDS[0]:
             return "LOW"
-        elif stake_percent < 3.0:
+        elif stake_percent < RISK_THRESHOLDS[1]:
             return "MEDIUM"
         else:
             return "HIGH"
@@ -185,6 +383,227 @@ class KellyCriterion:
             risk_level=risk_level,
         )
 
+    def calculate_batch(
+        self,
+        probs,
+        odds,
+        apply_fraction: bool = True,
+        apply_max_stake: bool = True,
+    ) -> KellyBatch:
+        """
+        Vectorized calculate() over many (probability, odds) pairs.
+
+        Inputs broadcast against each other, so one probability can be
+        scanned against every bookmaker's odds. Rows are treated exactly
+        like calculate(), but nothing is logged per row: invalid inputs,
+        Kelly above 100% and capped stakes are counted and reported in a
+        single summary line.
+
+        Args:
+            probs: Model probabilities (0-1), array-like
+            odds: Decimal odds, array-like
+            apply_fraction: Apply fractional Kelly (default True)
+            apply_max_stake: Apply max stake cap (default True)
+
+        Returns:
+            KellyBatch with 1-D arrays
+
+        Example:
+            >>> kelly = KellyCriterion()
+            >>> batch = kelly.calculate_batch([0.6, 0.4], [2.0, 2.0])
+            >>> batch.recommended_stake
+            array([5., 0.])
+        """
+        probs, odds = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(probs, dtype=np.float64)),
+            np.atleast_1d(np.asarray(odds, dtype=np.float64)),
+        )
+        probs = probs.ravel()
+        odds = odds.ravel()
+
+        ev = probs * odds - 1
+
+        # NaN (missing price) compares False everywhere, so test finiteness explicitly
+        invalid_prob = ~np.isfinite(probs) | (probs <= 0) | (probs >= 1)
+        invalid_odds = ~np.isfinite(odds) | (odds <= 1.0)
+        valid = ~(invalid_prob | invalid_odds)
+
+        # Kelly formula on valid rows; b = 1 placeholder avoids division by zero
+        b = np.where(valid, odds - 1, 1.0)
+        full_kelly = np.where(valid, (probs * b - (1 - probs)) / b, 0.0)
+        over_bet = full_kelly > 1
+        full_kelly = np.clip(full_kelly, 0.0, 1.0)
+
+        fractional_kelly = full_kelly * self.kelly_fraction if apply_fraction else full_kelly
+        recommended_stake = fractional_kelly * 100
+        capped = np.zeros(recommended_stake.shape, dtype=bool)
+        if apply_max_stake:
+            capped = recommended_stake > self.max_stake
+            recommended_stake = np.minimum(recommended_stake, self.max_stake)
+
+        is_value_bet = (ev >= self.min_ev) & (recommended_stake > 0)
+        risk_code = np.searchsorted(RISK_THRESHOLDS, recommended_stake, side="right").astype(np.int8)
+
+        diagnostics = {
+            "rows": int(probs.shape[0]),
+            "invalid_probability": int(np.count_nonzero(invalid_prob)),
+            "invalid_odds": int(np.count_nonzero(invalid_odds & ~invalid_prob)),
+            "kelly_over_100": int(np.count_nonzero(over_bet)),
+            "capped": int(np.count_nonzero(capped)),
+            "value_bets": int(np.count_nonzero(is_value_bet)),
+        }
+
+        invalid = diagnostics["invalid_probability"] + diagnostics["invalid_odds"]
+        logger.log(
+            logging.WARNING if invalid else logging.DEBUG,
+            f"Kelly batch: {diagnostics['rows']} rows, "
+            f"{diagnostics['value_bets']} value bets, "
+            f"{diagnostics['capped']} capped, "
+            f"{diagnostics['kelly_over_100']} Kelly > 100%, "
+            f"{diagnostics['invalid_probability']} invalid probabilities, "
+            f"{diagnostics['invalid_odds']} invalid odds",
+        )
+
+        return KellyBatch(
+            model_prob=probs,
+            odds=odds,
+            ev=ev,
+            full_kelly=full_kelly * 100,
+            fractional_kelly=fractional_kelly * 100,
+            recommended_stake=recommended_stake,
+            is_value_bet=is_value_bet,
+            risk_code=risk_code,
+            diagnostics=diagnostics,
+        )
+
+    def optimize_portfolio(
+        self,
+        opportunities: Sequence[BetOpportunity],
+        max_total_exposure: float = MAX_PORTFOLIO_EXPOSURE,
+        apply_fraction: bool = True,
+        n_scenarios: int = PORTFOLIO_SCENARIOS,
+        seed: Optional[int] = 0,
+        max_iter: int = 500,
+        tol: float = 1e-9,
+    ) -> PortfolioAllocation:
+        """
+        Size all open bets jointly by maximizing expected log growth.
+
+        Maximizes E[log(1 + Σ_j s_j·r_j)] over joint match outcomes, where
+        r_j is the net return of bet j (odds - 1 or -1). Outcomes of the
+        same match are mutually exclusive; matches are independent. Joint
+        outcomes are enumerated exactly when there are at most n_scenarios,
+        otherwise n_scenarios are sampled (seeded, so results repeat).
+
+        Stakes satisfy 0 <= s_j <= max_stake and Σ s_j <= max_total_exposure.
+        With apply_fraction, the full-Kelly problem is solved with the caps
+        divided by kelly_fraction and the result is scaled back, so the
+        fractional stakes respect the caps exactly.
+
+        Solver: projected gradient ascent with Barzilai-Borwein steps and
+        Armijo backtracking; each iteration is two matrix-vector products
+        on the (scenarios × bets) return matrix plus an exact projection.
+
+        Args:
+            opportunities: Open bets (see BetOpportunity)
+            max_total_exposure: Cap on total stake (% of bankroll)
+            apply_fraction: Apply fractional Kelly (default True)
+            n_scenarios: Joint outcomes to enumerate or sample
+            seed: Seed for scenario sampling
+            max_iter: Maximum solver iterations
+            tol: Convergence tolerance on the stake step (fraction of bankroll)
+
+        Returns:
+            PortfolioAllocation with stakes in % of bankroll
+
+        Example:
+            >>> kelly = KellyCriterion()
+            >>> allocation = kelly.optimize_portfolio([
+            ...     BetOpportunity("m1", "home_win", 0.55, 2.1),
+            ...     BetOpportunity("m1", "draw", 0.30, 3.6),
+            ... ])
+            >>> allocation.stakes
+            array([5.  , 2.80...])
+        """
+        if not opportunities:
+            raise ValueError("At least one opportunity is required")
+        for opp in opportunities:
+            if not 0 < opp.model_prob < 1 or opp.odds <= 1.0:
+                raise ValueError(
+                    f"Invalid opportunity {opp.match_id} {opp.selection}: "
+                    f"prob={opp.model_prob}, odds={opp.odds}"
+                )
+
+        fraction = self.kelly_fraction if apply_fraction else 1.0
+        # Keep the full-Kelly budget below 100% so wealth stays positive
+        upper = np.full(len(opportunities), self.max_stake / 100 / fraction)
+        total = min(max_total_exposure / 100 / fraction, 0.999)
+
+        returns, weights, exact = _portfolio_scenarios(opportunities, n_scenarios, seed)
+
+        def growth(stakes: np.ndarray) -> Tuple[float, np.ndarray]:
+            wealth = 1.0 + (returns @ stakes.astype(np.float32)).astype(np.float64)
+            return float(weights @ np.log(wealth)), wealth
+
+        def gradient(wealth: np.ndarray) -> np.ndarray:
+            return (returns.T @ (weights / wealth).astype(np.float32)).astype(np.float64)
+
+        # Warm start: independent full-Kelly stakes, projected onto the caps
+        probs = np.array([opp.model_prob for opp in opportunities])
+        odds = np.array([opp.odds for opp in opportunities])
+        independent = np.maximum((probs * odds - 1) / (odds - 1), 0.0)
+        stakes = _project_capped_simplex(independent, upper, total)
+        value, wealth = growth(stakes)
+        grad = gradient(wealth)
+        step = 1.0
+        converged = False
+        iteration = 0
+
+        for iteration in range(1, max_iter + 1):
+            # Armijo backtracking along the projection arc
+            while True:
+                candidate = _project_capped_simplex(stakes + step * grad, upper, total)
+                candidate_value, candidate_wealth = growth(candidate)
+                if candidate_value >= value + 1e-4 * grad @ (candidate - stakes) or step < 1e-12:
+                    break
+                step *= 0.5
+
+            delta = candidate - stakes
+            candidate_grad = gradient(candidate_wealth)
+
+            stakes, value, wealth = candidate, candidate_value, candidate_wealth
+            if np.max(np.abs(delta)) < tol:
+                converged = True
+                grad = candidate_grad
+                break
+
+            # Barzilai-Borwein step (objective is concave, so s·y < 0)
+            curvature = delta @ (candidate_grad - grad)
+            step = (delta @ delta) / -curvature if curvature < 0 else step * 2
+            grad = candidate_grad
+
+        if not converged:
+            logger.warning(f"Portfolio optimizer stopped after {max_iter} iterations")
+
+        stakes = stakes * fraction
+        expected_growth, _ = growth(stakes)
+
+        logger.debug(
+            f"Portfolio: {len(opportunities)} bets, {returns.shape[0]} scenarios "
+            f"({'exact' if exact else 'sampled'}), {iteration} iterations, "
+            f"exposure {stakes.sum() * 100:.2f}%"
+        )
+
+        return PortfolioAllocation(
+            opportunities=list(opportunities),
+            stakes=stakes * 100,
+            expected_growth=expected_growth,
+            total_exposure=float(stakes.sum() * 100),
+            iterations=iteration,
+            converged=converged,
+            exact=exact,
+        )
+
     def calculate_stake_amount(
         self, model_prob: float, odds: float, bankroll: float
     ) -> float:
@@ -0,0 +1,264 @@
+"""
+Precomputed market lookup table over a (λ_home, λ_away) grid.
+
+The table stores 1X2, BTTS, grid mass and over probabilities for every
+lambda pair on a regular grid (default 0.05-5.0, step 0.01). Queries use
+bilinear interpolation on a memory-mapped array, so pricing costs four
+reads per market and allocates nothing.
+
+Accuracy: with the default 0.01 step the maximum absolute error against
+the exact MatchSimulator path is below 5e-5 for every market (bilinear
+error is bounded by step² / 8 × max second derivative, and the market
+curves are smooth in λ). Results are rounded to 4 decimals like the
+exact path, so most queries return identical values.
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from bet_copilot.config import LAMBDA_TABLE_PATH
+from bet_copilot.math_engine.poisson import (
+    MARKET_COLUMNS,
+    PoissonCalculator,
+    market_weight_matrix,
+)
+
+logger = logging.getLogger(__name__)
+
+TABLE_TOTAL_LINES = (0.5, 1.5, 2.5, 3.5, 4.5, 5.5)
+
+# Documented maximum absolute error against the exact path (default grid)
+TABLE_MAX_ERROR = 5e-5
+
+
+class LambdaTable:
+    """
+    Bilinear-interpolated market table.
+
+    values[m, i, j] = market m at (λ_min + i·step, λ_min + j·step)
+    """
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        lambda_min: float,
+        lambda_step: float,
+        max_goals: int,
+        total_lines: Sequence[float] = TABLE_TOTAL_LINES,
+    ):
+        """
+        Initialize table from precomputed values.
+
+        Args:
+            values: Array (n_markets, n, n), possibly memory-mapped
+            lambda_min: Lambda at index 0
+            lambda_step: Lambda spacing between indices
+            max_goals: Grid size the values were computed with
+            total_lines: Goal lines of the "over" columns
+        """
+        self.values = values
+        self.lambda_min = float(lambda_min)
+        self.lambda_step = float(lambda_step)
+        self.max_goals = int(max_goals)
+        self.total_lines = tuple(float(line) for line in total_lines)
+        self.size = values.shape[1]
+        self.lambda_max = self.lambda_min + (self.size - 1) * self.lambda_step
+
+        self._columns = {name: idx for idx, name in enumerate(MARKET_COLUMNS)}
+        for idx, line in enumerate(self.total_lines):
+            self._columns[line] = len(MARKET_COLUMNS) + idx
+
+    @classmethod
+    def build(
+        cls,
+        max_goals: int = 8,
+        lambda_min: float = 0.05,
+        lambda_max: float = 5.0,
+        lambda_step: float = 0.01,
+        total_lines: Sequence[float] = TABLE_TOTAL_LINES,
+        chunk_size: int = 32,
+    ) -> "LambdaTable":
+        """
+        Compute a table with the exact grid reductions.
+
+        Args:
+            max_goals: Maximum goals per team (must match the simulator)
+            lambda_min: Smallest lambda in the table
+            lambda_max: Largest lambda in the table
+            lambda_step: Lambda spacing
+            total_lines: Goal lines to store
+            chunk_size: Home lambdas processed per block (bounds memory)
+
+        Returns:
+            LambdaTable held in memory
+        """
+        size = int(round((lambda_max - lambda_min) / lambda_step)) + 1
+        lambdas = lambda_min + lambda_step * np.arange(size)
+
+        pmfs = PoissonCalculator.probability_matrix(max_goals, lambdas)
+        weights = market_weight_matrix(max_goals, total_lines)
+        goals = max_goals + 1
+
+        values = np.empty((weights.shape[1], size, size), dtype=np.float32)
+
+        for start in range(0, size, chunk_size):
+            home = pmfs[start:start + chunk_size]
+            # (chunk, size, G, G) grids for every away lambda
+            grids = home[:, None, :, None] * pmfs[None, :, None, :]
+            markets = grids.reshape(-1, goals * goals) @ weights
+            values[:, start:start + home.shape[0], :] = markets.reshape(
+                home.shape[0], size, -1
+            ).transpose(2, 0, 1)
+
+        logger.info(f"Built lambda table: {size}x{size}, {weights.shape[1]} markets")
+
+        return cls(values, lambda_min, lambda_step, max_goals, total_lines)
+
+    def save(self, path: Path = LAMBDA_TABLE_PATH):
+        """
+        Save table as .npy plus a JSON metadata sidecar.
+
+        Args:
+            path: Destination .npy file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        np.save(path, np.asarray(self.values, dtype=np.float32))
+        path.with_suffix(".json").write_text(json.dumps(self._metadata()))
+
+    @classmethod
+    def load(cls, path: Path = LAMBDA_TABLE_PATH) -> "LambdaTable":
+        """
+        Load a saved table memory-mapped (read-only).
+
+        Args:
+            path: .npy file written by save()
+
+        Returns:
+            LambdaTable backed by the file
+        """
+        path = Path(path)
+        metadata = json.loads(path.with_suffix(".json").read_text())
+        values = np.load(path, mmap_mode="r")
+
+        return cls(
+            values,
+            lambda_min=metadata["lambda_min"],
+            lambda_step=metadata["lambda_step"],
+            max_goals=metadata["max_goals"],
+            total_lines=metadata["total_lines"],
+        )
+
+    @classmethod
+    def load_or_build(
+        cls,
+        path: Path = LAMBDA_TABLE_PATH,
+        max_goals: int = 8,
+        **build_kwargs,
+    ) -> "LambdaTable":
+        """
+        Load table from disk, building and saving it if missing or stale.
+
+        Args:
+            path: .npy file location
+            max_goals: Required grid size
+            **build_kwargs: Extra arguments for build()
+
+        Returns:
+            LambdaTable
+        """
+        path = Path(path)
+
+        if path.exists() and path.with_suffix(".json").exists():
+            try:
+                table = cls.load(path)
+                if table.max_goals == max_goals:
+                    return table
+                logger.info(f"Lambda table at {path} uses max_goals={table.max_goals}, rebuilding")
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Could not load lambda table {path}: {e}")
+
+        table = cls.build(max_goals=max_goals, **build_kwargs)
+        try:
+            table.save(path)
+            table = cls.load(path)
+        except OSError as e:
+            logger.warning(f"Could not save lambda table {path}: {e}")
+
+        return table
+
+    def _metadata(self) -> Dict:
+        return {
+            "lambda_min": self.lambda_min,
+            "lambda_step": self.lambda_step,
+            "max_goals": self.max_goals,
+            "total_lines": list(self.total_lines),
+        }
+
+    def covers(self, lambda_home: float, lambda_away: float) -> bool:
+        """Whether both lambdas are inside the table range."""
+        return (
+            self.lambda_min <= lambda_home <= self.lambda_max
+            and self.lambda_min <= lambda_away <= self.lambda_max
+        )
+
+    def has_line(self, threshold: float) -> bool:
+        """Whether an over/under line is stored in the table."""
+        return float(threshold) in self.total_lines
+
+    def _position(self, lambda_: float) -> Tuple[int, float]:
+        """Lower grid index and fractional offset for a lambda."""
+        position = (lambda_ - self.lambda_min) / self.lambda_step
+        index = min(int(math.floor(position)), self.size - 2)
+        return index, position - index
+
+    def lookup(self, market, lambda_home: float, lambda_away: float) -> float:
+        """
+        Interpolated value of one market.
+
+        Args:
+            market: Column name from MARKET_COLUMNS or an over/under line
+            lambda_home: Expected goals for home team (inside the table)
+            lambda_away: Expected goals for away team (inside the table)
+
+        Returns:
+            Interpolated probability
+        """
+        column = self._columns[market]
+        i, di = self._position(lambda_home)
+        j, dj = self._position(lambda_away)
+
+        # ndarray.item() reads a single element without creating arrays
+        item = self.values.item
+        top = item(column, i, j) * (1 - dj) + item(column, i, j + 1) * dj
+        bottom = item(column, i + 1, j) * (1 - dj) + item(column, i + 1, j + 1) * dj
+
+        return top * (1 - di) + bottom * di
+
+    def match_outcome(self, lambda_home: float, lambda_away: float) -> Dict[str, float]:
+        """Home/Draw/Away probabilities (same format as MatchSimulator)."""
+        return {
+            "home_win": round(self.lookup("home_win", lambda_home, lambda_away), 4),
+            "draw": round(self.lookup("draw", lambda_home, lambda_away), 4),
+            "away_win": round(self.lookup("away_win", lambda_home, lambda_away), 4),
+        }
+
+    def over_under(
+        self, lambda_home: float, lambda_away: float, threshold: float = 2.5
+    ) -> Dict[str, float]:
+        """Over/under probabilities for a stored line."""
+        over = self.lookup(float(threshold), lambda_home, lambda_away)
+        mass = self.lookup("mass", lambda_home, lambda_away)
+        return {"over": round(over, 4), "under": round(mass - over, 4)}
+
+    def both_teams_to_score(self, lambda_home: float, lambda_away: float) -> Dict[str, float]:
+        """BTTS probabilities."""
+        yes = self.lookup("btts_yes", lambda_home, lambda_away)
+        mass = self.lookup("mass", lambda_home, lambda_away)
+        return {"yes": round(yes, 4), "no": round(mass - yes, 4)}
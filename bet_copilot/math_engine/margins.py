@@ -0,0 +1,239 @@
+"""
+Bookmaker margin (overround) removal, vectorized over events and books.
+
+Prices come as a dense array whose last two axes are (bookmaker, outcome),
+e.g. (events, bookmakers, outcomes) for every event of a sport; NaN marks
+a price a book does not offer. Each complete book row is turned into fair
+probabilities with one of:
+
+- "multiplicative": p = π / Σπ (proportional; ignores favourite-longshot bias)
+- "additive": p = π - (Σπ - 1) / K (equal margin per outcome)
+- "power": p = π^k with k chosen so Σp = 1 (more margin on longshots)
+- "shin": Shin's insider-trading model, solving for the insider share z
+
+where π = 1 / odds. Fair probabilities of every book are then averaged into
+a no-vig consensus, and the EV of the best available price against that
+consensus comes out of the same pass.
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+from bet_copilot.config import MARGIN_METHOD
+
+logger = logging.getLogger(__name__)
+
+METHODS = ("multiplicative", "additive", "power", "shin")
+
+SOLVER_TOLERANCE = 1e-12
+SOLVER_MAX_ITERATIONS = 100
+
+
+def _implied(odds) -> np.ndarray:
+    """1 / odds, NaN for missing or invalid (<= 1.0) prices."""
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(odds > 1.0, 1.0 / odds, np.nan)
+
+
+def overround(odds) -> np.ndarray:
+    """
+    Book margin Σ(1/odds) - 1 over the last axis (NaN for incomplete books).
+
+    Example:
+        >>> round(float(overround([1.90, 1.90])), 4)
+        0.0526
+    """
+    return _implied(odds).sum(axis=-1) - 1.0
+
+
+def _power(implied: np.ndarray) -> np.ndarray:
+    """Solve Σ π^k = 1 for k by Newton's method (f is convex in k)."""
+    log_implied = np.log(implied)
+    k = np.ones(implied.shape[:-1] + (1,))
+    for _ in range(SOLVER_MAX_ITERATIONS):
+        powered = implied ** k
+        excess = powered.sum(axis=-1, keepdims=True) - 1.0
+        if np.all(np.abs(excess) < SOLVER_TOLERANCE):
+            break
+        k = k - excess / (powered * log_implied).sum(axis=-1, keepdims=True)
+    return implied ** k
+
+
+def _shin(implied: np.ndarray) -> np.ndarray:
+    """
+    Shin probabilities: p_i = (√(z² + 4(1 - z) π_i² / Σπ) - z) / (2(1 - z)).
+
+    Σp is decreasing in z, so z is found for every book at once by Newton
+    steps kept inside a bisection bracket on [0, 1). Books without a margin
+    get z = 0.
+    """
+    booksum = implied.sum(axis=-1, keepdims=True)
+    share = implied ** 2 / booksum
+
+    low = np.zeros_like(booksum)
+    high = np.full_like(booksum, 1.0 - 1e-9)
+    z = np.zeros_like(booksum)
+    for _ in range(SOLVER_MAX_ITERATIONS):
+        root = np.sqrt(z ** 2 + 4 * (1 - z) * share)
+        probs = (root - z) / (2 * (1 - z))
+        excess = probs.sum(axis=-1, keepdims=True) - 1.0
+        if np.all((np.abs(excess) < SOLVER_TOLERANCE) | (booksum <= 1.0)):
+            break
+
+        low = np.where(excess > 0, z, low)
+        high = np.where(excess > 0, high, z)
+        slope = (((z - 2 * share) / root - 1) * 2 * (1 - z) + 2 * (root - z)) / (4 * (1 - z) ** 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = z - excess / slope.sum(axis=-1, keepdims=True)
+        z = np.where((step >= low) & (step <= high), step, (low + high) / 2)
+
+    z = np.where(booksum > 1.0, z, 0.0)
+    return (np.sqrt(z ** 2 + 4 * (1 - z) * share) - z) / (2 * (1 - z))
+
+
+def remove_margin(odds, method: str = MARGIN_METHOD) -> np.ndarray:
+    """
+    Fair probabilities of every book row.
+
+    Args:
+        odds: Decimal odds, shape (..., outcomes); NaN for missing prices
+        method: One of METHODS
+
+    Returns:
+        Array of the same shape; rows summing to 1, NaN where the book
+        does not price every outcome
+
+    Example:
+        >>> remove_margin([[2.0, 3.4, 3.6]], "multiplicative").round(4)
+        array([[0.4665, 0.2744, 0.2591]])
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown margin method: {method} (expected one of {METHODS})")
+
+    implied = _implied(odds)
+    if implied.ndim == 0 or implied.shape[-1] < 2:
+        raise ValueError("odds must have at least two outcomes on the last axis")
+
+    complete = ~np.isnan(implied).any(axis=-1, keepdims=True)
+    # Placeholder row for incomplete books so the solvers stay finite
+    implied = np.where(complete, implied, 1.0 / implied.shape[-1])
+
+    if method == "multiplicative":
+        fair = implied
+    elif method == "additive":
+        fair = implied - (implied.sum(axis=-1, keepdims=True) - 1.0) / implied.shape[-1]
+        # Longshots can go negative when the margin exceeds their price
+        fair = np.clip(fair, 0.0, None)
+    elif method == "power":
+        fair = _power(implied)
+    else:
+        fair = _shin(implied)
+
+    fair = fair / fair.sum(axis=-1, keepdims=True)
+    return np.where(complete, fair, np.nan)
+
+
+def apply_margin(probabilities, margin: float, method: str = "multiplicative") -> np.ndarray:
+    """
+    Bookmaker-style odds for fair probabilities (inverse of remove_margin).
+
+    Args:
+        probabilities: Fair probabilities, shape (..., outcomes)
+        margin: Overround to build in (0.08 = book summing to 108%)
+        method: "multiplicative", "additive" or "power"
+
+    Returns:
+        Decimal odds of the same shape
+
+    Example:
+        >>> apply_margin([0.5, 0.3, 0.2], 0.08).round(3)
+        array([1.852, 3.086, 4.63 ])
+    """
+    probs = np.asarray(probabilities, dtype=float)
+    if np.any(probs <= 0):
+        raise ValueError("Probabilities must be positive")
+    if margin < 0:
+        raise ValueError("margin must be non-negative")
+
+    if method == "multiplicative":
+        implied = probs * (1.0 + margin)
+    elif method == "additive":
+        implied = probs + margin / probs.shape[-1]
+    elif method == "power":
+        # π = p^(1/k): solve Σ p^e = 1 + margin for e = 1/k
+        log_probs = np.log(probs)
+        exponent = np.ones(probs.shape[:-1] + (1,))
+        for _ in range(SOLVER_MAX_ITERATIONS):
+            powered = probs ** exponent
+            excess = powered.sum(axis=-1, keepdims=True) - (1.0 + margin)
+            if np.all(np.abs(excess) < SOLVER_TOLERANCE):
+                break
+            exponent = exponent - excess / (powered * log_probs).sum(axis=-1, keepdims=True)
+        implied = probs ** exponent
+    else:
+        raise ValueError(f"Cannot apply margin with method: {method}")
+
+    return 1.0 / np.minimum(implied, 1.0)
+
+
+@dataclass
+class NoVigConsensus:
+    """Margin-free market view of a set of events."""
+
+    fair: np.ndarray  # (..., books, outcomes) fair probabilities per book
+    probabilities: np.ndarray  # (..., outcomes) consensus, NaN without complete books
+    books: np.ndarray  # (...,) complete books in the consensus
+    best_odds: np.ndarray  # (..., outcomes) highest price, NaN if none
+    best_book: np.ndarray  # (..., outcomes) index of the best price (-1 if none)
+    ev: np.ndarray  # (..., outcomes) consensus × best odds - 1
+    margin: np.ndarray  # (...,) mean overround of the complete books
+
+
+def no_vig_consensus(odds, method: str = MARGIN_METHOD) -> NoVigConsensus:
+    """
+    Consensus fair probabilities and best-price EV for many events.
+
+    Args:
+        odds: Decimal odds, shape (..., books, outcomes), NaN for missing
+        method: Margin removal method (see METHODS)
+
+    Returns:
+        NoVigConsensus
+
+    Example:
+        >>> odds = [[[2.10, 3.40, 3.50], [2.00, 3.60, 3.70], [2.25, np.nan, 3.30]]]
+        >>> consensus = no_vig_consensus(odds, "shin")
+        >>> consensus.books, consensus.best_odds
+        (array([2]), array([[2.25, 3.6 , 3.7 ]]))
+    """
+    odds = np.asarray(odds, dtype=float)
+    if odds.ndim < 2:
+        raise ValueError("odds must have shape (..., books, outcomes)")
+
+    fair = remove_margin(odds, method)
+    complete = ~np.isnan(fair[..., 0])
+    books = complete.sum(axis=-1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        probabilities = np.nansum(fair, axis=-2) / books[..., None]
+        margin = np.nansum(np.where(complete, overround(odds), np.nan), axis=-1) / books
+    probabilities = np.where(books[..., None] > 0, probabilities, np.nan)
+    margin = np.where(books > 0, margin, np.nan)
+
+    priced = np.where(odds > 1.0, odds, np.nan)
+    offered = ~np.isnan(priced).all(axis=-2)
+    best_book = np.where(offered, np.argmax(np.nan_to_num(priced, nan=-np.inf), axis=-2), -1)
+    best_odds = np.where(offered, np.nanmax(np.where(offered[..., None, :], priced, 0.0), axis=-2), np.nan)
+
+    return NoVigConsensus(
+        fair=fair,
+        probabilities=probabilities,
+        books=books,
+        best_odds=best_odds,
+        best_book=best_book,
+        ev=probabilities * best_odds - 1.0,
+        margin=margin,
+    )
@@ -0,0 +1,237 @@
+"""
+Memoization of derived market prices keyed by quantized lambdas.
+
+Lambdas are rounded to 2 decimals by PredictionInput, so the space of
+distinct (λ_home, λ_away) pairs is small and repeats constantly across
+refreshes and re-analyses. Caching the derived markets skips the scoreline
+grid computation entirely on repeated predictions.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from bet_copilot.config import MARKET_CACHE_DECIMALS, MARKET_CACHE_SIZE
+from bet_copilot.math_engine.poisson import ScorelineGrid
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[float, float, Hashable]
+
+EVICTION_POLICIES = ("lru", "fifo")
+
+
+@dataclass(frozen=True)
+class MarketVector:
+    """
+    Markets derived from one scoreline grid.
+
+    The grid is kept on purpose: scoreline dictionaries, totals ladders and
+    Asian handicaps are built lazily from it on predictions with details.
+    Since every hit shares it, its arrays are read-only.
+    """
+
+    home_win: float
+    draw: float
+    away_win: float
+    most_likely_score: Tuple[int, int]
+    most_likely_score_prob: float
+    over_under_2_5: Dict[str, float]
+    btts: Dict[str, float]
+    truncated_mass: float
+    grid: ScorelineGrid
+
+    @classmethod
+    def from_grid(cls, grid: ScorelineGrid) -> "MarketVector":
+        """
+        Reduce a scoreline grid to its market vector.
+
+        The grid's diagonal sums are computed here and every array is
+        marked read-only, so later hits can share the grid safely.
+
+        Args:
+            grid: Scoreline grid for a match
+
+        Returns:
+            MarketVector
+        """
+        outcome = grid.match_outcome()
+        most_likely_score, most_likely_prob = grid.most_likely(top_n=1)[0]
+
+        vector = cls(
+            home_win=outcome["home_win"],
+            draw=outcome["draw"],
+            away_win=outcome["away_win"],
+            most_likely_score=most_likely_score,
+            most_likely_score_prob=most_likely_prob,
+            over_under_2_5=grid.over_under(2.5),
+            btts=grid.both_teams_to_score(),
+            truncated_mass=grid.truncated_mass(),
+            grid=grid,
+        )
+        arrays = (grid.probabilities, grid.total_goals_distribution(), grid.goal_difference_distribution())
+        for array in arrays:
+            array.setflags(write=False)
+        return vector
+
+
+class MarketCache:
+    """
+    Bounded, thread-safe cache of MarketVector objects.
+
+    Keys are (quantized λ_home, quantized λ_away, grid_key), where grid_key
+    is MatchSimulator.grid_key (max_goals, or the adaptive settings). When
+    full, the least recently used entry ("lru") or the oldest inserted
+    entry ("fifo") is evicted.
+    """
+
+    def __init__(
+        self,
+        max_size: int = MARKET_CACHE_SIZE,
+        decimals: int = MARKET_CACHE_DECIMALS,
+        eviction: str = "lru",
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of entries
+            decimals: Decimals used to quantize lambdas
+            eviction: Eviction policy, "lru" or "fifo"
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy: {eviction} (expected one of {EVICTION_POLICIES})"
+            )
+
+        self.max_size = max_size
+        self.decimals = decimals
+        self.eviction = eviction
+
+        self._entries: "OrderedDict[CacheKey, MarketVector]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def quantize(self, lambda_: float) -> float:
+        """Round a lambda to the cache resolution."""
+        return round(float(lambda_), self.decimals)
+
+    def make_key(self, lambda_home: float, lambda_away: float, grid_key: Hashable) -> CacheKey:
+        """
+        Build cache key.
+
+        Args:
+            lambda_home: Expected goals for home team
+            lambda_away: Expected goals for away team
+            grid_key: How the grid is sized (MatchSimulator.grid_key)
+
+        Returns:
+            (quantized λ_home, quantized λ_away, grid_key)
+        """
+        return (self.quantize(lambda_home), self.quantize(lambda_away), grid_key)
+
+    def get(self, key: CacheKey) -> Optional[MarketVector]:
+        """Get cached vector (counts a hit or a miss)."""
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            if self.eviction == "lru":
+                self._entries.move_to_end(key)
+            return vector
+
+    def put(self, key: CacheKey, vector: MarketVector):
+        """Store a vector, evicting if the cache is full."""
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = vector
+                if self.eviction == "lru":
+                    self._entries.move_to_end(key)
+                return
+
+            while len(self._entries) >= self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+            self._entries[key] = vector
+
+    def get_or_compute(
+        self,
+        lambda_home: float,
+        lambda_away: float,
+        grid_key: Hashable,
+        compute: Callable[[float, float], MarketVector],
+    ) -> MarketVector:
+        """
+        Get markets for a lambda pair, computing them on a miss.
+
+        The computation runs outside the lock, so concurrent misses on the
+        same key may compute twice but never block other readers.
+
+        Args:
+            lambda_home: Expected goals for home team
+            lambda_away: Expected goals for away team
+            grid_key: How the grid is sized (MatchSimulator.grid_key)
+            compute: Callable receiving the quantized lambdas
+
+        Returns:
+            MarketVector for the quantized pair
+        """
+        key = self.make_key(lambda_home, lambda_away, grid_key)
+
+        vector = self.get(key)
+        if vector is None:
+            vector = compute(key[0], key[1])
+            self.put(key, vector)
+
+        return vector
+
+    def clear(self):
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __getstate__(self) -> Dict[str, object]:
+        """Pickle the settings only: worker processes start with an empty cache."""
+        return {"max_size": self.max_size, "decimals": self.decimals, "eviction": self.eviction}
+
+    def __setstate__(self, state: Dict[str, object]):
+        self.__init__(**state)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        with self._lock:
+            return key in self._entries
@@ -0,0 +1,309 @@
+"""
+Monte Carlo match simulation for combined markets.
+
+Markets such as same-game parlays ("home win and over 2.5"), multi-match
+accumulators or arbitrary predicates over several scorelines are not
+single cells or sums of one scoreline grid. MonteCarloSimulator samples
+joint scorelines for a set of matches and estimates the probability of
+any event, with its binomial standard error.
+
+Sampling is split into fixed-size chunks, each with its own child seed
+spawned from one SeedSequence. Results therefore depend only on
+(seed, n_samples, chunk_size) and are identical whether the chunks run
+in-process or on a process pool.
+
+Legs are written as strings:
+- "home_win", "draw", "away_win"
+- "btts_yes", "btts_no"
+- "over_2.5", "under_2.5" (any line)
+- "home_over_1.5", "away_under_0.5" (team totals)
+"""
+
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from bet_copilot.config import MONTE_CARLO_CHUNK_SIZE, MONTE_CARLO_SAMPLES
+from bet_copilot.math_engine.goal_models import GoalModel, IndependentPoisson, get_goal_model
+from bet_copilot.math_engine.poisson import MatchSimulator
+
+logger = logging.getLogger(__name__)
+
+# Event over sampled goals: (home_goals, away_goals), each (n, n_matches) -> (n,) bool
+Event = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+# Leg = (match index, market string)
+Leg = Tuple[int, str]
+
+# Tail mass left out of grids used for inverse-CDF sampling
+SAMPLING_TAIL_EPSILON = 1e-10
+
+
+@dataclass
+class MonteCarloEstimate:
+    """Probability estimate from simulation."""
+
+    probability: float
+    standard_error: float
+    n_samples: int
+
+    def confidence_interval(self, z: float = 1.96) -> Tuple[float, float]:
+        """
+        Normal-approximation confidence interval.
+
+        Args:
+            z: Standard normal quantile (1.96 = 95%)
+
+        Returns:
+            (lower, upper) clipped to [0, 1]
+        """
+        return (
+            max(self.probability - z * self.standard_error, 0.0),
+            min(self.probability + z * self.standard_error, 1.0),
+        )
+
+    @property
+    def fair_odds(self) -> float:
+        """Decimal odds implied by the estimate (inf if never hit)."""
+        return 1 / self.probability if self.probability > 0 else math.inf
+
+
+def leg_mask(market: str, home_goals: np.ndarray, away_goals: np.ndarray) -> np.ndarray:
+    """
+    Evaluate a market string on sampled goals.
+
+    Args:
+        market: Market string (see module docstring)
+        home_goals: Sampled home goals
+        away_goals: Sampled away goals
+
+    Returns:
+        Boolean array, True where the leg wins
+    """
+    if market == "home_win":
+        return home_goals > away_goals
+    if market == "draw":
+        return home_goals == away_goals
+    if market == "away_win":
+        return home_goals < away_goals
+    if market == "btts_yes":
+        return (home_goals > 0) & (away_goals > 0)
+    if market == "btts_no":
+        return (home_goals == 0) | (away_goals == 0)
+
+    # Totals: "over_2.5", or team totals "home_over_1.5" / "away_under_0.5"
+    goals, rest = None, market
+    if market.startswith("home_"):
+        goals, rest = home_goals, market[len("home_"):]
+    elif market.startswith("away_"):
+        goals, rest = away_goals, market[len("away_"):]
+    if goals is None:
+        goals = home_goals + away_goals
+
+    direction, _, line = rest.partition("_")
+    if direction in ("over", "under"):
+        try:
+            threshold = float(line)
+        except ValueError:
+            raise ValueError(f"Invalid line in market: {market}") from None
+        return goals > threshold if direction == "over" else goals < threshold
+
+    raise ValueError(f"Unknown market: {market}")
+
+
+class LegsEvent:
+    """Event that wins when every leg wins (picklable for process pools)."""
+
+    def __init__(self, legs: Sequence[Leg]):
+        if not legs:
+            raise ValueError("At least one leg is required")
+        self.legs = [(int(match), str(market)) for match, market in legs]
+
+    def __call__(self, home_goals: np.ndarray, away_goals: np.ndarray) -> np.ndarray:
+        hits = np.ones(home_goals.shape[0], dtype=bool)
+        for match, market in self.legs:
+            hits &= leg_mask(market, home_goals[:, match], away_goals[:, match])
+        return hits
+
+
+class MonteCarloSimulator:
+    """
+    Seeded, vectorized scoreline sampler.
+
+    Independent Poisson matches are drawn with Generator.poisson. Other
+    goal models are drawn by inverse-CDF sampling of their scoreline grid
+    (sized so the truncated mass is below SAMPLING_TAIL_EPSILON).
+    """
+
+    def __init__(
+        self,
+        model: Union[str, GoalModel] = "poisson",
+        n_samples: int = MONTE_CARLO_SAMPLES,
+        chunk_size: int = MONTE_CARLO_CHUNK_SIZE,
+        workers: int = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize simulator.
+
+        Args:
+            model: Goal model name or instance (see goal_models)
+            n_samples: Default number of simulated outcomes
+            chunk_size: Samples per chunk (memory bound and unit of work)
+            workers: Processes used for estimates (1 = in-process)
+            seed: Default seed; None draws fresh entropy per call
+        """
+        if n_samples < 1 or chunk_size < 1:
+            raise ValueError("n_samples and chunk_size must be positive")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.model = get_goal_model(model)
+        self.n_samples = n_samples
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.seed = seed
+
+    def _scoreline_cdfs(self, lambda_home: np.ndarray, lambda_away: np.ndarray) -> np.ndarray:
+        """Flattened, normalized scoreline CDFs, shape (n_matches, G²)."""
+        simulator = MatchSimulator(model=self.model, tail_epsilon=SAMPLING_TAIL_EPSILON)
+        grids = simulator.scoreline_tensor(lambda_home, lambda_away)
+        cdfs = np.cumsum(grids.reshape(grids.shape[0], -1), axis=1)
+        cdfs /= cdfs[:, -1:]
+        return cdfs
+
+    def sample(
+        self,
+        lambda_home,
+        lambda_away,
+        n: int,
+        rng: np.random.Generator,
+        cdfs: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample joint scorelines for several matches.
+
+        Args:
+            lambda_home: Home expected goals, shape (M,)
+            lambda_away: Away expected goals, shape (M,)
+            n: Number of simulated outcomes
+            rng: NumPy random generator
+            cdfs: Precomputed _scoreline_cdfs() for non-Poisson models
+
+        Returns:
+            (home_goals, away_goals), each int array of shape (n, M)
+        """
+        lambda_home = np.atleast_1d(np.asarray(lambda_home, dtype=np.float64))
+        lambda_away = np.atleast_1d(np.asarray(lambda_away, dtype=np.float64))
+
+        if isinstance(self.model, IndependentPoisson):
+            home_goals = rng.poisson(lambda_home, size=(n, lambda_home.shape[0]))
+            away_goals = rng.poisson(lambda_away, size=(n, lambda_away.shape[0]))
+            return home_goals, away_goals
+
+        if cdfs is None:
+            cdfs = self._scoreline_cdfs(lambda_home, lambda_away)
+        size = math.isqrt(cdfs.shape[1])
+
+        uniforms = rng.random((n, cdfs.shape[0]))
+        cells = np.empty(uniforms.shape, dtype=np.intp)
+        for match in range(cdfs.shape[0]):
+            cells[:, match] = np.searchsorted(cdfs[match], uniforms[:, match], side="right")
+        np.minimum(cells, size * size - 1, out=cells)
+
+        return np.divmod(cells, size)
+
+    def _chunks(self, n_samples: int, seed: Optional[int]) -> List[Tuple[int, np.random.SeedSequence]]:
+        """Split a run into (size, child seed) chunks."""
+        counts = [self.chunk_size] * (n_samples // self.chunk_size)
+        if n_samples % self.chunk_size:
+            counts.append(n_samples % self.chunk_size)
+
+        children = np.random.SeedSequence(seed).spawn(len(counts))
+        return list(zip(counts, children))
+
+    def _count_hits(
+        self,
+        lambda_home: np.ndarray,
+        lambda_away: np.ndarray,
+        event: Event,
+        n: int,
+        seed_sequence: np.random.SeedSequence,
+        cdfs: Optional[np.ndarray],
+    ) -> int:
+        """Simulate one chunk and count event hits."""
+        rng = np.random.default_rng(seed_sequence)
+        home_goals, away_goals = self.sample(lambda_home, lambda_away, n, rng, cdfs)
+        return int(np.count_nonzero(event(home_goals, away_goals)))
+
+    def estimate(
+        self,
+        lambda_home,
+        lambda_away,
+        event: Union[Event, Sequence[Leg]],
+        n_samples: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> MonteCarloEstimate:
+        """
+        Estimate the probability of an event over several matches.
+
+        Args:
+            lambda_home: Home expected goals per match, shape (M,)
+            lambda_away: Away expected goals per match, shape (M,)
+            event: Callable over sampled (home_goals, away_goals), each of
+                   shape (n, M), or a list of (match index, market) legs
+                   that must all win. Callables must be picklable when
+                   workers > 1.
+            n_samples: Simulated outcomes (default self.n_samples)
+            seed: Seed (default self.seed)
+
+        Returns:
+            MonteCarloEstimate
+
+        Example:
+            >>> mc = MonteCarloSimulator(seed=7)
+            >>> mc.estimate([1.6], [1.1], [(0, "home_win"), (0, "over_2.5")])
+            MonteCarloEstimate(probability=0.295..., standard_error=0.0014..., n_samples=100000)
+        """
+        lambda_home = np.atleast_1d(np.asarray(lambda_home, dtype=np.float64))
+        lambda_away = np.atleast_1d(np.asarray(lambda_away, dtype=np.float64))
+        if lambda_home.shape != lambda_away.shape:
+            raise ValueError("lambda_home and lambda_away must have the same shape")
+
+        if not callable(event):
+            event = LegsEvent(event)
+            for match, _ in event.legs:
+                if not 0 <= match < lambda_home.shape[0]:
+                    raise ValueError(f"Leg refers to unknown match index {match}")
+
+        n_samples = self.n_samples if n_samples is None else n_samples
+        seed = self.seed if seed is None else seed
+        if n_samples < 1:
+            raise ValueError("n_samples must be positive")
+
+        cdfs = None
+        if not isinstance(self.model, IndependentPoisson):
+            cdfs = self._scoreline_cdfs(lambda_home, lambda_away)
+
+        chunks = self._chunks(n_samples, seed)
+        args = [(lambda_home, lambda_away, event, n, child, cdfs) for n, child in chunks]
+
+        if self.workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks))) as pool:
+                hits = sum(pool.map(self._count_hits, *zip(*args)))
+        else:
+            hits = sum(self._count_hits(*chunk_args) for chunk_args in args)
+
+        probability = hits / n_samples
+        standard_error = math.sqrt(probability * (1 - probability) / n_samples)
+
+        logger.debug(
+            f"Monte Carlo: {lambda_home.shape[0]} matches, {n_samples} samples, "
+            f"{len(chunks)} chunks, p={probability:.4f} ± {standard_error:.4f}"
+        )
+
+        return MonteCarloEstimate(probability, standard_error, n_samples)
@@ -2,8 +2,102 @@
 Poisson distribution calculator for goal prediction
 """
 import math
-from typing import Dict, Tuple, List
 from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Tuple, List, Optional, Sequence, Union
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from bet_copilot.math_engine.goal_models import GoalModel
+    from bet_copilot.math_engine.lambda_table import LambdaTable
+
+SIMULATOR_BACKENDS = ("exact", "table")
+
+# e^-λ underflows past λ ≈ 745; above this the kernels work in log space
+LOG_SPACE_LAMBDA = 600.0
+
+# Hard upper bound on grid size in adaptive truncation mode
+ADAPTIVE_GOAL_LIMIT = 50
+
+# Bookmaker ladders: totals 0.5-6.5 and home handicaps -3 to +3, quarter steps
+TOTAL_LINE_LADDER = tuple(k / 4 for k in range(2, 27))
+HANDICAP_LADDER = tuple(k / 4 for k in range(-12, 13))
+
+
+class _KernelTables:
+    """
+    Shared lookup arrays for the vectorized kernels, grown on demand.
+    
+    Holding 1/k and log(k!) here lets the kernels fill caller buffers
+    without allocating temporaries.
+    """
+    
+    def __init__(self, size: int = 64):
+        self._grow(size)
+    
+    def _grow(self, size: int):
+        integers = np.arange(size, dtype=np.float64)
+        reciprocals = np.zeros(size)
+        reciprocals[1:] = 1.0 / integers[1:]
+        log_factorials = np.array([math.lgamma(k + 1) for k in range(size)])
+        
+        # Publish complete arrays only (safe for concurrent readers)
+        self.integers = integers
+        self.reciprocals = reciprocals
+        self.log_factorials = log_factorials
+    
+    def ensure(self, size: int) -> "_KernelTables":
+        """Make sure tables hold at least size entries."""
+        if size > self.integers.shape[0]:
+            self._grow(max(size, 2 * self.integers.shape[0]))
+        return self
+
+
+_TABLES = _KernelTables()
+
+
+def _regularized_gamma_q(a: float, x: float) -> float:
+    """
+    Upper regularized incomplete gamma Q(a, x) = Γ(a, x) / Γ(a).
+    
+    Series expansion for x < a + 1, Lentz continued fraction otherwise
+    (Numerical Recipes, gammq).
+    """
+    eps = 1e-15
+    tiny = 1e-300
+    log_prefactor = -x + a * math.log(x) - math.lgamma(a)
+    
+    if x < a + 1:
+        term = 1.0 / a
+        total = term
+        n = a
+        for _ in range(1000):
+            n += 1
+            term *= x / n
+            total += term
+            if abs(term) < abs(total) * eps:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefactor))
+    
+    b = x + 1 - a
+    c = 1.0 / tiny
+    d = 1.0 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        if abs(d) < tiny:
+            d = tiny
+        c = b + an / c
+        if abs(c) < tiny:
+            c = tiny
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < eps:
+            break
+    return min(1.0, math.exp(log_prefactor) * h)
 
 
 class PoissonCalculator:
@@ -19,30 +113,18 @@ class PoissonCalculator:
     - λ (lambda): Expected number of events
     - k: Actual number of events
     - e: Euler's constant (~2.71828)
-    """
     
-    @staticmethod
-    @lru_cache(maxsize=128)
-    def _factorial(n: int) -> int:
-        """
-        Calculate factorial with caching.
-        
-        Args:
-            n: Non-negative integer
-            
-        Returns:
-            n! = n × (n-1) × ... × 2 × 1
-        """
-        if n <= 1:
-            return 1
-        return n * PoissonCalculator._factorial(n - 1)
+    Single probabilities are evaluated in log space, ranges with the
+    recurrence P(k) = P(k-1) × λ / k, and the CDF through the regularized
+    incomplete gamma function, so no factorials are ever formed.
+    """
     
     @staticmethod
     def probability(k: int, lambda_: float) -> float:
         """
         Calculate Poisson probability for exactly k events.
         
-        P(X = k) = (λ^k × e^-λ) / k!
+        P(X = k) = exp(k·ln λ - λ - ln k!)
         
         Args:
             k: Number of events (goals)
@@ -62,11 +144,64 @@ class PoissonCalculator:
         if lambda_ <= 0:
             return 1.0 if k == 0 else 0.0
         
-        # P(X = k) = (λ^k × e^-λ) / k!
-        numerator = (lambda_ ** k) * math.exp(-lambda_)
-        denominator = PoissonCalculator._factorial(k)
+        return math.exp(k * math.log(lambda_) - lambda_ - math.lgamma(k + 1))
+    
+    @staticmethod
+    def pmf_into(lambda_: float, out: np.ndarray) -> np.ndarray:
+        """
+        Fill a preallocated buffer with P(X = 0) .. P(X = len(out) - 1).
+        
+        Uses the recurrence P(k) = P(k-1) × λ / k, switching to log space
+        for λ ≥ LOG_SPACE_LAMBDA where e^-λ would underflow.
+        
+        Args:
+            lambda_: Expected rate
+            out: Float64 buffer to fill (its length sets max_k + 1)
+            
+        Returns:
+            The filled buffer
+        """
+        size = out.shape[0]
+        if size == 0:
+            return out
+        
+        if lambda_ <= 0:
+            out.fill(0.0)
+            out[0] = 1.0
+            return out
+        
+        tables = _TABLES.ensure(size)
+        
+        if lambda_ < LOG_SPACE_LAMBDA:
+            out[0] = math.exp(-lambda_)
+            np.multiply(tables.reciprocals[1:size], lambda_, out=out[1:])
+            np.cumprod(out, out=out)
+        else:
+            np.multiply(tables.integers[:size], math.log(lambda_), out=out)
+            out -= lambda_
+            out -= tables.log_factorials[:size]
+            np.exp(out, out=out)
+        
+        return out
+    
+    @staticmethod
+    def cdf_into(lambda_: float, out: np.ndarray) -> np.ndarray:
+        """
+        Fill a preallocated buffer with P(X <= 0) .. P(X <= len(out) - 1).
         
-        return numerator / denominator
+        One pass over the PMF (O(k) for every threshold at once).
+        
+        Args:
+            lambda_: Expected rate
+            out: Float64 buffer to fill
+            
+        Returns:
+            The filled buffer
+        """
+        PoissonCalculator.pmf_into(lambda_, out)
+        np.cumsum(out, out=out)
+        np.minimum(out, 1.0, out=out)
+        return out
     
     @staticmethod
     def probability_range(max_k: int, lambda_: float) -> List[float]:
@@ -80,10 +215,41 @@ class PoissonCalculator:
         Returns:
             List of probabilities [P(0), P(1), ..., P(max_k)]
         """
-        return [
-            PoissonCalculator.probability(k, lambda_)
-            for k in range(max_k + 1)
-        ]
+        return PoissonCalculator.pmf_into(lambda_, np.empty(max_k + 1)).tolist()
+    
+    @staticmethod
+    def probability_matrix(max_k: int, lambdas) -> np.ndarray:
+        """
+        Calculate Poisson probabilities for many lambdas at once.
+        
+        Uses the recurrence P(k) = P(k-1) × λ / k, one row per lambda
+        (log space for rows with λ ≥ LOG_SPACE_LAMBDA).
+        
+        Args:
+            max_k: Maximum number of events to calculate
+            lambdas: Array-like of expected rates, shape (N,)
+            
+        Returns:
+            Array of shape (N, max_k + 1) where out[n, k] = P(X = k | λ_n)
+        """
+        lambdas = np.maximum(np.asarray(lambdas, dtype=np.float64), 0.0)
+        tables = _TABLES.ensure(max_k + 1)
+        
+        factors = np.empty((lambdas.shape[0], max_k + 1))
+        factors[:, 0] = np.exp(-lambdas)
+        factors[:, 1:] = lambdas[:, None] * tables.reciprocals[1:max_k + 1]
+        probabilities = np.cumprod(factors, axis=1)
+        
+        large = lambdas >= LOG_SPACE_LAMBDA
+        if large.any():
+            log_probs = (
+                np.log(lambdas[large])[:, None] * tables.integers[:max_k + 1]
+                - lambdas[large][:, None]
+                - tables.log_factorials[:max_k + 1]
+            )
+            probabilities[large] = np.exp(log_probs)
+        
+        return probabilities
     
     @staticmethod
     def expected_value(lambda_: float) -> float:
@@ -135,7 +301,8 @@ class PoissonCalculator:
         """
         Calculate cumulative Poisson probability P(X <= k).
         
-        This is the sum of probabilities from 0 to k.
+        Evaluated as the regularized upper incomplete gamma Q(k + 1, λ),
+        so cost does not grow with k.
         
         Args:
             k: Upper bound (inclusive)
@@ -155,31 +322,499 @@ class PoissonCalculator:
         if lambda_ <= 0:
             return 1.0
         
-        # Sum probabilities from 0 to k
-        cumulative = sum(
-            PoissonCalculator.probability(i, lambda_)
-            for i in range(k + 1)
-        )
+        return _regularized_gamma_q(k + 1, lambda_)
+
+
+# Columns of market_weight_matrix(), followed by one "over" column per line
+MARKET_COLUMNS = ("home_win", "draw", "away_win", "btts_yes", "mass")
+
+
+def market_weight_matrix(max_goals: int, total_lines) -> np.ndarray:
+    """
+    Weights that reduce flattened scoreline grids to market probabilities.
+    
+    flat_grids @ weights gives, per grid, the MARKET_COLUMNS followed by
+    P(total > line) for each of total_lines.
+    
+    Args:
+        max_goals: Maximum goals per team in the grids
+        total_lines: Goal lines for over/under
+        
+    Returns:
+        Array of shape ((max_goals + 1)², len(MARKET_COLUMNS) + len(total_lines))
+    """
+    size = max_goals + 1
+    home_goals, away_goals = np.indices((size, size))
+    total_goals = (home_goals + away_goals).ravel()
+    home_goals = home_goals.ravel()
+    away_goals = away_goals.ravel()
+    
+    return np.column_stack(
+        [
+            home_goals > away_goals,
+            home_goals == away_goals,
+            home_goals < away_goals,
+            (home_goals > 0) & (away_goals > 0),
+            np.ones(size * size, dtype=bool),
+        ]
+        + [total_goals > line for line in total_lines]
+    ).astype(np.float64)
+
+
+@lru_cache(maxsize=64)
+def _diagonal_indices(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Flat (i + j) and (i - j + size - 1) indices of a size × size grid."""
+    home, away = np.indices((size, size))
+    return (home + away).ravel(), (home - away + size - 1).ravel()
+
+
+@lru_cache(maxsize=256)
+def _settlement_indices(
+    lines: Tuple[float, ...],
+    offset: int,
+    last: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """CDF indices giving P(X < leg) and P(X <= leg) for both stake halves."""
+    lines = np.asarray(lines, dtype=np.float64)
+    quarter = np.round(lines * 4) % 2 == 1
+    legs = np.stack([
+        np.where(quarter, lines - 0.25, lines),
+        np.where(quarter, lines + 0.25, lines)
+    ])
+    below = np.clip(np.ceil(legs).astype(np.intp) + offset, 0, last)
+    at_or_below = np.clip(np.floor(legs).astype(np.intp) + 1 + offset, 0, last)
+    return below, at_or_below
+
+
+def line_outcomes(
+    distribution: np.ndarray,
+    lines: Sequence[float],
+    offset: int = 0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Settle a ladder of lines against a discrete distribution.
+    
+    Whole lines can push; quarter lines (x.25, x.75) split the stake
+    between the two adjacent lines, so a result on the whole-number half
+    settles as half win / half push (or half push / half loss).
+    
+    Args:
+        distribution: distribution[k] = P(X = k - offset)
+        lines: Lines to settle
+        offset: Index of X = 0 in distribution
+        
+    Returns:
+        (above, push, below) arrays per line, where above = P(X > line)
+        and push = P(X = line) per unit stake, averaged over quarter halves
+    """
+    # cdf[k] = P(X <= k - offset - 1)
+    cdf = np.concatenate(([0.0], np.cumsum(distribution)))
+    mass = cdf[-1]
+    below_idx, at_or_below_idx = _settlement_indices(
+        tuple(lines), offset, cdf.shape[0] - 1
+    )
+    
+    below = cdf[below_idx].sum(axis=0) / 2
+    above = mass - cdf[at_or_below_idx].sum(axis=0) / 2
+    push = np.maximum(mass - above - below, 0.0)
+    
+    return above, push, below
+
+
+class ScorelineGrid:
+    """
+    Joint scoreline distribution backed by a NumPy matrix.
+    
+    grid[i, j] = P(home goals = i, away goals = j), built once as the
+    outer product of the two goal PMFs. Every market is a cheap reduction
+    over this matrix:
+    
+    - 1X2: lower triangle (home), diagonal (draw), upper triangle (away)
+    - Totals: anti-diagonal sums (i + j = constant)
+    - Handicaps: diagonal sums (i - j = constant)
+    - BTTS: everything outside row 0 and column 0
+    """
+    
+    def __init__(self, probabilities: np.ndarray):
+        """
+        Initialize grid from a square probability matrix.
+        
+        Args:
+            probabilities: (G, G) array, rows = home goals, cols = away goals
+        """
+        self.probabilities = np.asarray(probabilities, dtype=np.float64)
+        self._totals: np.ndarray = None
+        self._differences: np.ndarray = None
+    
+    @classmethod
+    def from_pmfs(cls, home_pmf, away_pmf) -> "ScorelineGrid":
+        """
+        Build grid assuming independence: P(i-j) = P(home=i) × P(away=j).
+        
+        Args:
+            home_pmf: Home goals PMF [P(0), ..., P(max_goals)]
+            away_pmf: Away goals PMF [P(0), ..., P(max_goals)]
+            
+        Returns:
+            ScorelineGrid
+        """
+        return cls(np.outer(home_pmf, away_pmf))
+    
+    @property
+    def max_goals(self) -> int:
+        """Maximum goals per team covered by the grid."""
+        return self.probabilities.shape[0] - 1
+    
+    def total_mass(self) -> float:
+        """Probability mass captured by the (truncated) grid."""
+        return float(self.probabilities.sum())
+    
+    def truncated_mass(self) -> float:
+        """Probability mass lost beyond max_goals (1 - total_mass)."""
+        return max(0.0, 1.0 - self.total_mass())
+    
+    def total_goals_distribution(self) -> np.ndarray:
+        """
+        Distribution of total goals (anti-diagonal sums).
+        
+        Returns:
+            Array where element k = P(home + away = k), k = 0..2*max_goals
+        """
+        if self._totals is None:
+            size = self.probabilities.shape[0]
+            sums, _ = _diagonal_indices(size)
+            self._totals = np.bincount(
+                sums, weights=self.probabilities.ravel(), minlength=2 * size - 1
+            )
+        return self._totals
+    
+    def goal_difference_distribution(self) -> np.ndarray:
+        """
+        Distribution of home minus away goals (diagonal sums).
+        
+        Returns:
+            Array where element d + max_goals = P(home - away = d)
+        """
+        if self._differences is None:
+            size = self.probabilities.shape[0]
+            _, differences = _diagonal_indices(size)
+            self._differences = np.bincount(
+                differences, weights=self.probabilities.ravel(), minlength=2 * size - 1
+            )
+        return self._differences
+    
+    def match_outcome(self) -> Dict[str, float]:
+        """
+        Home/Draw/Away probabilities.
+        
+        Returns:
+            Dictionary with "home_win", "draw" and "away_win"
+        """
+        grid = self.probabilities
+        return {
+            "home_win": round(float(np.tril(grid, -1).sum()), 4),
+            "draw": round(float(np.trace(grid)), 4),
+            "away_win": round(float(np.triu(grid, 1).sum()), 4)
+        }
+    
+    def most_likely(self, top_n: int = 10) -> List[Tuple[Tuple[int, int], float]]:
+        """
+        Most likely scorelines sorted by probability.
+        
+        Ties keep row-major order (home goals, then away goals).
         
-        return cumulative
+        Args:
+            top_n: Number of scorelines to return
+            
+        Returns:
+            List of ((home_goals, away_goals), probability) tuples
+        """
+        flat = self.probabilities.ravel()
+        size = self.probabilities.shape[1]
+        order = np.argsort(-flat, kind="stable")[:top_n]
+        
+        return [
+            ((int(idx // size), int(idx % size)), round(float(flat[idx]), 4))
+            for idx in order
+        ]
+    
+    def over_under(self, threshold: float = 2.5) -> Dict[str, float]:
+        """
+        Probability of total goals over/under threshold.
+        
+        Args:
+            threshold: Goals threshold (e.g., 2.5)
+            
+        Returns:
+            Dictionary with "over" and "under" probabilities
+        """
+        totals = self.total_goals_distribution()
+        goals = np.arange(totals.shape[0])
+        over = float(totals[goals > threshold].sum())
+        under = float(totals[goals <= threshold].sum())
+        
+        return {
+            "over": round(over, 4),
+            "under": round(under, 4)
+        }
+    
+    def totals_ladder(
+        self,
+        lines=TOTAL_LINE_LADDER
+    ) -> Dict[float, Dict[str, float]]:
+        """
+        Over/under for a whole ladder of total-goals lines in one pass.
+        
+        Args:
+            lines: Lines to price, including whole (push) and quarter lines
+            
+        Returns:
+            Dictionary mapping line to "over", "push" and "under"
+            probabilities per unit stake (quarter lines split the stake)
+            
+        Example:
+            >>> grid = MatchSimulator().scoreline_grid(1.5, 1.2)
+            >>> grid.totals_ladder([2.0, 2.25])[2.25]
+            {'over': 0.5063, 'push': 0.1225, 'under': 0.3711}
+        """
+        outcomes = np.round(line_outcomes(self.total_goals_distribution(), lines), 4)
+        
+        return {
+            float(line): {"over": o, "push": p, "under": u}
+            for line, o, p, u in zip(lines, *outcomes.tolist())
+        }
+    
+    def asian_handicap(
+        self,
+        lines=HANDICAP_LADDER
+    ) -> Dict[float, Dict[str, float]]:
+        """
+        Asian handicap ladder from the home side in one pass.
+        
+        The home bet on line h wins when home - away + h > 0, pushes on 0
+        and loses otherwise; the away bet is the mirror image (away +h
+        wins exactly when home -h loses). Quarter lines split the stake,
+        so expected return at decimal odds o is home × o + push.
+        
+        Args:
+            lines: Home handicaps (e.g. -0.75 = home gives 0.75 goals)
+            
+        Returns:
+            Dictionary mapping line to "home", "push" and "away"
+            probabilities per unit stake
+        """
+        outcomes = np.round(line_outcomes(
+            self.goal_difference_distribution(),
+            [-line for line in lines],
+            offset=self.max_goals
+        ), 4)
+        
+        return {
+            float(line): {"home": h, "push": p, "away": a}
+            for line, h, p, a in zip(lines, *outcomes.tolist())
+        }
+    
+    def both_teams_to_score(self) -> Dict[str, float]:
+        """
+        Probability of both teams scoring (BTTS).
+        
+        Returns:
+            Dictionary with "yes" and "no" probabilities
+        """
+        btts_yes = float(self.probabilities[1:, 1:].sum())
+        btts_no = self.total_mass() - btts_yes
+        
+        return {
+            "yes": round(btts_yes, 4),
+            "no": round(btts_no, 4)
+        }
+    
+    def to_dict(self) -> Dict[Tuple[int, int], float]:
+        """
+        Dictionary view of the grid (compatibility format).
+        
+        Returns:
+            Dictionary mapping (home_goals, away_goals) to probability
+        """
+        size = self.probabilities.shape[1]
+        return {
+            (idx // size, idx % size): prob
+            for idx, prob in enumerate(self.probabilities.ravel().tolist())
+        }
 
 
 class MatchSimulator:
     """
-    Simulates match outcomes using independent Poisson distributions
-    for home and away goals.
+    Simulates match outcomes from a joint scoreline distribution.
+    
+    The distribution comes from a GoalModel: independent Poisson by
+    default, or "dixon_coles" / "bivariate_poisson" for models that
+    correlate home and away goals (see goal_models).
+    
+    All markets are derived from a single ScorelineGrid; use
+    scoreline_grid() directly when several markets are needed for the
+    same match.
+    
+    With backend="table", 1X2, over/under and BTTS are answered from a
+    precomputed LambdaTable by bilinear interpolation (max absolute error
+    TABLE_MAX_ERROR = 5e-5). Lambdas or lines outside the table fall back
+    to the exact path. The table is built with independent Poisson, so it
+    is only available with the default model.
+    
+    With tail_epsilon set, the grid is sized per match: the smallest
+    max_goals whose Poisson upper tail is below tail_epsilon for both
+    teams (capped at ADAPTIVE_GOAL_LIMIT). Low-λ matches get smaller grids
+    and high-λ matches stop losing mass; ScorelineGrid.truncated_mass()
+    reports what is left out.
     """
     
-    def __init__(self, max_goals: int = 8):
+    def __init__(
+        self,
+        max_goals: int = 8,
+        backend: str = "exact",
+        table: Optional["LambdaTable"] = None,
+        tail_epsilon: Optional[float] = None,
+        model: Union[str, "GoalModel"] = "poisson"
+    ):
         """
         Initialize match simulator.
         
         Args:
             max_goals: Maximum goals to consider per team (default 8)
                       Higher values are more accurate but slower.
+            backend: "exact" (grid per call) or "table" (interpolated lookup)
+            table: Table for the "table" backend; loaded (or built) from
+                   config.LAMBDA_TABLE_PATH on first use if omitted
+            tail_epsilon: Enable adaptive grid sizing with this maximum
+                          tail mass per team (max_goals is then ignored)
+            model: Goal model name ("poisson", "dixon_coles",
+                   "bivariate_poisson") or a GoalModel instance
         """
+        from bet_copilot.math_engine.goal_models import IndependentPoisson, get_goal_model
+        
+        model = get_goal_model(model)
+        if backend not in SIMULATOR_BACKENDS:
+            raise ValueError(
+                f"Unknown backend: {backend} (expected one of {SIMULATOR_BACKENDS})"
+            )
+        if tail_epsilon is not None:
+            if not 0 < tail_epsilon < 1:
+                raise ValueError("tail_epsilon must be between 0 and 1")
+            if backend == "table":
+                raise ValueError("The table backend requires a fixed max_goals")
+        if backend == "table" and not isinstance(model, IndependentPoisson):
+            raise ValueError("The table backend only supports the independent Poisson model")
+        if table is not None and table.max_goals != max_goals:
+            raise ValueError(
+                f"Table built with max_goals={table.max_goals}, simulator uses {max_goals}"
+            )
+        
         self.max_goals = max_goals
+        self.backend = backend
+        self.tail_epsilon = tail_epsilon
+        self.model = model
+        self._independent = isinstance(model, IndependentPoisson)
         self.calculator = PoissonCalculator()
+        self._table = table
+    
+    @property
+    def adaptive(self) -> bool:
+        """Whether grids are sized per match by tail mass."""
+        return self.tail_epsilon is not None
+    
+    @property
+    def grid_key(self):
+        """Hashable description of how grids are built (for caches)."""
+        size_key = ("adaptive", self.tail_epsilon) if self.adaptive else self.max_goals
+        if self._independent:
+            return size_key
+        return (self.model.key, size_key)
+    
+    def goals_for(self, lambda_home, lambda_away) -> int:
+        """
+        Grid size (max goals per team) to use for the given lambdas.
+        
+        Fixed mode returns max_goals. Adaptive mode returns the smallest n
+        with P(X > n) < tail_epsilon for every lambda given (scalars or
+        arrays), capped at ADAPTIVE_GOAL_LIMIT.
+        
+        Args:
+            lambda_home: Home expected goals (scalar or array-like)
+            lambda_away: Away expected goals (scalar or array-like)
+            
+        Returns:
+            Maximum goals per team
+        """
+        if not self.adaptive:
+            return self.max_goals
+        
+        lambdas = np.concatenate([
+            np.atleast_1d(np.asarray(lambda_home, dtype=np.float64)),
+            np.atleast_1d(np.asarray(lambda_away, dtype=np.float64))
+        ])
+        cdf = np.cumsum(
+            self.calculator.probability_matrix(ADAPTIVE_GOAL_LIMIT, lambdas),
+            axis=1
+        )
+        # Number of leading values still below 1 - ε = first n meeting the bound
+        needed = int((cdf < 1.0 - self.tail_epsilon).sum(axis=1).max())
+        
+        return min(needed, ADAPTIVE_GOAL_LIMIT)
+    
+    @property
+    def table(self) -> Optional["LambdaTable"]:
+        """Lookup table for the "table" backend (None for "exact")."""
+        if self.backend != "table":
+            return None
+        
+        if self._table is None:
+            from bet_copilot.math_engine.lambda_table import LambdaTable
+            self._table = LambdaTable.load_or_build(max_goals=self.max_goals)
+        
+        return self._table
+    
+    def _table_for(self, lambda_home: float, lambda_away: float) -> Optional["LambdaTable"]:
+        """Table able to answer this lambda pair, if any."""
+        table = self.table
+        if table is not None and table.covers(lambda_home, lambda_away):
+            return table
+        return None
+    
+    def scoreline_grid(
+        self,
+        lambda_home: float,
+        lambda_away: float
+    ) -> ScorelineGrid:
+        """
+        Build the joint scoreline grid for a match.
+        
+        Args:
+            lambda_home: Expected goals for home team (xG)
+            lambda_away: Expected goals for away team (xG)
+            
+        Returns:
+            ScorelineGrid of shape (max_goals + 1, max_goals + 1), with
+            max_goals chosen per match in adaptive mode
+        """
+        max_goals = self.goals_for(lambda_home, lambda_away)
+        
+        return ScorelineGrid(self.model.grid(lambda_home, lambda_away, max_goals))
+    
+    def scoreline_tensor(self, lambda_home, lambda_away) -> np.ndarray:
+        """
+        Build scoreline grids for many matches in one shot.
+        
+        Args:
+            lambda_home: Array-like of home expected goals, shape (N,)
+            lambda_away: Array-like of away expected goals, shape (N,)
+            
+        Returns:
+            Array of shape (N, max_goals + 1, max_goals + 1); in adaptive
+            mode max_goals is the largest needed by any match in the batch
+        """
+        max_goals = self.goals_for(lambda_home, lambda_away)
+        
+        return self.model.tensor(lambda_home, lambda_away, max_goals)
     
     def calculate_scoreline_probabilities(
         self,
@@ -189,7 +824,7 @@ class MatchSimulator:
         """
         Calculate probabilities for all possible scorelines.
         
-        Assumes independence: P(i-j) = P(home=i) × P(away=j)
+        With the default model: P(i-j) = P(home=i) × P(away=j)
         
         Args:
             lambda_home: Expected goals for home team (xG)
@@ -204,20 +839,7 @@ class MatchSimulator:
             >>> probs[(2, 1)]  # Probability of 2-1
             0.0897
         """
-        # Pre-calculate probabilities for each team
-        home_probs = self.calculator.probability_range(self.max_goals, lambda_home)
-        away_probs = self.calculator.probability_range(self.max_goals, lambda_away)
-        
-        scorelines = {}
-        
-        # Calculate joint probability for each scoreline
-        for home_goals in range(self.max_goals + 1):
-            for away_goals in range(self.max_goals + 1):
-                # Independence assumption: multiply individual probabilities
-                prob = home_probs[home_goals] * away_probs[away_goals]
-                scorelines[(home_goals, away_goals)] = prob
-        
-        return scorelines
+        return self.scoreline_grid(lambda_home, lambda_away).to_dict()
     
     def calculate_match_outcome(
         self,
@@ -243,27 +865,11 @@ class MatchSimulator:
             >>> outcomes["home_win"]
             0.523
         """
-        # Get all scoreline probabilities
-        scorelines = self.calculate_scoreline_probabilities(lambda_home, lambda_away)
-        
-        # Aggregate by outcome
-        home_win = 0.0
-        draw = 0.0
-        away_win = 0.0
+        table = self._table_for(lambda_home, lambda_away)
+        if table is not None:
+            return table.match_outcome(lambda_home, lambda_away)
         
-        for (home_goals, away_goals), prob in scorelines.items():
-            if home_goals > away_goals:
-                home_win += prob
-            elif home_goals == away_goals:
-                draw += prob
-            else:
-                away_win += prob
-        
-        return {
-            "home_win": round(home_win, 4),
-            "draw": round(draw, 4),
-            "away_win": round(away_win, 4)
-        }
+        return self.scoreline_grid(lambda_home, lambda_away).match_outcome()
     
     def most_likely_scorelines(
         self,
@@ -288,16 +894,7 @@ class MatchSimulator:
             >>> scorelines[0]
             ((1, 1), 0.1682)
         """
-        scorelines = self.calculate_scoreline_probabilities(lambda_home, lambda_away)
-        
-        # Sort by probability (descending)
-        sorted_scorelines = sorted(
-            scorelines.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        return [(score, round(prob, 4)) for score, prob in sorted_scorelines[:top_n]]
+        return self.scoreline_grid(lambda_home, lambda_away).most_likely(top_n)
     
     def expected_total_goals(
         self,
@@ -335,22 +932,11 @@ class MatchSimulator:
         Returns:
             Dictionary with "over" and "under" probabilities
         """
-        scorelines = self.calculate_scoreline_probabilities(lambda_home, lambda_away)
+        table = self._table_for(lambda_home, lambda_away)
+        if table is not None and table.has_line(threshold):
+            return table.over_under(lambda_home, lambda_away, threshold)
         
-        over = 0.0
-        under = 0.0
-        
-        for (home_goals, away_goals), prob in scorelines.items():
-            total = home_goals + away_goals
-            if total > threshold:
-                over += prob
-            else:
-                under += prob
-        
-        return {
-            "over": round(over, 4),
-            "under": round(under, 4)
-        }
+        return self.scoreline_grid(lambda_home, lambda_away).over_under(threshold)
     
     def both_teams_to_score(
         self,
@@ -367,18 +953,8 @@ class MatchSimulator:
         Returns:
             Dictionary with "yes" and "no" probabilities
         """
-        scorelines = self.calculate_scoreline_probabilities(lambda_home, lambda_away)
-        
-        btts_yes = 0.0
-        btts_no = 0.0
-        
-        for (home_goals, away_goals), prob in scorelines.items():
-            if home_goals > 0 and away_goals > 0:
-                btts_yes += prob
-            else:
-                btts_no += prob
+        table = self._table_for(lambda_home, lambda_away)
+        if table is not None:
+            return table.both_teams_to_score(lambda_home, lambda_away)
         
-        return {
-            "yes": round(btts_yes, 4),
-            "no": round(btts_no, 4)
-        }
+        return self.scoreline_grid(lambda_home, lambda_away).both_teams_to_score()
@@ -2,9 +2,19 @@
 Soccer match predictor using Poisson distribution and xG data
 """
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
 
-from bet_copilot.math_engine.poisson import MatchSimulator
+import numpy as np
+
+from bet_copilot.math_engine.goal_models import GoalModel
+from bet_copilot.math_engine.market_cache import MarketCache, MarketVector
+from bet_copilot.math_engine.monte_carlo import Event, Leg, MonteCarloEstimate, MonteCarloSimulator
+from bet_copilot.math_engine.poisson import (
+    MatchSimulator,
+    ScorelineGrid,
+    market_weight_matrix,
+)
 from bet_copilot.models.soccer import (
     TeamForm,
     PredictionInput,
@@ -13,6 +23,130 @@ from bet_copilot.models.soccer import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TOTAL_LINES = (0.5, 1.5, 2.5, 3.5, 4.5)
+
+
+@dataclass
+class BatchPrediction:
+    """
+    Struct-of-arrays predictions for N matches.
+    
+    Every array is indexed by match; MatchPrediction objects are only
+    built on request via to_prediction() / to_predictions().
+    """
+    
+    lambda_home: np.ndarray  # (N,)
+    lambda_away: np.ndarray  # (N,)
+    home_win: np.ndarray  # (N,)
+    draw: np.ndarray  # (N,)
+    away_win: np.ndarray  # (N,)
+    total_lines: Tuple[float, ...]  # (L,) goal thresholds
+    over: np.ndarray  # (N, L) P(total > line)
+    under: np.ndarray  # (N, L) P(total <= line)
+    btts_yes: np.ndarray  # (N,)
+    btts_no: np.ndarray  # (N,)
+    most_likely_home: np.ndarray  # (N,) modal home goals
+    most_likely_away: np.ndarray  # (N,) modal away goals
+    most_likely_prob: np.ndarray  # (N,)
+    truncated_mass: np.ndarray  # (N,) mass beyond the grid
+    scorelines: Optional[np.ndarray] = None  # (N, G, G) if kept
+    
+    def __len__(self) -> int:
+        return self.lambda_home.shape[0]
+    
+    def over_under(self, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get over/under arrays for one of the computed lines.
+        
+        Args:
+            threshold: Goals line (must be in total_lines)
+            
+        Returns:
+            Tuple of (over, under) arrays, shape (N,)
+        """
+        if threshold not in self.total_lines:
+            raise ValueError(
+                f"Line {threshold} not computed (available: {self.total_lines})"
+            )
+        
+        column = self.total_lines.index(threshold)
+        return self.over[:, column], self.under[:, column]
+    
+    def to_prediction(
+        self,
+        index: int,
+        home_team: str,
+        away_team: str,
+        include_details: bool = False
+    ) -> MatchPrediction:
+        """
+        Build a MatchPrediction for one row of the batch.
+        
+        Args:
+            index: Row index
+            home_team: Home team name
+            away_team: Away team name
+            include_details: Attach scoreline grid, O/U 2.5 and BTTS
+                             (requires scorelines to be kept)
+            
+        Returns:
+            MatchPrediction equivalent to predict_from_lambdas()
+        """
+        lambda_home = float(self.lambda_home[index])
+        lambda_away = float(self.lambda_away[index])
+        
+        prediction = MatchPrediction(
+            home_team=home_team,
+            away_team=away_team,
+            home_lambda=lambda_home,
+            away_lambda=lambda_away,
+            home_win_prob=round(float(self.home_win[index]), 4),
+            draw_prob=round(float(self.draw[index]), 4),
+            away_win_prob=round(float(self.away_win[index]), 4),
+            most_likely_score=(
+                int(self.most_likely_home[index]),
+                int(self.most_likely_away[index])
+            ),
+            most_likely_score_prob=round(float(self.most_likely_prob[index]), 4),
+            expected_total_goals=round(lambda_home + lambda_away, 2),
+            truncated_mass=float(self.truncated_mass[index])
+        )
+        
+        if include_details:
+            if self.scorelines is None:
+                raise ValueError("Scorelines were not kept for this batch")
+            grid = ScorelineGrid(self.scorelines[index])
+            prediction.scoreline_grid = grid
+            prediction.over_under_2_5 = grid.over_under(2.5)
+            prediction.btts = grid.both_teams_to_score()
+        
+        return prediction
+    
+    def to_predictions(
+        self,
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+        include_details: bool = False
+    ) -> List[MatchPrediction]:
+        """
+        Build MatchPrediction objects for every row.
+        
+        Args:
+            home_teams: Home team names, one per row
+            away_teams: Away team names, one per row
+            include_details: Attach detailed markets
+            
+        Returns:
+            List of MatchPrediction
+        """
+        if len(home_teams) != len(self) or len(away_teams) != len(self):
+            raise ValueError("Team names must have one entry per match")
+        
+        return [
+            self.to_prediction(i, home, away, include_details)
+            for i, (home, away) in enumerate(zip(home_teams, away_teams))
+        ]
+
 
 class SoccerPredictor:
     """
@@ -32,7 +166,11 @@ class SoccerPredictor:
         self,
         matches_to_consider: int = 5,
         home_advantage_factor: float = 1.0,
-        max_goals: int = 8
+        max_goals: int = 8,
+        cache: Optional[MarketCache] = None,
+        tail_epsilon: Optional[float] = None,
+        model: Union[str, GoalModel] = "poisson",
+        half_life_days: Optional[float] = None
     ):
         """
         Initialize soccer predictor.
@@ -41,14 +179,32 @@ class SoccerPredictor:
             matches_to_consider: Number of recent matches to analyze (default 5)
             home_advantage_factor: Multiplier for home xG (e.g., 1.1 = 10% boost)
             max_goals: Maximum goals to consider in simulation (default 8)
+            cache: Optional market cache; when set, lambdas are quantized to
+                   the cache resolution and repeated pairs skip the grid
+            tail_epsilon: Size grids adaptively so each team's truncated
+                          tail is below this mass (overrides max_goals)
+            model: Goal model name ("poisson", "dixon_coles",
+                   "bivariate_poisson") or a GoalModel instance
+            half_life_days: Use exponentially time-weighted xG with this
+                            half-life instead of the last N matches
+                            (e.g. config.FORM_HALF_LIFE_DAYS)
         """
+        if half_life_days is not None and half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+        
         self.matches_to_consider = matches_to_consider
+        self.half_life_days = half_life_days
         self.home_advantage_factor = home_advantage_factor
-        self.simulator = MatchSimulator(max_goals=max_goals)
+        self.simulator = MatchSimulator(
+            max_goals=max_goals, tail_epsilon=tail_epsilon, model=model
+        )
+        self.cache = cache
+        self.monte_carlo = MonteCarloSimulator(model=self.simulator.model)
         
         logger.info(
             f"SoccerPredictor initialized: matches={matches_to_consider}, "
-            f"home_advantage={home_advantage_factor}"
+            f"half_life={half_life_days}, home_advantage={home_advantage_factor}, "
+            f"model={self.simulator.model!r}"
         )
     
     def predict(
@@ -82,7 +238,8 @@ class SoccerPredictor:
             home_team=home_team,
             away_team=away_team,
             matches_to_consider=self.matches_to_consider,
-            home_advantage_factor=self.home_advantage_factor
+            home_advantage_factor=self.home_advantage_factor,
+            half_life_days=self.half_life_days
         )
         
         # Calculate lambdas (expected goals)
@@ -94,42 +251,14 @@ class SoccerPredictor:
             f"λ_home={lambda_home}, λ_away={lambda_away}"
         )
         
-        # Calculate match outcome probabilities
-        outcome_probs = self.simulator.calculate_match_outcome(lambda_home, lambda_away)
-        
-        # Get most likely scoreline
-        scorelines = self.simulator.most_likely_scorelines(lambda_home, lambda_away, top_n=1)
-        most_likely_score, most_likely_prob = scorelines[0]
-        
-        # Expected total goals
-        expected_total = self.simulator.expected_total_goals(lambda_home, lambda_away)
-        
-        # Create prediction object
-        prediction = MatchPrediction(
-            home_team=home_team.team_name,
-            away_team=away_team.team_name,
-            home_lambda=lambda_home,
-            away_lambda=lambda_away,
-            home_win_prob=outcome_probs["home_win"],
-            draw_prob=outcome_probs["draw"],
-            away_win_prob=outcome_probs["away_win"],
-            most_likely_score=most_likely_score,
-            most_likely_score_prob=most_likely_prob,
-            expected_total_goals=round(expected_total, 2)
+        prediction = self._build_prediction(
+            home_team.team_name,
+            away_team.team_name,
+            lambda_home,
+            lambda_away,
+            include_details
         )
         
-        # Add detailed probabilities if requested
-        if include_details:
-            prediction.scoreline_probabilities = self.simulator.calculate_scoreline_probabilities(
-                lambda_home, lambda_away
-            )
-            prediction.over_under_2_5 = self.simulator.over_under_probability(
-                lambda_home, lambda_away, threshold=2.5
-            )
-            prediction.btts = self.simulator.both_teams_to_score(
-                lambda_home, lambda_away
-            )
-        
         logger.info(
             f"Prediction complete: {prediction.get_favorite()} "
             f"(confidence: {prediction.get_confidence():.1%})"
@@ -173,44 +302,181 @@ class SoccerPredictor:
             f"λ_home={lambda_home}, λ_away={lambda_away}"
         )
         
-        # Calculate match outcome probabilities
-        outcome_probs = self.simulator.calculate_match_outcome(lambda_home, lambda_away)
+        return self._build_prediction(
+            home_team_name,
+            away_team_name,
+            lambda_home,
+            lambda_away,
+            include_details
+        )
+    
+    def _build_prediction(
+        self,
+        home_team_name: str,
+        away_team_name: str,
+        lambda_home: float,
+        lambda_away: float,
+        include_details: bool
+    ) -> MatchPrediction:
+        """
+        Build a MatchPrediction from a single scoreline grid.
         
-        # Get most likely scoreline
-        scorelines = self.simulator.most_likely_scorelines(lambda_home, lambda_away, top_n=1)
-        most_likely_score, most_likely_prob = scorelines[0]
+        Every market is a reduction over the same grid, so it is
+        computed at most once per prediction (never on a cache hit).
+        """
+        if self.cache is not None:
+            markets = self.cache.get_or_compute(
+                lambda_home,
+                lambda_away,
+                self.simulator.grid_key,
+                self._compute_markets
+            )
+            lambda_home = self.cache.quantize(lambda_home)
+            lambda_away = self.cache.quantize(lambda_away)
+        else:
+            markets = self._compute_markets(lambda_home, lambda_away)
         
-        # Expected total goals
         expected_total = self.simulator.expected_total_goals(lambda_home, lambda_away)
         
-        # Create prediction object
         prediction = MatchPrediction(
             home_team=home_team_name,
             away_team=away_team_name,
             home_lambda=lambda_home,
             away_lambda=lambda_away,
-            home_win_prob=outcome_probs["home_win"],
-            draw_prob=outcome_probs["draw"],
-            away_win_prob=outcome_probs["away_win"],
-            most_likely_score=most_likely_score,
-            most_likely_score_prob=most_likely_prob,
-            expected_total_goals=round(expected_total, 2)
+            home_win_prob=markets.home_win,
+            draw_prob=markets.draw,
+            away_win_prob=markets.away_win,
+            most_likely_score=markets.most_likely_score,
+            most_likely_score_prob=markets.most_likely_score_prob,
+            expected_total_goals=round(expected_total, 2),
+            truncated_mass=markets.truncated_mass
         )
         
-        # Add detailed probabilities if requested
+        # Add detailed probabilities if requested (the grid is read-only, dicts are copied)
         if include_details:
-            prediction.scoreline_probabilities = self.simulator.calculate_scoreline_probabilities(
-                lambda_home, lambda_away
-            )
-            prediction.over_under_2_5 = self.simulator.over_under_probability(
-                lambda_home, lambda_away, threshold=2.5
-            )
-            prediction.btts = self.simulator.both_teams_to_score(
-                lambda_home, lambda_away
-            )
+            prediction.scoreline_grid = markets.grid
+            prediction.over_under_2_5 = dict(markets.over_under_2_5)
+            prediction.btts = dict(markets.btts)
         
         return prediction
     
+    def _compute_markets(self, lambda_home: float, lambda_away: float) -> MarketVector:
+        """Build the scoreline grid and reduce it to a market vector."""
+        return MarketVector.from_grid(
+            self.simulator.scoreline_grid(lambda_home, lambda_away)
+        )
+    
+    def predict_many(
+        self,
+        lambda_home,
+        lambda_away,
+        total_lines: Sequence[float] = DEFAULT_TOTAL_LINES,
+        keep_scorelines: bool = True
+    ) -> BatchPrediction:
+        """
+        Predict many matches at once from lambda arrays.
+        
+        Builds an (N, G, G) scoreline tensor in one shot and reduces every
+        market with a single matrix product, with no per-match Python
+        work or logging.
+        
+        Args:
+            lambda_home: Array-like of home expected goals, shape (N,)
+            lambda_away: Array-like of away expected goals, shape (N,)
+            total_lines: Goal lines to price for over/under
+            keep_scorelines: Keep the scoreline tensor on the result
+                             (needed for detailed MatchPrediction objects)
+            
+        Returns:
+            BatchPrediction with one entry per match
+            
+        Example:
+            >>> predictor = SoccerPredictor()
+            >>> batch = predictor.predict_many([2.1, 1.2], [1.5, 1.1])
+            >>> batch.home_win
+            array([0.5145..., 0.3831...])
+        """
+        lambda_home = np.atleast_1d(np.asarray(lambda_home, dtype=np.float64))
+        lambda_away = np.atleast_1d(np.asarray(lambda_away, dtype=np.float64))
+        
+        if lambda_home.shape != lambda_away.shape or lambda_home.ndim != 1:
+            raise ValueError("lambda_home and lambda_away must be 1-D arrays of equal length")
+        
+        total_lines = tuple(float(line) for line in total_lines)
+        
+        scorelines = self.simulator.scoreline_tensor(lambda_home, lambda_away)
+        n_matches, size, _ = scorelines.shape
+        flat = scorelines.reshape(n_matches, size * size)
+        
+        # One weight column per market, applied with a single matmul
+        weights = market_weight_matrix(size - 1, total_lines)
+        
+        markets = flat @ weights
+        mass = markets[:, 4]
+        over = markets[:, 5:]
+        
+        modal = flat.argmax(axis=1)
+        
+        logger.debug(f"Batch prediction complete: {n_matches} matches")
+        
+        return BatchPrediction(
+            lambda_home=lambda_home,
+            lambda_away=lambda_away,
+            home_win=markets[:, 0],
+            draw=markets[:, 1],
+            away_win=markets[:, 2],
+            total_lines=total_lines,
+            over=over,
+            under=mass[:, None] - over,
+            btts_yes=markets[:, 3],
+            btts_no=mass - markets[:, 3],
+            most_likely_home=modal // size,
+            most_likely_away=modal % size,
+            most_likely_prob=flat[np.arange(n_matches), modal],
+            truncated_mass=np.maximum(1.0 - mass, 0.0),
+            scorelines=scorelines if keep_scorelines else None
+        )
+    
+    def price_combo(
+        self,
+        lambdas: Sequence[Tuple[float, float]],
+        legs: Union[Sequence[Leg], Event],
+        n_samples: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> MonteCarloEstimate:
+        """
+        Price a same-game parlay or accumulator by Monte Carlo.
+        
+        Scorelines are sampled from the predictor's goal model, so legs
+        on the same match stay correlated (e.g. home win and over 2.5).
+        
+        Args:
+            lambdas: (λ_home, λ_away) per match
+            legs: (match index, market) legs that must all win, or an
+                  event callable (see MonteCarloSimulator.estimate)
+            n_samples: Simulated outcomes (default config.MONTE_CARLO_SAMPLES)
+            seed: Seed for reproducible estimates
+            
+        Returns:
+            MonteCarloEstimate with probability and standard error
+            
+        Example:
+            >>> predictor = SoccerPredictor()
+            >>> combo = predictor.price_combo(
+            ...     [(1.6, 1.1)], [(0, "home_win"), (0, "over_2.5")], seed=7
+            ... )
+            >>> combo.fair_odds
+            3.388...
+        """
+        if not lambdas:
+            raise ValueError("At least one match is required")
+        
+        lambda_home, lambda_away = np.asarray(lambdas, dtype=np.float64).T
+        
+        return self.monte_carlo.estimate(
+            lambda_home, lambda_away, legs, n_samples=n_samples, seed=seed
+        )
+    
     def get_top_scorelines(
         self,
         home_team: TeamForm,
@@ -232,7 +498,8 @@ class SoccerPredictor:
             home_team=home_team,
             away_team=away_team,
             matches_to_consider=self.matches_to_consider,
-            home_advantage_factor=self.home_advantage_factor
+            home_advantage_factor=self.home_advantage_factor,
+            half_life_days=self.half_life_days
         )
         
         lambda_home = prediction_input.get_home_lambda()
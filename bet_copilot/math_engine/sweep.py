@@ -0,0 +1,473 @@
+"""
+Hyperparameter sweeps for SoccerPredictor + KellyCriterion settings.
+
+Every point of a grid or random-search space is backtested on the same
+historical seasons and scored on 1X2 log-loss / Brier score and on
+flat-stake yield (1 unit on every value bet).
+
+The fixtures are parsed once and written to a structured .npy file
+(SeasonArchive). Workers memory-map it, so a process pool shares one copy
+of the history through the page cache instead of re-reading CSVs or
+pickling fixtures for every task; each worker decodes a season at most once.
+
+Seasons are evaluated in rungs. After each rung, configurations whose
+running objective is worse than the best one by more than a margin are
+stopped, so clearly bad settings do not use the rest of the budget.
+"""
+
+import csv
+import itertools
+import json
+import logging
+import random
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from bet_copilot.config import BACKTEST_MIN_HISTORY, SWEEP_RUNGS
+from bet_copilot.math_engine.backtest import (
+    MARKETS,
+    BacktestMetrics,
+    Backtester,
+    HistoricalFixture,
+    SeasonResult,
+    load_seasons,
+)
+from bet_copilot.math_engine.kelly import KellyCriterion
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+
+logger = logging.getLogger(__name__)
+
+# Tunable constructor arguments
+PREDICTOR_PARAMS = ("matches_to_consider", "home_advantage_factor", "max_goals", "half_life_days", "model")
+KELLY_PARAMS = ("kelly_fraction", "max_stake", "min_ev")
+
+# Objective -> True if higher is better
+OBJECTIVES = {"log_loss": False, "brier": False, "flat_yield": True, "roi": True, "yield_percent": True}
+
+# How far behind the best running objective a configuration may fall
+# before it is stopped (objective units: nats, Brier points, yield %)
+EARLY_STOP_MARGINS = {"log_loss": 0.03, "brier": 0.02, "flat_yield": 8.0, "roi": 15.0, "yield_percent": 8.0}
+
+EPOCH = datetime(1970, 1, 1)
+
+HISTORY_DTYPE = np.dtype([
+    ("kickoff", "i8"),  # microseconds since EPOCH
+    ("league", "i4"),
+    ("season", "i4"),
+    ("home_team", "i4"),
+    ("away_team", "i4"),
+    ("home_goals", "i2"),
+    ("away_goals", "i2"),
+    ("home_xg", "f8"),
+    ("away_xg", "f8"),
+    ("odds", "f8", (len(MARKETS),)),  # NaN = not offered
+    ("closing_odds", "f8", (len(MARKETS),)),
+])
+
+
+def split_params(params: Mapping[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Split a configuration into SoccerPredictor and KellyCriterion kwargs.
+
+    Raises:
+        ValueError: For names that are not tunable
+    """
+    unknown = [name for name in params if name not in PREDICTOR_PARAMS + KELLY_PARAMS]
+    if unknown:
+        raise ValueError(f"Unknown parameters: {unknown} (expected {PREDICTOR_PARAMS + KELLY_PARAMS})")
+    predictor = {name: value for name, value in params.items() if name in PREDICTOR_PARAMS}
+    kelly = {name: value for name, value in params.items() if name in KELLY_PARAMS}
+    return predictor, kelly
+
+
+def grid_points(grid: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Every combination of a parameter grid.
+
+    Example:
+        >>> grid_points({"matches_to_consider": [5, 10], "kelly_fraction": [0.25]})
+        [{'matches_to_consider': 5, 'kelly_fraction': 0.25}, {'matches_to_consider': 10, 'kelly_fraction': 0.25}]
+    """
+    split_params(grid)
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def random_points(space: Mapping[str, Any], n: int, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Random-search sample of a parameter space.
+
+    Args:
+        space: Per parameter, a list of choices or a (low, high) tuple;
+               ranges are integer when both bounds are ints, else uniform
+        n: Number of configurations
+        seed: Random seed
+
+    Returns:
+        List of n configurations
+    """
+    split_params(space)
+    rng = random.Random(seed)
+
+    def draw(spec):
+        if isinstance(spec, tuple):
+            low, high = spec
+            if isinstance(low, int) and isinstance(high, int):
+                return rng.randint(low, high)
+            return round(rng.uniform(low, high), 4)
+        return rng.choice(list(spec))
+
+    return [{name: draw(spec) for name, spec in space.items()} for _ in range(n)]
+
+
+class SeasonArchive:
+    """
+    Fixtures of many seasons in one memory-mapped structured array.
+
+    Rows are grouped by season in kickoff order; names are stored once in a
+    JSON sidecar next to the .npy file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open an archive written by SeasonArchive.write.
+
+        Args:
+            path: .npy file
+        """
+        self.path = Path(path)
+        self.rows = np.load(self.path, mmap_mode="r")
+        meta = json.loads(self.path.with_suffix(".json").read_text())
+        self.leagues: List[str] = meta["leagues"]
+        self.seasons: List[str] = meta["seasons"]
+        self.teams: List[str] = meta["teams"]
+        self.bounds: List[Tuple[int, int]] = [tuple(bound) for bound in meta["bounds"]]
+        self._decoded: Dict[int, List[HistoricalFixture]] = {}
+
+    @classmethod
+    def write(cls, seasons: Iterable[Sequence[HistoricalFixture]], path: Union[str, Path]) -> "SeasonArchive":
+        """
+        Encode seasons (each in kickoff order) and open the result.
+
+        Args:
+            seasons: Fixtures of one (league, season) per item
+            path: Destination .npy file
+
+        Returns:
+            SeasonArchive
+        """
+        path = Path(path)
+        names: Dict[str, Dict[str, int]] = {"leagues": {}, "seasons": {}, "teams": {}}
+
+        def code(table: str, name: str) -> int:
+            return names[table].setdefault(name, len(names[table]))
+
+        blocks, bounds, start = [], [], 0
+        for fixtures in seasons:
+            block = np.zeros(len(fixtures), dtype=HISTORY_DTYPE)
+            for row, fixture in zip(block, fixtures):
+                row["kickoff"] = (fixture.kickoff - EPOCH) // timedelta(microseconds=1)
+                row["league"] = code("leagues", fixture.league)
+                row["season"] = code("seasons", fixture.season)
+                row["home_team"] = code("teams", fixture.home_team)
+                row["away_team"] = code("teams", fixture.away_team)
+                row["home_goals"] = fixture.home_goals
+                row["away_goals"] = fixture.away_goals
+                row["home_xg"] = fixture.home_xg
+                row["away_xg"] = fixture.away_xg
+                row["odds"] = [fixture.odds.get(market, np.nan) for market in MARKETS]
+                row["closing_odds"] = [fixture.closing_odds.get(market, np.nan) for market in MARKETS]
+            blocks.append(block)
+            bounds.append((start, start + len(block)))
+            start += len(block)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, np.concatenate(blocks) if blocks else np.zeros(0, dtype=HISTORY_DTYPE))
+        meta = {table: list(codes) for table, codes in names.items()}
+        meta["bounds"] = bounds
+        path.with_suffix(".json").write_text(json.dumps(meta))
+        return cls(path)
+
+    @classmethod
+    def from_paths(cls, paths: Sequence[Union[str, Path]], path: Union[str, Path]) -> "SeasonArchive":
+        """
+        Load CSV season files (see load_seasons) into a new archive.
+
+        Args:
+            paths: CSV files (one or more seasons each)
+            path: Destination .npy file
+        """
+        return cls.write(load_seasons(paths), path)
+
+    def __len__(self) -> int:
+        """Number of seasons."""
+        return len(self.bounds)
+
+    def season(self, index: int) -> List[HistoricalFixture]:
+        """Fixtures of one season (decoded once per process)."""
+        fixtures = self._decoded.get(index)
+        if fixtures is not None:
+            return fixtures
+
+        start, end = self.bounds[index]
+        rows = self.rows[start:end]
+        kickoffs = [EPOCH + timedelta(microseconds=int(value)) for value in rows["kickoff"]]
+        odds = rows["odds"].tolist()
+        closing = rows["closing_odds"].tolist()
+
+        def prices(values):
+            return {market: price for market, price in zip(MARKETS, values) if price == price}
+
+        fixtures = [
+            HistoricalFixture(
+                kickoff=kickoff,
+                league=self.leagues[league],
+                season=self.seasons[season],
+                home_team=self.teams[home],
+                away_team=self.teams[away],
+                home_goals=home_goals,
+                away_goals=away_goals,
+                home_xg=home_xg,
+                away_xg=away_xg,
+                odds=prices(row_odds),
+                closing_odds=prices(row_closing),
+            )
+            for kickoff, league, season, home, away, home_goals, away_goals, home_xg, away_xg, row_odds, row_closing
+            in zip(
+                kickoffs, rows["league"].tolist(), rows["season"].tolist(),
+                rows["home_team"].tolist(), rows["away_team"].tolist(),
+                rows["home_goals"].tolist(), rows["away_goals"].tolist(),
+                rows["home_xg"].tolist(), rows["away_xg"].tolist(), odds, closing,
+            )
+        ]
+        self._decoded[index] = fixtures
+        return fixtures
+
+
+# Archives opened by this process, by path
+_ARCHIVES: Dict[str, SeasonArchive] = {}
+
+
+def _evaluate(task: Tuple[str, int, Dict[str, Any], int]) -> SeasonResult:
+    """Backtest one configuration on one archived season (pool worker)."""
+    path, index, params, min_history = task
+    archive = _ARCHIVES.get(path)
+    if archive is None:
+        archive = _ARCHIVES[path] = SeasonArchive(path)
+
+    predictor, kelly = split_params(params)
+    backtester = Backtester(
+        predictor=SoccerPredictor(**predictor),
+        kelly=KellyCriterion(**kelly),
+        min_history=min_history,
+    )
+    return backtester.run_season(archive.season(index))
+
+
+@dataclass
+class SweepTrial:
+    """Result of one configuration."""
+
+    params: Dict[str, Any]
+    metrics: BacktestMetrics
+    seasons: int  # seasons evaluated
+    stopped_early: bool
+    rank: int = 0
+
+    def score(self, objective: str) -> Optional[float]:
+        """Value of an objective (None when nothing was predicted)."""
+        return getattr(self.metrics, objective)
+
+
+@dataclass
+class SweepResult:
+    """Ranked trials of a sweep."""
+
+    objective: str
+    trials: List[SweepTrial]  # best first
+
+    @property
+    def best(self) -> SweepTrial:
+        """Top-ranked trial."""
+        return self.trials[0]
+
+    def to_csv(self, path: Union[str, Path]):
+        """
+        Write one row per trial (rank, parameters, metrics).
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        params = list(dict.fromkeys(name for trial in self.trials for name in trial.params))
+        metrics = [name for name in BacktestMetrics.__dataclass_fields__ if name != "initial_bankroll"]
+        with path.open("w", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["rank", *params, "seasons", "stopped_early", *metrics])
+            for trial in self.trials:
+                writer.writerow([
+                    trial.rank,
+                    *(trial.params.get(name, "") for name in params),
+                    trial.seasons,
+                    trial.stopped_early,
+                    *(getattr(trial.metrics, name) for name in metrics),
+                ])
+
+
+class HyperparameterSweep:
+    """
+    Ranks predictor and stake settings by backtesting them.
+
+    Example:
+        >>> sweep = HyperparameterSweep(["data/E0/2022.csv", "data/E0/2023.csv"], workers=4)
+        >>> result = sweep.run(grid_points({"matches_to_consider": [5, 8, 12]}))
+        >>> result.best.params, result.best.metrics.log_loss
+        ({'matches_to_consider': 8}, 0.9871)
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[Union[str, Path]],
+        objective: str = "log_loss",
+        workers: int = 1,
+        rungs: int = SWEEP_RUNGS,
+        early_stop: Optional[float] = None,
+        min_history: int = BACKTEST_MIN_HISTORY,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Initialize sweep.
+
+        Args:
+            paths: CSV season files (see load_fixtures)
+            objective: Ranking metric, a key of OBJECTIVES
+            workers: Processes used (1 = in-process)
+            rungs: Season chunks between early-stopping checks
+            early_stop: Margin behind the best running objective that stops
+                        a configuration (default EARLY_STOP_MARGINS;
+                        0 or less disables early stopping)
+            min_history: Matches each team needs before its fixtures count
+            cache_dir: Where the shared archive is written (default a
+                       temporary directory removed after each run)
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective} (expected one of {list(OBJECTIVES)})")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if rungs < 1:
+            raise ValueError("rungs must be at least 1")
+
+        self.paths = [Path(path) for path in paths]
+        self.objective = objective
+        self.workers = workers
+        self.rungs = rungs
+        self.early_stop = EARLY_STOP_MARGINS[objective] if early_stop is None else early_stop
+        self.min_history = min_history
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def _stopped(self, scores: Dict[int, Optional[float]]) -> List[int]:
+        """Configurations too far behind the best running score."""
+        if self.early_stop <= 0:
+            return []
+        sign = 1 if OBJECTIVES[self.objective] else -1
+        known = {k: sign * score for k, score in scores.items() if score is not None}
+        if not known:
+            return []
+        best = max(known.values())
+        return [k for k in scores if k not in known or known[k] < best - self.early_stop]
+
+    def _rank(self, trials: List[SweepTrial]) -> List[SweepTrial]:
+        """Completed trials first, then by objective (missing scores last)."""
+        sign = -1 if OBJECTIVES[self.objective] else 1
+
+        def key(trial):
+            score = trial.score(self.objective)
+            return (trial.stopped_early, score is None, sign * score if score is not None else 0.0)
+
+        trials = sorted(trials, key=key)
+        for rank, trial in enumerate(trials, 1):
+            trial.rank = rank
+        return trials
+
+    def run(self, points: Sequence[Mapping[str, Any]]) -> SweepResult:
+        """
+        Backtest every configuration and rank them.
+
+        Args:
+            points: Configurations (see grid_points / random_points)
+
+        Returns:
+            SweepResult, best trial first
+        """
+        points = [dict(point) for point in points]
+        if not points:
+            raise ValueError("No configurations to evaluate")
+        for point in points:
+            split_params(point)
+
+        workdir = self.cache_dir or Path(tempfile.mkdtemp(prefix="sweep_"))
+        try:
+            archive = SeasonArchive.from_paths(self.paths, workdir / "history.npy")
+            return self._run(points, archive)
+        finally:
+            if self.cache_dir is None:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+    def _run(self, points: List[Dict[str, Any]], archive: SeasonArchive) -> SweepResult:
+        rungs = [
+            [int(index) for index in chunk]
+            for chunk in np.array_split(np.arange(len(archive)), min(self.rungs, max(len(archive), 1)))
+        ]
+        seasons: Dict[int, List[SeasonResult]] = {k: [] for k in range(len(points))}
+        live = list(range(len(points)))
+        stopped: List[int] = []
+
+        # Registered before the pool starts so forked workers inherit it
+        _ARCHIVES[str(archive.path)] = archive
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            for level, chunk in enumerate(rungs):
+                tasks = [
+                    (str(archive.path), index, points[k], self.min_history)
+                    for k in live for index in chunk
+                ]
+                if pool is not None:
+                    results = list(pool.map(_evaluate, tasks, chunksize=max(1, len(tasks) // (4 * self.workers))))
+                else:
+                    results = [_evaluate(task) for task in tasks]
+                for (k, _), result in zip(itertools.product(live, chunk), results):
+                    seasons[k].append(result)
+
+                if level < len(rungs) - 1:
+                    scores = {
+                        k: getattr(Backtester.aggregate(seasons[k]), self.objective) for k in live
+                    }
+                    dropped = self._stopped(scores)
+                    stopped.extend(dropped)
+                    live = [k for k in live if k not in dropped]
+                    logger.info(
+                        f"Sweep rung {level + 1}/{len(rungs)}: {len(dropped)} stopped, {len(live)} left"
+                    )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            _ARCHIVES.pop(str(archive.path), None)
+
+        trials = [
+            SweepTrial(
+                params=points[k],
+                metrics=Backtester.aggregate(seasons[k]),
+                seasons=len(seasons[k]),
+                stopped_early=k in stopped,
+            )
+            for k in range(len(points))
+        ]
+        return SweepResult(objective=self.objective, trials=self._rank(trials))
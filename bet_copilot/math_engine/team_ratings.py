@@ -0,0 +1,435 @@
+"""
+League-wide attack/defence ratings fitted by Poisson maximum likelihood.
+
+Model (Maher / Dixon-Coles style):
+
+    log λ_home = μ + h + attack[home] - defence[away]
+    log λ_away = μ +     attack[away] - defence[home]
+
+Parameters are fitted with Newton-Raphson (IRLS for a Poisson GLM) on a
+dense design matrix of 2 rows per match. A small ridge penalty on attack
+and defence keeps the Hessian invertible (the ratings are otherwise only
+identified up to a shared shift) and shrinks teams with few matches.
+
+A 20-team season (380 matches, 42 parameters) fits in a few milliseconds
+from scratch, and a warm-started refit after a new result typically needs
+two or three Newton steps.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bet_copilot.config import TEAM_RATINGS_PATH
+from bet_copilot.models.soccer import MatchResult
+
+logger = logging.getLogger(__name__)
+
+# Number of non-team parameters (intercept μ, home advantage h)
+GLOBAL_PARAMS = 2
+
+# Linear predictor clip so exp() never overflows on degenerate data
+MAX_LOG_RATE = 10.0
+
+
+@dataclass
+class TeamRatings:
+    """Fitted league parameters (log scale)."""
+
+    teams: List[str]
+    attack: np.ndarray
+    defence: np.ndarray
+    home_advantage: float
+    intercept: float
+    iterations: int = 0
+    converged: bool = True
+    log_likelihood: float = 0.0
+    _index: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.attack = np.asarray(self.attack, dtype=np.float64)
+        self.defence = np.asarray(self.defence, dtype=np.float64)
+        self._index = {team: i for i, team in enumerate(self.teams)}
+
+    def __contains__(self, team: str) -> bool:
+        return team in self._index
+
+    def index(self, team: str) -> int:
+        """Position of a team in the parameter arrays."""
+        try:
+            return self._index[team]
+        except KeyError:
+            raise ValueError(f"Unknown team: {team}") from None
+
+    def expected_goals(self, home_team: str, away_team: str) -> Tuple[float, float]:
+        """
+        Expected goals for a fixture.
+
+        Args:
+            home_team: Home team name
+            away_team: Away team name
+
+        Returns:
+            (λ_home, λ_away)
+
+        Example:
+            >>> ratings.expected_goals("Arsenal", "Chelsea")
+            (1.73, 1.02)
+        """
+        home = self.index(home_team)
+        away = self.index(away_team)
+
+        lambda_home = np.exp(
+            self.intercept + self.home_advantage + self.attack[home] - self.defence[away]
+        )
+        lambda_away = np.exp(self.intercept + self.attack[away] - self.defence[home])
+
+        return float(lambda_home), float(lambda_away)
+
+    def expected_goals_many(
+        self, home_index: np.ndarray, away_index: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized expected goals for index arrays (see index()).
+
+        Args:
+            home_index: Home team indices, shape (N,)
+            away_index: Away team indices, shape (N,)
+
+        Returns:
+            (λ_home, λ_away) arrays of shape (N,)
+        """
+        lambda_home = np.exp(
+            self.intercept
+            + self.home_advantage
+            + self.attack[home_index]
+            - self.defence[away_index]
+        )
+        lambda_away = np.exp(
+            self.intercept + self.attack[away_index] - self.defence[home_index]
+        )
+        return lambda_home, lambda_away
+
+    def to_dict(self) -> Dict:
+        """Convert to JSON-serializable dictionary."""
+        return {
+            "teams": list(self.teams),
+            "attack": self.attack.tolist(),
+            "defence": self.defence.tolist(),
+            "home_advantage": self.home_advantage,
+            "intercept": self.intercept,
+            "iterations": self.iterations,
+            "converged": self.converged,
+            "log_likelihood": self.log_likelihood,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TeamRatings":
+        """Rebuild ratings from to_dict() output."""
+        return cls(
+            teams=list(data["teams"]),
+            attack=np.asarray(data["attack"], dtype=np.float64),
+            defence=np.asarray(data["defence"], dtype=np.float64),
+            home_advantage=float(data["home_advantage"]),
+            intercept=float(data["intercept"]),
+            iterations=int(data.get("iterations", 0)),
+            converged=bool(data.get("converged", True)),
+            log_likelihood=float(data.get("log_likelihood", 0.0)),
+        )
+
+
+class RatingEngine:
+    """
+    Incremental fitter for league ratings.
+
+    Keeps the match history as flat arrays (team indices, goals, weights)
+    and refits after every batch of new results, warm-starting Newton from
+    the previous parameters. Goals may be replaced by xG (Poisson
+    quasi-likelihood accepts non-integer responses).
+    """
+
+    def __init__(
+        self,
+        regularization: float = 1e-3,
+        max_iter: int = 50,
+        tol: float = 1e-8,
+    ):
+        """
+        Initialize engine.
+
+        Args:
+            regularization: Ridge penalty on attack/defence (must be > 0)
+            max_iter: Maximum Newton iterations per fit
+            tol: Convergence tolerance on the largest parameter step
+        """
+        if regularization <= 0:
+            raise ValueError("regularization must be positive")
+
+        self.regularization = regularization
+        self.max_iter = max_iter
+        self.tol = tol
+
+        self.teams: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._home = np.empty(0, dtype=np.intp)
+        self._away = np.empty(0, dtype=np.intp)
+        self._home_goals = np.empty(0)
+        self._away_goals = np.empty(0)
+        self._weights = np.empty(0)
+        self.ratings: Optional[TeamRatings] = None
+
+    def __len__(self) -> int:
+        """Number of matches in the history."""
+        return len(self._home)
+
+    def _team_indices(self, names: Sequence[str]) -> np.ndarray:
+        """Map names to indices, registering new teams."""
+        indices = np.empty(len(names), dtype=np.intp)
+        for i, name in enumerate(names):
+            if name not in self._index:
+                self._index[name] = len(self.teams)
+                self.teams.append(name)
+            indices[i] = self._index[name]
+        return indices
+
+    def add_results(
+        self,
+        home_teams: Sequence[str],
+        away_teams: Sequence[str],
+        home_goals: Sequence[float],
+        away_goals: Sequence[float],
+        weights: Optional[Sequence[float]] = None,
+        refit: bool = True,
+    ) -> Optional[TeamRatings]:
+        """
+        Append results to the history and refit (warm-started).
+
+        Args:
+            home_teams: Home team names
+            away_teams: Away team names
+            home_goals: Home goals (or xG)
+            away_goals: Away goals (or xG)
+            weights: Optional per-match likelihood weights (default 1)
+            refit: Refit immediately (set False to batch several calls)
+
+        Returns:
+            Updated ratings (None if refit is False)
+        """
+        n = len(home_teams)
+        if not (len(away_teams) == len(home_goals) == len(away_goals) == n):
+            raise ValueError("Result arrays must have the same length")
+
+        home_goals = np.asarray(home_goals, dtype=np.float64)
+        away_goals = np.asarray(away_goals, dtype=np.float64)
+        if np.any(home_goals < 0) or np.any(away_goals < 0):
+            raise ValueError("Goals must be non-negative")
+
+        weights = np.ones(n) if weights is None else np.asarray(weights, dtype=np.float64)
+        if weights.shape != (n,):
+            raise ValueError("weights must have one entry per match")
+
+        self._home = np.concatenate([self._home, self._team_indices(home_teams)])
+        self._away = np.concatenate([self._away, self._team_indices(away_teams)])
+        self._home_goals = np.concatenate([self._home_goals, home_goals])
+        self._away_goals = np.concatenate([self._away_goals, away_goals])
+        self._weights = np.concatenate([self._weights, weights])
+
+        if not refit:
+            return None
+        return self.fit()
+
+    def add_result(
+        self, home_team: str, away_team: str, home_goals: float, away_goals: float
+    ) -> TeamRatings:
+        """Append one result and refit."""
+        return self.add_results([home_team], [away_team], [home_goals], [away_goals])
+
+    def add_match_results(
+        self, results: Sequence[MatchResult], use_xg: bool = False
+    ) -> TeamRatings:
+        """
+        Append MatchResult objects and refit.
+
+        Args:
+            results: Match results (deduplicate home/away perspectives first)
+            use_xg: Fit on xG instead of goals
+
+        Returns:
+            Updated ratings
+        """
+        return self.add_results(
+            [r.home_team for r in results],
+            [r.away_team for r in results],
+            [r.home_xg if use_xg else r.home_goals for r in results],
+            [r.away_xg if use_xg else r.away_goals for r in results],
+        )
+
+    def _initial_params(self, n_teams: int) -> np.ndarray:
+        """Warm start from the last fit; new teams start at league average."""
+        params = np.zeros(GLOBAL_PARAMS + 2 * n_teams)
+
+        if self.ratings is None:
+            goals = np.concatenate([self._home_goals, self._away_goals])
+            mean = np.average(goals, weights=np.tile(self._weights, 2))
+            params[0] = np.log(max(mean, 1e-3))
+            return params
+
+        previous = len(self.ratings.teams)
+        params[0] = self.ratings.intercept
+        params[1] = self.ratings.home_advantage
+        params[GLOBAL_PARAMS:GLOBAL_PARAMS + previous] = self.ratings.attack
+        params[GLOBAL_PARAMS + n_teams:GLOBAL_PARAMS + n_teams + previous] = self.ratings.defence
+        return params
+
+    def _design(self, n_teams: int) -> np.ndarray:
+        """Dense design matrix: rows [home goals; away goals]."""
+        n = len(self._home)
+        rows = np.arange(n)
+        design = np.zeros((2 * n, GLOBAL_PARAMS + 2 * n_teams))
+
+        design[:, 0] = 1.0
+        design[:n, 1] = 1.0
+        design[rows, GLOBAL_PARAMS + self._home] = 1.0
+        design[rows, GLOBAL_PARAMS + n_teams + self._away] = -1.0
+        design[n + rows, GLOBAL_PARAMS + self._away] = 1.0
+        design[n + rows, GLOBAL_PARAMS + n_teams + self._home] = -1.0
+
+        return design
+
+    def fit(self) -> TeamRatings:
+        """
+        Fit ratings on the full history (warm-started if fitted before).
+
+        Returns:
+            TeamRatings (also stored in self.ratings)
+        """
+        if len(self) == 0:
+            raise ValueError("No results to fit")
+
+        n_teams = len(self.teams)
+        design = self._design(n_teams)
+        goals = np.concatenate([self._home_goals, self._away_goals])
+        weights = np.tile(self._weights, 2)
+
+        penalty = np.full(design.shape[1], self.regularization)
+        penalty[:GLOBAL_PARAMS] = 0.0
+
+        def objective(eta: np.ndarray, theta: np.ndarray) -> float:
+            return float(
+                weights @ (goals * eta - np.exp(eta)) - 0.5 * penalty @ (theta * theta)
+            )
+
+        params = self._initial_params(n_teams)
+        eta = np.clip(design @ params, -MAX_LOG_RATE, MAX_LOG_RATE)
+        current = objective(eta, params)
+        converged = False
+        iteration = 0
+
+        for iteration in range(1, self.max_iter + 1):
+            rates = np.exp(eta)
+            gradient = design.T @ (weights * (goals - rates)) - penalty * params
+            hessian = (design.T * (weights * rates)) @ design
+            hessian[np.diag_indices_from(hessian)] += penalty
+
+            step = np.linalg.solve(hessian, gradient)
+
+            # Step halving keeps every iteration an ascent step
+            scale = 1.0
+            while True:
+                candidate = params + scale * step
+                candidate_eta = np.clip(design @ candidate, -MAX_LOG_RATE, MAX_LOG_RATE)
+                value = objective(candidate_eta, candidate)
+                if value >= current - 1e-12 or scale < 1e-4:
+                    break
+                scale *= 0.5
+
+            params, eta, current = candidate, candidate_eta, value
+
+            if np.max(np.abs(scale * step)) < self.tol:
+                converged = True
+                break
+
+        if not converged:
+            logger.warning(f"Rating fit did not converge after {self.max_iter} iterations")
+
+        self.ratings = TeamRatings(
+            teams=list(self.teams),
+            attack=params[GLOBAL_PARAMS:GLOBAL_PARAMS + n_teams].copy(),
+            defence=params[GLOBAL_PARAMS + n_teams:].copy(),
+            home_advantage=float(params[1]),
+            intercept=float(params[0]),
+            iterations=iteration,
+            converged=converged,
+            log_likelihood=current,
+        )
+
+        logger.debug(
+            f"Ratings fitted: {n_teams} teams, {len(self)} matches, "
+            f"{iteration} iterations"
+        )
+
+        return self.ratings
+
+    def expected_goals(self, home_team: str, away_team: str) -> Tuple[float, float]:
+        """Expected goals from the current fit (see TeamRatings)."""
+        if self.ratings is None:
+            raise ValueError("Engine has not been fitted")
+        return self.ratings.expected_goals(home_team, away_team)
+
+    def save(self, path: Path = TEAM_RATINGS_PATH):
+        """
+        Save parameters and match history as JSON.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "regularization": self.regularization,
+            "teams": self.teams,
+            "history": {
+                "home": self._home.tolist(),
+                "away": self._away.tolist(),
+                "home_goals": self._home_goals.tolist(),
+                "away_goals": self._away_goals.tolist(),
+                "weights": self._weights.tolist(),
+            },
+            "ratings": self.ratings.to_dict() if self.ratings else None,
+        }
+        path.write_text(json.dumps(data))
+
+    @classmethod
+    def load(cls, path: Path = TEAM_RATINGS_PATH, **kwargs) -> "RatingEngine":
+        """
+        Load an engine saved with save().
+
+        Args:
+            path: File written by save()
+            **kwargs: Extra constructor arguments (max_iter, tol)
+
+        Returns:
+            RatingEngine with history and last fit restored
+        """
+        data = json.loads(Path(path).read_text())
+
+        engine = cls(regularization=data["regularization"], **kwargs)
+        engine.teams = list(data["teams"])
+        engine._index = {team: i for i, team in enumerate(engine.teams)}
+
+        history = data["history"]
+        engine._home = np.asarray(history["home"], dtype=np.intp)
+        engine._away = np.asarray(history["away"], dtype=np.intp)
+        engine._home_goals = np.asarray(history["home_goals"], dtype=np.float64)
+        engine._away_goals = np.asarray(history["away_goals"], dtype=np.float64)
+        engine._weights = np.asarray(history["weights"], dtype=np.float64)
+
+        if data["ratings"] is not None:
+            engine.ratings = TeamRatings.from_dict(data["ratings"])
+
+        return engine
@@ -0,0 +1,419 @@
+"""
+Columnar store for historical match results.
+
+A MatchResult is a 25-field dataclass: every match costs a Python object,
+its __dict__ and one boxed value per field. MatchHistory keeps the same
+data as one typed NumPy array per field (team names dictionary-encoded),
+so multi-season, multi-league histories cost ~80 bytes per match.
+
+Optional statistics use a sentinel for "not available": MISSING (-1)
+for integer counts and NaN for possession. TeamForm.from_history()
+reads a team's matches straight from the columns; MatchResult objects
+are only built when a match is accessed.
+"""
+
+from collections.abc import Sequence as SequenceABC
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+
+from bet_copilot.models.soccer import FORM_STATS, MatchResult
+
+# Sentinel for missing optional integer statistics
+MISSING = -1
+
+# Optional integer statistics (stored as int16, MISSING when None)
+COUNT_FIELDS = (
+    "home_corners",
+    "away_corners",
+    "home_shots",
+    "away_shots",
+    "home_shots_on_target",
+    "away_shots_on_target",
+    "home_fouls",
+    "away_fouls",
+    "home_yellow_cards",
+    "away_yellow_cards",
+    "home_red_cards",
+    "away_red_cards",
+    "home_offsides",
+    "away_offsides",
+)
+
+# Optional float statistics (NaN when None)
+RATIO_FIELDS = ("home_possession", "away_possession")
+
+COLUMNS: Dict[str, np.dtype] = {
+    "date": np.dtype("datetime64[us]"),
+    "home_team": np.dtype(np.int32),
+    "away_team": np.dtype(np.int32),
+    "home_goals": np.dtype(np.int16),
+    "away_goals": np.dtype(np.int16),
+    "home_xg": np.dtype(np.float64),
+    "away_xg": np.dtype(np.float64),
+    "is_home": np.dtype(bool),
+    **{name: np.dtype(np.int16) for name in COUNT_FIELDS},
+    **{name: np.dtype(np.float64) for name in RATIO_FIELDS},
+}
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+REQUIRED_COLUMNS = ("date", "home_team", "away_team", "home_goals", "away_goals", "home_xg", "away_xg")
+
+
+class MatchHistoryView(SequenceABC):
+    """
+    Read-only sequence of one team's matches inside a MatchHistory.
+
+    Items are materialized as MatchResult on access, from the team's
+    perspective (is_home = team played at home). Slices return lists.
+    """
+
+    def __init__(self, history: "MatchHistory", rows: np.ndarray, is_home: np.ndarray):
+        self.history = history
+        self.rows = rows
+        self.is_home = is_home
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.history.match(int(self.rows[index]), is_home=bool(self.is_home[index]))
+
+    def subset(self, mask: np.ndarray) -> "MatchHistoryView":
+        """View of the rows where mask is True."""
+        return MatchHistoryView(self.history, self.rows[mask], self.is_home[mask])
+
+    def reversed(self) -> "MatchHistoryView":
+        """View with the opposite row order."""
+        return MatchHistoryView(self.history, self.rows[::-1], self.is_home[::-1])
+
+    def __repr__(self) -> str:
+        return f"MatchHistoryView({len(self)} matches)"
+
+
+class MatchHistory:
+    """
+    Growable columnar table of match results.
+
+    Example:
+        >>> from bet_copilot.models.soccer import TeamForm
+        >>> history = MatchHistory()
+        >>> history.extend_columns({
+        ...     "date": ["2024-08-17", "2024-08-24"],
+        ...     "home_team": ["Arsenal", "Chelsea"],
+        ...     "away_team": ["Chelsea", "Arsenal"],
+        ...     "home_goals": [2, 1], "away_goals": [0, 1],
+        ...     "home_xg": [1.9, 1.2], "away_xg": [0.6, 1.4],
+        ... })
+        >>> TeamForm.from_history(history, "Arsenal").average_goals_for()
+        1.5
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize an empty history.
+
+        Args:
+            capacity: Initial number of rows allocated (grows by doubling)
+        """
+        self._size = 0
+        self._columns = {name: np.empty(max(capacity, 1), dtype) for name, dtype in COLUMNS.items()}
+        self._teams: List[str] = []
+        self._team_codes: Dict[str, int] = {}
+        self._aware: Optional[bool] = None
+
+    @classmethod
+    def from_matches(cls, matches: Iterable[MatchResult]) -> "MatchHistory":
+        """Build a history from MatchResult objects."""
+        matches = list(matches)
+        history = cls(capacity=len(matches))
+        history.extend(matches)
+        return history
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def teams(self) -> List[str]:
+        """Team names, indexed by the codes in home_team/away_team."""
+        return list(self._teams)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the filled part of the columns."""
+        return sum(self._size * dtype.itemsize for dtype in COLUMNS.values())
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Read-only view of one column.
+
+        Args:
+            name: Column name (see COLUMNS)
+
+        Returns:
+            Array of length len(self)
+        """
+        if name not in self._columns:
+            raise ValueError(f"Unknown column: {name}")
+        view = self._columns[name][: self._size]
+        view.flags.writeable = False
+        return view
+
+    def team_code(self, team: str) -> int:
+        """Code of a team name (ValueError if never seen)."""
+        if team not in self._team_codes:
+            raise ValueError(f"Unknown team: {team}")
+        return self._team_codes[team]
+
+    def _encode_teams(self, names) -> np.ndarray:
+        names = list(names)
+        for name in dict.fromkeys(names):
+            if name not in self._team_codes:
+                self._team_codes[name] = len(self._teams)
+                self._teams.append(name)
+        return np.fromiter(map(self._team_codes.__getitem__, names), dtype=np.int32, count=len(names))
+
+    def _encode_dates(self, dates) -> np.ndarray:
+        dates = np.asarray(dates)
+        if dates.dtype.kind == "M":
+            # datetime64 values are taken as UTC in an aware history
+            aware = bool(self._aware)
+            encoded = dates.astype(COLUMNS["date"])
+        elif dates.dtype.kind in "OU":
+            values = [
+                datetime.fromisoformat(d) if isinstance(d, str) else d for d in dates.tolist()
+            ]
+            awareness = {d.tzinfo is not None for d in values}
+            if len(awareness) > 1:
+                raise ValueError("Cannot mix naive and timezone-aware dates")
+            aware = awareness.pop() if awareness else self._aware
+            if aware:
+                values = [d.astimezone(timezone.utc).replace(tzinfo=None) for d in values]
+            # Integer microseconds are much faster than datetime -> datetime64
+            micros = [(d - EPOCH) // MICROSECOND for d in values]
+            encoded = np.array(micros, dtype=np.int64).view(COLUMNS["date"])
+        else:
+            raise ValueError(f"Unsupported date column type: {dates.dtype}")
+
+        if len(encoded) and self._aware is not None and aware != self._aware:
+            raise ValueError("Cannot mix naive and timezone-aware dates")
+        if len(encoded):
+            self._aware = aware
+        return encoded
+
+    @staticmethod
+    def validate(columns: Mapping[str, np.ndarray]):
+        """
+        Validate encoded columns in bulk (same rules as MatchResult).
+
+        Raises:
+            ValueError: Negative or NaN xG/goals, or negative statistics
+        """
+        xg = np.concatenate([columns["home_xg"], columns["away_xg"]])
+        if not np.all(xg >= 0):
+            raise ValueError("xG values must be non-negative")
+        if np.any(columns["home_goals"] < 0) or np.any(columns["away_goals"] < 0):
+            raise ValueError("Goals must be non-negative")
+        for name in COUNT_FIELDS:
+            if name in columns and np.any(columns[name] < MISSING):
+                raise ValueError(f"{name} must be non-negative")
+
+    def _grow(self, required: int):
+        capacity = len(self._columns["date"])
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        for name, values in self._columns.items():
+            grown = np.empty(capacity, values.dtype)
+            grown[: self._size] = values[: self._size]
+            self._columns[name] = grown
+
+    def extend_columns(self, columns: Mapping[str, Any]):
+        """
+        Append many matches given as columns.
+
+        Required: date, home_team, away_team (names), home_goals, away_goals,
+        home_xg, away_xg. Optional statistics may be omitted or contain
+        None (stored as missing); is_home defaults to True.
+
+        Args:
+            columns: Mapping of column name -> sequence (all the same length)
+
+        Raises:
+            ValueError: Missing/unknown columns, mismatched lengths or
+                invalid values. Nothing is appended on error.
+        """
+        missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+        if missing:
+            raise ValueError(f"Missing columns: {missing}")
+        unknown = [name for name in columns if name not in COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown columns: {unknown}")
+
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        n = lengths.pop()
+        if n == 0:
+            return
+
+        aware, teams = self._aware, len(self._teams)
+        encoded: Dict[str, np.ndarray] = {}
+        try:
+            encoded["date"] = self._encode_dates(columns["date"])
+            for name in ("home_team", "away_team"):
+                encoded[name] = self._encode_teams(columns[name])
+            for name in ("home_goals", "away_goals", "home_xg", "away_xg"):
+                encoded[name] = np.asarray(columns[name], dtype=COLUMNS[name])
+            encoded["is_home"] = np.asarray(columns.get("is_home", np.ones(n, bool)), dtype=bool)
+            for name in COUNT_FIELDS + RATIO_FIELDS:
+                encoded[name] = self._encode_optional(name, columns.get(name), n)
+            self.validate(encoded)
+        except (TypeError, ValueError):
+            # Roll back dictionary entries added by the failed batch
+            for name in self._teams[teams:]:
+                del self._team_codes[name]
+            del self._teams[teams:]
+            self._aware = aware
+            raise
+
+        self._grow(self._size + n)
+        for name, values in encoded.items():
+            self._columns[name][self._size : self._size + n] = values
+        self._size += n
+
+    @staticmethod
+    def _encode_optional(name: str, values, n: int) -> np.ndarray:
+        dtype = COLUMNS[name]
+        fill = MISSING if name in COUNT_FIELDS else np.nan
+        if values is None:
+            return np.full(n, fill, dtype)
+        if not isinstance(values, np.ndarray):
+            return np.array([fill if v is None else v for v in values], dtype=dtype)
+        if name in COUNT_FIELDS and values.dtype.kind == "f":
+            values = np.where(np.isnan(values), MISSING, values)
+        return values.astype(dtype)
+
+    def extend(self, matches: Iterable[MatchResult]):
+        """Append MatchResult objects (validated in bulk)."""
+        matches = list(matches)
+        self.extend_columns(
+            {name: [getattr(m, name) for m in matches] for name in COLUMNS}
+        )
+
+    def append(self, match: MatchResult):
+        """Append one MatchResult."""
+        self.extend([match])
+
+    def _date(self, row: int) -> datetime:
+        value = self._columns["date"][row].item()
+        return value.replace(tzinfo=timezone.utc) if self._aware else value
+
+    def match(self, row: int, is_home: Optional[bool] = None) -> MatchResult:
+        """
+        Materialize one row as a MatchResult.
+
+        Args:
+            row: Row index
+            is_home: Perspective override (default: stored is_home)
+
+        Returns:
+            MatchResult
+        """
+        if not -self._size <= row < self._size:
+            raise IndexError("MatchHistory index out of range")
+        row %= self._size
+        columns = self._columns
+
+        optional: Dict[str, Union[int, float, None]] = {}
+        for name in COUNT_FIELDS:
+            value = int(columns[name][row])
+            optional[name] = None if value == MISSING else value
+        for name in RATIO_FIELDS:
+            value = float(columns[name][row])
+            optional[name] = None if np.isnan(value) else value
+
+        return MatchResult(
+            date=self._date(row),
+            home_team=self._teams[columns["home_team"][row]],
+            away_team=self._teams[columns["away_team"][row]],
+            home_goals=int(columns["home_goals"][row]),
+            away_goals=int(columns["away_goals"][row]),
+            home_xg=float(columns["home_xg"][row]),
+            away_xg=float(columns["away_xg"][row]),
+            is_home=bool(columns["is_home"][row]) if is_home is None else is_home,
+            **optional,
+        )
+
+    def __getitem__(self, row: int) -> MatchResult:
+        return self.match(row)
+
+    def team_view(self, team: str) -> MatchHistoryView:
+        """
+        One team's matches, newest first.
+
+        Equal dates keep insertion order, as TeamForm.add_match does.
+
+        Args:
+            team: Team name
+
+        Returns:
+            MatchHistoryView with is_home from the team's perspective
+        """
+        code = self.team_code(team)
+        home = self.column("home_team") == code
+        rows = np.flatnonzero(home | (self.column("away_team") == code))
+        dates = self.column("date")[rows].view(np.int64)
+        rows = rows[np.argsort(-dates, kind="stable")]
+        return MatchHistoryView(self, rows, home[rows])
+
+    def form_values(self, view: MatchHistoryView) -> np.ndarray:
+        """
+        FORM_STATS for every match of a view (vectorized _form_values).
+
+        Args:
+            view: Team view
+
+        Returns:
+            Array (len(view), len(FORM_STATS)), NaN where not available
+        """
+        home = view.is_home
+
+        def column(name: str) -> np.ndarray:
+            return self._columns[name][view.rows]
+
+        def counts(name: str) -> np.ndarray:
+            raw = column(name)
+            values = raw.astype(np.float64)
+            values[raw == MISSING] = np.nan
+            return values
+
+        def side(home_values: np.ndarray, away_values: np.ndarray) -> np.ndarray:
+            return np.where(home, home_values, away_values).astype(np.float64)
+
+        home_yellow, away_yellow = counts("home_yellow_cards"), counts("away_yellow_cards")
+        home_red = np.nan_to_num(counts("home_red_cards"))
+        away_red = np.nan_to_num(counts("away_red_cards"))
+        cards = np.nan_to_num(home_yellow) + home_red * 2 + np.nan_to_num(away_yellow) + away_red * 2
+        cards[np.isnan(home_yellow) & np.isnan(away_yellow)] = np.nan
+
+        values = {
+            "xg_for": side(column("home_xg"), column("away_xg")),
+            "xg_against": side(column("away_xg"), column("home_xg")),
+            "goals_for": side(column("home_goals"), column("away_goals")),
+            "goals_against": side(column("away_goals"), column("home_goals")),
+            "corners": counts("home_corners") + counts("away_corners"),
+            "corners_for": side(counts("home_corners"), counts("away_corners")),
+            "cards": cards,
+            "shots": side(counts("home_shots"), counts("away_shots")),
+        }
+        return np.column_stack([values[stat] for stat in FORM_STATS])
+
+    def __repr__(self) -> str:
+        return f"MatchHistory({self._size} matches, {len(self._teams)} teams)"
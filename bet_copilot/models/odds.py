@@ -2,9 +2,14 @@
 Data models for odds and betting markets.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# float32 keeps ~7 significant digits; quoted odds never need more than 4 decimals
+ODDS_DECIMALS = 4
 
 
 @dataclass
@@ -26,6 +31,135 @@ class Bookmaker:
     last_update: datetime
 
 
+@dataclass
+class OddsMatrix:
+    """
+    Dense prices of one market: bookmaker index × outcome index.
+
+    Bookmaker keys and outcome names are dictionary-encoded (row / column
+    indices); best and median price per outcome are computed once when the
+    matrix is built, the no-vig consensus on first access.
+    """
+
+    market_key: str
+    bookmakers: List[str]  # bookmaker keys, row order
+    outcomes: List[str]  # outcome names, column order
+    prices: np.ndarray  # (bookmakers, outcomes) float32, NaN = not offered
+    best: np.ndarray  # (outcomes,) highest price, NaN if none
+    best_bookmaker: np.ndarray  # (outcomes,) row of the highest price, -1 if none
+    median: np.ndarray  # (outcomes,) median price across bookmakers
+    bookmaker_index: Dict[str, int] = field(default_factory=dict, repr=False)
+    outcome_index: Dict[str, int] = field(default_factory=dict, repr=False)
+    _consensus: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_bookmakers(cls, market_key: str, bookmakers: List["Bookmaker"]) -> Optional["OddsMatrix"]:
+        """
+        Build the matrix of one market from parsed bookmakers.
+
+        Args:
+            market_key: Market type (e.g., "h2h")
+            bookmakers: Bookmakers of one event
+
+        Returns:
+            OddsMatrix, or None if no bookmaker offers the market
+        """
+        bookmaker_index: Dict[str, int] = {}
+        outcome_index: Dict[str, int] = {}
+        cells: List[Tuple[int, int, float]] = []
+        for bookmaker in bookmakers:
+            for market in bookmaker.markets:
+                if market.key != market_key:
+                    continue
+                row = bookmaker_index.setdefault(bookmaker.key, len(bookmaker_index))
+                for outcome, price in market.outcomes.items():
+                    if price is None:
+                        continue
+                    column = outcome_index.setdefault(outcome, len(outcome_index))
+                    cells.append((row, column, price))
+
+        if not bookmaker_index or not outcome_index:
+            return None
+
+        prices = np.full((len(bookmaker_index), len(outcome_index)), np.nan, dtype=np.float32)
+        rows, columns, values = zip(*cells)
+        prices[list(rows), list(columns)] = values
+
+        offered = ~np.isnan(prices).all(axis=0)
+        best_bookmaker = np.where(offered, np.argmax(np.nan_to_num(prices, nan=-np.inf), axis=0), -1)
+        best = np.where(offered, prices[np.maximum(best_bookmaker, 0), np.arange(prices.shape[1])], np.nan)
+        # Sorting puts NaN last, so each column's median sits among its first `count` rows
+        count = (~np.isnan(prices)).sum(axis=0)
+        ordered = np.sort(prices, axis=0)
+        columns = np.arange(prices.shape[1])
+        low = ordered[np.maximum((count - 1) // 2, 0), columns]
+        high = ordered[np.maximum(count // 2, 0), columns]
+        median = np.where(offered, (low + high) / 2, np.nan)
+
+        return cls(
+            market_key=market_key,
+            bookmakers=list(bookmaker_index),
+            outcomes=list(outcome_index),
+            prices=prices,
+            best=best.astype(np.float32),
+            best_bookmaker=best_bookmaker,
+            median=median.astype(np.float32),
+            bookmaker_index=bookmaker_index,
+            outcome_index=outcome_index,
+        )
+
+    @property
+    def consensus(self) -> np.ndarray:
+        """(outcomes,) margin-free probabilities, NaN without complete books."""
+        if self._consensus is None:
+            if len(self.outcomes) > 1:
+                # lazy: math_engine depends on models, not the other way round
+                from bet_copilot.math_engine.margins import no_vig_consensus
+
+                fair = no_vig_consensus(self.columns(self.outcomes)).probabilities
+            else:
+                fair = np.full(len(self.outcomes), np.nan)
+            self._consensus = fair.astype(np.float32)
+        return self._consensus
+
+    def price(self, bookmaker_key: str, outcome: str) -> Optional[float]:
+        """Price of one bookmaker for one outcome (None if not offered)."""
+        row = self.bookmaker_index.get(bookmaker_key)
+        column = self.outcome_index.get(outcome)
+        if row is None or column is None:
+            return None
+        return _as_odds(self.prices[row, column])
+
+    def best_price(self, outcome: str) -> Optional[float]:
+        """Highest price for an outcome (None if not offered)."""
+        column = self.outcome_index.get(outcome)
+        return _as_odds(self.best[column]) if column is not None else None
+
+    def best_bookmaker_key(self, outcome: str) -> Optional[str]:
+        """Key of the bookmaker offering the highest price."""
+        column = self.outcome_index.get(outcome)
+        if column is None or self.best_bookmaker[column] < 0:
+            return None
+        return self.bookmakers[self.best_bookmaker[column]]
+
+    def columns(self, outcomes: Sequence[str]) -> np.ndarray:
+        """
+        Prices reordered to the given outcomes, as float64 decimal odds
+        (rounded back to the quoted precision; NaN columns for unknown names).
+        """
+        picked = np.full((self.prices.shape[0], len(outcomes)), np.nan)
+        for k, outcome in enumerate(outcomes):
+            column = self.outcome_index.get(outcome)
+            if column is not None:
+                picked[:, k] = self.prices[:, column]
+        return np.round(picked, ODDS_DECIMALS)
+
+
+def _as_odds(value: np.floating) -> Optional[float]:
+    """float32 cell as decimal odds (rounded back to the quoted precision)."""
+    return round(float(value), ODDS_DECIMALS) if value == value else None
+
+
 @dataclass
 class OddsEvent:
     """Sports event with odds from multiple bookmakers."""
@@ -36,6 +170,27 @@ class OddsEvent:
     away_team: str
     commence_time: datetime
     bookmakers: List[Bookmaker]
+    matrices: Dict[str, OddsMatrix] = field(default_factory=dict, repr=False, compare=False)
+
+    def build_matrices(self) -> Dict[str, OddsMatrix]:
+        """
+        Build a dense OddsMatrix for every market of the event.
+
+        Lookups then read the matrices instead of scanning bookmakers;
+        call again after changing `bookmakers`.
+        """
+        keys = dict.fromkeys(market.key for bookmaker in self.bookmakers for market in bookmaker.markets)
+        self.matrices = {}
+        for key in keys:
+            matrix = OddsMatrix.from_bookmakers(key, self.bookmakers)
+            if matrix is not None:
+                self.matrices[key] = matrix
+        return self.matrices
+
+    @property
+    def h2h_outcomes(self) -> Tuple[str, str, str]:
+        """h2h outcome names in (home, draw, away) order."""
+        return (self.home_team, "Draw", self.away_team)
 
     def get_best_odds(self, market_key: str, outcome: str) -> Optional[float]:
         """
@@ -48,6 +203,10 @@ class OddsEvent:
         Returns:
             Best odds or None
         """
+        if self.matrices:
+            matrix = self.matrices.get(market_key)
+            return matrix.best_price(outcome) if matrix is not None else None
+
         best_odds = None
 
         for bookmaker in self.bookmakers:
@@ -73,6 +232,10 @@ class OddsEvent:
         Returns:
             Odds or None
         """
+        if self.matrices:
+            matrix = self.matrices.get(market_key)
+            return matrix.price(bookmaker_key, outcome) if matrix is not None else None
+
         for bookmaker in self.bookmakers:
             if bookmaker.key == bookmaker_key:
                 for market in bookmaker.markets:
@@ -80,3 +243,51 @@ class OddsEvent:
                         return market.outcomes[outcome]
 
         return None
+
+
+def stack_prices(
+    events: Sequence[OddsEvent],
+    market_key: str = "h2h",
+    outcomes: Optional[Callable[[OddsEvent], Sequence[str]]] = None,
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Prices of many events in one (events, bookmakers, outcomes) array.
+
+    Rows follow the union of bookmaker keys; events without a matrix for
+    the market (or without a bookmaker) are NaN.
+
+    Args:
+        events: Events with matrices built (built here if missing)
+        market_key: Market type
+        outcomes: Outcome names per event, in a shared order (default:
+                  (home, draw, away) for h2h, else the first matrix's order)
+
+    Returns:
+        (prices, bookmaker keys)
+    """
+    matrices = []
+    for event in events:
+        if not event.matrices:
+            event.build_matrices()
+        matrices.append(event.matrices.get(market_key))
+
+    if outcomes is None:
+        if market_key == "h2h":
+            outcomes = lambda event: event.h2h_outcomes
+        else:
+            first = next((matrix.outcomes for matrix in matrices if matrix is not None), [])
+            outcomes = lambda event: first
+
+    bookmakers = list(dict.fromkeys(key for matrix in matrices if matrix is not None for key in matrix.bookmakers))
+    index = {key: row for row, key in enumerate(bookmakers)}
+    width = max((len(outcomes(event)) for event in events), default=0)
+    prices = np.full((len(events), len(bookmakers), width), np.nan, dtype=np.float32)
+
+    for e, (event, matrix) in enumerate(zip(events, matrices)):
+        if matrix is None:
+            continue
+        rows = [index[key] for key in matrix.bookmakers]
+        names = outcomes(event)
+        prices[e, rows, :len(names)] = matrix.columns(names)
+
+    return prices, bookmakers
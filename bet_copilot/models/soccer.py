@@ -2,9 +2,17 @@
 Data models for soccer prediction
 """
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Optional, Dict
-from statistics import mean
+from datetime import datetime, timezone
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, List, Optional, Dict, Sequence, Tuple
+
+import numpy as np
+
+from bet_copilot.config import FORM_HALF_LIFE_DAYS
+
+if TYPE_CHECKING:
+    from bet_copilot.math_engine.poisson import ScorelineGrid
+    from bet_copilot.models.match_history import MatchHistory
 
 
 @dataclass
@@ -45,17 +53,375 @@ class MatchResult:
             raise ValueError("Goals must be non-negative")
 
 
+# Per-match values aggregated by TeamForm, from the team's perspective.
+# None means the statistic is missing for that match.
+FORM_STATS = (
+    "xg_for",
+    "xg_against",
+    "goals_for",
+    "goals_against",
+    "corners",
+    "corners_for",
+    "cards",
+    "shots",
+)
+_STAT_INDEX = {stat: i for i, stat in enumerate(FORM_STATS)}
+
+SECONDS_PER_DAY = 86400.0
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _seconds(date: datetime) -> float:
+    """Seconds since the epoch (aware dates converted to UTC)"""
+    if date.tzinfo is not None:
+        date = date.astimezone(timezone.utc).replace(tzinfo=None)
+    return (date - _EPOCH).total_seconds()
+
+
+def _form_values(m: MatchResult) -> tuple:
+    """Values of FORM_STATS for one match (None = not available)"""
+    if m.is_home:
+        xg_for, xg_against = m.home_xg, m.away_xg
+        goals_for, goals_against = m.home_goals, m.away_goals
+        corners_for, shots = m.home_corners, m.home_shots
+    else:
+        xg_for, xg_against = m.away_xg, m.home_xg
+        goals_for, goals_against = m.away_goals, m.home_goals
+        corners_for, shots = m.away_corners, m.away_shots
+    
+    corners = None
+    if m.home_corners is not None and m.away_corners is not None:
+        corners = m.home_corners + m.away_corners
+    
+    cards = None
+    if m.home_yellow_cards is not None or m.away_yellow_cards is not None:
+        home_cards = (m.home_yellow_cards or 0) + (m.home_red_cards or 0) * 2
+        away_cards = (m.away_yellow_cards or 0) + (m.away_red_cards or 0) * 2
+        cards = home_cards + away_cards
+    
+    return (xg_for, xg_against, goals_for, goals_against, corners, corners_for, cards, shots)
+
+
+class _RollingAggregates:
+    """
+    Prefix sums of FORM_STATS over one venue split, oldest match first.
+    
+    The mean of the n most recent matches is a difference of two prefix
+    entries, so window averages are O(1). Appending a newer match extends
+    the prefixes in O(1); anything else rebuilds them lazily.
+    """
+    
+    def __init__(self, matches: Optional[List[MatchResult]] = None):
+        self.rebuild(matches or [])
+    
+    @classmethod
+    def from_values(cls, matches: Sequence[MatchResult], values: np.ndarray) -> "_RollingAggregates":
+        """
+        Build prefixes from precomputed values (oldest first).
+        
+        Args:
+            matches: Matches of the split (e.g. a MatchHistoryView)
+            values: Array (len(matches), len(FORM_STATS)), NaN = not available
+        """
+        split = cls.__new__(cls)
+        available = ~np.isnan(values)
+        sums = np.zeros((len(FORM_STATS), len(matches) + 1))
+        counts = np.zeros((len(FORM_STATS), len(matches) + 1), dtype=np.int64)
+        np.cumsum(np.where(available, values, 0.0).T, axis=1, out=sums[:, 1:])
+        np.cumsum(available.T, axis=1, out=counts[:, 1:])
+        
+        # Arrays are read-only here: add_match copies history-backed forms
+        # into lists and rebuilds before appending
+        split.matches = matches
+        split.sums = sums
+        split.counts = counts
+        split.stale = False
+        return split
+    
+    def append(self, match: MatchResult):
+        """Add a match newer than every match already in the split"""
+        self.matches.append(match)
+        for sums, counts, value in zip(self.sums, self.counts, _form_values(match)):
+            if value is None:
+                sums.append(sums[-1])
+                counts.append(counts[-1])
+            else:
+                sums.append(sums[-1] + value)
+                counts.append(counts[-1] + 1)
+    
+    def rebuild(self, matches: List[MatchResult]):
+        """Recompute prefixes from matches (oldest first)"""
+        self.matches: List[MatchResult] = []
+        self.sums: List[List[float]] = [[0.0] for _ in FORM_STATS]
+        self.counts: List[List[int]] = [[0] for _ in FORM_STATS]
+        self.stale = False
+        for match in matches:
+            self.append(match)
+    
+    def window_size(self, n: int) -> int:
+        """Number of matches in the n most recent (same semantics as list[:n])"""
+        size = len(self.matches)
+        return min(n, size) if n >= 0 else max(size + n, 0)
+    
+    def mean(self, stat: int, n: int) -> float:
+        """Mean of a statistic over the n most recent matches with data"""
+        size = len(self.matches)
+        start = size - self.window_size(n)
+        sums, counts = self.sums[stat], self.counts[stat]
+        count = counts[size] - counts[start]
+        
+        if count == 0:
+            return 0.0
+        
+        return round(float((sums[size] - sums[start]) / count), 2)
+
+
+class _DecayedAggregates:
+    """
+    Exponentially time-decayed sums of FORM_STATS over one venue split.
+    
+    With weights w_i = 2^(-(t - t_i) / half_life), the sums after the k-th
+    match (oldest first) are referenced to its date t_k so they stay
+    bounded:
+    
+        S_k = S_(k-1) · 2^(-(t_k - t_(k-1)) / half_life) + v_k
+    
+    A newer match is one O(1) update. The weighted mean at any time t on
+    or after t_k is S_k / W_k (the common decay factor cancels), so a
+    query at a timestamp is a bisect over match times.
+    """
+    
+    def __init__(self, half_life_days: float):
+        if half_life_days <= 0:
+            raise ValueError("half_life_days must be positive")
+        self.half_life = half_life_days * SECONDS_PER_DAY
+        self.times: List[float] = []
+        self.sums: List[List[float]] = [[] for _ in FORM_STATS]
+        self.weights: List[List[float]] = [[] for _ in FORM_STATS]
+        self.stale = False
+    
+    def append(self, seconds: float, values: Sequence[Optional[float]]):
+        """Add a match not older than every match already in the split"""
+        decay = 2.0 ** (-(seconds - self.times[-1]) / self.half_life) if self.times else 0.0
+        self.times.append(seconds)
+        for sums, weights, value in zip(self.sums, self.weights, values):
+            previous_sum = sums[-1] * decay if sums else 0.0
+            previous_weight = weights[-1] * decay if weights else 0.0
+            if value is None or value != value:  # None or NaN: not available
+                sums.append(previous_sum)
+                weights.append(previous_weight)
+            else:
+                sums.append(previous_sum + value)
+                weights.append(previous_weight + 1.0)
+    
+    def mean(self, stat: int, at: Optional[datetime] = None) -> float:
+        """Weighted mean of a statistic over matches played up to `at`"""
+        k = len(self.times) if at is None else bisect_right(self.times, _seconds(at))
+        if k == 0 or self.weights[stat][k - 1] == 0:
+            return 0.0
+        
+        return round(self.sums[stat][k - 1] / self.weights[stat][k - 1], 2)
+
+
 @dataclass
 class TeamForm:
-    """Team's recent form and xG statistics"""
+    """
+    Team's recent form and xG statistics.
+    
+    Matches are kept newest first with bisect insertion, and rolling
+    aggregates per venue split (all, home, away) make every average_*
+    call an O(1) lookup. Appending directly to `matches` is detected on
+    the next query; after editing matches in place, call refresh().
+    
+    A form built with from_history() reads a MatchHistory through a
+    view and only copies the matches into a list on the first add_match.
+    """
     team_name: str
     matches: List[MatchResult] = field(default_factory=list)
     
+    # Match dates, oldest first (bisect keys)
+    _dates: List[datetime] = field(default_factory=list, init=False, repr=False, compare=False)
+    _splits: Dict[Optional[bool], _RollingAggregates] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Time-decayed aggregates, built on first use: (split key, half-life) -> sums
+    _decayed: Dict[Tuple[Optional[bool], float], _DecayedAggregates] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self.refresh()
+    
+    @classmethod
+    def from_history(cls, history: "MatchHistory", team_name: str) -> "TeamForm":
+        """
+        Form of one team read from a columnar MatchHistory.
+        
+        Rolling aggregates are computed directly from the columns;
+        MatchResult objects are only built when matches are accessed.
+        
+        Args:
+            history: MatchHistory containing the team's matches
+            team_name: Team name as stored in the history
+            
+        Returns:
+            TeamForm whose `matches` is a MatchHistoryView (newest first)
+        """
+        form = cls(team_name=team_name)
+        view = history.team_view(team_name)
+        chronological = view.reversed()
+        values = history.form_values(chronological)
+        home = chronological.is_home
+        
+        form.matches = view
+        form._dates = history.column("date")[chronological.rows]
+        form._splits = {
+            None: _RollingAggregates.from_values(chronological, values),
+            True: _RollingAggregates.from_values(chronological.subset(home), values[home]),
+            False: _RollingAggregates.from_values(chronological.subset(~home), values[~home]),
+        }
+        return form
+    
+    def refresh(self):
+        """Re-sort matches and rebuild all rolling aggregates"""
+        if not isinstance(self.matches, list):
+            # History-backed form: copy into a list before modifying
+            self.matches = list(self.matches)
+        self.matches.sort(key=lambda m: m.date, reverse=True)
+        chronological = self.matches[::-1]
+        self._dates = [m.date for m in chronological]
+        
+        # Split key: None = all matches, True = home, False = away
+        self._decayed = {}
+        self._splits = {
+            None: _RollingAggregates(chronological),
+            True: _RollingAggregates([m for m in chronological if m.is_home]),
+            False: _RollingAggregates([m for m in chronological if not m.is_home]),
+        }
+    
     def add_match(self, match: MatchResult):
         """Add a match to the team's history"""
-        self.matches.append(match)
-        # Keep only most recent matches (sorted by date)
-        self.matches.sort(key=lambda m: m.date, reverse=True)
+        if not isinstance(self.matches, list):
+            self.refresh()
+        self._sync()
+        
+        # bisect_left keeps the previous tie order: among equal dates the
+        # earliest added stays first in the (newest first) match list
+        position = bisect_left(self._dates, match.date)
+        newest = position == len(self._dates)
+        
+        self._dates.insert(position, match.date)
+        self.matches.insert(len(self.matches) - position, match)
+        
+        for key in (None, match.is_home):
+            split = self._splits[key]
+            if newest and not split.stale:
+                split.append(match)
+            else:
+                split.stale = True
+        
+        for (key, _), decayed in self._decayed.items():
+            if key is not None and key != match.is_home:
+                continue
+            if newest and not decayed.stale:
+                decayed.append(_seconds(match.date), _form_values(match))
+            else:
+                decayed.stale = True
+    
+    def _sync(self):
+        """Rebuild if matches was modified behind add_match"""
+        if len(self.matches) != len(self._dates):
+            self.refresh()
+    
+    def _split(self, home_only: bool = False, away_only: bool = False) -> _RollingAggregates:
+        """Up-to-date aggregates for the requested venue split"""
+        self._sync()
+        key = True if home_only else False if away_only else None
+        split = self._splits[key]
+        
+        if split.stale:
+            chronological = reversed(self.matches)
+            if key is None:
+                split.rebuild(list(chronological))
+            else:
+                split.rebuild([m for m in chronological if m.is_home == key])
+        
+        return split
+    
+    def _average(self, stat: str, n: int, home_only: bool, away_only: bool) -> float:
+        return self._split(home_only, away_only).mean(_STAT_INDEX[stat], n)
+    
+    def _decayed_split(self, half_life_days: float, home_only: bool, away_only: bool) -> _DecayedAggregates:
+        """Up-to-date time-decayed aggregates for a venue split and half-life"""
+        split = self._split(home_only, away_only)
+        key = (True if home_only else False if away_only else None, float(half_life_days))
+        decayed = self._decayed.get(key)
+        
+        if decayed is None or decayed.stale:
+            decayed = _DecayedAggregates(half_life_days)
+            matches = split.matches
+            if isinstance(matches, list):
+                rows = [(_seconds(m.date), _form_values(m)) for m in matches]
+            else:
+                # MatchHistoryView: dates (UTC) and values straight from the columns
+                dates = matches.history.column("date")[matches.rows]
+                seconds = (dates.astype(np.int64) / 1e6).tolist()
+                rows = zip(seconds, matches.history.form_values(matches).tolist())
+            for seconds, values in rows:
+                decayed.append(seconds, values)
+            self._decayed[key] = decayed
+        
+        return decayed
+    
+    def weighted_average(
+        self,
+        stat: str,
+        half_life_days: float = FORM_HALF_LIFE_DAYS,
+        at: Optional[datetime] = None,
+        home_only: bool = False,
+        away_only: bool = False,
+    ) -> float:
+        """
+        Exponentially time-weighted average of a form statistic.
+        
+        A match played `half_life_days` before the latest one counts half
+        as much. Accumulators update in O(1) per new match.
+        
+        Args:
+            stat: One of FORM_STATS (e.g. "xg_for", "corners")
+            half_life_days: Half-life of the weights in days
+            at: Only use matches played up to this time (default: all)
+            home_only: Only consider home matches
+            away_only: Only consider away matches
+            
+        Returns:
+            Weighted average (0.0 without data)
+        """
+        if stat not in _STAT_INDEX:
+            raise ValueError(f"Unknown form statistic: {stat} (expected one of {FORM_STATS})")
+        
+        decayed = self._decayed_split(half_life_days, home_only, away_only)
+        return decayed.mean(_STAT_INDEX[stat], at)
+    
+    def weighted_xg_for(
+        self,
+        half_life_days: float = FORM_HALF_LIFE_DAYS,
+        at: Optional[datetime] = None,
+        home_only: bool = False,
+        away_only: bool = False,
+    ) -> float:
+        """Time-weighted average xG generated (see weighted_average)"""
+        return self.weighted_average("xg_for", half_life_days, at, home_only, away_only)
+    
+    def weighted_xg_against(
+        self,
+        half_life_days: float = FORM_HALF_LIFE_DAYS,
+        at: Optional[datetime] = None,
+        home_only: bool = False,
+        away_only: bool = False,
+    ) -> float:
+        """Time-weighted average xG conceded (see weighted_average)"""
+        return self.weighted_average("xg_against", half_life_days, at, home_only, away_only)
     
     def get_recent_matches(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> List[MatchResult]:
         """
@@ -69,14 +435,10 @@ class TeamForm:
         Returns:
             List of recent matches
         """
-        matches = self.matches
-        
-        if home_only:
-            matches = [m for m in matches if m.is_home]
-        elif away_only:
-            matches = [m for m in matches if not m.is_home]
+        split = self._split(home_only, away_only)
+        size = len(split.matches)
         
-        return matches[:n]
+        return split.matches[size - split.window_size(n):][::-1]
     
     def average_xg_for(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> float:
         """
@@ -90,17 +452,7 @@ class TeamForm:
         Returns:
             Average xG for
         """
-        matches = self.get_recent_matches(n, home_only, away_only)
-        
-        if not matches:
-            return 0.0
-        
-        xg_values = [
-            m.home_xg if m.is_home else m.away_xg
-            for m in matches
-        ]
-        
-        return round(mean(xg_values), 2) if xg_values else 0.0
+        return self._average("xg_for", n, home_only, away_only)
     
     def average_xg_against(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> float:
         """
@@ -114,45 +466,15 @@ class TeamForm:
         Returns:
             Average xG against
         """
-        matches = self.get_recent_matches(n, home_only, away_only)
-        
-        if not matches:
-            return 0.0
-        
-        xg_values = [
-            m.away_xg if m.is_home else m.home_xg
-            for m in matches
-        ]
-        
-        return round(mean(xg_values), 2) if xg_values else 0.0
+        return self._average("xg_against", n, home_only, away_only)
     
     def average_goals_for(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> float:
         """Calculate average goals scored"""
-        matches = self.get_recent_matches(n, home_only, away_only)
-        
-        if not matches:
-            return 0.0
-        
-        goals = [
-            m.home_goals if m.is_home else m.away_goals
-            for m in matches
-        ]
-        
-        return round(mean(goals), 2) if goals else 0.0
+        return self._average("goals_for", n, home_only, away_only)
     
     def average_goals_against(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> float:
         """Calculate average goals conceded"""
-        matches = self.get_recent_matches(n, home_only, away_only)
-        
-        if not matches:
-            return 0.0
-        
-        goals = [
-            m.away_goals if m.is_home else m.home_goals
-            for m in matches
-        ]
-        
-        return round(mean(goals), 2) if goals else 0.0
+        return self._average("goals_against", n, home_only, away_only)
     
     def get_form_string(self, n: int = 5) -> str:
         """
@@ -184,54 +506,47 @@ class TeamForm:
     
     def average_corners(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> float:
         """Calculate average corners (for/against combined)"""
-        matches = self.get_recent_matches(n, home_only, away_only)
-        corners = [
-            (m.home_corners or 0) + (m.away_corners or 0)
-            for m in matches
-            if m.home_corners is not None and m.away_corners is not None
-        ]
-        return round(mean(corners), 2) if corners else 0.0
+        return self._average("corners", n, home_only, away_only)
     
     def average_corners_for(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> float:
         """Calculate average corners won by this team"""
-        matches = self.get_recent_matches(n, home_only, away_only)
-        corners = [
-            m.home_corners if m.is_home else m.away_corners
-            for m in matches
-            if (m.home_corners is not None if m.is_home else m.away_corners is not None)
-        ]
-        return round(mean(corners), 2) if corners else 0.0
+        return self._average("corners_for", n, home_only, away_only)
     
     def average_cards(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> float:
         """Calculate average cards (yellow + red) per match"""
-        matches = self.get_recent_matches(n, home_only, away_only)
-        cards = []
-        for m in matches:
-            home_cards = (m.home_yellow_cards or 0) + (m.home_red_cards or 0) * 2
-            away_cards = (m.away_yellow_cards or 0) + (m.away_red_cards or 0) * 2
-            total = home_cards + away_cards
-            if m.home_yellow_cards is not None or m.away_yellow_cards is not None:
-                cards.append(total)
-        return round(mean(cards), 2) if cards else 0.0
+        return self._average("cards", n, home_only, away_only)
     
     def average_shots(self, n: int = 5, home_only: bool = False, away_only: bool = False) -> float:
         """Calculate average shots per match"""
-        matches = self.get_recent_matches(n, home_only, away_only)
-        shots = [
-            m.home_shots if m.is_home else m.away_shots
-            for m in matches
-            if (m.home_shots is not None if m.is_home else m.away_shots is not None)
-        ]
-        return round(mean(shots), 2) if shots else 0.0
+        return self._average("shots", n, home_only, away_only)
 
 
 @dataclass
 class PredictionInput:
-    """Input data for match prediction"""
+    """
+    Input data for match prediction.
+    
+    By default team strength is the plain mean over the last
+    `matches_to_consider` matches. Setting `half_life_days` switches to
+    exponentially time-weighted xG over the whole history, optionally
+    evaluated as of a past time.
+    """
     home_team: TeamForm
     away_team: TeamForm
     matches_to_consider: int = 5
     home_advantage_factor: float = 1.0  # Multiplier for home xG (e.g., 1.1 = 10% boost)
+    half_life_days: Optional[float] = None  # None = hard window of matches_to_consider
+    as_of: Optional[datetime] = None  # Time-weighted mode only: ignore later matches
+    
+    def _xg_for(self, team: TeamForm, home_only: bool = False, away_only: bool = False) -> float:
+        if self.half_life_days is None:
+            return team.average_xg_for(n=self.matches_to_consider, home_only=home_only, away_only=away_only)
+        return team.weighted_xg_for(self.half_life_days, self.as_of, home_only, away_only)
+    
+    def _xg_against(self, team: TeamForm, home_only: bool = False, away_only: bool = False) -> float:
+        if self.half_life_days is None:
+            return team.average_xg_against(n=self.matches_to_consider, home_only=home_only, away_only=away_only)
+        return team.weighted_xg_against(self.half_life_days, self.as_of, home_only, away_only)
     
     def get_home_lambda(self) -> float:
         """
@@ -242,15 +557,9 @@ class PredictionInput:
         - Away team's defensive weakness (xG against away)
         - Home advantage factor
         """
-        home_attack = self.home_team.average_xg_for(
-            n=self.matches_to_consider,
-            home_only=True
-        )
+        home_attack = self._xg_for(self.home_team, home_only=True)
         
-        away_defense = self.away_team.average_xg_against(
-            n=self.matches_to_consider,
-            away_only=True
-        )
+        away_defense = self._xg_against(self.away_team, away_only=True)
         
         # Simple average, adjusted for home advantage
         lambda_home = ((home_attack + away_defense) / 2) * self.home_advantage_factor
@@ -265,15 +574,9 @@ class PredictionInput:
         - Away team's offensive strength (xG for away)
         - Home team's defensive weakness (xG against at home)
         """
-        away_attack = self.away_team.average_xg_for(
-            n=self.matches_to_consider,
-            away_only=True
-        )
+        away_attack = self._xg_for(self.away_team, away_only=True)
         
-        home_defense = self.home_team.average_xg_against(
-            n=self.matches_to_consider,
-            home_only=True
-        )
+        home_defense = self._xg_against(self.home_team, home_only=True)
         
         # Simple average
         lambda_away = (away_attack + home_defense) / 2
@@ -295,11 +598,58 @@ class MatchPrediction:
     most_likely_score_prob: float
     expected_total_goals: float
     prediction_timestamp: datetime = field(default_factory=datetime.now)
+    truncated_mass: Optional[float] = None  # Probability beyond the scoreline grid
     
     # Optional detailed probabilities
-    scoreline_probabilities: Optional[Dict[tuple[int, int], float]] = None
+    scoreline_grid: Optional["ScorelineGrid"] = field(default=None, repr=False, compare=False)
     over_under_2_5: Optional[Dict[str, float]] = None
     btts: Optional[Dict[str, float]] = None
+    _scoreline_probabilities: Optional[Dict[tuple[int, int], float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _totals_ladder: Optional[Dict[float, Dict[str, float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _asian_handicap: Optional[Dict[float, Dict[str, float]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    @property
+    def scoreline_probabilities(self) -> Optional[Dict[tuple[int, int], float]]:
+        """
+        Scoreline dictionary view, built lazily from scoreline_grid.
+        
+        Kept for compatibility; prefer scoreline_grid for new code.
+        """
+        if self._scoreline_probabilities is None and self.scoreline_grid is not None:
+            self._scoreline_probabilities = self.scoreline_grid.to_dict()
+        return self._scoreline_probabilities
+    
+    @scoreline_probabilities.setter
+    def scoreline_probabilities(self, value: Optional[Dict[tuple[int, int], float]]):
+        self._scoreline_probabilities = value
+    
+    @property
+    def totals_ladder(self) -> Optional[Dict[float, Dict[str, float]]]:
+        """
+        Over/push/under for every totals line 0.5-6.5 (quarter steps).
+        
+        Built lazily from scoreline_grid (None without details).
+        """
+        if self._totals_ladder is None and self.scoreline_grid is not None:
+            self._totals_ladder = self.scoreline_grid.totals_ladder()
+        return self._totals_ladder
+    
+    @property
+    def asian_handicap(self) -> Optional[Dict[float, Dict[str, float]]]:
+        """
+        Home/push/away for every home handicap -3 to +3 (quarter steps).
+        
+        Built lazily from scoreline_grid (None without details).
+        """
+        if self._asian_handicap is None and self.scoreline_grid is not None:
+            self._asian_handicap = self.scoreline_grid.asian_handicap()
+        return self._asian_handicap
     
     def get_favorite(self) -> str:
         """Get the favorite outcome"""
@@ -344,6 +694,9 @@ class MatchPrediction:
         if self.btts:
             result["btts"] = self.btts
         
+        if self.truncated_mass is not None:
+            result["truncated_mass"] = self.truncated_mass
+        
         return result
     
     def __str__(self) -> str:
@@ -21,7 +21,8 @@ from typing import List, Optional, Dict
 from urllib.parse import urljoin
 import xml.etree.ElementTree as ET
 
-import aiohttp
+from bet_copilot.api.single_flight import SingleFlight, get_single_flight
+from bet_copilot.api.transport import HttpTransport, get_transport
 
 logger = logging.getLogger(__name__)
 
@@ -106,60 +107,79 @@ class NewsScraper:
         "miss", "missing", "ruled out", "sidelined", "unavailable", "fitness"
     ]
     
-    def __init__(self, cache_ttl: int = 3600):
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (compatible; BetCopilot/1.0; +https://github.com/betcopilot)"
+    }
+    
+    def __init__(
+        self,
+        cache_ttl: int = 3600,
+        transport: Optional[HttpTransport] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ):
         """
         Initialize news scraper.
         
         Args:
             cache_ttl: Cache time-to-live in seconds (default 1 hour)
+            transport: Pooled HTTP transport (default: shared transport)
+            single_flight: Request coalescing (default: shared SingleFlight)
         """
         self.cache = NewsCache(ttl_seconds=cache_ttl)
-        self.session: Optional[aiohttp.ClientSession] = None
-    
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "User-Agent": "Mozilla/5.0 (compatible; BetCopilot/1.0; +https://github.com/betcopilot)"
-                }
-            )
-        return self.session
+        self.transport = transport or get_transport()
+        self.single_flight = single_flight or get_single_flight()
     
-    async def fetch_bbc_news(self, max_articles: int = 20) -> List[NewsArticle]:
+    async def _fetch_feed(self, url: str, source: str, cache_key: str) -> List[NewsArticle]:
         """
-        Fetch news from BBC Sport RSS feed.
+        Download and parse one RSS feed, through the cache.
+        
+        Concurrent callers share a single download (SingleFlight).
         
         Args:
-            max_articles: Maximum articles to return
+            url: Feed URL
+            source: Source name stored on the articles
+            cache_key: NewsCache key
             
         Returns:
-            List of NewsArticle objects
+            All articles of the feed (empty on a non-200 response)
         """
-        # Check cache first
-        cached = self.cache.get("bbc")
+        cached = self.cache.get(cache_key)
         if cached:
-            logger.info("Returning cached BBC news")
-            return cached[:max_articles]
+            logger.info(f"Returning cached {source} news")
+            return cached
         
-        try:
-            logger.info("Fetching BBC Sport football news...")
-            session = await self._get_session()
-            
-            async with session.get(self.BBC_RSS, timeout=10) as response:
+        async def download() -> List[NewsArticle]:
+            logger.info(f"Fetching {source} football news...")
+            async with self.transport.get(url, headers=self.HEADERS, timeout=10) as response:
                 if response.status != 200:
-                    logger.error(f"BBC RSS returned status {response.status}")
+                    logger.error(f"{source} RSS returned status {response.status}")
                     return []
                 
                 xml_content = await response.text()
-                
+            
             # Parse RSS
-            articles = self._parse_rss(xml_content, source="BBC Sport")
+            articles = self._parse_rss(xml_content, source=source)
             
             # Cache results
-            self.cache.set("bbc", articles)
+            self.cache.set(cache_key, articles)
+            
+            logger.info(f"✓ Fetched {len(articles)} articles from {source}")
+            return articles
+        
+        return await self.single_flight.do(url, download)
+    
+    async def fetch_bbc_news(self, max_articles: int = 20) -> List[NewsArticle]:
+        """
+        Fetch news from BBC Sport RSS feed.
+        
+        Args:
+            max_articles: Maximum articles to return
             
-            logger.info(f"✓ Fetched {len(articles)} articles from BBC Sport")
+        Returns:
+            List of NewsArticle objects
+        """
+        try:
+            articles = await self._fetch_feed(self.BBC_RSS, "BBC Sport", "bbc")
             return articles[:max_articles]
         
         except Exception as e:
@@ -176,30 +196,8 @@ class NewsScraper:
         Returns:
             List of NewsArticle objects
         """
-        # Check cache first
-        cached = self.cache.get("espn")
-        if cached:
-            logger.info("Returning cached ESPN news")
-            return cached[:max_articles]
-        
         try:
-            logger.info("Fetching ESPN soccer news...")
-            session = await self._get_session()
-            
-            async with session.get(self.ESPN_RSS, timeout=10) as response:
-                if response.status != 200:
-                    logger.error(f"ESPN RSS returned status {response.status}")
-                    return []
-                
-                xml_content = await response.text()
-            
-            # Parse RSS
-            articles = self._parse_rss(xml_content, source="ESPN")
-            
-            # Cache results
-            self.cache.set("espn", articles)
-            
-            logger.info(f"✓ Fetched {len(articles)} articles from ESPN")
+            articles = await self._fetch_feed(self.ESPN_RSS, "ESPN", "espn")
             return articles[:max_articles]
         
         except Exception as e:
@@ -405,6 +403,5 @@ class NewsScraper:
         return [a for a in articles if a.category in categories]
     
     async def close(self):
-        """Close HTTP session."""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """Clean up resources."""
+        pass
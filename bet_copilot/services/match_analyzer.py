@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from bet_copilot.api.odds_client import OddsAPIClient
 from bet_copilot.api.football_client import (
     FootballAPIClient,
@@ -21,16 +23,24 @@ from bet_copilot.api.multi_source_client import MultiSourceFootballClient
 from bet_copilot.ai.blackbox_client import BlackboxClient
 from bet_copilot.ai.types import ContextualAnalysis
 from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+from bet_copilot.math_engine.market_cache import MarketCache
+from bet_copilot.math_engine.team_ratings import RatingEngine
 from bet_copilot.math_engine.kelly import KellyCriterion, KellyRecommendation
+from bet_copilot.math_engine.margins import NoVigConsensus, apply_margin, no_vig_consensus
 from bet_copilot.math_engine.alternative_markets import (
     AlternativeMarketsPredictor,
     AlternativeMarketPrediction,
 )
+from bet_copilot.models.odds import OddsMatrix
 from bet_copilot.models.soccer import TeamForm, MatchResult, MatchPrediction
 from bet_copilot.news import NewsScraper, NewsArticle
+from bet_copilot.config import ESTIMATED_BOOK_MARGIN
 
 logger = logging.getLogger(__name__)
 
+# Orden de resultados en la matriz de cuotas h2h
+H2H_OUTCOMES = ("home", "draw", "away")
+
 
 @dataclass
 class EnhancedMatchAnalysis:
@@ -59,6 +69,10 @@ class EnhancedMatchAnalysis:
     draw_odds: Optional[float] = None
     bookmaker: Optional[str] = None
 
+    # Consenso del mercado sin margen (todas las casas) y EV de la mejor cuota
+    fair_probabilities: Optional[Dict[str, float]] = None
+    market_ev: Optional[Dict[str, float]] = None
+
     # Predicción matemática
     prediction: Optional[MatchPrediction] = None
 
@@ -185,15 +199,17 @@ class MatchAnalyzer:
         kelly: Optional[KellyCriterion] = None,
         alternative_markets: Optional[AlternativeMarketsPredictor] = None,
         news_scraper: Optional[NewsScraper] = None,
+        rating_engine: Optional[RatingEngine] = None,
     ):
         self.odds_client = odds_client or OddsAPIClient()
         self.football_client = football_client or FootballAPIClient()
         self.multi_source = multi_source_client or MultiSourceFootballClient()
         self.blackbox_client = blackbox_client or BlackboxClient()
-        self.soccer_predictor = soccer_predictor or SoccerPredictor()
+        self.soccer_predictor = soccer_predictor or SoccerPredictor(cache=MarketCache())
         self.kelly = kelly or KellyCriterion()
         self.alternative_markets = alternative_markets or AlternativeMarketsPredictor()
         self.news_scraper = news_scraper or NewsScraper()
+        self.rating_engine = rating_engine
         
         logger.info("MatchAnalyzer initialized with Blackbox AI support")
 
@@ -321,10 +337,17 @@ class MatchAnalyzer:
                 logger.warning(f"Error obteniendo jugadores: {str(e)}")
 
         # 4. Calcular predicción Poisson con stats reales
-        if analysis.home_stats and analysis.away_stats:
-            # Usar xG aproximado de goles promedio
-            home_xg = analysis.home_stats.avg_goals_for
-            away_xg = analysis.away_stats.avg_goals_against
+        ratings_lambdas = self._rating_lambdas(
+            (home_team, home_team_full_name), (away_team, away_team_full_name)
+        )
+        if ratings_lambdas or (analysis.home_stats and analysis.away_stats):
+            if ratings_lambdas:
+                # Ratings de ataque/defensa ajustados a toda la liga
+                home_xg, away_xg = ratings_lambdas
+            else:
+                # Usar xG aproximado de goles promedio
+                home_xg = analysis.home_stats.avg_goals_for
+                away_xg = analysis.away_stats.avg_goals_against
 
             prediction = self.soccer_predictor.predict_from_lambdas(
                 home_team,
@@ -454,6 +477,7 @@ class MatchAnalyzer:
                 )
 
         # 7b. Obtener odds si se solicita
+        matched_event = None  # (sport_key, event_id) del evento de The Odds API
         if fetch_odds and self.odds_client:
             try:
                 logger.info(f"Fetching odds for {home_team} vs {away_team}...")
@@ -491,39 +515,33 @@ class MatchAnalyzer:
                     
                     if home_match and away_match:
                         logger.info(f"✓ Found matching event: {event.home_team} vs {event.away_team}")
+                        matched_event = (sport_key, event.id)
                         
-                        # Get best odds from all bookmakers
-                        best_home = 0.0
-                        best_draw = 0.0
-                        best_away = 0.0
-                        best_bookmaker = ""
-                        
-                        for bookmaker in event.bookmakers:
-                            for market in bookmaker.markets:
-                                if market.key == "h2h":
-                                    outcomes = market.outcomes
-                                    home_odd = outcomes.get(event.home_team, 0.0)
-                                    draw_odd = outcomes.get("Draw", 0.0)
-                                    away_odd = outcomes.get(event.away_team, 0.0)
-                                    
-                                    # Take best odds (highest)
-                                    if home_odd > best_home:
-                                        best_home = home_odd
-                                    if draw_odd > best_draw:
-                                        best_draw = draw_odd
-                                    if away_odd > best_away:
-                                        best_away = away_odd
-                                        best_bookmaker = bookmaker.title
-                        
-                        if best_home > 0:
+                        # Precios de todas las casas: mejor cuota y consenso sin margen
+                        consensus = self._h2h_consensus(event)
+                        best_home, best_draw, best_away = (
+                            consensus.best_odds[0].tolist() if consensus is not None else (np.nan,) * 3
+                        )
+                        if best_home == best_home and best_away == best_away:
                             analysis.home_odds = best_home
-                            analysis.draw_odds = best_draw if best_draw > 0 else None
+                            analysis.draw_odds = best_draw if best_draw == best_draw else None
                             analysis.away_odds = best_away
                             analysis.bookmaker = f"Best Odds (via The Odds API)"
-                            
+
+                            if consensus.books[0] > 0:
+                                fair = consensus.probabilities[0].tolist()
+                                ev = consensus.ev[0].tolist()
+                                analysis.fair_probabilities = {
+                                    name: prob for name, prob in zip(H2H_OUTCOMES, fair) if prob == prob
+                                }
+                                analysis.market_ev = {
+                                    name: value for name, value in zip(H2H_OUTCOMES, ev) if value == value
+                                }
+
                             logger.info(
-                                f"✓ Real odds from {best_bookmaker}: "
-                                f"H={best_home:.2f} D={best_draw:.2f} A={best_away:.2f}"
+                                f"✓ Real odds from {len(event.bookmakers)} bookmakers: "
+                                f"H={best_home:.2f} D={best_draw:.2f} A={best_away:.2f}, "
+                                f"margen medio {float(consensus.margin[0]):.1%}"
                             )
                         break
                 
@@ -552,6 +570,14 @@ class MatchAnalyzer:
                     analysis.prediction.draw_prob, analysis.draw_odds
                 )
                 logger.info(f"Kelly Draw: EV={analysis.kelly_draw.ev:+.1%}, Value={analysis.kelly_draw.is_value_bet}")
+
+            # Los deportes con más value bets se sondean más a menudo (OddsBudget)
+            if matched_event:
+                value_bets = sum(
+                    1 for kelly in (analysis.kelly_home, analysis.kelly_draw, analysis.kelly_away)
+                    if kelly and kelly.is_value_bet
+                )
+                self.odds_client.budget.record_value_bets(*matched_event, value_bets)
         
         # 8. Predicciones de mercados alternativos (si hay datos históricos)
         if analysis.home_stats and analysis.away_stats:
@@ -603,11 +629,16 @@ class MatchAnalyzer:
         if analysis.prediction and not analysis.home_odds:
             # Use fair odds WITH typical bookmaker margin
             # This way EV will be negative unless AI provides strong adjustments
-            margin = 1.08  # 8% bookmaker margin (typical)
+            estimated = apply_margin(
+                [
+                    analysis.prediction.home_win_prob,
+                    analysis.prediction.draw_prob,
+                    analysis.prediction.away_win_prob,
+                ],
+                ESTIMATED_BOOK_MARGIN,
+            )
             
-            analysis.home_odds = (1.0 / analysis.prediction.home_win_prob) / margin
-            analysis.draw_odds = (1.0 / analysis.prediction.draw_prob) / margin
-            analysis.away_odds = (1.0 / analysis.prediction.away_win_prob) / margin
+            analysis.home_odds, analysis.draw_odds, analysis.away_odds = estimated.tolist()
             analysis.bookmaker = "Estimated Odds"
             
             # Calculate Kelly with estimated odds
@@ -627,7 +658,48 @@ class MatchAnalyzer:
             )
 
         return analysis
-    
+
+    @staticmethod
+    def _h2h_consensus(event) -> Optional[NoVigConsensus]:
+        """
+        Matriz (casa × resultado) de cuotas h2h y su consenso sin margen.
+
+        Args:
+            event: OddsEvent de The Odds API
+
+        Returns:
+            NoVigConsensus de un solo evento o None si ninguna casa cotiza h2h
+        """
+        matrix = event.matrices.get("h2h") if event.matrices else None
+        if matrix is None:
+            matrix = OddsMatrix.from_bookmakers("h2h", event.bookmakers)
+        if matrix is None:
+            return None
+
+        return no_vig_consensus(matrix.columns(event.h2h_outcomes)[None])
+
+    def _rating_lambdas(self, home_names, away_names) -> Optional[tuple]:
+        """
+        Lambdas desde el RatingEngine si conoce a ambos equipos.
+
+        Args:
+            home_names: Nombres candidatos del local (búsqueda, nombre completo)
+            away_names: Nombres candidatos del visitante
+
+        Returns:
+            (λ_home, λ_away) o None si no hay ratings para el partido
+        """
+        ratings = self.rating_engine.ratings if self.rating_engine else None
+        if ratings is None:
+            return None
+
+        home = next((name for name in home_names if name in ratings), None)
+        away = next((name for name in away_names if name in ratings), None)
+        if home is None or away is None:
+            return None
+
+        return ratings.expected_goals(home, away)
+
     def _build_team_form_from_matches(
         self, team_name: str, matches: List[Dict], team_id: int
     ) -> TeamForm:
@@ -711,13 +783,7 @@ class MatchAnalyzer:
         home_odds = odds_event.get_best_odds("h2h", odds_event.home_team)
         away_odds = odds_event.get_best_odds("h2h", odds_event.away_team)
 
-        # Intentar obtener draw odds
-        draw_odds = None
-        for bookmaker in odds_event.bookmakers:
-            for market in bookmaker.markets:
-                if market.key == "h2h" and "Draw" in market.outcomes:
-                    draw_odds = market.outcomes["Draw"]
-                    break
+        draw_odds = odds_event.get_best_odds("h2h", "Draw")
 
         bookmaker_name = (
             odds_event.bookmakers[0].title if odds_event.bookmakers else "Unknown"
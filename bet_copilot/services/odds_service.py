@@ -0,0 +1,152 @@
+"""
+Servicio de cuotas: The Odds API con persistencia en SQLite.
+Cada consulta se guarda en OddsRepository (snapshots y log de requests).
+El gasto de créditos lo controla OddsBudget: con poco saldo las consultas
+de baja prioridad se reducen o se rechazan y se sirven desde la base.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from bet_copilot.api.odds_budget import Priority, request_cost
+from bet_copilot.api.odds_client import OddsAPIClient, QuotaExceededError
+from bet_copilot.db.odds_repository import OddsRepository
+from bet_copilot.models.odds import OddsEvent
+
+logger = logging.getLogger(__name__)
+
+
+class OddsService:
+    """
+    Punto de acceso único a cuotas: API + base de datos.
+
+    El cliente encola los snapshots en el writer del repositorio, así que
+    get_odds no espera a SQLite.
+    """
+
+    def __init__(
+        self,
+        odds_client: Optional[OddsAPIClient] = None,
+        repository: Optional[OddsRepository] = None,
+    ):
+        """
+        Inicializa el servicio.
+
+        Args:
+            odds_client: Cliente ya creado con repository=..., que también
+                usan su caché en disco y su presupuesto
+            repository: Base de datos (por defecto la del cliente, o una
+                nueva si tampoco se pasa cliente)
+        """
+        if odds_client is None:
+            self.repository = repository or OddsRepository()
+            self.odds_client = OddsAPIClient(repository=self.repository)
+            return
+
+        if odds_client.repository is None:
+            raise ValueError("odds_client must be created with repository=... to persist odds")
+        if repository is not None and repository is not odds_client.repository:
+            raise ValueError("repository must be the one odds_client was created with")
+        self.repository = odds_client.repository
+        self.odds_client = odds_client
+
+    async def initialize(self):
+        """Abre la base de datos (idempotente)."""
+        await self.repository.initialize()
+
+    async def get_odds(
+        self,
+        sport_key: str,
+        regions: str = "us",
+        markets: str = "h2h",
+        priority: Priority = Priority.NORMAL,
+    ) -> List[OddsEvent]:
+        """
+        Obtiene cuotas frescas de la API y las persiste.
+
+        Si el presupuesto de créditos rechaza la consulta, devuelve las
+        últimas cuotas guardadas.
+
+        Args:
+            sport_key: Deporte (ej. "soccer_epl")
+            regions: Regiones de casas de apuestas
+            markets: Mercados
+            priority: Prioridad ante el presupuesto
+
+        Returns:
+            Lista de OddsEvent
+        """
+        await self.initialize()
+        try:
+            return await self.odds_client.get_odds(
+                sport_key, regions=regions, markets=markets, priority=priority
+            )
+        except QuotaExceededError as e:
+            logger.warning(f"{str(e)}; usando cuotas guardadas")
+            return await self.repository.get_events(sport_key)
+
+    async def get_stored_odds(
+        self, sport_key: str, fetched_since: Optional[datetime] = None
+    ) -> List[OddsEvent]:
+        """Cuotas guardadas de un deporte (sin llamar a la API)."""
+        await self.initialize()
+        return await self.repository.get_events(sport_key, fetched_since=fetched_since)
+
+    async def refresh_due(
+        self, sport_keys: Optional[List[str]] = None, regions: str = "us", markets: str = "h2h"
+    ) -> Dict[str, List[OddsEvent]]:
+        """
+        Sondeo en segundo plano: refresca los deportes a los que les toca.
+
+        El intervalo de cada deporte sale de OddsBudget (cercanía del
+        partido y densidad de value bets); las consultas van con prioridad
+        LOW, así que se frenan antes de agotar la cuota del mes.
+
+        Args:
+            sport_keys: Deportes a vigilar (se añaden al calendario)
+            regions: Regiones de casas de apuestas
+            markets: Mercados
+
+        Returns:
+            Dict deporte -> eventos obtenidos (guardados si se rechazó la consulta)
+        """
+        budget = self.odds_client.budget
+        for sport_key in sport_keys or []:
+            budget.watch(sport_key)
+
+        refreshed = {}
+        for sport_key in budget.due_sports(cost=request_cost(regions, markets)):
+            try:
+                events = await self.get_odds(sport_key, regions, markets, priority=Priority.LOW)
+                refreshed[sport_key] = events
+            except Exception as e:
+                logger.warning(f"Error refrescando {sport_key}: {str(e)}")
+        return refreshed
+
+    def record_value_bets(self, sport_key: str, event_id: str, count: int):
+        """Registra los value bets de un evento (suben la frecuencia de sondeo)."""
+        self.odds_client.budget.record_value_bets(sport_key, event_id, count)
+
+    async def get_quota_stats(self) -> Dict:
+        """Saldo de créditos de The Odds API y decisiones del presupuesto."""
+        await self.initialize()
+        await self.odds_client.budget.load()
+        return self.odds_client.budget.stats()
+
+    async def get_circuit_stats(self) -> Dict:
+        """Estado del circuit breaker del cliente de cuotas."""
+        breaker = self.odds_client.circuit_breaker
+        stats = breaker.get_state()
+
+        wait_time = 0.0
+        if breaker.is_open() and breaker.last_failure_time:
+            elapsed = (datetime.now() - breaker.last_failure_time).total_seconds()
+            wait_time = max(0.0, breaker.timeout - elapsed)
+        stats["wait_time_remaining"] = round(wait_time, 1)
+        return stats
+
+    async def close(self):
+        """Vacía la cola de escritura y cierra la base de datos."""
+        await self.repository.close()
+        await self.odds_client.close()
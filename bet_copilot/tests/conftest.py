@@ -0,0 +1,120 @@
+"""
+Shared fixtures for the odds tests: The Odds API payloads, a settable
+clock, the SQLite repository and a local stub of the API.
+"""
+
+import random
+from datetime import datetime, timezone
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bet_copilot.api.odds_client import OddsAPIClient
+from bet_copilot.api.transport import HttpTransport
+from bet_copilot.db.odds_repository import OddsRepository
+
+NOW = datetime(2024, 5, 4, 12, 0, tzinfo=timezone.utc)
+ODDS_PATH = "/sports/soccer_epl/odds"
+
+
+def _event_json(seed, n_books=8, home="Arsenal", away="Chelsea"):
+    """The Odds API event with h2h and totals; some books skip markets or outcomes."""
+    rng = random.Random(seed)
+    bookmakers = []
+    for b in range(n_books):
+        h2h = [
+            {"name": home, "price": round(rng.uniform(1.8, 2.4), 2)},
+            {"name": away, "price": round(rng.uniform(3.0, 4.2), 2)},
+        ]
+        if b % 4 != 3:
+            h2h.insert(1, {"name": "Draw", "price": round(rng.uniform(3.2, 3.8), 2)})
+        markets = [{"key": "h2h", "last_update": "2024-05-01T10:00:00Z", "outcomes": h2h}]
+        if b % 2 == 0:
+            markets.append({
+                "key": "totals",
+                "last_update": "2024-05-01T10:00:00Z",
+                "outcomes": [
+                    {"name": "Over", "price": round(rng.uniform(1.8, 2.1), 2), "point": 2.5},
+                    {"name": "Under", "price": round(rng.uniform(1.7, 2.0), 2), "point": 2.5},
+                ],
+            })
+        bookmakers.append({
+            "key": f"book{b}", "title": f"Book {b}",
+            "last_update": "2024-05-01T10:00:00Z", "markets": markets,
+        })
+    return {
+        "id": f"event{seed}", "sport_key": "soccer_epl",
+        "commence_time": "2024-05-04T14:00:00Z",
+        "home_team": home, "away_team": away, "bookmakers": bookmakers,
+    }
+
+
+class Clock:
+    """Settable unix clock."""
+
+    def __init__(self, now=NOW.timestamp()):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def event_json():
+    """Factory of The Odds API event dicts: event_json(seed, n_books, home, away)."""
+    return _event_json
+
+
+@pytest.fixture
+def clock():
+    """Settable clock starting at NOW (2024-05-04 12:00 UTC)."""
+    return Clock()
+
+
+@pytest.fixture
+async def repo(tmp_path):
+    """Initialized OddsRepository on a temporary database."""
+    async with OddsRepository(tmp_path / "odds.db") as repository:
+        yield repository
+
+
+@pytest.fixture
+async def odds_api():
+    """
+    Local The Odds API stub.
+
+    odds_api(routes, **client_kwargs) serves routes ({path: handler}, or a
+    single handler for /sports/soccer_epl/odds) and returns an
+    OddsAPIClient pointed at it with its own HttpTransport. Clients,
+    transports and servers are closed on teardown, also when a test fails.
+    """
+    clients, transports, servers = [], [], []
+
+    async def start(routes, **client_kwargs):
+        if callable(routes):
+            routes = {ODDS_PATH: routes}
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_get(path, handler)
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+
+        transport = HttpTransport()
+        transports.append(transport)
+        client = OddsAPIClient(
+            api_key="test", base_url=str(server.make_url("")), transport=transport, **client_kwargs
+        )
+        clients.append(client)
+        return client
+
+    try:
+        yield start
+    finally:
+        for client in clients:
+            await client.close()
+        for transport in transports:
+            await transport.close()
+        for server in servers:
+            await server.close()
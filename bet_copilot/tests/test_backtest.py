@@ -0,0 +1,226 @@
+"""
+Tests for the historical backtesting engine.
+"""
+
+import csv
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+from bet_copilot.math_engine import backtest
+from bet_copilot.math_engine.backtest import (
+    Backtester,
+    HistoricalFixture,
+    load_fixtures,
+)
+from bet_copilot.math_engine.market_cache import MarketCache
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+
+
+TEAMS = ["Alpha", "Bravo", "Charlie", "Delta"]
+
+
+def write_season(path, rounds=8, seed=0, shuffle=False):
+    """Double round robin of 4 teams in canonical column names."""
+    rows = []
+    start = datetime(2023, 8, 5, 15, 0)
+    for r in range(rounds):
+        a, b, c, d = TEAMS[r % 4:] + TEAMS[:r % 4]
+        for k, (home, away) in enumerate(((a, b), (c, d)) if r % 2 == 0 else ((b, a), (d, c))):
+            goals = (seed + r * 3 + k * 5) % 4, (seed + r + k) % 3
+            rows.append({
+                "date": (start + timedelta(days=7 * r)).isoformat(),
+                "home_team": home,
+                "away_team": away,
+                "home_goals": goals[0],
+                "away_goals": goals[1],
+                "home_xg": 1.0 + 0.3 * goals[0],
+                "away_xg": 0.8 + 0.2 * goals[1],
+                "odds_home": 2.4,
+                "odds_draw": 3.6,
+                "odds_away": 3.1,
+                "closing_home": 2.2,
+                "closing_draw": 3.5,
+                "closing_away": 3.6,
+            })
+    if shuffle:
+        rows = rows[::-1]
+    with path.open("w", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    return path
+
+
+class TestLoadFixtures:
+    """Test CSV streaming."""
+
+    def test_football_data_columns(self, tmp_path):
+        """football-data.co.uk names, dd/mm/yy dates and times are parsed."""
+        path = tmp_path / "E0" / "2324.csv"
+        path.parent.mkdir()
+        path.write_text(
+            "Div,Date,Time,HomeTeam,AwayTeam,FTHG,FTAG,B365H,B365D,B365A,PSCH,PSCD,PSCA,B365>2.5\n"
+            "E0,12/08/23,17:30,Arsenal,Forest,2,1,1.25,6.5,11,1.22,6.8,13,\n"
+            "E0,11/08/23,20:00,Burnley,Man City,0,3,8.5,5.25,1.33,9,5.5,1.3,1.6\n"
+            ",,,,,,,,,,,,,\n"
+        )
+
+        fixtures = list(load_fixtures(path))
+
+        assert [f.home_team for f in fixtures] == ["Burnley", "Arsenal"]
+        assert fixtures[0].kickoff == datetime(2023, 8, 11, 20, 0)
+        assert fixtures[0].league == "E0"
+        assert fixtures[0].season == "2324"
+        assert fixtures[0].home_xg == 0.0 and fixtures[0].away_xg == 3.0
+        assert fixtures[0].odds == {"home_win": 8.5, "draw": 5.25, "away_win": 1.33, "over_2.5": 1.6}
+        assert fixtures[1].closing_odds["away_win"] == 13.0
+        assert "over_2.5" not in fixtures[1].odds
+
+    def test_missing_columns(self, tmp_path):
+        """Files without results are rejected."""
+        path = tmp_path / "bad.csv"
+        path.write_text("Date,HomeTeam,AwayTeam\n01/01/2024,A,B\n")
+        with pytest.raises(ValueError, match="missing columns"):
+            list(load_fixtures(path))
+
+    def test_settlement(self):
+        """Markets settle from the final score."""
+        fixture = HistoricalFixture(datetime(2024, 1, 1), "L", "S", "A", "B", 2, 1, 1.5, 1.0)
+        assert fixture.won("home_win") and fixture.won("over_2.5")
+        assert not fixture.won("draw") and not fixture.won("under_2.5")
+
+
+class TestBacktester:
+    """Test season replay, ledger and metrics."""
+
+    def test_no_lookahead(self, tmp_path):
+        """Changing a later result never changes earlier bets."""
+        backtester = Backtester(min_history=2)
+        base = backtester.run([write_season(tmp_path / "a.csv")]).ledger
+
+        path = tmp_path / "b.csv"
+        write_season(path)
+        rows = list(csv.DictReader(path.open()))
+        rows[-1]["home_goals"], rows[-1]["home_xg"] = "9", "6.0"
+        with path.open("w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        changed = backtester.run([path]).ledger
+
+        last_kickoff = datetime.fromisoformat(rows[-1]["date"])
+        before = [(b.kickoff, b.market, b.model_prob) for b in base if b.kickoff < last_kickoff]
+        assert before
+        assert before == [(b.kickoff, b.market, b.model_prob) for b in changed if b.kickoff < last_kickoff]
+
+    def test_ledger_and_metrics(self, tmp_path):
+        """Bankroll, profit, yield and CLV are consistent with the ledger."""
+        result = Backtester(min_history=2).run([write_season(tmp_path / "s.csv")])
+        ledger = result.ledger
+        metrics = result.metrics
+
+        assert metrics.bets == len(ledger) > 0
+        assert metrics.fixtures == 16
+        assert metrics.profit == pytest.approx(sum(b.profit for b in ledger), abs=0.05)
+        assert metrics.final_bankroll == pytest.approx(ledger[-1].bankroll, abs=0.01)
+        assert metrics.yield_percent == pytest.approx(
+            metrics.profit / metrics.turnover * 100, abs=0.01
+        )
+        assert 0 <= metrics.max_drawdown <= 100
+
+        for bet in ledger:
+            assert bet.profit == pytest.approx(bet.stake * (bet.odds - 1) if bet.won else -bet.stake, abs=0.01)
+            assert bet.model_prob * bet.odds - 1 >= 0.05
+
+        home_bets = [b for b in ledger if b.market == "home_win"]
+        if home_bets:
+            overround = 1 / 2.2 + 1 / 3.5 + 1 / 3.6
+            assert home_bets[0].clv == pytest.approx(2.4 / 2.2 / overround - 1, abs=1e-4)
+
+    def test_same_kickoff_shares_bankroll(self, tmp_path):
+        """Bets at one kickoff are sized from the bankroll before it."""
+        ledger = Backtester(min_history=2).run([write_season(tmp_path / "s.csv")]).ledger
+        previous = {}
+        for bet in ledger:
+            previous.setdefault(bet.kickoff, []).append(bet)
+        bankroll = 1000.0
+        for kickoff in sorted(previous):
+            for bet in previous[kickoff]:
+                assert bet.stake == pytest.approx(bankroll * bet.stake_percent / 100, abs=0.01)
+            bankroll = previous[kickoff][-1].bankroll
+
+    def test_unsorted_file_and_parallel(self, tmp_path):
+        """Unsorted rows are replayed in order; pools match in-process runs."""
+        paths = [
+            write_season(tmp_path / "s1.csv", seed=1),
+            write_season(tmp_path / "s2.csv", seed=2, shuffle=True),
+            write_season(tmp_path / "s3.csv", seed=3),
+        ]
+        backtester = Backtester(min_history=2, predictor=SoccerPredictor(half_life_days=30))
+
+        serial = backtester.run(paths)
+        parallel = backtester.run(paths, workers=2)
+
+        assert [s.season for s in serial.seasons] == ["s1", "s2", "s3"]
+        assert serial.metrics == parallel.metrics
+        assert serial.ledger == parallel.ledger
+
+    def test_parallel_with_cached_predictor(self, tmp_path):
+        """Predictors holding a MarketCache (and its lock) can be sent to workers."""
+        paths = [write_season(tmp_path / f"s{seed}.csv", seed=seed) for seed in (1, 2)]
+        backtester = Backtester(min_history=2, predictor=SoccerPredictor(cache=MarketCache()))
+
+        serial = backtester.run(paths)
+        parallel = backtester.run(paths, workers=2)
+
+        assert serial.ledger == parallel.ledger
+
+    def test_multi_season_file_runs_per_season(self, tmp_path, monkeypatch):
+        """One file with several seasons is split into one pool task per season."""
+        rows = []
+        for seed in (1, 2, 3):
+            with write_season(tmp_path / f"{seed}.csv", seed=seed).open(newline="") as handle:
+                rows += [{**row, "season": f"202{seed}"} for row in csv.DictReader(handle)]
+        path = tmp_path / "all.csv"
+        with path.open("w", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+        tasks = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def map(self, fn, *iterables, **kwargs):
+                iterables = [list(items) for items in iterables]
+                tasks.extend(iterables[0])
+                return super().map(fn, *iterables, **kwargs)
+
+        monkeypatch.setattr(backtest, "ProcessPoolExecutor", RecordingPool)
+        backtester = Backtester(min_history=2)
+        serial = backtester.run([path])
+        parallel = backtester.run([path], workers=2)
+
+        assert [s.season for s in parallel.seasons] == ["2021", "2022", "2023"]
+        assert len(tasks) == 3
+        assert serial.ledger == parallel.ledger
+
+    def test_to_csv(self, tmp_path):
+        """The ledger is written with one row per bet."""
+        result = Backtester(min_history=2).run([write_season(tmp_path / "s.csv")])
+        out = tmp_path / "out" / "ledger.csv"
+        result.to_csv(out)
+
+        rows = list(csv.DictReader(out.open()))
+        assert len(rows) == len(result.ledger)
+        assert rows[0]["market"] == result.ledger[0].market
+
+    def test_invalid_arguments(self):
+        """Unknown markets and bad settings raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown markets"):
+            Backtester(markets=["corners"])
+        with pytest.raises(ValueError):
+            Backtester(initial_bankroll=0)
+        with pytest.raises(ValueError):
+            Backtester().run([], workers=0)
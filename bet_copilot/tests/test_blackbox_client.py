@@ -5,6 +5,7 @@ Tests for BlackboxClient.
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from bet_copilot.ai.blackbox_client import BlackboxClient
+from bet_copilot.api.transport import HttpTransport
 from bet_copilot.ai.types import ContextualAnalysis
 
 
@@ -118,15 +119,18 @@ class TestBlackboxClient:
         assert analysis.sentiment == "NEUTRAL"
     
     @pytest.mark.asyncio
-    async def test_close(self, client):
-        """Test closing client session."""
-        # Create session
-        await client._get_session()
-        assert client.session is not None
+    async def test_close(self):
+        """Test closing client: pooled sessions close with the transport."""
+        transport = HttpTransport()
+        client = BlackboxClient(api_key="test_key", transport=transport)
+        session = await client.transport.session(client.API_URL)
         
-        # Close it
+        # The client does not own the pool
         await client.close()
-        assert client.session.closed is True
+        assert session.closed is False
+        
+        await transport.close()
+        assert session.closed is True
     
     @pytest.mark.asyncio
     async def test_analyze_match_with_mock_response(self, client):
@@ -0,0 +1,178 @@
+"""
+Tests for the streaming calibration evaluator.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from bet_copilot.math_engine.alternative_markets import AlternativeMarketsPredictor
+from bet_copilot.math_engine.calibration import CalibrationEvaluator, MarketCalibration
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+from bet_copilot.models.soccer import MatchResult, TeamForm
+
+
+def random_pairs(n, seed=0):
+    """(prediction, result) dicts in the JSONL layout."""
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(n):
+        home, draw = rng.uniform(0.2, 0.6), rng.uniform(0.15, 0.3)
+        over = rng.uniform(0.3, 0.7)
+        yes = rng.uniform(0.3, 0.7)
+        corners_over = rng.uniform(0.3, 0.7)
+        prediction = {
+            "home_win_prob": home,
+            "draw_prob": draw,
+            "away_win_prob": 1 - home - draw,
+            "over_under_2_5": {"over": over, "under": 1 - over},
+            "btts": {"yes": yes, "no": 1 - yes},
+            "corners": {"9.5": {"over": corners_over, "under": 1 - corners_over}},
+        }
+        result = {"home_goals": rng.randint(0, 3), "away_goals": rng.randint(0, 3), "corners": rng.randint(4, 15)}
+        pairs.append((prediction, result))
+    return pairs
+
+
+def write_jsonl(path, pairs):
+    """One {prediction, result} record per line."""
+    with path.open("w") as handle:
+        for prediction, result in pairs:
+            handle.write(json.dumps({"prediction": prediction, "result": result}) + "\n")
+    return path
+
+
+class TestMarketCalibration:
+    """Scoring rules and reliability bins of one market."""
+
+    def test_matches_direct_formulas(self):
+        """Streaming sums equal log-loss, Brier and RPS computed in one pass."""
+        rng = np.random.default_rng(4)
+        probs = rng.dirichlet([3, 2, 3], size=500)
+        outcomes = rng.integers(0, 3, size=500)
+        actual = np.eye(3)[outcomes]
+
+        scores = MarketCalibration(("home_win", "draw", "away_win"))
+        for p, o in zip(probs[:200], outcomes[:200]):
+            scores.update(p, o)
+        scores.update(probs[200:], outcomes[200:])
+
+        assert scores.count == 500
+        assert scores.log_loss == pytest.approx(-np.mean(np.log(probs[np.arange(500), outcomes])), abs=1e-6)
+        assert scores.brier == pytest.approx(np.mean(((probs - actual) ** 2).sum(axis=1)), abs=1e-6)
+        rps = (np.cumsum(probs - actual, axis=1)[:, :2] ** 2).sum(axis=1) / 2
+        assert scores.rps == pytest.approx(rps.mean(), abs=1e-6)
+
+    def test_reliability_bins(self):
+        """Bins hold the mean forecast and the observed frequency."""
+        scores = MarketCalibration(("under", "over"), bins=4)
+        scores.update([[0.9, 0.1], [0.8, 0.2], [0.4, 0.6]], [0, 1, 1])
+
+        over = scores.reliability("over")
+        assert [(b.lower, b.count) for b in over] == [(0.0, 2), (0.5, 1)]
+        assert over[0].mean_predicted == 0.15 and over[0].observed_frequency == 0.5
+        assert sum(b.count for b in scores.reliability()) == 6
+
+    def test_invalid_input(self):
+        """Bad shapes and outcome indices raise ValueError."""
+        scores = MarketCalibration(("no", "yes"))
+        with pytest.raises(ValueError, match="out of range"):
+            scores.update([0.5, 0.5], 2)
+        with pytest.raises(ValueError, match="Expected"):
+            scores.update([0.2, 0.3, 0.5], 0)
+        with pytest.raises(ValueError, match="Unknown outcome"):
+            scores.reliability("maybe")
+
+
+class TestCalibrationEvaluator:
+    """Per-market evaluation of prediction streams."""
+
+    def test_merge_equals_single_pass(self):
+        """Partial results merge (also through JSON) into the full result."""
+        pairs = random_pairs(300)
+        full = CalibrationEvaluator().consume(pairs)
+
+        left = CalibrationEvaluator().consume(pairs[:120])
+        right = CalibrationEvaluator().consume(pairs[120:])
+        right = CalibrationEvaluator.from_dict(json.loads(json.dumps(right.to_dict())))
+        merged = left.merge(right)
+
+        assert set(merged.markets) == {"1x2", "over_under_2.5", "btts", "corners_9.5"}
+        for market, scores in full.summary().items():
+            assert merged.summary()[market] == pytest.approx(scores)
+        assert np.array_equal(merged.markets["1x2"].bin_count, full.markets["1x2"].bin_count)
+
+    def test_model_objects(self):
+        """MatchPrediction, MatchResult and alternative predictions are scored."""
+        form = TeamForm(team_name="Team")
+        for day in range(6):
+            form.add_match(MatchResult(
+                date=datetime(2024, 1, 1) + timedelta(days=7 * day),
+                home_team="Team", away_team=f"Rival {day}",
+                home_goals=2, away_goals=1, home_xg=1.8, away_xg=0.9, is_home=True,
+                home_corners=6, away_corners=4, home_yellow_cards=2, away_yellow_cards=1,
+            ))
+        prediction = SoccerPredictor().predict(form, form)
+        corners = AlternativeMarketsPredictor().predict_corners(form, form)
+        result = MatchResult(
+            date=datetime(2024, 3, 1), home_team="Team", away_team="Team",
+            home_goals=1, away_goals=1, home_xg=1.0, away_xg=1.0, is_home=True,
+            home_corners=5, away_corners=7, home_yellow_cards=1, home_red_cards=1,
+        )
+
+        evaluator = CalibrationEvaluator()
+        evaluator.add(prediction, result, alternatives=[corners])
+
+        assert evaluator.markets["btts"].count == 1
+        line = corners.over_under_predictions[10.5]
+        assert evaluator.markets["corners_10.5"].log_loss == pytest.approx(
+            -np.log(line["over"] / (line["over"] + line["under"])), abs=1e-6
+        )
+        assert not any(market.startswith("cards") for market in evaluator.markets)
+
+    def test_jsonl_files_and_workers(self, tmp_path):
+        """Files are streamed per process; bad lines are skipped."""
+        paths = [write_jsonl(tmp_path / f"p{k}.jsonl", random_pairs(100, seed=k)) for k in range(3)]
+        with paths[0].open("a") as handle:
+            handle.write("not json\n")
+            handle.write(json.dumps({"prediction": {"btts": {"yes": 0.5}}, "result": {"home_goals": 1, "away_goals": 0}}) + "\n")
+
+        serial = CalibrationEvaluator.from_jsonl(paths)
+        parallel = CalibrationEvaluator.from_jsonl(paths, workers=2)
+
+        assert serial.skipped == parallel.skipped == 2
+        assert serial.markets["1x2"].count == 300
+        assert serial.summary() == parallel.summary()
+
+    def test_invalid_market_records_nothing(self, tmp_path):
+        """A record with one unreadable market adds no score to the others."""
+        pairs = [({"home_win_prob": 0.5, "draw_prob": 0.3, "away_win_prob": 0.2,
+                   "btts": {"yes": 0, "no": 0}}, {"home_goals": 1, "away_goals": 0})]
+        evaluator = CalibrationEvaluator().consume_jsonl(write_jsonl(tmp_path / "bad.jsonl", pairs))
+
+        assert evaluator.skipped == 1
+        assert evaluator.markets == {}
+
+    def test_to_dict_round_trip(self, tmp_path):
+        """JSONL written from MatchPrediction.to_dict() is scored on every market."""
+        prediction = SoccerPredictor().predict_from_lambdas("Home", "Away", 1.6, 1.1)
+        pairs = [(prediction.to_dict(), {"home_goals": 2, "away_goals": 1})]
+        from_json = CalibrationEvaluator().consume_jsonl(write_jsonl(tmp_path / "p.jsonl", pairs))
+        direct = CalibrationEvaluator()
+        direct.add(prediction, {"home_goals": 2, "away_goals": 1})
+
+        assert from_json.skipped == 0
+        assert set(from_json.markets) == {"1x2", "over_under_2.5", "btts"}
+        assert from_json.markets["1x2"].log_loss == pytest.approx(direct.markets["1x2"].log_loss)
+
+    def test_outcome_mismatch(self):
+        """Markets keep their outcomes; bin counts must agree to merge."""
+        evaluator = CalibrationEvaluator()
+        evaluator.update("btts", ("no", "yes"), [0.5, 0.5], 1)
+        with pytest.raises(ValueError, match="do not match"):
+            evaluator.update("btts", ("under", "over"), [0.5, 0.5], 1)
+        with pytest.raises(ValueError, match="bins"):
+            evaluator.merge(CalibrationEvaluator(bins=5))
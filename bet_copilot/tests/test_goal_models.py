@@ -0,0 +1,137 @@
+"""
+Tests for correlated goal models.
+"""
+
+import numpy as np
+import pytest
+
+from bet_copilot.math_engine.goal_models import (
+    BivariatePoisson,
+    DixonColes,
+    IndependentPoisson,
+    get_goal_model,
+)
+from bet_copilot.math_engine.poisson import MatchSimulator, PoissonCalculator
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+
+
+class TestDixonColes:
+    """Test τ-corrected grid."""
+
+    def test_tau_cells(self):
+        """Test only the four low-score cells change."""
+        rho = -0.13
+        independent = IndependentPoisson().grid(1.4, 1.1, 8)
+        corrected = DixonColes(rho=rho).grid(1.4, 1.1, 8)
+
+        assert corrected[0, 0] == pytest.approx(independent[0, 0] * (1 - 1.4 * 1.1 * rho))
+        assert corrected[0, 1] == pytest.approx(independent[0, 1] * (1 + 1.4 * rho))
+        assert corrected[1, 0] == pytest.approx(independent[1, 0] * (1 + 1.1 * rho))
+        assert corrected[1, 1] == pytest.approx(independent[1, 1] * (1 - rho))
+        assert np.array_equal(corrected[2:], independent[2:])
+
+    def test_preserves_mass_and_raises_draws(self):
+        """Test negative ρ moves mass onto low-score draws."""
+        independent = MatchSimulator(model="poisson").scoreline_grid(1.3, 1.0)
+        corrected = MatchSimulator(model="dixon_coles").scoreline_grid(1.3, 1.0)
+
+        assert corrected.total_mass() == pytest.approx(independent.total_mass(), abs=1e-12)
+        assert corrected.match_outcome()["draw"] > independent.match_outcome()["draw"]
+
+    def test_zero_rho_is_independent(self):
+        """Test ρ = 0 reduces to independent Poisson."""
+        assert np.allclose(
+            DixonColes(rho=0.0).grid(1.7, 0.9, 8), IndependentPoisson().grid(1.7, 0.9, 8)
+        )
+
+
+class TestBivariatePoisson:
+    """Test bivariate Poisson grid."""
+
+    def _reference(self, lambda_home, lambda_away, lambda3, max_goals=8):
+        """Direct convolution over the shared component."""
+        lambda1 = lambda_home - lambda3
+        lambda2 = lambda_away - lambda3
+        prob = PoissonCalculator.probability
+        return np.array([
+            [
+                sum(
+                    prob(x - k, lambda1) * prob(y - k, lambda2) * prob(k, lambda3)
+                    for k in range(min(x, y) + 1)
+                )
+                for y in range(max_goals + 1)
+            ]
+            for x in range(max_goals + 1)
+        ])
+
+    def test_matches_direct_sum(self):
+        """Test recurrence against the convolution formula."""
+        grid = BivariatePoisson(lambda3=0.2).grid(1.6, 1.1, 8)
+
+        assert grid == pytest.approx(self._reference(1.6, 1.1, 0.2), abs=1e-15)
+
+    def test_marginals_and_covariance(self):
+        """Test marginal means are kept and covariance equals λ3."""
+        grid = BivariatePoisson(lambda3=0.15).grid(1.5, 1.2, 30)
+        goals = np.arange(31)
+
+        mean_home = (grid.sum(axis=1) * goals).sum()
+        mean_away = (grid.sum(axis=0) * goals).sum()
+        covariance = (grid * np.outer(goals, goals)).sum() - mean_home * mean_away
+
+        assert mean_home == pytest.approx(1.5, abs=1e-9)
+        assert mean_away == pytest.approx(1.2, abs=1e-9)
+        assert covariance == pytest.approx(0.15, abs=1e-9)
+
+    def test_shared_component_clipped(self):
+        """Test λ3 never exceeds the smaller marginal mean."""
+        grid = BivariatePoisson(lambda3=0.5).grid(2.0, 0.2, 20)
+
+        assert np.all(grid >= 0)
+        assert grid.sum() == pytest.approx(1.0, abs=1e-9)
+
+    def test_invalid_lambda3(self):
+        """Test negative covariance is rejected."""
+        with pytest.raises(ValueError):
+            BivariatePoisson(lambda3=-0.1)
+
+
+class TestModelSelection:
+    """Test model plumbing through simulator and predictor."""
+
+    @pytest.mark.parametrize("model", ["poisson", "dixon_coles", "bivariate_poisson"])
+    def test_tensor_matches_single_grids(self, model):
+        """Test batched tensor equals per-match grids."""
+        simulator = MatchSimulator(model=model)
+        lambda_home = [0.4, 1.35, 2.9]
+        lambda_away = [1.1, 0.8, 2.2]
+
+        tensor = simulator.scoreline_tensor(lambda_home, lambda_away)
+
+        for index, (lh, la) in enumerate(zip(lambda_home, lambda_away)):
+            grid = simulator.scoreline_grid(lh, la).probabilities
+            assert tensor[index] == pytest.approx(grid, abs=1e-15)
+
+    def test_predictor_selects_model_by_name(self):
+        """Test SoccerPredictor threads the model to both APIs."""
+        predictor = SoccerPredictor(model="dixon_coles")
+        single = predictor.predict_from_lambdas("Home", "Away", 1.2, 0.9)
+        batch = predictor.predict_many([1.2], [0.9])
+
+        assert isinstance(predictor.simulator.model, DixonColes)
+        assert single.draw_prob == pytest.approx(batch.draw[0], abs=1e-4)
+        assert single.draw_prob > SoccerPredictor().predict_from_lambdas(
+            "Home", "Away", 1.2, 0.9
+        ).draw_prob
+
+    def test_grid_key_includes_model(self):
+        """Test cache keys differ between models."""
+        assert MatchSimulator(model="poisson").grid_key == 8
+        assert MatchSimulator(model="dixon_coles").grid_key == (("dixon_coles", -0.13), 8)
+
+    def test_unknown_model(self):
+        """Test invalid model names and backend combinations."""
+        with pytest.raises(ValueError):
+            get_goal_model("negative_binomial")
+        with pytest.raises(ValueError):
+            MatchSimulator(backend="table", model="bivariate_poisson")
@@ -2,8 +2,18 @@
 Tests for Kelly Criterion calculator.
 """
 
+import logging
+from dataclasses import replace
+
+import numpy as np
 import pytest
-from bet_copilot.math_engine.kelly import KellyCriterion, KellyRecommendation
+from bet_copilot.math_engine.kelly import (
+    BetOpportunity,
+    KellyBatch,
+    KellyCriterion,
+    KellyRecommendation,
+    _project_capped_simplex,
+)
 
 
 class TestKellyCriterion:
@@ -152,3 +162,198 @@ class TestKellyCriterion:
         assert rec.recommended_stake > 0
         assert isinstance(rec.is_value_bet, bool)
         assert rec.risk_level in ["LOW", "MEDIUM", "HIGH"]
+
+
+class TestKellyBatch:
+    """Test vectorized Kelly calculations."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.kelly = KellyCriterion(
+            kelly_fraction=0.25, max_stake=5.0, min_ev=0.05
+        )
+
+    def test_matches_scalar_path(self):
+        """Test every row equals calculate()."""
+        rng = np.random.default_rng(3)
+        probs = rng.uniform(-0.05, 1.05, 500)
+        odds = rng.uniform(0.9, 8.0, 500)
+
+        batch = self.kelly.calculate_batch(probs, odds)
+
+        assert isinstance(batch, KellyBatch)
+        assert len(batch) == 500
+        for index in range(500):
+            expected = self.kelly.calculate(probs[index], odds[index])
+            result = batch.to_recommendation(index)
+            assert result.ev == pytest.approx(expected.ev)
+            assert result.full_kelly == pytest.approx(expected.full_kelly)
+            assert result.recommended_stake == pytest.approx(expected.recommended_stake)
+            assert result.is_value_bet == expected.is_value_bet
+            assert result.risk_level == expected.risk_level
+
+    def test_broadcast_one_probability_across_bookmakers(self):
+        """Test scalar probability against an odds vector."""
+        batch = self.kelly.calculate_batch(0.55, [1.70, 1.95, 2.10])
+
+        assert batch.model_prob.tolist() == [0.55, 0.55, 0.55]
+        assert batch.is_value_bet.tolist() == [False, True, True]
+        assert batch.risk_levels == ["LOW", "MEDIUM", "HIGH"]
+
+    def test_options(self):
+        """Test fraction and cap switches."""
+        batch = self.kelly.calculate_batch(
+            [0.6], [2.0], apply_fraction=False, apply_max_stake=False
+        )
+
+        assert batch.recommended_stake[0] == pytest.approx(20.0)
+        assert batch.diagnostics["capped"] == 0
+
+    def test_single_summary_log(self, caplog):
+        """Test diagnostics are aggregated into one log record."""
+        with caplog.at_level(logging.DEBUG, logger="bet_copilot.math_engine.kelly"):
+            batch = self.kelly.calculate_batch([0.0, 1.0, 0.6, 0.9, 0.6], [2.0, 2.0, 1.0, 20.0, 2.0])
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].levelno == logging.WARNING
+        assert batch.diagnostics["invalid_probability"] == 2
+        assert batch.diagnostics["invalid_odds"] == 1
+        assert batch.diagnostics["capped"] == 1
+
+    def test_non_finite_inputs_are_invalid(self):
+        """Test NaN/inf cells (missing prices in OddsMatrix) get no stake."""
+        batch = self.kelly.calculate_batch([0.5, 0.5, np.nan, 0.5], [np.nan, 2.5, 2.5, np.inf])
+        expected = self.kelly.calculate(0.5, 2.5)
+
+        assert batch.recommended_stake.tolist() == [0.0, pytest.approx(expected.recommended_stake), 0.0, 0.0]
+        assert batch.is_value_bet.tolist() == [False, True, False, False]
+        assert batch.risk_levels[0] == batch.risk_levels[2] == batch.risk_levels[3] == "LOW"
+        assert batch.diagnostics["invalid_probability"] == 1
+        assert batch.diagnostics["invalid_odds"] == 2
+
+
+class TestPortfolioOptimizer:
+    """Test simultaneous Kelly sizing."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.kelly = KellyCriterion(kelly_fraction=0.25, max_stake=5.0, min_ev=0.05)
+
+    def _random_slate(self, n_matches, seed=0):
+        """1X2 opportunities with noisy bookmaker odds."""
+        rng = np.random.default_rng(seed)
+        opportunities = []
+        for match in range(n_matches):
+            probs = rng.dirichlet([4, 3, 3])
+            for selection, prob in zip(("home_win", "draw", "away_win"), probs):
+                odds = 1 / prob * rng.uniform(0.85, 1.15)
+                opportunities.append(BetOpportunity(f"m{match}", selection, float(prob), float(odds)))
+        return opportunities
+
+    def test_single_bet_is_classic_kelly(self):
+        """Test one uncapped bet reproduces f* = (pb - q) / b."""
+        kelly = KellyCriterion(max_stake=100.0)
+        allocation = kelly.optimize_portfolio(
+            [BetOpportunity("m1", "home_win", 0.55, 2.1)],
+            max_total_exposure=100.0,
+            apply_fraction=False,
+        )
+
+        assert allocation.exact
+        assert allocation.stakes[0] == pytest.approx((0.55 * 1.1 - 0.45) / 1.1 * 100, abs=1e-3)
+
+    def test_exclusive_outcomes_match_brute_force(self):
+        """Test two outcomes of one match against a grid search."""
+        kelly = KellyCriterion(max_stake=100.0)
+        allocation = kelly.optimize_portfolio(
+            [
+                BetOpportunity("m1", "home_win", 0.50, 2.3),
+                BetOpportunity("m1", "draw", 0.30, 3.6),
+            ],
+            max_total_exposure=100.0,
+            apply_fraction=False,
+        )
+
+        grid = np.linspace(0, 0.45, 451)
+        home, draw = np.meshgrid(grid, grid, indexing="ij")
+        growth = (
+            0.50 * np.log(1 + 1.3 * home - draw)
+            + 0.30 * np.log(1 - home + 2.6 * draw)
+            + 0.20 * np.log(1 - home - draw)
+        )
+        best = np.unravel_index(np.argmax(growth), growth.shape)
+
+        assert allocation.stakes[0] / 100 == pytest.approx(grid[best[0]], abs=2e-3)
+        assert allocation.stakes[1] / 100 == pytest.approx(grid[best[1]], abs=2e-3)
+        assert allocation.expected_growth == pytest.approx(growth.max(), abs=1e-6)
+
+    def test_caps_respected(self):
+        """Test per-bet and total exposure caps on a large slate."""
+        opportunities = self._random_slate(34)[:100]
+        independent = self.kelly.calculate_batch(
+            [o.model_prob for o in opportunities], [o.odds for o in opportunities]
+        )
+
+        allocation = self.kelly.optimize_portfolio(opportunities, max_total_exposure=20.0)
+
+        assert not allocation.exact
+        assert allocation.converged
+        assert independent.recommended_stake.sum() > 20.0
+        assert allocation.total_exposure <= 20.0 + 1e-9
+        assert allocation.stakes.max() <= 5.0 + 1e-9
+        assert allocation.stakes.min() >= 0.0
+        assert allocation.expected_growth > 0
+
+    def test_sampling_reproducible(self):
+        """Test seeded scenarios give identical allocations."""
+        opportunities = self._random_slate(20, seed=4)
+
+        first = self.kelly.optimize_portfolio(opportunities, n_scenarios=512, seed=1)
+        second = self.kelly.optimize_portfolio(opportunities, n_scenarios=512, seed=1)
+
+        assert np.array_equal(first.stakes, second.stakes)
+
+    def test_positions(self):
+        """Test positions list only staked bets, largest first."""
+        allocation = self.kelly.optimize_portfolio(self._random_slate(5, seed=2))
+        stakes = [stake for _, stake in allocation.positions()]
+
+        assert all(stake > 0 for stake in stakes)
+        assert stakes == sorted(stakes, reverse=True)
+
+    def test_projection(self):
+        """Test capped-simplex projection keeps order and budget."""
+        projected = _project_capped_simplex(
+            np.array([0.5, 0.2, -0.1, 0.05]), np.full(4, 0.3), 0.4
+        )
+
+        assert projected.sum() == pytest.approx(0.4)
+        assert projected.tolist() == pytest.approx([0.3, 0.1, 0.0, 0.0])
+
+    def test_markets_of_one_match(self):
+        """1X2 and totals selections of one match are separate exclusive groups."""
+        home = BetOpportunity("m1", "home_win", 0.55, 2.1)
+        over = BetOpportunity("m1", "over", 0.60, 1.9, market="totals_2.5")
+        mixed = self.kelly.optimize_portfolio([home, over])
+        separate = self.kelly.optimize_portfolio([home, replace(over, match_id="m2")])
+
+        assert mixed.exact
+        np.testing.assert_allclose(mixed.stakes, separate.stakes)
+        assert mixed.expected_growth == pytest.approx(separate.expected_growth)
+
+    def test_invalid_portfolios(self):
+        """Test validation errors."""
+        with pytest.raises(ValueError):
+            self.kelly.optimize_portfolio([])
+        with pytest.raises(ValueError):
+            self.kelly.optimize_portfolio([
+                BetOpportunity("m1", "home_win", 0.7, 2.0),
+                BetOpportunity("m1", "away_win", 0.5, 3.0),
+            ])
+        with pytest.raises(ValueError):
+            self.kelly.optimize_portfolio([
+                BetOpportunity("m1", "home_win", 0.5, 2.2),
+                BetOpportunity("m1", "home_win", 0.6, 2.1),
+            ])
+        with pytest.raises(ValueError):
+            self.kelly.optimize_portfolio([BetOpportunity("m1", "home_win", 0.5, 1.0)])
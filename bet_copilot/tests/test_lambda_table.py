@@ -0,0 +1,120 @@
+"""
+Tests for precomputed lambda lookup table.
+"""
+
+import numpy as np
+import pytest
+
+from bet_copilot.math_engine.lambda_table import LambdaTable, TABLE_MAX_ERROR
+from bet_copilot.math_engine.poisson import MatchSimulator
+
+
+@pytest.fixture(scope="module")
+def table():
+    """Default-resolution table held in memory."""
+    return LambdaTable.build(max_goals=8)
+
+
+class TestLambdaTable:
+    """Test interpolation accuracy and persistence."""
+
+    def test_max_error_against_exact(self, table):
+        """Test documented error bound on random lambda pairs."""
+        simulator = MatchSimulator(max_goals=8)
+        rng = np.random.default_rng(7)
+
+        for lambda_home, lambda_away in rng.uniform(0.05, 5.0, size=(200, 2)):
+            grid = simulator.scoreline_grid(lambda_home, lambda_away)
+            probs = grid.probabilities
+
+            assert table.lookup("home_win", lambda_home, lambda_away) == pytest.approx(
+                np.tril(probs, -1).sum(), abs=TABLE_MAX_ERROR
+            )
+            assert table.lookup("draw", lambda_home, lambda_away) == pytest.approx(
+                np.trace(probs), abs=TABLE_MAX_ERROR
+            )
+            assert table.lookup("btts_yes", lambda_home, lambda_away) == pytest.approx(
+                probs[1:, 1:].sum(), abs=TABLE_MAX_ERROR
+            )
+            assert table.lookup(2.5, lambda_home, lambda_away) == pytest.approx(
+                grid.total_goals_distribution()[3:].sum(), abs=TABLE_MAX_ERROR
+            )
+
+    def test_exact_on_grid_points(self, table):
+        """Test lookups on grid nodes return stored values."""
+        simulator = MatchSimulator(max_goals=8)
+
+        assert table.match_outcome(1.5, 1.2) == simulator.calculate_match_outcome(1.5, 1.2)
+        assert table.both_teams_to_score(2.0, 0.8) == simulator.both_teams_to_score(2.0, 0.8)
+
+    def test_range(self, table):
+        """Test table bounds."""
+        assert table.covers(0.05, 5.0)
+        assert not table.covers(0.01, 1.0)
+        assert not table.covers(1.0, 6.0)
+        assert table.has_line(5.5)
+        assert not table.has_line(6.5)
+
+    def test_save_and_load_memory_mapped(self, tmp_path):
+        """Test table round-trips through a memory-mapped file."""
+        path = tmp_path / "table.npy"
+        built = LambdaTable.build(max_goals=6, lambda_min=0.5, lambda_max=2.0, lambda_step=0.05)
+        built.save(path)
+
+        loaded = LambdaTable.load(path)
+
+        assert isinstance(loaded.values, np.memmap)
+        assert loaded.max_goals == 6
+        assert loaded.lambda_max == pytest.approx(2.0)
+        assert loaded.lookup("draw", 1.23, 0.87) == pytest.approx(
+            built.lookup("draw", 1.23, 0.87)
+        )
+
+    def test_load_or_build_rebuilds_stale_table(self, tmp_path):
+        """Test a table with a different max_goals is rebuilt."""
+        path = tmp_path / "table.npy"
+        LambdaTable.build(max_goals=6, lambda_min=0.5, lambda_max=1.0, lambda_step=0.1).save(path)
+
+        table = LambdaTable.load_or_build(
+            path, max_goals=8, lambda_min=0.5, lambda_max=1.0, lambda_step=0.1
+        )
+
+        assert table.max_goals == 8
+        assert LambdaTable.load(path).max_goals == 8
+
+
+class TestTableBackend:
+    """Test MatchSimulator "table" backend."""
+
+    def test_backend_matches_exact(self, table):
+        """Test table backend agrees with the exact path."""
+        exact = MatchSimulator(max_goals=8)
+        fast = MatchSimulator(max_goals=8, backend="table", table=table)
+
+        for lambda_home, lambda_away in [(1.37, 0.92), (2.815, 1.104), (0.3, 3.3)]:
+            for key, value in exact.calculate_match_outcome(lambda_home, lambda_away).items():
+                assert fast.calculate_match_outcome(lambda_home, lambda_away)[key] == pytest.approx(
+                    value, abs=2e-4
+                )
+            assert fast.over_under_probability(lambda_home, lambda_away, 3.5)["over"] == pytest.approx(
+                exact.over_under_probability(lambda_home, lambda_away, 3.5)["over"], abs=2e-4
+            )
+
+    def test_fallback_outside_table(self, table):
+        """Test out-of-range lambdas and lines use the exact path."""
+        exact = MatchSimulator(max_goals=8)
+        fast = MatchSimulator(max_goals=8, backend="table", table=table)
+
+        assert fast.calculate_match_outcome(6.0, 0.5) == exact.calculate_match_outcome(6.0, 0.5)
+        assert fast.over_under_probability(1.5, 1.2, 6.5) == exact.over_under_probability(1.5, 1.2, 6.5)
+
+    def test_invalid_backend(self, table):
+        """Test invalid backend configuration."""
+        with pytest.raises(ValueError):
+            MatchSimulator(backend="gpu")
+        with pytest.raises(ValueError):
+            MatchSimulator(max_goals=10, backend="table", table=table)
+
+    def test_exact_backend_has_no_table(self):
+        """Test exact backend never loads a table."""
+        assert MatchSimulator().table is None
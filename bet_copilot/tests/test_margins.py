@@ -0,0 +1,161 @@
+"""
+Tests for bookmaker margin removal.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from bet_copilot.math_engine.margins import (
+    METHODS,
+    apply_margin,
+    no_vig_consensus,
+    overround,
+    remove_margin,
+)
+from bet_copilot.models.odds import Bookmaker, Market, OddsEvent
+from bet_copilot.services.match_analyzer import MatchAnalyzer
+
+
+def shin_odds(probabilities, z):
+    """Shin's model forward: prices quoted for true probabilities and insider share z."""
+    p = np.asarray(probabilities)
+    root = np.sqrt(z * p + (1 - z) * p ** 2)
+    return 1.0 / (root * root.sum())
+
+
+@pytest.fixture
+def odds():
+    """(events, books, outcomes) prices with a missing draw price and a missing book."""
+    return np.array([
+        [[1.50, 4.20, 7.00], [1.55, 4.00, 6.50], [1.45, np.nan, 7.50]],
+        [[3.10, 3.30, 2.40], [3.00, 3.40, 2.45], [np.nan, np.nan, np.nan]],
+    ])
+
+
+class TestRemoveMargin:
+    """Fair probabilities per book."""
+
+    @pytest.mark.parametrize("method", METHODS)
+    def test_rows_sum_to_one(self, odds, method):
+        """Complete books give probabilities; incomplete ones NaN."""
+        fair = remove_margin(odds, method)
+
+        assert fair.shape == odds.shape
+        complete = ~np.isnan(odds).any(axis=-1)
+        np.testing.assert_allclose(fair[complete].sum(axis=-1), 1.0)
+        assert np.isnan(fair[~complete]).all()
+
+    def test_closed_forms(self):
+        """Multiplicative and additive match their formulas; power is π^k."""
+        odds = np.array([1.80, 3.75, 4.50])
+        implied = 1 / odds
+
+        np.testing.assert_allclose(remove_margin(odds, "multiplicative"), implied / implied.sum())
+        np.testing.assert_allclose(
+            remove_margin(odds, "additive"), implied - (implied.sum() - 1) / 3
+        )
+        power = remove_margin(odds, "power")
+        exponents = np.log(power) / np.log(implied)
+        np.testing.assert_allclose(exponents, exponents[0])
+        assert exponents[0] > 1
+
+    @pytest.mark.parametrize("z", [0.01, 0.03, 0.08])
+    def test_shin_recovers_true_probabilities(self, z):
+        """Prices built with Shin's model are inverted exactly."""
+        truth = np.array([0.62, 0.24, 0.14])
+        fair = remove_margin(shin_odds(truth, z), "shin")
+        np.testing.assert_allclose(fair, truth, atol=1e-9)
+
+    def test_favourite_longshot_ordering(self):
+        """Power and Shin move probability from the longshot to the favourite."""
+        odds = np.array([1.20, 6.50, 15.0])
+        favourite = {method: remove_margin(odds, method)[0] for method in METHODS}
+        assert favourite["multiplicative"] < favourite["shin"]
+        assert favourite["multiplicative"] < favourite["power"]
+
+    def test_invalid_arguments(self):
+        """Unknown methods and single-outcome markets raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown margin method"):
+            remove_margin([2.0, 2.0], "logit")
+        with pytest.raises(ValueError, match="two outcomes"):
+            remove_margin([[2.0]])
+
+
+class TestApplyMargin:
+    """Bookmaker-style odds from fair probabilities."""
+
+    @pytest.mark.parametrize("method", ["multiplicative", "additive", "power"])
+    def test_round_trip(self, method):
+        """The requested overround is built in and removed again."""
+        truth = np.array([[0.5, 0.3, 0.2], [0.7, 0.2, 0.1]])
+        odds = apply_margin(truth, 0.06, method)
+
+        np.testing.assert_allclose(overround(odds), 0.06, atol=1e-9)
+        np.testing.assert_allclose(remove_margin(odds, method), truth, atol=1e-9)
+
+    def test_invalid_arguments(self):
+        """Shin has no closed inverse here; probabilities must be positive."""
+        with pytest.raises(ValueError, match="Cannot apply"):
+            apply_margin([0.5, 0.5], 0.05, "shin")
+        with pytest.raises(ValueError):
+            apply_margin([1.0, 0.0], 0.05)
+
+
+class TestNoVigConsensus:
+    """Consensus and best-price EV over many events."""
+
+    def test_vectorized_over_events(self, odds):
+        """Batch results equal per-event results."""
+        consensus = no_vig_consensus(odds, "power")
+
+        for e in range(odds.shape[0]):
+            single = no_vig_consensus(odds[e], "power")
+            np.testing.assert_allclose(consensus.probabilities[e], single.probabilities)
+            np.testing.assert_allclose(consensus.ev[e], single.ev)
+
+        assert consensus.books.tolist() == [2, 2]
+        np.testing.assert_allclose(consensus.probabilities.sum(axis=-1), 1.0)
+
+    def test_best_prices_and_ev(self, odds):
+        """Best odds ignore missing prices; EV is consensus × best - 1."""
+        consensus = no_vig_consensus(odds, "multiplicative")
+
+        assert consensus.best_odds[0].tolist() == [1.55, 4.20, 7.50]
+        assert consensus.best_book[0].tolist() == [1, 0, 2]
+        np.testing.assert_allclose(consensus.ev, consensus.probabilities * consensus.best_odds - 1)
+        np.testing.assert_allclose(consensus.margin[1], (overround(odds[1, 0]) + overround(odds[1, 1])) / 2)
+
+    def test_event_without_complete_books(self):
+        """No complete book gives NaN consensus but still a best price."""
+        consensus = no_vig_consensus([[[2.0, np.nan, 3.0]]])
+        assert consensus.books.tolist() == [0]
+        assert np.isnan(consensus.probabilities).all()
+        assert consensus.best_odds[0, 0] == 2.0
+
+
+class TestMatchAnalyzerConsensus:
+    """h2h price matrix built from an OddsEvent."""
+
+    def test_h2h_consensus(self):
+        """Every bookmaker's h2h market becomes one matrix row."""
+        now = datetime(2024, 5, 1)
+
+        def book(key, home, draw, away):
+            market = Market(key="h2h", outcomes={"Arsenal": home, "Draw": draw, "Chelsea": away}, last_update=now)
+            return Bookmaker(key=key, title=key.title(), markets=[market], last_update=now)
+
+        event = OddsEvent(
+            id="1", sport_key="soccer_epl", home_team="Arsenal", away_team="Chelsea",
+            commence_time=now, bookmakers=[book("a", 2.0, 3.5, 3.8), book("b", 2.1, 3.4, 3.6)],
+        )
+
+        consensus = MatchAnalyzer._h2h_consensus(event)
+
+        assert consensus.best_odds[0].tolist() == [2.1, 3.5, 3.8]
+        np.testing.assert_allclose(
+            consensus.probabilities[0],
+            no_vig_consensus([[[2.0, 3.5, 3.8], [2.1, 3.4, 3.6]]]).probabilities[0],
+        )
+        assert MatchAnalyzer._h2h_consensus(OddsEvent("2", "soccer_epl", "A", "B", now, [])) is None
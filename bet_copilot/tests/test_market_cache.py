@@ -0,0 +1,167 @@
+"""
+Tests for quantized-lambda market cache.
+"""
+
+import pickle
+import threading
+
+import pytest
+
+from bet_copilot.math_engine.market_cache import MarketCache, MarketVector
+from bet_copilot.math_engine.poisson import MatchSimulator
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+
+
+def _vector(lambda_home, lambda_away):
+    return MarketVector.from_grid(MatchSimulator().scoreline_grid(lambda_home, lambda_away))
+
+
+class TestMarketCache:
+    """Test cache bookkeeping."""
+
+    def test_hits_and_misses(self):
+        """Test counters on repeated lookups."""
+        cache = MarketCache(max_size=4)
+        calls = []
+
+        def compute(lh, la):
+            calls.append((lh, la))
+            return _vector(lh, la)
+
+        first = cache.get_or_compute(1.5, 1.2, 8, compute)
+        second = cache.get_or_compute(1.5, 1.2, 8, compute)
+
+        assert first is second
+        assert calls == [(1.5, 1.2)]
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.stats()["hit_rate"] == pytest.approx(0.5)
+
+    def test_quantized_key(self):
+        """Test lambdas within the resolution share an entry."""
+        cache = MarketCache(decimals=2)
+
+        assert cache.make_key(1.499, 1.2001, 8) == (1.5, 1.2, 8)
+        assert cache.make_key(1.5, 1.2, 8) != cache.make_key(1.5, 1.2, 10)
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted."""
+        cache = MarketCache(max_size=2, eviction="lru")
+        cache.get_or_compute(1.0, 1.0, 8, _vector)
+        cache.get_or_compute(2.0, 1.0, 8, _vector)
+        cache.get_or_compute(1.0, 1.0, 8, _vector)  # refresh 1.0
+        cache.get_or_compute(3.0, 1.0, 8, _vector)
+
+        assert (1.0, 1.0, 8) in cache
+        assert (2.0, 1.0, 8) not in cache
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_fifo_eviction(self):
+        """Test oldest inserted entry is evicted regardless of hits."""
+        cache = MarketCache(max_size=2, eviction="fifo")
+        cache.get_or_compute(1.0, 1.0, 8, _vector)
+        cache.get_or_compute(2.0, 1.0, 8, _vector)
+        cache.get_or_compute(1.0, 1.0, 8, _vector)
+        cache.get_or_compute(3.0, 1.0, 8, _vector)
+
+        assert (1.0, 1.0, 8) not in cache
+        assert (2.0, 1.0, 8) in cache
+
+    def test_invalid_config(self):
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            MarketCache(max_size=0)
+        with pytest.raises(ValueError):
+            MarketCache(eviction="random")
+
+    def test_clear(self):
+        """Test clear resets entries and counters."""
+        cache = MarketCache()
+        cache.get_or_compute(1.0, 1.0, 8, _vector)
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats()["misses"] == 0
+
+    def test_pickle_keeps_settings_only(self):
+        """Test pickled caches (process pools) start empty with a new lock."""
+        cache = MarketCache(max_size=3, decimals=1, eviction="fifo")
+        cache.get_or_compute(1.5, 1.2, 10, _vector)
+
+        restored = pickle.loads(pickle.dumps(cache))
+
+        assert (restored.max_size, restored.decimals, restored.eviction) == (3, 1, "fifo")
+        assert len(restored) == 0 and restored.stats()["misses"] == 0
+        restored.get_or_compute(1.5, 1.2, 10, _vector)
+        assert len(restored) == 1
+
+    def test_thread_safety(self):
+        """Test concurrent access keeps counters consistent."""
+        cache = MarketCache(max_size=8)
+        lambdas = [0.5, 1.0, 1.5, 2.0]
+
+        def worker():
+            for _ in range(50):
+                for lh in lambdas:
+                    cache.get_or_compute(lh, 1.0, 8, _vector)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.hits + cache.misses == 4 * 50 * len(lambdas)
+        assert len(cache) == len(lambdas)
+
+
+class TestPredictorWithCache:
+    """Test SoccerPredictor integration."""
+
+    def test_cached_prediction_matches_uncached(self):
+        """Test cached predictions are identical and skip the grid."""
+        cache = MarketCache()
+        cached = SoccerPredictor(cache=cache)
+        plain = SoccerPredictor()
+
+        first = cached.predict_from_lambdas("H", "A", 1.5, 1.2)
+        second = cached.predict_from_lambdas("H", "A", 1.5, 1.2)
+        reference = plain.predict_from_lambdas("H", "A", 1.5, 1.2)
+
+        assert cache.hits == 1
+        assert second.to_dict()["probabilities"] == reference.to_dict()["probabilities"]
+        assert second.over_under_2_5 == reference.over_under_2_5
+        assert second.scoreline_grid is first.scoreline_grid
+
+    def test_prediction_dicts_are_copies(self):
+        """Test mutating a prediction does not corrupt the cache."""
+        predictor = SoccerPredictor(cache=MarketCache())
+
+        first = predictor.predict_from_lambdas("H", "A", 1.5, 1.2)
+        first.btts["yes"] = 0.0
+        second = predictor.predict_from_lambdas("H", "A", 1.5, 1.2)
+
+        assert second.btts["yes"] > 0
+
+    def test_shared_grid_is_read_only(self):
+        """Test the grid shared by cache hits cannot be mutated in place."""
+        predictor = SoccerPredictor(cache=MarketCache())
+
+        first = predictor.predict_from_lambdas("H", "A", 1.5, 1.2)
+        grid = first.scoreline_grid
+        for array in (grid.probabilities, grid.total_goals_distribution(), grid.goal_difference_distribution()):
+            with pytest.raises(ValueError):
+                array[0] = 0.9
+
+        second = predictor.predict_from_lambdas("H", "A", 1.5, 1.2)
+        assert second.scoreline_grid.probabilities[0, 0] < 0.9
+        assert second.totals_ladder == first.totals_ladder
+
+    def test_lambdas_are_quantized(self):
+        """Test reported lambdas match the cached pair."""
+        predictor = SoccerPredictor(cache=MarketCache())
+        prediction = predictor.predict_from_lambdas("H", "A", 1.4999, 1.2012)
+
+        assert prediction.home_lambda == 1.5
+        assert prediction.away_lambda == 1.2
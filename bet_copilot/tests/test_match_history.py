@@ -0,0 +1,171 @@
+"""
+Tests for the columnar MatchHistory store.
+"""
+
+import random
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from bet_copilot.models.match_history import MISSING, MatchHistory
+from bet_copilot.models.soccer import MatchResult, TeamForm
+from bet_copilot.tests.test_team_form import make_match, reference_averages
+
+
+@pytest.fixture
+def matches():
+    """200 random matches of "Team", added out of date order."""
+    rng = random.Random(11)
+    return [make_match(rng, rng.randint(0, 60), rng.random() < 0.5) for _ in range(200)]
+
+
+class TestMatchHistory:
+    """Test suite for MatchHistory."""
+
+    def test_round_trip(self, matches):
+        """Rows materialize back into equal MatchResult objects."""
+        history = MatchHistory.from_matches(matches)
+
+        assert len(history) == len(matches)
+        assert [history[i] for i in range(len(history))] == matches
+        assert history[-1] == matches[-1]
+        assert history.nbytes < 100 * len(history)
+
+    def test_missing_statistics_use_sentinels(self):
+        """None is stored as MISSING / NaN and read back as None."""
+        match = MatchResult(
+            date=datetime(2024, 5, 1), home_team="A", away_team="B",
+            home_goals=1, away_goals=0, home_xg=1.2, away_xg=0.4, is_home=True,
+            home_corners=7, home_possession=61.5,
+        )
+        history = MatchHistory.from_matches([match])
+
+        assert history.column("away_corners")[0] == MISSING
+        assert np.isnan(history.column("away_possession")[0])
+        assert history[0].away_corners is None
+        assert history[0].home_possession == 61.5
+
+    def test_growth_and_bulk_columns(self):
+        """extend_columns grows past the initial capacity."""
+        history = MatchHistory(capacity=2)
+        n = 37
+        history.extend_columns({
+            "date": np.arange(n).astype("datetime64[D]"),
+            "home_team": ["A" if i % 2 else "B" for i in range(n)],
+            "away_team": ["B" if i % 2 else "A" for i in range(n)],
+            "home_goals": np.full(n, 2),
+            "away_goals": np.ones(n, dtype=int),
+            "home_xg": np.full(n, 1.5),
+            "away_xg": np.full(n, 0.5),
+            "home_corners": [None] * n,
+        })
+
+        assert len(history) == n
+        assert history.teams == ["B", "A"]
+        assert history[n - 1].date == datetime(1970, 2, 6)
+        assert history[0].home_corners is None
+
+    @pytest.mark.parametrize("column, value, message", [
+        ("home_xg", -0.1, "xG"),
+        ("away_goals", -1, "Goals"),
+        ("home_corners", -3, "home_corners"),
+    ])
+    def test_validation_rolls_back(self, column, value, message):
+        """Invalid batches raise ValueError and append nothing."""
+        history = MatchHistory()
+        columns = {
+            "date": [datetime(2024, 1, 1), datetime(2024, 1, 8)],
+            "home_team": ["New A", "New B"],
+            "away_team": ["New B", "New C"],
+            "home_goals": [1, 1], "away_goals": [0, 0],
+            "home_xg": [1.0, 1.0], "away_xg": [1.0, 1.0],
+        }
+        columns[column] = [columns.get(column, [0, 0])[0], value]
+
+        with pytest.raises(ValueError, match=message):
+            history.extend_columns(columns)
+        assert len(history) == 0
+        assert history.teams == []
+
+    def test_missing_and_unknown_columns(self):
+        """Required and unknown columns are checked."""
+        history = MatchHistory()
+        with pytest.raises(ValueError, match="Missing columns"):
+            history.extend_columns({"date": [datetime(2024, 1, 1)]})
+        with pytest.raises(ValueError, match="Unknown column"):
+            history.column("referee")
+        with pytest.raises(ValueError, match="Unknown team"):
+            history.team_view("Nobody")
+
+    def test_timezone_aware_dates(self):
+        """Aware dates round-trip as UTC and cannot be mixed with naive ones."""
+        aware = datetime(2024, 3, 9, 15, 0, tzinfo=timezone.utc)
+        match = MatchResult(
+            date=aware, home_team="A", away_team="B",
+            home_goals=0, away_goals=0, home_xg=0.5, away_xg=0.5, is_home=True,
+        )
+        history = MatchHistory.from_matches([match])
+        assert history[0].date == aware
+
+        naive = MatchResult(
+            date=datetime(2024, 3, 16), home_team="B", away_team="A",
+            home_goals=0, away_goals=0, home_xg=0.5, away_xg=0.5, is_home=True,
+        )
+        with pytest.raises(ValueError, match="naive"):
+            history.append(naive)
+
+    def test_columns_are_read_only(self, matches):
+        """column() views cannot modify the store."""
+        history = MatchHistory.from_matches(matches)
+        with pytest.raises(ValueError):
+            history.column("home_goals")[0] = 9
+
+
+class TestTeamFormFromHistory:
+    """TeamForm read from a MatchHistory view."""
+
+    @pytest.mark.parametrize("venue", [{}, {"home_only": True}, {"away_only": True}])
+    def test_matches_object_form(self, matches, venue):
+        """Averages, recent matches and form string match add_match."""
+        history = MatchHistory.from_matches(matches)
+        from_history = TeamForm.from_history(history, "Team")
+        from_objects = TeamForm(team_name="Team")
+        for match in matches:
+            from_objects.add_match(match)
+
+        assert list(from_history.matches) == from_objects.matches
+        for n in (1, 5, 20, 500):
+            for method in reference_averages(from_objects.matches, n):
+                assert getattr(from_history, method)(n=n, **venue) == getattr(from_objects, method)(n=n, **venue)
+            assert from_history.get_recent_matches(n, **venue) == from_objects.get_recent_matches(n, **venue)
+        assert from_history.get_form_string(10) == from_objects.get_form_string(10)
+
+    def test_league_history_perspective(self):
+        """Each team sees its own matches with is_home from its side."""
+        history = MatchHistory()
+        history.extend_columns({
+            "date": [datetime(2024, 8, 17), datetime(2024, 8, 24), datetime(2024, 8, 31)],
+            "home_team": ["Arsenal", "Chelsea", "Arsenal"],
+            "away_team": ["Chelsea", "Arsenal", "Spurs"],
+            "home_goals": [2, 1, 3], "away_goals": [0, 1, 2],
+            "home_xg": [1.9, 1.2, 2.4], "away_xg": [0.6, 1.4, 1.1],
+        })
+
+        chelsea = TeamForm.from_history(history, "Chelsea")
+        assert [m.is_home for m in chelsea.matches] == [True, False]
+        assert chelsea.average_goals_for() == 0.5
+        assert chelsea.average_xg_against(away_only=True) == 1.9
+        assert TeamForm.from_history(history, "Arsenal").get_form_string() == "WDW"
+
+    def test_add_match_copies_into_list(self, matches):
+        """Adding to a history-backed form copies it into a list."""
+        history = MatchHistory.from_matches(matches[:100])
+        form = TeamForm.from_history(history, "Team")
+        form.add_match(matches[100])
+
+        assert isinstance(form.matches, list)
+        assert len(form.matches) == 101
+        assert len(history) == 100
+        expected = reference_averages(form.matches, 8)["average_shots"]
+        assert form.average_shots(n=8) == expected
@@ -0,0 +1,128 @@
+"""
+Tests for Monte Carlo match simulation.
+"""
+
+import numpy as np
+import pytest
+
+from bet_copilot.math_engine.monte_carlo import (
+    MonteCarloEstimate,
+    MonteCarloSimulator,
+    leg_mask,
+)
+from bet_copilot.math_engine.poisson import MatchSimulator
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+
+
+def _exact(model, lambda_home, lambda_away, predicate):
+    """Exact probability of a per-match predicate from the grid."""
+    grid = MatchSimulator(model=model, tail_epsilon=1e-12).scoreline_grid(
+        lambda_home, lambda_away
+    )
+    home, away = np.indices(grid.probabilities.shape)
+    return grid.probabilities[predicate(home, away)].sum()
+
+
+class TestLegMask:
+    """Test market string parsing."""
+
+    def test_markets(self):
+        """Test every market family on fixed scores."""
+        home = np.array([0, 1, 2, 3])
+        away = np.array([0, 1, 0, 2])
+
+        assert leg_mask("home_win", home, away).tolist() == [False, False, True, True]
+        assert leg_mask("draw", home, away).tolist() == [True, True, False, False]
+        assert leg_mask("btts_yes", home, away).tolist() == [False, True, False, True]
+        assert leg_mask("over_2.5", home, away).tolist() == [False, False, False, True]
+        assert leg_mask("under_1.5", home, away).tolist() == [True, False, False, False]
+        assert leg_mask("home_over_1.5", home, away).tolist() == [False, False, True, True]
+        assert leg_mask("away_under_0.5", home, away).tolist() == [True, False, True, False]
+
+    def test_unknown_market(self):
+        """Test invalid markets are rejected."""
+        with pytest.raises(ValueError):
+            leg_mask("corners_over_9.5", np.zeros(1), np.zeros(1))
+        with pytest.raises(ValueError):
+            leg_mask("over_x", np.zeros(1), np.zeros(1))
+
+
+class TestMonteCarloSimulator:
+    """Test estimates, seeding and parallel execution."""
+
+    @pytest.mark.parametrize("model", ["poisson", "dixon_coles", "bivariate_poisson"])
+    def test_same_game_parlay_matches_grid(self, model):
+        """Test 'home win and over 2.5' against the exact grid sum."""
+        simulator = MonteCarloSimulator(model=model, n_samples=200_000, seed=11)
+        estimate = simulator.estimate([1.6], [1.1], [(0, "home_win"), (0, "over_2.5")])
+        exact = _exact(model, 1.6, 1.1, lambda h, a: (h > a) & (h + a > 2.5))
+
+        assert estimate.n_samples == 200_000
+        assert abs(estimate.probability - exact) < 4 * estimate.standard_error
+
+    def test_accumulator_is_product_of_independent_matches(self):
+        """Test legs on different matches multiply."""
+        simulator = MonteCarloSimulator(n_samples=200_000, seed=5)
+        estimate = simulator.estimate(
+            [1.8, 1.2], [0.9, 1.3], [(0, "home_win"), (1, "btts_yes")]
+        )
+        exact = _exact("poisson", 1.8, 0.9, lambda h, a: h > a) * _exact(
+            "poisson", 1.2, 1.3, lambda h, a: (h > 0) & (a > 0)
+        )
+
+        assert abs(estimate.probability - exact) < 4 * estimate.standard_error
+
+    def test_seed_reproducible(self):
+        """Test the same seed gives the same estimate."""
+        simulator = MonteCarloSimulator(n_samples=30_000, chunk_size=10_000)
+
+        first = simulator.estimate([1.4], [1.0], [(0, "draw")], seed=3)
+        second = simulator.estimate([1.4], [1.0], [(0, "draw")], seed=3)
+
+        assert first == second
+
+    def test_process_pool_matches_in_process(self):
+        """Test chunk seeding makes results independent of worker count."""
+        legs = [(0, "home_win"), (1, "under_2.5")]
+        serial = MonteCarloSimulator(n_samples=40_000, chunk_size=10_000, seed=9)
+        pooled = MonteCarloSimulator(n_samples=40_000, chunk_size=10_000, seed=9, workers=2)
+
+        assert pooled.estimate([1.5, 1.1], [1.2, 1.0], legs) == serial.estimate(
+            [1.5, 1.1], [1.2, 1.0], legs
+        )
+
+    def test_custom_event(self):
+        """Test callable events over all matches."""
+        simulator = MonteCarloSimulator(n_samples=50_000, seed=1)
+        estimate = simulator.estimate(
+            [1.5, 1.5, 1.5], [1.0, 1.0, 1.0], lambda home, away: (home + away).sum(axis=1) > 6.5
+        )
+
+        assert 0.0 < estimate.probability < 1.0
+        lower, upper = estimate.confidence_interval()
+        assert lower < estimate.probability < upper
+
+    def test_invalid_arguments(self):
+        """Test validation errors."""
+        simulator = MonteCarloSimulator()
+
+        with pytest.raises(ValueError):
+            simulator.estimate([1.0], [1.0], [(1, "home_win")])
+        with pytest.raises(ValueError):
+            simulator.estimate([1.0, 2.0], [1.0], [(0, "home_win")])
+        with pytest.raises(ValueError):
+            MonteCarloSimulator(workers=0)
+
+
+class TestPredictorCombos:
+    """Test SoccerPredictor Monte Carlo entry point."""
+
+    def test_price_combo_uses_predictor_model(self):
+        """Test combos are priced with the predictor's goal model."""
+        predictor = SoccerPredictor(model="dixon_coles")
+        estimate = predictor.price_combo([(1.2, 1.0)], [(0, "draw")], n_samples=100_000, seed=2)
+        exact = predictor.predict_from_lambdas("Home", "Away", 1.2, 1.0).draw_prob
+
+        assert isinstance(estimate, MonteCarloEstimate)
+        assert abs(estimate.probability - exact) < 4 * estimate.standard_error + 1e-4
+        assert estimate.fair_odds == pytest.approx(1 / estimate.probability)
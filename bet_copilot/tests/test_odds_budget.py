@@ -0,0 +1,221 @@
+"""
+Tests for The Odds API credit budget and polling scheduler.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from aiohttp import web
+
+from bet_copilot.api.odds_budget import (
+    Admission,
+    OddsBudget,
+    Priority,
+    downgrade,
+    request_cost,
+)
+from bet_copilot.api.odds_client import OddsAPIClient, QuotaExceededError
+from bet_copilot.config import CACHE_TTL_HISTORICAL
+from bet_copilot.services.odds_service import OddsService
+
+# Mid-May: 16 of 31 days left, so a linear spend of 500 credits leaves ~258
+MID_MONTH = datetime(2024, 5, 16, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def mid_month(clock):
+    clock.now = MID_MONTH.timestamp()
+    return clock
+
+
+def budget_with(clock, remaining, reserve=25, **kwargs):
+    budget = OddsBudget(monthly_credits=500, reserve=reserve, clock=clock, **kwargs)
+    budget._remaining = remaining
+    return budget
+
+
+def events_at(event_json, *kickoffs, sport_key="soccer_epl"):
+    client = OddsAPIClient(api_key="test")
+    events = []
+    for seed, kickoff in enumerate(kickoffs):
+        data = event_json(seed)
+        data["sport_key"] = sport_key
+        data["commence_time"] = kickoff.isoformat().replace("+00:00", "Z")
+        events.append(client._parse_event(data))
+    return events
+
+
+class TestAdmission:
+    """Costs, pacing and the reserve."""
+
+    def test_cost_and_downgrade(self):
+        """Credits are regions × markets; downgrades keep h2h."""
+        assert request_cost("us", "h2h") == 1
+        assert request_cost("us,uk,eu", "h2h,totals") == 6
+        assert downgrade("uk,us", "totals,h2h") == ("uk", "h2h")
+        assert downgrade("us", "totals") == ("us", "totals")
+
+    def test_priorities_follow_pace(self, mid_month):
+        """Background polls are downgraded, then refused, as the balance falls behind."""
+        ahead, behind, short = (budget_with(mid_month, remaining) for remaining in (300, 200, 100))
+        assert ahead.pace() == pytest.approx(300 / (500 * 16 / 31))
+
+        assert ahead.admit(4, Priority.LOW) is Admission.ALLOW
+        assert behind.admit(4, Priority.LOW) is Admission.DOWNGRADE
+        assert behind.admit(4, Priority.NORMAL) is Admission.ALLOW
+        assert short.admit(4, Priority.LOW) is Admission.REFUSE
+        assert short.admit(4, Priority.NORMAL) is Admission.DOWNGRADE
+        assert short.admit(1, Priority.NORMAL) is Admission.ALLOW
+        assert short.admit(4, Priority.HIGH) is Admission.ALLOW
+        assert short.stats()["refuse"] == 1
+
+    def test_reserve(self, mid_month):
+        """Only high-priority requests spend the last credits."""
+        assert budget_with(mid_month, 26).admit(3, Priority.NORMAL) is Admission.DOWNGRADE
+        assert budget_with(mid_month, 25).admit(3, Priority.NORMAL) is Admission.REFUSE
+        assert budget_with(mid_month, 25).admit(3, Priority.HIGH) is Admission.ALLOW
+        assert budget_with(mid_month, 2).admit(3, Priority.HIGH) is Admission.DOWNGRADE
+        assert budget_with(mid_month, 0).admit(1, Priority.HIGH) is Admission.REFUSE
+        with pytest.raises(ValueError):
+            OddsBudget(monthly_credits=10, reserve=10)
+
+    async def test_headers_rollover_and_persistence(self, repo, mid_month):
+        """The reported balance survives restarts and resets with the month."""
+        budget = OddsBudget(monthly_credits=500, repository=repo, clock=mid_month)
+        await budget.record(2)
+        assert budget.remaining() == 498  # estimated until the API reports it
+        await budget.record(2, remaining="120", used="380")
+        await budget.record(2)
+        assert (budget.remaining(), budget.used) == (118, 382)
+        await repo.flush()
+
+        restarted = OddsBudget(monthly_credits=500, repository=repo, clock=mid_month)
+        await restarted.load()
+        assert restarted.remaining() == 118
+
+        mid_month.now = datetime(2024, 6, 1, 0, 5, tzinfo=timezone.utc).timestamp()
+        assert restarted.remaining() == 500
+        next_month = OddsBudget(monthly_credits=500, repository=repo, clock=mid_month)
+        await next_month.load()
+        assert next_month.remaining() == 500
+
+
+class TestPollingSchedule:
+    """Polling spreads credits by kickoff proximity and value-bet density."""
+
+    def test_intervals(self, mid_month, event_json):
+        """Imminent kickoffs and value bets poll more often; idle sports rarely."""
+        budget = budget_with(mid_month, 300)
+        budget.observe("soccer_epl", events_at(event_json, MID_MONTH + timedelta(hours=2)))
+        budget.observe("soccer_spain_la_liga", events_at(event_json, MID_MONTH + timedelta(days=3), sport_key="x"))
+        budget.observe("basketball_nba", [])
+
+        soon = budget.poll_interval("soccer_epl")
+        later = budget.poll_interval("soccer_spain_la_liga")
+        assert soon < later
+        assert budget.poll_interval("basketball_nba") == CACHE_TTL_HISTORICAL
+
+        budget.record_value_bets("soccer_spain_la_liga", "event0", 2)
+        assert budget.poll_interval("soccer_spain_la_liga") < later
+
+        budget.clock.now += budget.poll_interval("soccer_epl")
+        assert budget.due_sports() == ["soccer_epl"]
+        budget.clock.now += CACHE_TTL_HISTORICAL
+        assert budget.due_sports() == ["soccer_epl", "soccer_spain_la_liga", "basketball_nba"]
+
+        assert budget_with(mid_month, 20).poll_interval("soccer_epl") == CACHE_TTL_HISTORICAL
+
+    def test_next_poll_in(self, mid_month, event_json):
+        """The timer waits for the sport that is due first."""
+        budget = budget_with(mid_month, 300)
+        assert budget.next_poll_in() == CACHE_TTL_HISTORICAL
+        budget.watch("soccer_epl")
+        assert budget.next_poll_in() == 0.0
+
+        budget.observe("soccer_epl", events_at(event_json, MID_MONTH + timedelta(hours=2)))
+        wait = budget.next_poll_in()
+        assert wait == pytest.approx(budget.poll_interval("soccer_epl"))
+        budget.clock.now += wait
+        assert budget.next_poll_in() == 0.0
+
+
+class TestClientBudget:
+    """OddsAPIClient and OddsService apply the budget."""
+
+    async def test_downgrade_refuse_and_fallback(self, repo, odds_api, mid_month, event_json):
+        """A low balance downgrades analyses and refuses polls; cache and stored odds still serve."""
+        requests = []
+
+        async def odds(request):
+            requests.append(dict(request.query))
+            return web.json_response(
+                [event_json(1)],
+                headers={"x-requests-remaining": "100", "x-requests-used": "400"},
+            )
+
+        budget = OddsBudget(monthly_credits=500, repository=repo, clock=mid_month)
+        client = await odds_api(odds, repository=repo, budget=budget)
+        service = OddsService(odds_client=client, repository=repo)
+
+        await client.get_odds("soccer_epl", regions="us,uk", markets="h2h,totals")
+        assert budget.remaining() == 100
+
+        await client.get_odds("soccer_epl", regions="us,uk", markets="h2h,spreads")
+        assert requests[-1]["regions"] == "us" and requests[-1]["markets"] == "h2h"
+
+        cached = await client.get_odds("soccer_epl", priority=Priority.LOW)
+        assert [e.id for e in cached] == ["event1"] and len(requests) == 2
+
+        with pytest.raises(QuotaExceededError):
+            await client.get_odds("soccer_epl", markets="totals", priority=Priority.LOW)
+        assert len(requests) == 2
+
+        await repo.flush()
+        stored = await service.get_odds("soccer_epl", markets="totals", priority=Priority.LOW)
+        assert [e.id for e in stored] == ["event1"] and len(requests) == 2
+        assert repo.db_path.exists() and (await repo.get_quota("the-odds-api"))[0] == 100
+
+    async def test_refusal_does_not_spread_to_coalesced_callers(self, odds_api, mid_month, event_json):
+        """A refused LOW poll overlapping a HIGH request leaves the HIGH one alone."""
+        requests = []
+
+        async def odds(request):
+            requests.append(dict(request.query))
+            await asyncio.sleep(0.05)
+            return web.json_response([event_json(1)])
+
+        client = await odds_api(odds, budget=budget_with(mid_month, 30))
+
+        low, high = await asyncio.gather(
+            client.get_odds("soccer_epl", priority=Priority.LOW),
+            client.get_odds("soccer_epl", priority=Priority.HIGH),
+            return_exceptions=True,
+        )
+        assert isinstance(low, QuotaExceededError)
+        assert [e.id for e in high] == ["event1"] and len(requests) == 1
+
+    async def test_refresh_due(self, repo, odds_api, mid_month, event_json):
+        """Background refreshes poll each watched sport once, then wait for its interval."""
+        requests = []
+
+        async def odds(request):
+            requests.append(request.path)
+            data = event_json(1)
+            data["commence_time"] = (MID_MONTH + timedelta(hours=2)).isoformat().replace("+00:00", "Z")
+            return web.json_response([data])
+
+        budget = budget_with(mid_month, 300)
+        client = await odds_api(
+            {"/sports/{sport}/odds": odds}, repository=repo, budget=budget, use_cache=False
+        )
+        service = OddsService(odds_client=client, repository=repo)
+
+        refreshed = await service.refresh_due(["soccer_epl", "soccer_spain_la_liga"])
+        assert sorted(refreshed) == ["soccer_epl", "soccer_spain_la_liga"]
+        assert [e.id for e in refreshed["soccer_epl"]] == ["event1"]
+        assert await service.refresh_due(["soccer_epl"]) == {}
+        assert len(requests) == 2
+
+        budget.clock.now += budget.next_poll_in()
+        assert len(await service.refresh_due()) == 2 and len(requests) == 4  # same kickoff, same interval
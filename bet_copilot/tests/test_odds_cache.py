@@ -0,0 +1,143 @@
+"""
+Tests for the two-tier odds response cache.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from aiohttp import web
+
+from bet_copilot.api.odds_cache import OddsCache, odds_ttl, static_ttl
+from bet_copilot.config import CACHE_TTL_HISTORICAL, CACHE_TTL_LIVE, CACHE_TTL_MIN
+from bet_copilot.db.odds_repository import OddsRepository
+
+NOW = datetime(2024, 5, 4, 12, 0, tzinfo=timezone.utc)
+
+
+class Counter:
+    """Fetch function returning a new payload on every call."""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("API down")
+        return [{"call": self.calls}]
+
+
+def kickoff_in(**delta):
+    return [{"commence_time": (NOW + timedelta(**delta)).isoformat().replace("+00:00", "Z")}]
+
+
+def fixed_ttl(seconds):
+    return lambda payload, now: seconds
+
+
+class TestTTLPolicy:
+    """TTLs follow the nearest kickoff."""
+
+    def test_shrinks_towards_kickoff(self):
+        """Far kickoffs get the live TTL, imminent or started ones the floor."""
+        now = NOW.timestamp()
+        assert odds_ttl(kickoff_in(days=2), now) == CACHE_TTL_LIVE
+        assert odds_ttl(kickoff_in(minutes=10), now) == pytest.approx(60.0)
+        assert odds_ttl(kickoff_in(minutes=2), now) == CACHE_TTL_MIN
+        assert odds_ttl(kickoff_in(minutes=-30) + kickoff_in(days=1), now) == CACHE_TTL_MIN
+        assert odds_ttl([], now) == CACHE_TTL_LIVE
+        assert odds_ttl({"message": "error"}, now) == CACHE_TTL_LIVE
+        assert static_ttl([], now) == CACHE_TTL_HISTORICAL
+
+
+class TestOddsCache:
+    """Memory tier, stale-while-revalidate and disk tier."""
+
+    async def test_fresh_stale_and_expired(self, clock):
+        """Fresh hits skip the fetch, stale hits refresh in the background."""
+        cache = OddsCache(clock=clock, stale_factor=1.0)
+        fetch = Counter()
+
+        assert await cache.get_or_fetch("k", fetch, fixed_ttl(100)) == [{"call": 1}]
+        clock.now += 50
+        assert await cache.get_or_fetch("k", fetch, fixed_ttl(100)) == [{"call": 1}]
+        assert fetch.calls == 1
+
+        clock.now += 100  # stale: served at once, one refresh started
+        assert await cache.get_or_fetch("k", fetch, fixed_ttl(100)) == [{"call": 1}]
+        assert await cache.get_or_fetch("k", fetch, fixed_ttl(100)) == [{"call": 1}]
+        await cache.wait_for_refreshes()
+        assert fetch.calls == 2
+        assert await cache.get_or_fetch("k", fetch, fixed_ttl(100)) == [{"call": 2}]
+
+        clock.now += 500  # beyond the stale window: fetched inline
+        assert await cache.get_or_fetch("k", fetch, fixed_ttl(100)) == [{"call": 3}]
+        assert cache.stats()["stale_hits"] == 2
+        assert cache.stats()["misses"] == 2
+
+    async def test_failed_refresh_keeps_entry(self, clock):
+        """A failing background refresh leaves the stale payload in place."""
+        cache = OddsCache(clock=clock)
+        await cache.get_or_fetch("k", Counter(), fixed_ttl(10))
+
+        clock.now += 15
+        failing = Counter(fail=True)
+        assert await cache.get_or_fetch("k", failing, fixed_ttl(10)) == [{"call": 1}]
+        await cache.wait_for_refreshes()
+        assert failing.calls == 1
+        assert await cache.get_or_fetch("k", failing, fixed_ttl(10)) == [{"call": 1}]
+
+    async def test_lru_eviction(self):
+        """The least recently used response is dropped first."""
+        cache = OddsCache(max_entries=2)
+        fetch = Counter()
+        for key in ("a", "b", "a", "c"):
+            await cache.get_or_fetch(key, fetch, fixed_ttl(100))
+        await cache.get_or_fetch("b", fetch, fixed_ttl(100))
+        assert fetch.calls == 4  # "b" was evicted, "a" was kept
+        with pytest.raises(ValueError):
+            OddsCache(max_entries=0)
+
+    async def test_disk_tier_survives_restart(self, tmp_path, clock):
+        """A new process (empty memory tier) reads fresh entries from SQLite."""
+        async with OddsRepository(tmp_path / "odds.db") as repo:
+            fetch = Counter()
+            await OddsCache(repository=repo, clock=clock).get_or_fetch("k", fetch, fixed_ttl(100))
+            await repo.flush()
+
+            clock.now += 30
+            restarted = OddsCache(repository=repo, clock=clock)
+            assert await restarted.get_or_fetch("k", fetch, fixed_ttl(100)) == [{"call": 1}]
+            assert fetch.calls == 1
+            assert restarted.stats()["disk_hits"] == 1
+
+
+class TestClientCaching:
+    """OddsAPIClient requests go through the cache."""
+
+    async def test_get_odds_and_sports(self, odds_api, event_json):
+        """Repeated calls with the same parameters hit the API once."""
+        requests = []
+
+        async def odds(request):
+            requests.append(dict(request.query))
+            return web.json_response([event_json(1)])
+
+        async def sports(request):
+            requests.append("sports")
+            return web.json_response([{"key": "soccer_epl"}])
+
+        client = await odds_api({"/sports/soccer_epl/odds": odds, "/sports": sports})
+
+        first = await client.get_odds("soccer_epl")
+        again = await client.get_odds("soccer_epl")
+        await client.get_odds("soccer_epl", markets="totals")
+        await client.get_sports()
+        await client.get_sports()
+
+        assert len(requests) == 3
+        assert [e.id for e in again] == [e.id for e in first]
+        assert again[0] is not first[0]  # every caller gets its own events
+        assert again[0].get_best_odds("h2h", "Draw") == first[0].get_best_odds("h2h", "Draw")
+        assert "apiKey=test" not in " ".join(client.cache._entries)
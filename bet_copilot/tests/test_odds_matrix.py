@@ -0,0 +1,89 @@
+"""
+Tests for dense per-market odds matrices.
+"""
+
+import numpy as np
+import pytest
+
+from bet_copilot.api.odds_client import OddsAPIClient
+from bet_copilot.math_engine.margins import no_vig_consensus
+from bet_copilot.models.odds import OddsMatrix, stack_prices
+
+
+@pytest.fixture
+def client():
+    """Client that never reaches the network in these tests."""
+    return OddsAPIClient(api_key="test")
+
+
+class TestOddsMatrix:
+    """Matrix construction and O(1) lookups."""
+
+    def test_lookups_match_linear_scans(self, client, event_json):
+        """Dense lookups return the same prices as the bookmaker scans."""
+        data = event_json(1)
+        dense = client._parse_event(data, dense=True)
+        plain = client._parse_event(data)
+
+        assert set(dense.matrices) == {"h2h", "totals"} and not plain.matrices
+        for market, outcomes in (("h2h", ["Arsenal", "Draw", "Chelsea"]), ("totals", ["Over", "Under"])):
+            for outcome in outcomes + ["Nobody"]:
+                assert dense.get_best_odds(market, outcome) == plain.get_best_odds(market, outcome)
+                for b in range(9):
+                    assert dense.get_bookmaker_odds(f"book{b}", market, outcome) == \
+                        plain.get_bookmaker_odds(f"book{b}", market, outcome)
+        assert dense.get_best_odds("spreads", "Arsenal") is None
+
+    def test_encoding_and_summaries(self, client, event_json):
+        """Keys are dictionary-encoded; best, median and consensus per outcome."""
+        event = client._parse_event(event_json(2), dense=True)
+        matrix = event.matrices["h2h"]
+
+        assert matrix.prices.dtype == np.float32
+        assert matrix.prices.shape == (8, 3)
+        assert matrix.outcomes == ["Arsenal", "Draw", "Chelsea"]
+        assert matrix.bookmaker_index["book5"] == 5
+        assert np.isnan(matrix.prices[3, 1])
+
+        draw = [p for p in matrix.prices[:, 1].tolist() if p == p]
+        assert matrix.best_price("Draw") == round(max(draw), 4)
+        assert matrix.median[1] == pytest.approx(np.median(draw))
+        assert matrix.best_bookmaker_key("Draw") == matrix.bookmakers[int(np.nanargmax(matrix.prices[:, 1]))]
+        np.testing.assert_allclose(
+            matrix.consensus, no_vig_consensus(matrix.columns(matrix.outcomes)).probabilities, atol=1e-6
+        )
+
+    def test_missing_market(self):
+        """No bookmaker offering the market gives no matrix."""
+        assert OddsMatrix.from_bookmakers("h2h", []) is None
+
+
+class TestStackPrices:
+    """Cross-event aggregation."""
+
+    def test_events_align_by_role(self, client, event_json):
+        """h2h columns follow (home, draw, away) whatever the team names."""
+        events = [
+            client._parse_event(event_json(3, n_books=6), dense=True),
+            client._parse_event(event_json(4, n_books=8, home="Leeds", away="Everton"), dense=True),
+            client._parse_event({**event_json(5), "bookmakers": []}, dense=True),
+        ]
+
+        prices, bookmakers = stack_prices(events)
+
+        assert prices.shape == (3, 8, 3)
+        assert bookmakers[:6] == [f"book{b}" for b in range(6)]
+        assert prices[1, 7, 0] == events[1].matrices["h2h"].prices[7, 0]
+        assert np.isnan(prices[0, 6:]).all() and np.isnan(prices[2]).all()
+
+        consensus = no_vig_consensus(prices.astype(float))
+        assert consensus.best_odds[1, 2] == pytest.approx(events[1].get_best_odds("h2h", "Everton"))
+
+    def test_other_markets_and_lazy_build(self, client, event_json):
+        """Events parsed without matrices are built on demand."""
+        events = [client._parse_event(event_json(seed)) for seed in (6, 7)]
+        prices, bookmakers = stack_prices(events, "totals")
+
+        assert prices.shape == (2, 4, 2)
+        assert bookmakers == ["book0", "book2", "book4", "book6"]
+        assert all(event.matrices for event in events)
@@ -0,0 +1,157 @@
+"""
+Tests for the SQLite odds repository.
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime
+
+import pytest
+from aiohttp import web
+
+from bet_copilot.api.odds_client import OddsAPIClient, OddsAPIError
+from bet_copilot.db.odds_repository import OddsRepository
+from bet_copilot.services.odds_service import OddsService
+
+
+def parse(data):
+    return OddsAPIClient(api_key="test")._parse_event(data)
+
+
+def snapshot(event):
+    """Every (bookmaker, market, outcome) -> price of an event."""
+    return {
+        (b.key, m.key, outcome): price
+        for b in event.bookmakers
+        for m in b.markets
+        for outcome, price in m.outcomes.items()
+    }
+
+
+class TestOddsRepository:
+    """Schema, upserts and reads."""
+
+    async def test_round_trip(self, repo, event_json):
+        """Saved events come back with the same teams, kickoff and prices."""
+        events = [parse(event_json(seed)) for seed in range(3)]
+        written = await repo.save_events(events)
+
+        stored = await repo.get_events("soccer_epl")
+        assert written == sum(len(snapshot(e)) for e in events)
+        assert [e.id for e in stored] == [e.id for e in events]
+        for original, loaded in zip(events, stored):
+            assert loaded.commence_time == original.commence_time
+            assert snapshot(loaded) == snapshot(original)
+            assert loaded.get_best_odds("h2h", "Draw") == original.get_best_odds("h2h", "Draw")
+
+        assert await repo.get_event("missing") is None
+        assert await repo.get_events("basketball_nba") == []
+
+    async def test_schema(self, repo, event_json):
+        """WAL mode, normalized keys and the covering primary key."""
+        await repo.save_events([parse(event_json(1))])
+
+        with sqlite3.connect(repo.db_path) as db:
+            assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert db.execute("SELECT COUNT(*) FROM bookmakers").fetchone()[0] == 8
+            assert db.execute("SELECT COUNT(*) FROM markets").fetchone()[0] == 2
+            plan = " ".join(row[-1] for row in db.execute(
+                "EXPLAIN QUERY PLAN SELECT price FROM prices "
+                "WHERE event_id = 'event1' AND market_id = 1 AND bookmaker_id = 1"
+            ))
+            assert plan.startswith("SEARCH") and ("COVERING INDEX" in plan or "PRIMARY KEY" in plan)
+            assert db.execute("SELECT COUNT(*) FROM odds_data WHERE is_stale = 0").fetchone()[0] == 1
+
+    async def test_snapshot_upsert(self, repo, event_json):
+        """A new snapshot updates prices and drops pulled outcomes of its markets only."""
+        await repo.save_events([parse(event_json(1))], fetched_at=datetime(2024, 5, 1, 10))
+
+        data = event_json(1)
+        for book in data["bookmakers"]:
+            book["markets"] = [m for m in book["markets"] if m["key"] == "h2h"]
+        outcomes = data["bookmakers"][0]["markets"][0]["outcomes"]
+        outcomes[0]["price"] = 9.99
+        data["bookmakers"][0]["markets"][0]["outcomes"] = [o for o in outcomes if o["name"] != "Draw"]
+        await repo.save_events([parse(data)], fetched_at=datetime(2024, 5, 1, 11))
+
+        stored = snapshot(await repo.get_event("event1"))
+        assert stored[("book0", "h2h", "Arsenal")] == 9.99
+        assert ("book0", "h2h", "Draw") not in stored
+        assert ("book1", "h2h", "Draw") in stored
+        # totals were not part of the second snapshot and are kept
+        assert stored[("book0", "totals", "Over")] == snapshot(parse(event_json(1)))[("book0", "totals", "Over")]
+
+    async def test_snapshots_of_different_bookmakers(self, repo, event_json):
+        """A snapshot from other regions (other bookmakers) keeps the stored ones."""
+        full = parse(event_json(1))
+        await repo.save_events([full], fetched_at=datetime(2024, 5, 1, 10))
+
+        data = event_json(1)
+        data["bookmakers"] = data["bookmakers"][:1]
+        await repo.save_events([parse(data)], fetched_at=datetime(2024, 5, 1, 10, 0, 5))
+
+        stored = await repo.get_event("event1")
+        assert [b.key for b in stored.bookmakers] == [b.key for b in full.bookmakers]
+        assert snapshot(stored) == snapshot(full)
+
+    async def test_concurrent_writers(self, repo, event_json):
+        """Concurrent saves and background writes are serialized by the writer task."""
+        events = [parse(event_json(seed)) for seed in range(20)]
+        counts = await asyncio.gather(*(repo.save_events([e]) for e in events))
+        for k in range(5):
+            await repo.log_request(f"sports/{k}", 200, latency_ms=10.0)
+        await repo.flush()
+
+        assert len(await repo.get_events("soccer_epl")) == 20
+        assert sum(counts) == sum(len(snapshot(e)) for e in events)
+        assert (await repo.get_request_stats())["total_requests"] == 5
+
+    async def test_not_initialized(self, tmp_path, event_json):
+        """Writes need the writer task."""
+        with pytest.raises(RuntimeError):
+            await OddsRepository(tmp_path / "odds.db").save_events([parse(event_json(1))])
+
+
+class TestOddsClientPersistence:
+    """OddsAPIClient and OddsService write through the repository."""
+
+    async def test_service_uses_client_repository(self, repo):
+        """The service shares the client's repository and rejects clients without one."""
+        client = OddsAPIClient(api_key="test", repository=repo)
+        service = OddsService(odds_client=client)
+        assert service.repository is repo is client.cache.repository is client.budget.repository
+
+        with pytest.raises(ValueError):
+            OddsService(odds_client=OddsAPIClient(api_key="test"))
+        with pytest.raises(ValueError):
+            OddsService(odds_client=client, repository=OddsRepository(":memory:"))
+
+        await client.close()
+
+    async def test_get_odds_persists(self, repo, odds_api, event_json):
+        """get_odds queues the snapshot and every request is logged."""
+        calls = []
+
+        async def odds(request):
+            calls.append(request.path)
+            if len(calls) > 1:
+                return web.Response(status=429, headers={"Retry-After": "1"})
+            return web.json_response(
+                [event_json(1), event_json(2)], headers={"x-requests-remaining": "497"}
+            )
+
+        client = await odds_api(odds, repository=repo, use_cache=False)
+        service = OddsService(odds_client=client, repository=repo)
+
+        events = await service.get_odds("soccer_epl")
+        with pytest.raises(OddsAPIError):
+            await client.get_odds("soccer_epl")
+        await repo.flush()
+
+        stored = await service.get_stored_odds("soccer_epl")
+        assert [e.id for e in stored] == [e.id for e in events]
+        stats = await repo.get_request_stats(hours=1)
+        assert stats["total_requests"] == 2
+        assert stats["successful"] == 1 and stats["rate_limited"] == 1
+        assert stats["requests_remaining"] == 497
+        assert (await service.get_circuit_stats())["failure_count"] == 1
@@ -0,0 +1,311 @@
+"""
+Tests for Poisson calculator and match simulator.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from bet_copilot.math_engine.poisson import (
+    PoissonCalculator,
+    MatchSimulator,
+    ScorelineGrid,
+    line_outcomes,
+)
+
+
+class TestPoissonCalculator:
+    """Test Poisson distribution calculations."""
+
+    def test_probability(self):
+        """Test single-point probability."""
+        assert PoissonCalculator.probability(2, 1.5) == pytest.approx(0.2510, abs=1e-4)
+        assert PoissonCalculator.probability(0, 0.0) == 1.0
+        assert PoissonCalculator.probability(1, 0.0) == 0.0
+        assert PoissonCalculator.probability(-1, 1.5) == 0.0
+
+    def test_cumulative_probability(self):
+        """Test cumulative probability."""
+        assert PoissonCalculator.cumulative_probability(2, 1.5) == pytest.approx(0.8088, abs=1e-4)
+        assert PoissonCalculator.cumulative_probability(-1, 1.5) == 0.0
+
+
+class TestScorelineGrid:
+    """Test grid-based market reductions."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.simulator = MatchSimulator(max_goals=8)
+        self.grid = self.simulator.scoreline_grid(1.5, 1.2)
+
+    def _reference_scorelines(self, lambda_home, lambda_away, max_goals=8):
+        """Scoreline dict built with the scalar calculator."""
+        return {
+            (i, j): PoissonCalculator.probability(i, lambda_home)
+            * PoissonCalculator.probability(j, lambda_away)
+            for i in range(max_goals + 1)
+            for j in range(max_goals + 1)
+        }
+
+    def test_shape(self):
+        """Test grid dimensions."""
+        assert isinstance(self.grid, ScorelineGrid)
+        assert self.grid.probabilities.shape == (9, 9)
+        assert self.grid.max_goals == 8
+
+    def test_to_dict_matches_reference(self):
+        """Test dict view against scalar reference."""
+        reference = self._reference_scorelines(1.5, 1.2)
+        scorelines = self.grid.to_dict()
+
+        assert scorelines.keys() == reference.keys()
+        for score, prob in reference.items():
+            assert scorelines[score] == pytest.approx(prob, rel=1e-12)
+
+    def test_match_outcome(self):
+        """Test 1X2 triangle sums."""
+        reference = self._reference_scorelines(2.1, 1.5)
+        home = sum(p for (i, j), p in reference.items() if i > j)
+        draw = sum(p for (i, j), p in reference.items() if i == j)
+        away = sum(p for (i, j), p in reference.items() if i < j)
+
+        outcome = self.simulator.calculate_match_outcome(2.1, 1.5)
+
+        assert outcome["home_win"] == pytest.approx(home, abs=1e-4)
+        assert outcome["draw"] == pytest.approx(draw, abs=1e-4)
+        assert outcome["away_win"] == pytest.approx(away, abs=1e-4)
+
+    def test_over_under(self):
+        """Test anti-diagonal totals."""
+        reference = self._reference_scorelines(1.5, 1.2)
+
+        for threshold in (0.5, 2.5, 3.0, 4.5):
+            over = sum(p for (i, j), p in reference.items() if i + j > threshold)
+            result = self.grid.over_under(threshold)
+            assert result["over"] == pytest.approx(over, abs=1e-4)
+            assert result["over"] + result["under"] == pytest.approx(
+                self.grid.total_mass(), abs=2e-4
+            )
+
+    def test_total_goals_distribution(self):
+        """Test totals distribution sums to grid mass."""
+        totals = self.grid.total_goals_distribution()
+
+        assert len(totals) == 17
+        assert totals.sum() == pytest.approx(self.grid.total_mass())
+        assert totals[0] == pytest.approx(self.grid.probabilities[0, 0])
+
+    def test_btts(self):
+        """Test BTTS row/column masks."""
+        reference = self._reference_scorelines(1.5, 1.2)
+        yes = sum(p for (i, j), p in reference.items() if i > 0 and j > 0)
+
+        result = self.grid.both_teams_to_score()
+
+        assert result["yes"] == pytest.approx(yes, abs=1e-4)
+
+    def test_most_likely(self):
+        """Test top scorelines ordering."""
+        top = self.grid.most_likely(top_n=5)
+
+        assert len(top) == 5
+        assert top[0][0] == (1, 1)
+        probs = [prob for _, prob in top]
+        assert probs == sorted(probs, reverse=True)
+
+    def test_most_likely_ties_keep_row_major_order(self):
+        """Test ties are broken by (home, away) order."""
+        grid = self.simulator.scoreline_grid(1.0, 1.0)
+        top = grid.most_likely(top_n=4)
+
+        # 0-0, 1-0, 0-1 and 1-1 all share P = e^-2
+        assert [score for score, _ in top] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+
+
+class TestLineLadders:
+    """Test totals and Asian handicap ladders."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.grid = MatchSimulator(max_goals=10).scoreline_grid(1.7, 1.1)
+        home, away = np.indices(self.grid.probabilities.shape)
+        self.totals = home + away
+        self.margins = home - away
+
+    def _mass(self, mask):
+        return self.grid.probabilities[mask].sum()
+
+    def test_goal_difference_distribution(self):
+        """Test diagonal sums against masks."""
+        differences = self.grid.goal_difference_distribution()
+
+        assert len(differences) == 21
+        for margin in (-3, 0, 2):
+            assert differences[margin + 10] == pytest.approx(self._mass(self.margins == margin))
+
+    def test_whole_and_half_totals(self):
+        """Test pushes only on whole lines."""
+        ladder = self.grid.totals_ladder([2.0, 2.5])
+
+        assert ladder[2.0]["push"] == pytest.approx(self._mass(self.totals == 2), abs=1e-4)
+        assert ladder[2.0]["under"] == pytest.approx(self._mass(self.totals < 2), abs=1e-4)
+        assert ladder[2.5]["push"] == 0.0
+        assert ladder[2.5]["over"] == self.grid.over_under(2.5)["over"]
+
+    def test_quarter_total_splits_stake(self):
+        """Test 2.75 = half on 2.5, half on 3.0."""
+        over = self.grid.totals_ladder([2.75])[2.75]
+
+        # Exactly 3 goals: the 2.5 half wins, the 3.0 half is refunded
+        exact_three = self._mass(self.totals == 3)
+        assert over["over"] == pytest.approx(
+            self._mass(self.totals > 3) + exact_three / 2, abs=1e-4
+        )
+        assert over["push"] == pytest.approx(exact_three / 2, abs=1e-4)
+        assert over["under"] == pytest.approx(self._mass(self.totals < 3), abs=1e-4)
+
+    def test_asian_handicap(self):
+        """Test level, half and quarter handicaps."""
+        ladder = self.grid.asian_handicap([0.0, -0.5, -0.25, 1.0])
+        draw = self._mass(self.margins == 0)
+
+        # Draw no bet
+        assert ladder[0.0]["push"] == pytest.approx(draw, abs=1e-4)
+        assert ladder[-0.5]["home"] == self.grid.match_outcome()["home_win"]
+        # Home -0.25 on a draw: half stake lost, half refunded
+        assert ladder[-0.25]["push"] == pytest.approx(draw / 2, abs=1e-4)
+        assert ladder[-0.25]["away"] == pytest.approx(
+            self._mass(self.margins < 0) + draw / 2, abs=1e-4
+        )
+        # Home +1 loses only by two or more
+        assert ladder[1.0]["away"] == pytest.approx(self._mass(self.margins < -1), abs=1e-4)
+
+    def test_default_ladders(self):
+        """Test default ladders cover the bookmaker range."""
+        totals = self.grid.totals_ladder()
+        handicaps = self.grid.asian_handicap()
+
+        assert list(totals)[:3] == [0.5, 0.75, 1.0]
+        assert list(handicaps)[-2:] == [2.75, 3.0]
+        for outcome in list(totals.values()) + list(handicaps.values()):
+            assert sum(outcome.values()) == pytest.approx(self.grid.total_mass(), abs=2e-4)
+
+    def test_line_outcomes_out_of_range(self):
+        """Test lines beyond the distribution settle fully."""
+        above, push, below = line_outcomes(np.array([0.5, 0.5]), [-1.0, 5.0])
+
+        assert above.tolist() == [1.0, 0.0]
+        assert push.tolist() == [0.0, 0.0]
+        assert below.tolist() == [0.0, 1.0]
+
+
+class TestPoissonKernels:
+    """Test recurrence, log-space and regularized-gamma kernels."""
+
+    def test_pmf_into_fills_buffer(self):
+        """Test vectorized PMF matches scalar evaluation in place."""
+        buffer = np.empty(30)
+        result = PoissonCalculator.pmf_into(4.2, buffer)
+
+        assert result is buffer
+        for k in range(30):
+            assert buffer[k] == pytest.approx(PoissonCalculator.probability(k, 4.2), rel=1e-12)
+
+    def test_pmf_into_zero_lambda(self):
+        """Test degenerate lambda puts all mass at zero."""
+        buffer = PoissonCalculator.pmf_into(0.0, np.full(5, np.nan))
+
+        assert buffer.tolist() == [1.0, 0.0, 0.0, 0.0, 0.0]
+
+    def test_large_lambda_log_space(self):
+        """Test kernels stay finite where e^-λ underflows."""
+        lambda_ = 900.0
+        buffer = PoissonCalculator.pmf_into(lambda_, np.empty(1200))
+
+        assert math.exp(-lambda_) == 0.0
+        assert np.all(np.isfinite(buffer))
+        assert buffer.sum() == pytest.approx(1.0, abs=1e-9)
+        assert int(buffer.argmax()) in (899, 900)
+        assert PoissonCalculator.probability(900, lambda_) == pytest.approx(buffer[900], rel=1e-9)
+
+        matrix = PoissonCalculator.probability_matrix(1199, [1.5, lambda_])
+        assert matrix[1] == pytest.approx(buffer, rel=1e-9, abs=1e-300)
+
+    def test_cdf_into(self):
+        """Test cumulative buffer against scalar CDF."""
+        buffer = PoissonCalculator.cdf_into(9.5, np.empty(40))
+
+        for k in (0, 5, 9, 20, 39):
+            assert buffer[k] == pytest.approx(
+                PoissonCalculator.cumulative_probability(k, 9.5), abs=1e-12
+            )
+        assert buffer[-1] <= 1.0
+
+    def test_cumulative_probability_regularized_gamma(self):
+        """Test both series and continued-fraction branches."""
+        for lambda_ in (0.3, 2.5, 12.0, 45.0):
+            for k in (0, 1, 3, 10, 30, 60):
+                reference = sum(PoissonCalculator.probability(i, lambda_) for i in range(k + 1))
+                assert PoissonCalculator.cumulative_probability(k, lambda_) == pytest.approx(
+                    reference, abs=1e-12
+                )
+
+    def test_probability_range(self):
+        """Test list API is preserved."""
+        probs = PoissonCalculator.probability_range(3, 1.5)
+
+        assert isinstance(probs, list)
+        assert len(probs) == 4
+        assert probs[2] == pytest.approx(0.2510, abs=1e-4)
+
+
+class TestAdaptiveTruncation:
+    """Test tail-mass driven grid sizing."""
+
+    def test_low_lambda_uses_smaller_grid(self):
+        """Test low-scoring matches get a grid below the fixed default."""
+        simulator = MatchSimulator(tail_epsilon=1e-6)
+        grid = simulator.scoreline_grid(0.4, 0.3)
+
+        assert grid.max_goals < 8
+        assert grid.truncated_mass() < 2e-6
+
+    def test_high_lambda_keeps_mass(self):
+        """Test high-scoring matches grow beyond the fixed default."""
+        fixed = MatchSimulator(max_goals=8).scoreline_grid(5.5, 4.0)
+        adaptive = MatchSimulator(tail_epsilon=1e-6).scoreline_grid(5.5, 4.0)
+
+        assert fixed.truncated_mass() > 0.05
+        assert adaptive.max_goals > 8
+        assert adaptive.truncated_mass() < 2e-6
+
+    def test_smallest_grid_meets_epsilon(self):
+        """Test chosen size is minimal for the tail bound."""
+        epsilon = 1e-4
+        simulator = MatchSimulator(tail_epsilon=epsilon)
+        max_goals = simulator.goals_for(1.8, 1.1)
+
+        tail = 1 - PoissonCalculator.cumulative_probability(max_goals, 1.8)
+        previous_tail = 1 - PoissonCalculator.cumulative_probability(max_goals - 1, 1.8)
+
+        assert tail < epsilon <= previous_tail
+
+    def test_batch_uses_largest_needed_size(self):
+        """Test tensor size covers the highest-λ match."""
+        simulator = MatchSimulator(tail_epsilon=1e-6)
+        tensor = simulator.scoreline_tensor([0.5, 4.5], [0.5, 1.0])
+
+        assert tensor.shape[1] == simulator.goals_for(4.5, 1.0) + 1
+
+    def test_invalid_configuration(self):
+        """Test invalid adaptive settings."""
+        with pytest.raises(ValueError):
+            MatchSimulator(tail_epsilon=0)
+        with pytest.raises(ValueError):
+            MatchSimulator(backend="table", tail_epsilon=1e-6)
+
+    def test_grid_key(self):
+        """Test cache key distinguishes sizing modes."""
+        assert MatchSimulator(max_goals=8).grid_key == 8
+        assert MatchSimulator(tail_epsilon=1e-6).grid_key == ("adaptive", 1e-6)
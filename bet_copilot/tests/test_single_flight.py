@@ -0,0 +1,114 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from bet_copilot.api.single_flight import SingleFlight, request_key
+
+
+class Upstream:
+    """Slow call counting its executions."""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("API down")
+        return {"call": self.calls}
+
+
+class TestSingleFlight:
+    """Coalescing, shared errors and cancellation."""
+
+    def test_request_key(self):
+        """Parameter order does not change the key."""
+        assert request_key("u", {"b": 1, "a": 2}) == request_key("u", {"a": 2, "b": 1})
+        assert request_key("u", {"a": 1}) != request_key("u", {"a": 2})
+        assert request_key("u") == "u?"
+
+    async def test_concurrent_calls_share_one_execution(self):
+        """Five concurrent callers, one upstream call; the next one starts anew."""
+        flight = SingleFlight()
+        upstream = Upstream()
+
+        callers = [asyncio.create_task(flight.do("k", upstream)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.in_flight == 1
+        upstream.release.set()
+
+        results = await asyncio.gather(*callers)
+        assert upstream.calls == 1
+        assert all(r is results[0] for r in results)
+        assert flight.stats() == {
+            "calls": 5, "executions": 1, "saved": 4, "in_flight": 0, "saved_rate": 0.8,
+        }
+
+        assert await flight.do("k", upstream) == {"call": 2}
+        assert await flight.do("other", upstream) == {"call": 3}
+
+    async def test_exception_is_shared(self):
+        """Every waiter sees the upstream error."""
+        flight = SingleFlight()
+        upstream = Upstream(fail=True)
+
+        callers = [asyncio.create_task(flight.do("k", upstream)) for _ in range(3)]
+        await asyncio.sleep(0)
+        upstream.release.set()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        assert upstream.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.in_flight == 0
+
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Cancelling the caller that started the call leaves it running."""
+        flight = SingleFlight()
+        upstream = Upstream()
+
+        first = asyncio.create_task(flight.do("k", upstream))
+        second = asyncio.create_task(flight.do("k", upstream))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        upstream.release.set()
+        assert await second == {"call": 1}
+        assert upstream.calls == 1
+
+
+class TestClientCoalescing:
+    """OddsAPIClient shares concurrent identical requests."""
+
+    async def test_concurrent_get_odds(self, odds_api, event_json):
+        """Concurrent get_odds calls on a cold cache cost one API request."""
+        requests = []
+        release = asyncio.Event()
+
+        async def odds(request):
+            requests.append(dict(request.query))
+            await release.wait()
+            return web.json_response([event_json(1)])
+
+        flight = SingleFlight()
+        client = await odds_api(odds, use_cache=False, single_flight=flight)
+
+        callers = [asyncio.create_task(client.get_odds("soccer_epl")) for _ in range(5)]
+        while not requests:
+            await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert len(requests) == 1
+        assert flight.saved == 4
+        assert all([e.id for e in r] == ["event1"] for r in results)
+        assert results[1][0] is not results[0][0]  # every caller gets its own events
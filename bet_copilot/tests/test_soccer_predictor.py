@@ -0,0 +1,206 @@
+"""
+Tests for soccer predictor.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+from bet_copilot.math_engine.poisson import ScorelineGrid
+from bet_copilot.models.soccer import MatchResult, PredictionInput, TeamForm
+
+
+class TestSoccerPredictor:
+    """Test high-level predictions."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.predictor = SoccerPredictor()
+
+    def test_predict_from_lambdas(self):
+        """Test prediction matches simulator output."""
+        prediction = self.predictor.predict_from_lambdas(
+            "Home", "Away", lambda_home=2.1, lambda_away=1.5
+        )
+        simulator = self.predictor.simulator
+
+        assert prediction.home_win_prob == simulator.calculate_match_outcome(2.1, 1.5)["home_win"]
+        assert prediction.over_under_2_5 == simulator.over_under_probability(2.1, 1.5, 2.5)
+        assert prediction.btts == simulator.both_teams_to_score(2.1, 1.5)
+        assert prediction.most_likely_score == simulator.most_likely_scorelines(2.1, 1.5, 1)[0][0]
+        assert prediction.expected_total_goals == pytest.approx(3.6)
+
+    def test_scoreline_probabilities_lazy_view(self):
+        """Test dict view is built from the grid on demand."""
+        prediction = self.predictor.predict_from_lambdas("Home", "Away", 1.5, 1.2)
+
+        assert isinstance(prediction.scoreline_grid, ScorelineGrid)
+        assert prediction._scoreline_probabilities is None
+
+        scorelines = prediction.scoreline_probabilities
+
+        assert scorelines == self.predictor.simulator.calculate_scoreline_probabilities(1.5, 1.2)
+        assert prediction.scoreline_probabilities is scorelines
+
+    def test_without_details(self):
+        """Test detailed markets are skipped when not requested."""
+        prediction = self.predictor.predict_from_lambdas(
+            "Home", "Away", 1.5, 1.2, include_details=False
+        )
+
+        assert prediction.scoreline_grid is None
+        assert prediction.scoreline_probabilities is None
+        assert prediction.over_under_2_5 is None
+        assert prediction.btts is None
+        assert prediction.totals_ladder is None
+        assert prediction.asian_handicap is None
+
+    def test_line_ladders(self):
+        """Test full ladders are exposed on the prediction."""
+        prediction = self.predictor.predict_from_lambdas("Home", "Away", 1.5, 1.2)
+
+        totals = prediction.totals_ladder
+        handicaps = prediction.asian_handicap
+
+        assert len(totals) == 25 and min(totals) == 0.5 and max(totals) == 6.5
+        assert len(handicaps) == 25 and min(handicaps) == -3.0 and max(handicaps) == 3.0
+        assert totals[2.5]["over"] == prediction.over_under_2_5["over"]
+        assert handicaps[-0.5]["home"] == prediction.home_win_prob
+        assert prediction.totals_ladder is totals
+
+
+class TestPredictMany:
+    """Test batch predictions."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.predictor = SoccerPredictor()
+        self.lambda_home = np.array([2.1, 1.2, 0.4, 1.0])
+        self.lambda_away = np.array([1.5, 1.1, 2.8, 1.0])
+
+    def test_matches_scalar_path(self):
+        """Test every row matches predict_from_lambdas."""
+        batch = self.predictor.predict_many(self.lambda_home, self.lambda_away)
+        over, under = batch.over_under(2.5)
+
+        assert len(batch) == 4
+        for i, (lh, la) in enumerate(zip(self.lambda_home, self.lambda_away)):
+            single = self.predictor.predict_from_lambdas("H", "A", float(lh), float(la))
+
+            assert batch.home_win[i] == pytest.approx(single.home_win_prob, abs=1e-4)
+            assert batch.draw[i] == pytest.approx(single.draw_prob, abs=1e-4)
+            assert batch.away_win[i] == pytest.approx(single.away_win_prob, abs=1e-4)
+            assert over[i] == pytest.approx(single.over_under_2_5["over"], abs=1e-4)
+            assert under[i] == pytest.approx(single.over_under_2_5["under"], abs=1e-4)
+            assert batch.btts_yes[i] == pytest.approx(single.btts["yes"], abs=1e-4)
+            assert (batch.most_likely_home[i], batch.most_likely_away[i]) == single.most_likely_score
+
+    def test_scoreline_tensor_shape(self):
+        """Test tensor is kept only when requested."""
+        batch = self.predictor.predict_many(self.lambda_home, self.lambda_away)
+        assert batch.scorelines.shape == (4, 9, 9)
+
+        batch = self.predictor.predict_many(
+            self.lambda_home, self.lambda_away, keep_scorelines=False
+        )
+        assert batch.scorelines is None
+        with pytest.raises(ValueError):
+            batch.to_prediction(0, "H", "A", include_details=True)
+
+    def test_to_predictions(self):
+        """Test MatchPrediction objects built on request."""
+        batch = self.predictor.predict_many(self.lambda_home, self.lambda_away)
+        predictions = batch.to_predictions(
+            ["H1", "H2", "H3", "H4"], ["A1", "A2", "A3", "A4"], include_details=True
+        )
+        single = self.predictor.predict_from_lambdas("H1", "A1", 2.1, 1.5)
+
+        assert len(predictions) == 4
+        assert predictions[0].home_team == "H1"
+        assert predictions[0].to_dict()["probabilities"] == single.to_dict()["probabilities"]
+        assert predictions[0].scoreline_probabilities == pytest.approx(single.scoreline_probabilities)
+
+    def test_invalid_inputs(self):
+        """Test mismatched inputs are rejected."""
+        with pytest.raises(ValueError):
+            self.predictor.predict_many([1.0, 2.0], [1.0])
+
+        batch = self.predictor.predict_many([1.0], [1.0])
+        with pytest.raises(ValueError):
+            batch.over_under(7.5)
+        with pytest.raises(ValueError):
+            batch.to_predictions(["H"], [])
+
+
+class TestTruncatedMass:
+    """Test truncated mass reporting."""
+
+    def test_reported_on_prediction(self):
+        """Test fixed grids report the mass they drop."""
+        prediction = SoccerPredictor().predict_from_lambdas("H", "A", 5.0, 4.0)
+
+        assert prediction.truncated_mass > 0.01
+        assert prediction.to_dict()["truncated_mass"] == prediction.truncated_mass
+
+    def test_adaptive_predictor(self):
+        """Test adaptive predictor keeps totals correct on outliers."""
+        predictor = SoccerPredictor(tail_epsilon=1e-6)
+        prediction = predictor.predict_from_lambdas("H", "A", 5.0, 4.0)
+        total = prediction.home_win_prob + prediction.draw_prob + prediction.away_win_prob
+
+        assert prediction.truncated_mass < 2e-6
+        assert total == pytest.approx(1.0, abs=2e-4)
+
+    def test_batch_truncated_mass(self):
+        """Test batch results carry truncated mass per row."""
+        batch = SoccerPredictor().predict_many([0.5, 5.0], [0.5, 4.0])
+
+        assert batch.truncated_mass[0] < 1e-6
+        assert batch.truncated_mass[1] > 0.01
+        assert batch.to_prediction(1, "H", "A").truncated_mass == pytest.approx(
+            batch.truncated_mass[1]
+        )
+
+
+class TestTimeWeightedForm:
+    """Test predictions from exponentially time-weighted form."""
+
+    @staticmethod
+    def _form(name, home_xg, away_xg):
+        form = TeamForm(team_name=name)
+        for day, (xg_for, xg_against) in enumerate(zip(home_xg, away_xg)):
+            form.add_match(MatchResult(
+                date=datetime(2024, 1, 1) + timedelta(days=7 * day),
+                home_team=name, away_team=f"Rival {day}",
+                home_goals=1, away_goals=1,
+                home_xg=xg_for, away_xg=xg_against, is_home=True,
+            ))
+        return form
+
+    def test_weighted_lambdas(self):
+        """Recent matches dominate with a short half-life."""
+        home = self._form("H", [0.5] * 8 + [2.5] * 2, [1.0] * 10)
+        away = self._form("A", [1.0] * 10, [1.0] * 10)
+
+        window = SoccerPredictor(matches_to_consider=10).predict(home, away)
+        weighted = SoccerPredictor(half_life_days=7).predict(home, away)
+        expected = PredictionInput(home, away, half_life_days=7).get_home_lambda()
+
+        assert weighted.home_lambda == expected
+        assert weighted.home_lambda > window.home_lambda
+
+    def test_as_of_ignores_later_matches(self):
+        """PredictionInput.as_of evaluates the form at a past time."""
+        home = self._form("H", [0.5] * 8 + [2.5] * 2, [1.0] * 10)
+        away = self._form("A", [1.0] * 10, [1.0] * 10)
+        before = PredictionInput(home, away, half_life_days=7, as_of=datetime(2024, 2, 20))
+
+        # Only the 0.5 xG matches were played by then; away has no away matches
+        assert before.get_home_lambda() == 0.25
+
+    def test_invalid_half_life(self):
+        """Test non-positive half-life is rejected."""
+        with pytest.raises(ValueError):
+            SoccerPredictor(half_life_days=0)
@@ -0,0 +1,120 @@
+"""
+Tests for the hyperparameter sweep.
+"""
+
+import csv
+
+import pytest
+
+from bet_copilot.math_engine.backtest import Backtester, load_fixtures
+from bet_copilot.math_engine.kelly import KellyCriterion
+from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+from bet_copilot.math_engine.sweep import (
+    HyperparameterSweep,
+    SeasonArchive,
+    grid_points,
+    random_points,
+)
+from bet_copilot.tests.test_backtest import write_season
+
+
+@pytest.fixture
+def paths(tmp_path):
+    """Four seasons of the 4-team round robin."""
+    return [write_season(tmp_path / f"s{seed}.csv", seed=seed) for seed in range(4)]
+
+
+class TestSearchSpace:
+    """Grid and random-search specs."""
+
+    def test_grid_points(self):
+        """Every combination, last parameter varying fastest."""
+        points = grid_points({"matches_to_consider": [3, 5], "min_ev": [0.0, 0.05, 0.1]})
+        assert len(points) == 6
+        assert points[1] == {"matches_to_consider": 3, "min_ev": 0.05}
+
+    def test_random_points(self):
+        """Ranges and choices are sampled reproducibly."""
+        space = {"matches_to_consider": (3, 10), "kelly_fraction": (0.1, 0.5), "max_goals": [6, 8]}
+        points = random_points(space, 20, seed=1)
+
+        assert points == random_points(space, 20, seed=1)
+        for point in points:
+            assert isinstance(point["matches_to_consider"], int) and 3 <= point["matches_to_consider"] <= 10
+            assert 0.1 <= point["kelly_fraction"] <= 0.5
+            assert point["max_goals"] in (6, 8)
+
+    def test_unknown_parameter(self):
+        """Names that are not constructor arguments are rejected."""
+        with pytest.raises(ValueError, match="Unknown parameters"):
+            grid_points({"learning_rate": [0.1]})
+
+
+class TestSeasonArchive:
+    """Memory-mapped shared history."""
+
+    def test_round_trip(self, paths, tmp_path):
+        """Archived seasons decode to the fixtures loaded from CSV."""
+        archive = SeasonArchive.from_paths(paths, tmp_path / "cache" / "history.npy")
+
+        assert len(archive) == 4
+        assert archive.season(2) == list(load_fixtures(paths[2]))
+        reopened = SeasonArchive(archive.path)
+        assert reopened.season(0) == archive.season(0)
+
+
+class TestHyperparameterSweep:
+    """Sweep scoring, ranking and early stopping."""
+
+    def test_matches_backtester(self, paths):
+        """Each trial reports the metrics of a plain backtest."""
+        point = {"matches_to_consider": 3, "home_advantage_factor": 1.1, "kelly_fraction": 0.5}
+        result = HyperparameterSweep(paths, min_history=2, early_stop=0).run([point])
+
+        expected = Backtester(
+            predictor=SoccerPredictor(matches_to_consider=3, home_advantage_factor=1.1),
+            kelly=KellyCriterion(kelly_fraction=0.5),
+            min_history=2,
+        ).run(paths).metrics
+        assert result.best.metrics == expected
+        assert expected.log_loss is not None and expected.brier is not None
+
+    def test_ranking_and_csv(self, paths, tmp_path):
+        """Trials are ranked by the objective and written best first."""
+        points = grid_points({"matches_to_consider": [2, 4], "home_advantage_factor": [0.9, 1.2]})
+        result = HyperparameterSweep(paths, objective="brier", min_history=2, early_stop=0).run(points)
+
+        scores = [trial.metrics.brier for trial in result.trials]
+        assert scores == sorted(scores)
+        assert [trial.rank for trial in result.trials] == [1, 2, 3, 4]
+
+        result.to_csv(tmp_path / "sweep.csv")
+        rows = list(csv.DictReader((tmp_path / "sweep.csv").open()))
+        assert rows[0]["rank"] == "1"
+        assert float(rows[0]["brier"]) == result.best.metrics.brier
+
+    def test_early_stopping(self, paths):
+        """Configurations far behind the best stop after the first rung."""
+        points = [{"home_advantage_factor": 1.0}, {"home_advantage_factor": 3.0}]
+        result = HyperparameterSweep(paths, min_history=2, rungs=2, early_stop=0.01).run(points)
+
+        assert result.best.params == {"home_advantage_factor": 1.0}
+        assert result.best.seasons == 4 and not result.best.stopped_early
+        assert result.trials[1].stopped_early and result.trials[1].seasons == 2
+
+    def test_parallel_matches_serial(self, paths):
+        """Pool workers reading the memory-mapped archive match in-process runs."""
+        points = grid_points({"matches_to_consider": [2, 4], "min_ev": [0.0, 0.1]})
+        serial = HyperparameterSweep(paths, min_history=2).run(points)
+        parallel = HyperparameterSweep(paths, min_history=2, workers=2).run(points)
+
+        assert [(t.params, t.metrics) for t in serial.trials] == [(t.params, t.metrics) for t in parallel.trials]
+
+    def test_invalid_arguments(self, paths):
+        """Bad objectives, workers and empty sweeps raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown objective"):
+            HyperparameterSweep(paths, objective="accuracy")
+        with pytest.raises(ValueError):
+            HyperparameterSweep(paths, workers=0)
+        with pytest.raises(ValueError, match="No configurations"):
+            HyperparameterSweep(paths).run([])
@@ -0,0 +1,227 @@
+"""
+Tests for TeamForm ordering, rolling aggregates and time-weighted features.
+"""
+
+import random
+from datetime import datetime, timedelta
+from statistics import mean
+
+import pytest
+
+from bet_copilot.models.soccer import MatchResult, TeamForm
+
+
+def make_match(rng, day, is_home, with_stats=True):
+    """Random match from the team's perspective."""
+    optional = (lambda value: value if with_stats and rng.random() > 0.2 else None)
+    return MatchResult(
+        date=datetime(2024, 1, 1) + timedelta(days=day),
+        home_team="Team" if is_home else f"Rival {day}",
+        away_team=f"Rival {day}" if is_home else "Team",
+        home_goals=rng.randint(0, 4),
+        away_goals=rng.randint(0, 4),
+        home_xg=round(rng.uniform(0, 3), 2),
+        away_xg=round(rng.uniform(0, 3), 2),
+        is_home=is_home,
+        home_corners=optional(rng.randint(0, 12)),
+        away_corners=optional(rng.randint(0, 12)),
+        home_shots=optional(rng.randint(3, 25)),
+        away_shots=optional(rng.randint(3, 25)),
+        home_yellow_cards=optional(rng.randint(0, 5)),
+        away_yellow_cards=optional(rng.randint(0, 5)),
+        home_red_cards=optional(rng.randint(0, 1)),
+    )
+
+
+def reference_recent(matches, n, home_only=False, away_only=False):
+    """Previous implementation: filter the newest-first list and slice."""
+    if home_only:
+        matches = [m for m in matches if m.is_home]
+    elif away_only:
+        matches = [m for m in matches if not m.is_home]
+    return matches[:n]
+
+
+def reference_averages(matches, n, home_only=False, away_only=False):
+    """Previous implementation of every average_* method."""
+    recent = reference_recent(matches, n, home_only, away_only)
+
+    def avg(values):
+        return round(mean(values), 2) if values else 0.0
+
+    cards = []
+    for m in recent:
+        if m.home_yellow_cards is not None or m.away_yellow_cards is not None:
+            cards.append(
+                (m.home_yellow_cards or 0) + (m.home_red_cards or 0) * 2
+                + (m.away_yellow_cards or 0) + (m.away_red_cards or 0) * 2
+            )
+
+    return {
+        "average_xg_for": avg([m.home_xg if m.is_home else m.away_xg for m in recent]),
+        "average_xg_against": avg([m.away_xg if m.is_home else m.home_xg for m in recent]),
+        "average_goals_for": avg([m.home_goals if m.is_home else m.away_goals for m in recent]),
+        "average_goals_against": avg([m.away_goals if m.is_home else m.home_goals for m in recent]),
+        "average_corners": avg([
+            m.home_corners + m.away_corners for m in recent
+            if m.home_corners is not None and m.away_corners is not None
+        ]),
+        "average_corners_for": avg([
+            m.home_corners if m.is_home else m.away_corners for m in recent
+            if (m.home_corners if m.is_home else m.away_corners) is not None
+        ]),
+        "average_cards": avg(cards),
+        "average_shots": avg([
+            m.home_shots if m.is_home else m.away_shots for m in recent
+            if (m.home_shots if m.is_home else m.away_shots) is not None
+        ]),
+    }
+
+
+class TestTeamForm:
+    """Test suite for TeamForm."""
+
+    @pytest.fixture
+    def shuffled_matches(self):
+        """40 matches added out of date order, with some duplicate dates."""
+        rng = random.Random(3)
+        days = [rng.randint(0, 30) for _ in range(40)]
+        return [make_match(rng, day, rng.random() < 0.5) for day in days]
+
+    def test_matches_newest_first(self, shuffled_matches):
+        """Bisect insertion matches the previous append-and-sort order."""
+        form = TeamForm(team_name="Team")
+        expected = []
+        for match in shuffled_matches:
+            form.add_match(match)
+            expected.append(match)
+            expected.sort(key=lambda m: m.date, reverse=True)
+
+        assert form.matches == expected
+        assert all(a is b for a, b in zip(form.matches, expected))
+
+    @pytest.mark.parametrize("n", [0, 1, 3, 5, 10, 100, -2])
+    @pytest.mark.parametrize("venue", [{}, {"home_only": True}, {"away_only": True}])
+    def test_averages_match_reference(self, shuffled_matches, n, venue):
+        """Rolling aggregates reproduce the list-based averages."""
+        form = TeamForm(team_name="Team")
+        for match in shuffled_matches:
+            form.add_match(match)
+
+        for method, expected in reference_averages(form.matches, n, **venue).items():
+            assert getattr(form, method)(n=n, **venue) == pytest.approx(expected), method
+
+        assert form.get_recent_matches(n, **venue) == reference_recent(form.matches, n, **venue)
+
+    def test_chronological_appends_stay_incremental(self):
+        """Adding newer matches extends the aggregates without rebuilding."""
+        rng = random.Random(5)
+        form = TeamForm(team_name="Team")
+        for day in range(20):
+            form.add_match(make_match(rng, day, day % 2 == 0))
+            assert form.average_xg_for(n=5) == reference_averages(form.matches, 5)["average_xg_for"]
+
+        assert not any(split.stale for split in form._splits.values())
+
+    def test_constructor_and_direct_append(self, shuffled_matches):
+        """Matches passed in or appended to the list are picked up."""
+        form = TeamForm(team_name="Team", matches=list(shuffled_matches[:20]))
+        form.matches.extend(shuffled_matches[20:])
+
+        expected = sorted(shuffled_matches, key=lambda m: m.date, reverse=True)
+        assert form.average_goals_for(n=7) == reference_averages(expected, 7)["average_goals_for"]
+        assert form.matches == expected
+
+    def test_refresh_after_in_place_edit(self, shuffled_matches):
+        """refresh() picks up statistics edited on stored matches."""
+        form = TeamForm(team_name="Team", matches=list(shuffled_matches))
+        for match in form.matches:
+            match.home_corners = 5
+            match.away_corners = 5
+
+        form.refresh()
+        assert form.average_corners(n=10) == 10.0
+
+    def test_empty_form(self):
+        """No matches gives zero averages and an empty form string."""
+        form = TeamForm(team_name="Team")
+        assert form.average_xg_for() == 0.0
+        assert form.average_cards(home_only=True) == 0.0
+        assert form.get_recent_matches() == []
+        assert form.get_form_string() == ""
+
+
+def reference_weighted(matches, stat_values, half_life_days, at):
+    """Brute-force exponentially weighted mean, skipping missing values."""
+    matches = [m for m in matches if m.date <= at]
+    total = weight = 0.0
+    for m in matches:
+        value = stat_values(m)
+        if value is None:
+            continue
+        w = 0.5 ** ((at - m.date).total_seconds() / 86400 / half_life_days)
+        total += w * value
+        weight += w
+    return round(total / weight, 2) if weight else 0.0
+
+
+class TestWeightedForm:
+    """Exponentially time-weighted form features."""
+
+    @pytest.fixture
+    def form(self):
+        rng = random.Random(8)
+        form = TeamForm(team_name="Team")
+        for day in range(0, 120, 4):
+            form.add_match(make_match(rng, day, rng.random() < 0.5))
+        return form
+
+    @pytest.mark.parametrize("half_life", [7.0, 30.0, 365.0])
+    @pytest.mark.parametrize("venue", [{}, {"home_only": True}, {"away_only": True}])
+    def test_matches_brute_force(self, form, half_life, venue):
+        """Incremental accumulators equal the direct weighted mean at any time."""
+        matches = reference_recent(form.matches, len(form.matches), **venue)
+        for at in (datetime(2024, 2, 10), datetime(2024, 3, 1, 12), datetime(2025, 1, 1)):
+            expected = reference_weighted(
+                matches, lambda m: m.home_xg if m.is_home else m.away_xg, half_life, at
+            )
+            assert form.weighted_xg_for(half_life, at=at, **venue) == pytest.approx(expected)
+
+            expected = reference_weighted(
+                matches, lambda m: m.home_corners if m.is_home else m.away_corners, half_life, at
+            )
+            assert form.weighted_average("corners_for", half_life, at=at, **venue) == pytest.approx(expected)
+
+    def test_updates_after_new_matches(self, form):
+        """New matches update the cached accumulators (in or out of order)."""
+        rng = random.Random(9)
+        form.weighted_xg_for(30.0)
+        for day in (130, 50, 140):
+            form.add_match(make_match(rng, day, True))
+            expected = reference_weighted(
+                form.matches, lambda m: m.home_xg if m.is_home else m.away_xg,
+                30.0, form.matches[0].date,
+            )
+            assert form.weighted_xg_for(30.0) == pytest.approx(expected)
+
+    def test_long_half_life_approaches_plain_mean(self, form):
+        """With a very long half-life every match weighs the same."""
+        n = len(form.matches)
+        assert form.weighted_average("goals_against", 1e9) == form.average_goals_against(n=n)
+
+    def test_before_first_match_and_validation(self, form):
+        """No data before the first match; bad inputs raise ValueError."""
+        assert form.weighted_xg_for(at=datetime(2023, 1, 1)) == 0.0
+        with pytest.raises(ValueError, match="Unknown form statistic"):
+            form.weighted_average("possession")
+        with pytest.raises(ValueError, match="half_life_days"):
+            form.weighted_xg_for(half_life_days=0)
+
+    def test_history_backed_form(self, form):
+        """A form read from MatchHistory gives the same weighted features."""
+        from bet_copilot.models.match_history import MatchHistory
+
+        history = MatchHistory.from_matches(form.matches)
+        from_history = TeamForm.from_history(history, "Team")
+        for venue in ({}, {"home_only": True}):
+            assert from_history.weighted_average("cards", 21.0, **venue) == form.weighted_average("cards", 21.0, **venue)
@@ -0,0 +1,148 @@
+"""
+Tests for league attack/defence rating fitter.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from bet_copilot.math_engine.team_ratings import RatingEngine, TeamRatings
+
+
+def _season(n_teams=20, seed=1, home_advantage=0.25, intercept=0.1):
+    """Double round-robin with Poisson goals from known ratings."""
+    rng = np.random.default_rng(seed)
+    attack = rng.normal(0, 0.3, n_teams)
+    defence = rng.normal(0, 0.3, n_teams)
+    teams = [f"Team {i}" for i in range(n_teams)]
+
+    home, away = np.where(~np.eye(n_teams, dtype=bool))
+    lambda_home = np.exp(intercept + home_advantage + attack[home] - defence[away])
+    lambda_away = np.exp(intercept + attack[away] - defence[home])
+
+    return {
+        "teams": teams,
+        "attack": attack,
+        "home_teams": [teams[i] for i in home],
+        "away_teams": [teams[i] for i in away],
+        "lambda_home": lambda_home,
+        "lambda_away": lambda_away,
+        "home_goals": rng.poisson(lambda_home),
+        "away_goals": rng.poisson(lambda_away),
+    }
+
+
+class TestRatingEngine:
+    """Test maximum-likelihood fit."""
+
+    def test_recovers_expected_rates(self):
+        """Test fitting on expected rates recovers the generating model."""
+        season = _season()
+        engine = RatingEngine(regularization=1e-6)
+        ratings = engine.add_results(
+            season["home_teams"],
+            season["away_teams"],
+            season["lambda_home"],
+            season["lambda_away"],
+        )
+
+        assert ratings.converged
+        assert ratings.home_advantage == pytest.approx(0.25, abs=1e-4)
+
+        home, away = ratings.expected_goals("Team 3", "Team 7")
+        index = season["home_teams"].index("Team 3")
+        while season["away_teams"][index] != "Team 7":
+            index += 1
+        assert home == pytest.approx(season["lambda_home"][index], rel=1e-3)
+        assert away == pytest.approx(season["lambda_away"][index], rel=1e-3)
+
+    def test_fit_on_sampled_goals(self):
+        """Test attack ratings correlate with the truth on noisy data."""
+        season = _season()
+        ratings = RatingEngine().add_results(
+            season["home_teams"],
+            season["away_teams"],
+            season["home_goals"],
+            season["away_goals"],
+        )
+
+        assert np.corrcoef(ratings.attack, season["attack"])[0, 1] > 0.6
+        assert 0.0 < ratings.home_advantage < 0.6
+
+    def test_warm_start_refit_is_fast(self):
+        """Test a new result refits from the previous parameters."""
+        season = _season()
+        engine = RatingEngine()
+        cold = engine.add_results(
+            season["home_teams"],
+            season["away_teams"],
+            season["home_goals"],
+            season["away_goals"],
+        )
+
+        start = time.perf_counter()
+        warm = engine.add_result("Team 0", "Team 1", 3, 0)
+        elapsed = time.perf_counter() - start
+
+        assert warm.iterations < cold.iterations
+        assert warm.attack[0] > cold.attack[0]
+        assert elapsed < 0.05
+
+    def test_new_team_added_incrementally(self):
+        """Test unseen teams are registered and rated."""
+        season = _season(n_teams=6)
+        engine = RatingEngine()
+        engine.add_results(
+            season["home_teams"],
+            season["away_teams"],
+            season["home_goals"],
+            season["away_goals"],
+        )
+
+        ratings = engine.add_result("Promoted", "Team 0", 0, 2)
+
+        assert "Promoted" in ratings
+        assert len(ratings.attack) == 7
+        assert ratings.attack[ratings.index("Promoted")] < 0
+
+    def test_save_and_load(self, tmp_path):
+        """Test parameters and history survive a round trip."""
+        season = _season(n_teams=6)
+        engine = RatingEngine()
+        ratings = engine.add_results(
+            season["home_teams"],
+            season["away_teams"],
+            season["home_goals"],
+            season["away_goals"],
+        )
+        path = tmp_path / "ratings.json"
+        engine.save(path)
+
+        loaded = RatingEngine.load(path)
+
+        assert len(loaded) == len(engine)
+        assert loaded.expected_goals("Team 1", "Team 2") == ratings.expected_goals(
+            "Team 1", "Team 2"
+        )
+        assert loaded.add_result("Team 1", "Team 2", 1, 1).iterations <= 5
+
+    def test_invalid_input(self):
+        """Test validation errors."""
+        engine = RatingEngine()
+
+        with pytest.raises(ValueError):
+            engine.fit()
+        with pytest.raises(ValueError):
+            engine.add_results(["A"], ["B", "C"], [1], [0])
+        with pytest.raises(ValueError):
+            engine.add_result("A", "B", -1, 0)
+        with pytest.raises(ValueError):
+            RatingEngine(regularization=0)
+
+    def test_unknown_team(self):
+        """Test lookups for teams outside the fit."""
+        ratings = TeamRatings(["A", "B"], [0.1, -0.1], [0.0, 0.0], 0.2, 0.1)
+
+        with pytest.raises(ValueError):
+            ratings.expected_goals("A", "Z")
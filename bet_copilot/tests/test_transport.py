@@ -0,0 +1,113 @@
+"""
+Tests for the pooled HTTP transport.
+"""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bet_copilot.api.odds_client import OddsAPIClient
+from bet_copilot.api.transport import HttpTransport
+
+
+def stub_app(peers):
+    """Odds-API-like stub recording the client port of every request."""
+
+    async def sports(request):
+        peers.append(request.transport.get_extra_info("peername")[1])
+        body = json.dumps([{"key": "soccer_epl", "accept": request.headers.get("Accept-Encoding", "")}])
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return web.Response(
+                body=gzip.compress(body.encode()),
+                headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+            )
+        return web.Response(text=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/sports", sports)
+    return app
+
+
+@pytest.fixture
+async def stub():
+    peers = []
+    server = TestServer(stub_app(peers))
+    await server.start_server()
+    yield server, peers
+    await server.close()
+
+
+class TestHttpTransport:
+    """Test pooling, decoding and lifecycle."""
+
+    async def test_keep_alive_and_gzip(self, stub):
+        """Sequential requests reuse one connection; gzip is negotiated and decoded."""
+        server, peers = stub
+        transport = HttpTransport()
+
+        for _ in range(5):
+            async with transport.get(str(server.make_url("/sports")), timeout=5) as response:
+                data = await response.json()
+
+        assert data[0]["key"] == "soccer_epl"
+        assert "gzip" in data[0]["accept"]
+        assert len(peers) == 5 and len(set(peers)) == 1
+        await transport.close()
+
+    async def test_session_per_host(self, stub):
+        """Each host gets its own session; close() releases all of them."""
+        server, _ = stub
+        other = TestServer(web.Application())
+        await other.start_server()
+        transport = HttpTransport()
+
+        first = await transport.session(server.make_url("/sports"))
+        assert await transport.session(server.make_url("/other?x=1")) is first
+        second = await transport.session(other.make_url("/"))
+        assert second is not first
+        assert transport.open_sessions == 2
+
+        await transport.close()
+        assert first.closed and second.closed
+        assert transport.open_sessions == 0
+        await other.close()
+
+    def test_new_event_loop(self):
+        """A transport reused from a later event loop opens fresh sessions."""
+        transport = HttpTransport()
+
+        async def open_session(close=False):
+            session = await transport.session("http://127.0.0.1:1/")
+            sessions = len(transport._sessions)
+            if close:
+                await transport.close()
+            return session, sessions
+
+        first, _ = asyncio.run(open_session())
+        second, sessions = asyncio.run(open_session(close=True))
+        assert second is not first
+        assert sessions == 1
+        assert first.closed and second.closed
+
+    async def test_client_routes_through_transport(self, stub):
+        """API clients share the pooled connection."""
+        server, peers = stub
+        transport = HttpTransport()
+        client = OddsAPIClient(api_key="test", base_url=str(server.make_url("")), transport=transport)
+
+        await client.get_sports()
+        await client.get_sports()
+        await client.close()
+
+        assert len(set(peers)) == 1
+        assert transport.open_sessions == 1
+        await transport.close()
+
+    def test_invalid_limit(self):
+        """Pools need at least one connection."""
+        with pytest.raises(ValueError):
+            HttpTransport(limit_per_host=0)
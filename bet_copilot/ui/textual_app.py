@@ -22,10 +22,16 @@ from textual.suggester import Suggester
 
 from bet_copilot.news import NewsScraper, NewsArticle
 from bet_copilot.services.match_analyzer import MatchAnalyzer
+from bet_copilot.api.odds_budget import Priority, request_cost
 from bet_copilot.api.odds_client import OddsAPIClient
+from bet_copilot.api.transport import close_transport
+from bet_copilot.config import CACHE_TTL_MIN
+from bet_copilot.db.odds_repository import OddsRepository
+from bet_copilot.services.odds_service import OddsService
 from bet_copilot.api.football_client_with_fallback import create_football_client
 from bet_copilot.ai.ai_client import create_ai_client
 from bet_copilot.math_engine.soccer_predictor import SoccerPredictor
+from bet_copilot.math_engine.market_cache import MarketCache
 from bet_copilot.math_engine.kelly import KellyCriterion
 from bet_copilot.math_engine.alternative_markets import AlternativeMarketsPredictor
 
@@ -245,6 +251,18 @@ class MarketWatchWidget(Static):
     markets = reactive([])
     last_update = reactive("")
     
+    # Leagues polled in the background; how often each one is refreshed
+    # comes from the Odds API credit budget (OddsBudget)
+    SPORT_KEYS = (
+        "soccer_epl",
+        "soccer_spain_la_liga",
+        "soccer_germany_bundesliga",
+        "soccer_italy_serie_a",
+        "soccer_france_ligue_one",
+    )
+    REGIONS = "us"
+    MARKETS = "h2h"
+    
     def compose(self) -> ComposeResult:
         yield Label("📊 Market Watch")
         yield DataTable(id="markets-table")
@@ -263,37 +281,46 @@ class MarketWatchWidget(Static):
         
         table.cursor_type = "row"  # Allow row selection
         
-        # Auto-refresh every 5 minutes
-        self.set_interval(300, self.refresh_markets)
-        
-        # Load initial data
+        # Load initial data; later refreshes are scheduled by the budget
+        self._refresh_timer = None
         asyncio.create_task(self.refresh_markets())
     
+    def _schedule_refresh(self) -> None:
+        """Re-arm the refresh timer for the next sport the budget says is due."""
+        app = self.app
+        if not hasattr(app, 'odds_client'):
+            return
+        
+        budget = app.odds_client.budget
+        delay = max(CACHE_TTL_MIN, budget.next_poll_in(cost=request_cost(self.REGIONS, self.MARKETS)))
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(delay, self.refresh_markets)
+    
     async def refresh_markets(self) -> None:
         """Fetch latest market opportunities from live odds."""
         try:
             app = self.app
-            if not hasattr(app, 'odds_client'):
+            if not hasattr(app, 'odds_service'):
                 return
             
-            # Get top leagues matches
-            sports = await app.odds_client.get_sports()
-            if not sports:
-                return
-            
-            # Get soccer matches
-            soccer_key = next((s['key'] for s in sports if 'soccer' in s['key'].lower()), None)
-            if not soccer_key:
+            # Only the leagues that are due (kickoff proximity, value bets)
+            refreshed = await app.odds_service.refresh_due(
+                list(self.SPORT_KEYS), regions=self.REGIONS, markets=self.MARKETS
+            )
+            odds = sorted(
+                (event for events in refreshed.values() for event in events),
+                key=lambda event: event.commence_time,
+            )
+            if not odds:
                 return
             
-            odds = await app.odds_client.get_odds(sport_key=soccer_key, regions="us", markets="h2h")
-            
             # Analyze top 5 matches
             markets = []
             for match in odds[:5]:
                 try:
-                    home_team = match.get('home_team', '')
-                    away_team = match.get('away_team', '')
+                    home_team = match.home_team
+                    away_team = match.away_team
                     
                     # Quick analysis
                     analysis = await app.match_analyzer.analyze_match(
@@ -331,6 +358,8 @@ class MarketWatchWidget(Static):
             
         except Exception as e:
             logger.error(f"Error refreshing markets: {str(e)}")
+        finally:
+            self._schedule_refresh()
     
     def watch_markets(self, markets) -> None:
         """Update table when markets change."""
@@ -606,10 +635,13 @@ class BetCopilotApp(App):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # Initialize services
-        self.odds_client = OddsAPIClient()
+        # Odds responses are cached in memory and in SQLite (config.DB_PATH)
+        self.odds_repository = OddsRepository()
+        self.odds_client = OddsAPIClient(repository=self.odds_repository)
+        self.odds_service = OddsService(odds_client=self.odds_client, repository=self.odds_repository)
         self.football_client = create_football_client()  # With fallback to SimpleProvider
         self.ai_client = create_ai_client()  # Unified AI with fallback
-        self.soccer_predictor = SoccerPredictor()
+        self.soccer_predictor = SoccerPredictor(cache=MarketCache())
         self.kelly = KellyCriterion()
         
         # MatchAnalyzer creates its own clients for collaborative analysis
@@ -767,7 +799,7 @@ class BetCopilotApp(App):
         self.notify(f"📊 Obteniendo mercados para {sport_key}...")
         
         try:
-            events = await self.odds_client.get_odds(sport_key)
+            events = await self.odds_client.get_odds(sport_key, priority=Priority.HIGH)
             
             if not events:
                 self.notify("No se encontraron eventos", severity="warning")
@@ -932,10 +964,12 @@ class BetCopilotApp(App):
                 await self.match_analyzer.close()
             if hasattr(self, 'odds_client'):
                 await self.odds_client.close()
+                await self.odds_repository.close()
             if hasattr(self, 'football_client'):
                 await self.football_client.close()
             if hasattr(self, 'ai_client'):
                 await self.ai_client.close()
+            await close_transport()
             logger.info("App cleanup complete")
         except Exception as e:
             logger.error(f"Error during cleanup: {str(e)}")
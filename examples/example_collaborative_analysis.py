@@ -21,6 +21,7 @@ from rich.text import Text
 from bet_copilot.ai.collaborative_analyzer import CollaborativeAnalyzer
 from bet_copilot.ai.gemini_client import GeminiClient
 from bet_copilot.ai.blackbox_client import BlackboxClient
+from bet_copilot.api.transport import close_transport
 from bet_copilot.news import NewsScraper
 
 
@@ -342,14 +343,18 @@ async def main():
         border_style="white"
     ))
     
-    # Demo 1: News Feed
-    await demo_news_feed()
-    
-    # Demo 2: Collaborative Analysis
-    await demo_collaborative_analysis()
-    
-    # Demo 3: Integrated Flow
-    await demo_integrated_flow()
+    try:
+        # Demo 1: News Feed
+        await demo_news_feed()
+        
+        # Demo 2: Collaborative Analysis
+        await demo_collaborative_analysis()
+        
+        # Demo 3: Integrated Flow
+        await demo_integrated_flow()
+    finally:
+        # Clients share one connection pool; release it on exit
+        await close_transport()
     
     # Summary
     console.rule("[bold green]✅ SYSTEM CAPABILITIES[/bold green]")
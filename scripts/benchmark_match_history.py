@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria: lista de MatchResult vs MatchHistory columnar.
+
+Uso:
+    python scripts/benchmark_match_history.py [--matches N] [--teams N]
+"""
+
+# Add project to path
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+import sys
+sys.path.insert(0, str(project_root))
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+
+from bet_copilot.models.match_history import MatchHistory
+from bet_copilot.models.soccer import MatchResult, TeamForm
+
+console = Console()
+
+
+def random_columns(n: int, n_teams: int, seed: int = 42) -> dict:
+    """Historial sintético con estadísticas avanzadas (~10% ausentes)."""
+    rng = np.random.default_rng(seed)
+    home = rng.integers(0, n_teams, n)
+    away = (home + rng.integers(1, n_teams, n)) % n_teams
+    start = datetime(2015, 8, 1)
+
+    def stat(low, high):
+        values = rng.integers(low, high, n).astype(object)
+        values[rng.random(n) < 0.1] = None
+        return values.tolist()
+
+    return {
+        "date": [start + timedelta(hours=int(h)) for h in np.sort(rng.integers(0, 24 * 3650, n))],
+        "home_team": [f"Equipo {i}" for i in home],
+        "away_team": [f"Equipo {i}" for i in away],
+        "home_goals": rng.poisson(1.5, n).tolist(),
+        "away_goals": rng.poisson(1.1, n).tolist(),
+        "home_xg": np.round(rng.gamma(3, 0.5, n), 2).tolist(),
+        "away_xg": np.round(rng.gamma(3, 0.4, n), 2).tolist(),
+        "home_corners": stat(0, 14),
+        "away_corners": stat(0, 12),
+        "home_shots": stat(3, 25),
+        "away_shots": stat(3, 22),
+        "home_yellow_cards": stat(0, 6),
+        "away_yellow_cards": stat(0, 6),
+        "home_red_cards": stat(0, 2),
+        "away_red_cards": stat(0, 2),
+    }
+
+
+def timed(build):
+    """(resultado, segundos)."""
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    return result, time.perf_counter() - start
+
+
+def match_result_bytes(match: MatchResult) -> int:
+    """
+    Tamaño de un MatchResult: objeto, __dict__ y valores propios.
+
+    Los enteros pequeños y None están cacheados por Python y los nombres
+    de equipo se asumen compartidos, así que solo se cuentan floats y
+    fechas (estimación conservadora).
+    """
+    size = sys.getsizeof(match) + sys.getsizeof(match.__dict__)
+    for value in match.__dict__.values():
+        if isinstance(value, (float, datetime)):
+            size += sys.getsizeof(value)
+    return size
+
+
+def bench_memory(columns: dict):
+    """Memoria y tiempo de carga de ambas representaciones."""
+    n = len(columns["date"])
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    matches, list_time = timed(lambda: [MatchResult(is_home=True, **row) for row in rows])
+    list_bytes = sum(match_result_bytes(m) for m in matches) + sys.getsizeof(matches)
+
+    history, history_time = timed(lambda: _history_from_columns(columns, n))
+    del history
+    gc.collect()
+    tracemalloc.start()
+    history = _history_from_columns(columns, n)
+    history_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    table = Table(title=f"Memoria del historial ({n:,} partidos)")
+    table.add_column("Representación", style="cyan")
+    table.add_column("Bytes/partido", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Carga", justify="right")
+    table.add_row(
+        "list[MatchResult]", f"{list_bytes / n:.0f}",
+        f"{list_bytes / 2**20:.1f} MiB", f"{list_time * 1000:.0f} ms",
+    )
+    table.add_row(
+        "MatchHistory", f"{history_bytes / n:.0f}",
+        f"{history_bytes / 2**20:.1f} MiB", f"{history_time * 1000:.0f} ms",
+    )
+    table.add_row("Reducción", f"{list_bytes / history_bytes:.1f}x", "", "")
+
+    return table, history
+
+
+def _history_from_columns(columns: dict, n: int) -> MatchHistory:
+    history = MatchHistory(capacity=n)
+    history.extend_columns(columns)
+    return history
+
+
+def bench_team_forms(history: MatchHistory) -> Table:
+    """Construcción de TeamForm para todos los equipos."""
+    teams = history.teams
+    matches = [history[i] for i in range(len(history))]
+
+    def from_objects():
+        forms = {team: TeamForm(team_name=team) for team in teams}
+        for match in matches:
+            forms[match.home_team].add_match(match)
+            forms[match.away_team].add_match(match)
+        return forms
+
+    def from_history():
+        return {team: TeamForm.from_history(history, team) for team in teams}
+
+    table = Table(title=f"TeamForm para {len(teams)} equipos")
+    table.add_column("Origen", style="cyan")
+    table.add_column("Tiempo", justify="right")
+    for label, build in (("add_match (objetos)", from_objects), ("from_history (columnas)", from_history)):
+        start = time.perf_counter()
+        build()
+        table.add_row(label, f"{(time.perf_counter() - start) * 1000:.0f} ms")
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de memoria del historial de partidos")
+    parser.add_argument("--matches", type=int, default=200_000, help="Partidos en el historial")
+    parser.add_argument("--teams", type=int, default=400, help="Equipos distintos")
+    args = parser.parse_args()
+
+    console.print("\n[bold cyan]Benchmark de MatchHistory[/bold cyan]\n")
+    columns = random_columns(args.matches, args.teams)
+    table, history = bench_memory(columns)
+    console.print(table)
+    console.print(bench_team_forms(history))
+
+
+if __name__ == "__main__":
+    main()
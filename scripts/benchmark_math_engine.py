@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmarks del motor matemático.
+
+Uso:
+    python scripts/benchmark_math_engine.py [--matches N]
+"""
+
+# Add project to path
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+import sys
+sys.path.insert(0, str(project_root))
+
+import argparse
+import time
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+
+from bet_copilot.math_engine import LambdaTable, MatchSimulator, SoccerPredictor
+from bet_copilot.math_engine.kelly import BetOpportunity, KellyCriterion
+
+console = Console()
+
+
+def _timeit(func, repeat: int = 3) -> float:
+    """Best wall-clock time of several runs (seconds)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_lambdas(n: int, seed: int = 42):
+    """Random lambda pairs rounded like PredictionInput does."""
+    rng = np.random.default_rng(seed)
+    lambda_home = np.round(rng.uniform(0.3, 3.0, n), 2)
+    lambda_away = np.round(rng.uniform(0.3, 3.0, n), 2)
+    return lambda_home, lambda_away
+
+
+def bench_predict_many(n: int) -> Table:
+    """predict_from_lambdas en bucle vs predict_many."""
+    predictor = SoccerPredictor()
+    lambda_home, lambda_away = random_lambdas(n)
+
+    def loop():
+        for lh, la in zip(lambda_home.tolist(), lambda_away.tolist()):
+            predictor.predict_from_lambdas("Home", "Away", lh, la)
+
+    scalar = _timeit(loop, repeat=1)
+    batch = _timeit(lambda: predictor.predict_many(lambda_home, lambda_away))
+
+    table = Table(title=f"SoccerPredictor ({n:,} partidos)", show_header=True)
+    table.add_column("Método", style="cyan")
+    table.add_column("Tiempo", justify="right")
+    table.add_column("Partidos/s", justify="right")
+    table.add_row("predict_from_lambdas (bucle)", f"{scalar * 1000:.1f} ms", f"{n / scalar:,.0f}")
+    table.add_row("predict_many", f"{batch * 1000:.1f} ms", f"{n / batch:,.0f}")
+    table.add_row("[bold]Speedup[/bold]", f"[green]{scalar / batch:.0f}x[/green]", "")
+    return table
+
+
+def bench_table_backend(n: int) -> Table:
+    """MatchSimulator exacto vs backend "table"."""
+    exact = MatchSimulator()
+    fast = MatchSimulator(backend="table", table=LambdaTable.build())
+    lambda_home, lambda_away = random_lambdas(n)
+    pairs = list(zip(lambda_home.tolist(), lambda_away.tolist()))
+
+    def price(simulator):
+        for lh, la in pairs:
+            simulator.calculate_match_outcome(lh, la)
+            simulator.over_under_probability(lh, la, 2.5)
+            simulator.both_teams_to_score(lh, la)
+
+    exact_time = _timeit(lambda: price(exact), repeat=1)
+    table_time = _timeit(lambda: price(fast), repeat=1)
+
+    table = Table(title=f"Backend de MatchSimulator ({n:,} partidos, 1X2 + O/U + BTTS)")
+    table.add_column("Backend", style="cyan")
+    table.add_column("µs/partido", justify="right")
+    table.add_row("exact", f"{exact_time / n * 1e6:.1f}")
+    table.add_row("table", f"{table_time / n * 1e6:.1f}")
+    table.add_row("[bold]Speedup[/bold]", f"[green]{exact_time / table_time:.1f}x[/green]")
+    return table
+
+
+def bench_goal_models(n: int) -> Table:
+    """Coste de predict_many por modelo de goles (relativo a Poisson independiente)."""
+    lambda_home, lambda_away = random_lambdas(n)
+    timings = {}
+    for model in ("poisson", "dixon_coles", "bivariate_poisson"):
+        predictor = SoccerPredictor(model=model)
+        timings[model] = _timeit(
+            lambda: predictor.predict_many(lambda_home, lambda_away, keep_scorelines=False)
+        )
+
+    baseline = timings["poisson"]
+    table = Table(title=f"Modelos de goles, predict_many ({n:,} partidos)")
+    table.add_column("Modelo", style="cyan")
+    table.add_column("Tiempo", justify="right")
+    table.add_column("Coste relativo", justify="right")
+    for model, elapsed in timings.items():
+        ratio = elapsed / baseline
+        style = "green" if ratio <= 2.0 else "red"
+        table.add_row(model, f"{elapsed * 1000:.1f} ms", f"[{style}]{ratio:.2f}x[/{style}]")
+    return table
+
+
+def bench_portfolio(n_bets: int = 100, runs: int = 10) -> Table:
+    """Kelly de cartera (apuestas simultáneas) vs Kelly independiente."""
+    kelly = KellyCriterion()
+    times, iterations, exposures, independent = [], [], [], []
+
+    for seed in range(runs):
+        rng = np.random.default_rng(seed)
+        opportunities = []
+        for match in range((n_bets + 2) // 3):
+            probs = rng.dirichlet([4, 3, 3])
+            for selection, prob in zip(("home_win", "draw", "away_win"), probs):
+                odds = 1 / prob * rng.uniform(0.85, 1.15)
+                opportunities.append(BetOpportunity(f"m{match}", selection, float(prob), float(odds)))
+        opportunities = opportunities[:n_bets]
+
+        start = time.perf_counter()
+        allocation = kelly.optimize_portfolio(opportunities)
+        times.append(time.perf_counter() - start)
+        iterations.append(allocation.iterations)
+        exposures.append(allocation.total_exposure)
+        independent.append(kelly.calculate_batch(
+            [o.model_prob for o in opportunities], [o.odds for o in opportunities]
+        ).recommended_stake.sum())
+
+    table = Table(title=f"Kelly de cartera ({n_bets} apuestas, {runs} carteras)")
+    table.add_column("Métrica", style="cyan")
+    table.add_column("Valor", justify="right")
+    table.add_row("Tiempo medio", f"{np.mean(times) * 1000:.1f} ms")
+    table.add_row("Tiempo máximo", f"{np.max(times) * 1000:.1f} ms")
+    table.add_row("Iteraciones medias", f"{np.mean(iterations):.0f}")
+    table.add_row("Exposición independiente", f"{np.mean(independent):.1f}%")
+    table.add_row("Exposición cartera", f"{np.mean(exposures):.1f}%")
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks del motor matemático")
+    parser.add_argument("--matches", type=int, default=10_000, help="Partidos por lote")
+    args = parser.parse_args()
+
+    console.print("\n[bold cyan]Benchmarks del motor matemático[/bold cyan]\n")
+    console.print(bench_predict_many(args.matches))
+    console.print(bench_table_backend(min(args.matches, 5_000)))
+    console.print(bench_goal_models(args.matches))
+    console.print(bench_portfolio())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latencia: sesión aiohttp por request vs HttpTransport.
+
+Levanta un servidor aiohttp local que responde un JSON parecido a /odds
+y mide la latencia media por request secuencial de cada estrategia.
+Sin TLS: en hosts reales el ahorro del pool es mayor.
+
+Uso:
+    python scripts/benchmark_transport.py [--requests N] [--events N]
+"""
+
+# Add project to path
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+import sys
+sys.path.insert(0, str(project_root))
+
+import argparse
+import asyncio
+import time
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from rich.console import Console
+from rich.table import Table
+
+from bet_copilot.api.transport import HttpTransport
+
+console = Console()
+
+
+def fake_events(n: int) -> list:
+    """Respuesta sintética de /odds con n eventos y 8 casas."""
+    return [
+        {
+            "id": f"event{e}",
+            "sport_key": "soccer_epl",
+            "commence_time": "2024-05-04T14:00:00Z",
+            "home_team": f"Home {e}",
+            "away_team": f"Away {e}",
+            "bookmakers": [
+                {
+                    "key": f"book{b}",
+                    "title": f"Book {b}",
+                    "last_update": "2024-05-01T10:00:00Z",
+                    "markets": [{
+                        "key": "h2h",
+                        "last_update": "2024-05-01T10:00:00Z",
+                        "outcomes": [
+                            {"name": f"Home {e}", "price": 2.1},
+                            {"name": "Draw", "price": 3.4},
+                            {"name": f"Away {e}", "price": 3.6},
+                        ],
+                    }],
+                }
+                for b in range(8)
+            ],
+        }
+        for e in range(n)
+    ]
+
+
+async def start_stub(n_events: int) -> TestServer:
+    """Servidor local que sirve /sports/soccer_epl/odds (gzip si se pide)."""
+    payload = fake_events(n_events)
+
+    async def odds(request):
+        response = web.json_response(payload)
+        response.enable_compression()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/sports/soccer_epl/odds", odds)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+async def per_request_session(url: str, n: int) -> float:
+    """Como antes: una ClientSession nueva (y conexión nueva) por request."""
+    start = time.perf_counter()
+    for _ in range(n):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                await response.json()
+    return time.perf_counter() - start
+
+
+async def pooled_transport(url: str, n: int) -> float:
+    """HttpTransport: sesión keep-alive compartida."""
+    transport = HttpTransport()
+    try:
+        async with transport.get(url) as response:  # calentamiento: abre la conexión
+            await response.json()
+        start = time.perf_counter()
+        for _ in range(n):
+            async with transport.get(url) as response:
+                await response.json()
+        return time.perf_counter() - start
+    finally:
+        await transport.close()
+
+
+async def run(n: int, n_events: int) -> Table:
+    server = await start_stub(n_events)
+    try:
+        url = str(server.make_url("/sports/soccer_epl/odds"))
+        baseline = await per_request_session(url, n)
+        pooled = await pooled_transport(url, n)
+    finally:
+        await server.close()
+
+    table = Table(title=f"Transporte HTTP ({n:,} requests, {n_events} eventos por respuesta)")
+    table.add_column("Estrategia", style="cyan")
+    table.add_column("ms/request", justify="right")
+    table.add_column("Requests/s", justify="right")
+    table.add_row("Sesión por request", f"{baseline / n * 1000:.2f}", f"{n / baseline:,.0f}")
+    table.add_row("HttpTransport", f"{pooled / n * 1000:.2f}", f"{n / pooled:,.0f}")
+    table.add_row("[bold]Speedup[/bold]", f"[green]{baseline / pooled:.1f}x[/green]", "")
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del transporte HTTP compartido")
+    parser.add_argument("--requests", type=int, default=500, help="Requests por estrategia")
+    parser.add_argument(
+        "--events", type=int, default=0,
+        help="Eventos por respuesta (0 = solo el coste de conexión)",
+    )
+    args = parser.parse_args()
+
+    console.print("\n[bold cyan]Benchmark del transporte HTTP[/bold cyan]\n")
+    console.print(asyncio.run(run(args.requests, args.events)))
+
+
+if __name__ == "__main__":
+    main()
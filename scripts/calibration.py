@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Calibración y reglas de puntuación de predicciones guardadas en JSONL.
+
+Cada línea: {"prediction": {...}, "result": {...}} (ver CalibrationEvaluator.add).
+
+Uso:
+    python scripts/calibration.py predicciones/*.jsonl [--workers N] [--mercado 1x2]
+    python scripts/calibration.py lote1.jsonl --guardar parcial1.json   # resultado parcial
+    python scripts/calibration.py --combinar parcial1.json parcial2.json
+"""
+
+# Add project to path
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+import sys
+sys.path.insert(0, str(project_root))
+
+import argparse
+import json
+import os
+
+from rich.console import Console
+from rich.table import Table
+
+from bet_copilot.math_engine.calibration import CalibrationEvaluator
+
+console = Console()
+
+
+def scores_table(evaluator: CalibrationEvaluator) -> Table:
+    """Tabla de puntuaciones por mercado."""
+    table = Table(title="Calibración por mercado")
+    table.add_column("Mercado")
+    for column in ("Predicciones", "Log-loss", "Brier", "RPS", "ECE"):
+        table.add_column(column, justify="right")
+
+    for market, scores in evaluator.summary().items():
+        table.add_row(
+            market,
+            f"{scores['count']:,}",
+            f"{scores['log_loss']:.4f}",
+            f"{scores['brier']:.4f}",
+            f"{scores['rps']:.4f}",
+            f"{scores['calibration_error']:.4f}",
+        )
+    return table
+
+
+def reliability_table(evaluator: CalibrationEvaluator, market: str) -> Table:
+    """Diagrama de fiabilidad de un mercado (todos los resultados agregados)."""
+    table = Table(title=f"Fiabilidad: {market}")
+    for column in ("Intervalo", "N", "Prob. media", "Frecuencia real", "Diferencia"):
+        table.add_column(column, justify="right")
+
+    for b in evaluator.markets[market].reliability():
+        gap = b.observed_frequency - b.mean_predicted
+        table.add_row(
+            f"{b.lower:.2f}-{b.upper:.2f}", str(b.count), f"{b.mean_predicted:.3f}",
+            f"{b.observed_frequency:.3f}", f"[{'green' if abs(gap) < 0.05 else 'red'}]{gap:+.3f}[/]",
+        )
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibración de probabilidades (log-loss, Brier, RPS)")
+    parser.add_argument("paths", nargs="*", help="Archivos JSONL de predicciones y resultados")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Procesos en paralelo")
+    parser.add_argument("--mercado", help="Mostrar el diagrama de fiabilidad de este mercado")
+    parser.add_argument("--guardar", type=Path, help="Guardar el resultado (parcial) en JSON")
+    parser.add_argument("--combinar", nargs="+", type=Path, default=[], help="Resultados parciales JSON a sumar")
+    args = parser.parse_args()
+
+    if not args.paths and not args.combinar:
+        parser.error("indica archivos JSONL o --combinar")
+
+    evaluator = CalibrationEvaluator.from_jsonl(args.paths, workers=args.workers)
+    for path in args.combinar:
+        evaluator.merge(CalibrationEvaluator.from_dict(json.loads(path.read_text())))
+
+    console.print(scores_table(evaluator))
+    if evaluator.skipped:
+        console.print(f"[yellow]{evaluator.skipped} registros no puntuables omitidos[/yellow]")
+
+    if args.mercado:
+        if args.mercado not in evaluator.markets:
+            parser.error(f"mercado desconocido: {args.mercado} (disponibles: {', '.join(evaluator.markets)})")
+        console.print(reliability_table(evaluator, args.mercado))
+
+    if args.guardar:
+        args.guardar.write_text(json.dumps(evaluator.to_dict()))
+        console.print(f"Resultado guardado en {args.guardar}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ console = Console()
 # Dependencias requeridas (package_name: (import_name, description))
 REQUIRED_DEPS = {
     'aiohttp': ('aiohttp', 'HTTP async client'),
+    'numpy': ('numpy', 'Math engine arrays'),
     'aiosqlite': ('aiosqlite', 'SQLite async'),
     'rich': ('rich', 'Terminal UI'),
     'textual': ('textual', 'Dashboard TUI'),
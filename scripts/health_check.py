@@ -34,11 +34,9 @@ console = Console()
 async def check_database() -> dict:
     """Check database health"""
     try:
-        repo = OddsRepository()
-        await repo.initialize()
-        
-        # Get stats
-        stats = await repo.get_request_stats(hours=24)
+        async with OddsRepository() as repo:
+            # Get stats
+            stats = await repo.get_request_stats(hours=24)
         
         # Check if DB file exists
         db_exists = DB_PATH.exists()
@@ -81,8 +79,9 @@ async def check_circuit_breaker() -> dict:
 async def check_cache_stats() -> dict:
     """Check cache statistics"""
     try:
-        repo = OddsRepository()
-        await repo.initialize()
+        # Create schema if needed
+        async with OddsRepository():
+            pass
         
         # Count cached odds
         import aiosqlite
@@ -65,8 +65,8 @@ async def preflight_checks():
         from bet_copilot.db.odds_repository import OddsRepository
         
         try:
-            repo = OddsRepository()
-            await repo.initialize()
+            async with OddsRepository():
+                pass
             console.print("[green]✓ Database ready[/green]")
         except Exception as e:
             console.print(f"[red]✗ Database error: {str(e)[:50]}[/red]")
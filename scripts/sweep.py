@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Búsqueda de hiperparámetros de SoccerPredictor + KellyCriterion.
+
+Uso:
+    python scripts/sweep.py data/historico/*.csv --params matches_to_consider=3,5,8 home_advantage_factor=1.0,1.1
+    python scripts/sweep.py --synthetic 3x4 --random 30 --params kelly_fraction=0.1:0.5 matches_to_consider=3:12
+    python scripts/sweep.py ... --objective flat_yield --workers 4 --csv sweep.csv
+"""
+
+# Add project to path
+from pathlib import Path
+project_root = Path(__file__).parent.parent
+import sys
+sys.path.insert(0, str(project_root))
+
+import argparse
+import os
+import tempfile
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from bet_copilot.math_engine.sweep import OBJECTIVES, HyperparameterSweep, grid_points, random_points
+
+sys.path.insert(0, str(Path(__file__).parent))
+from backtest import write_synthetic_season
+
+console = Console()
+
+
+def parse_value(text: str):
+    """Entero, decimal o texto (p. ej. el nombre del modelo)."""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            continue
+    return text
+
+
+def parse_space(specs):
+    """nombre=a,b,c (opciones) o nombre=min:max (rango, solo con --random)."""
+    space = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        if ":" in values:
+            low, high = values.split(":")
+            space[name] = (parse_value(low), parse_value(high))
+        else:
+            space[name] = [parse_value(value) for value in values.split(",")]
+    return space
+
+
+def results_table(result, limit: int) -> Table:
+    """Tabla de configuraciones ordenadas por el objetivo."""
+    table = Table(title=f"Búsqueda de hiperparámetros (objetivo: {result.objective})")
+    params = list(dict.fromkeys(name for trial in result.trials for name in trial.params))
+    table.add_column("#", justify="right")
+    for name in params:
+        table.add_column(name, justify="right")
+    for column in ("Log-loss", "Brier", "Yield plano", "ROI Kelly", "Apuestas", "Temporadas"):
+        table.add_column(column, justify="right")
+
+    for trial in result.trials[:limit]:
+        metrics = trial.metrics
+        table.add_row(
+            str(trial.rank),
+            *(str(trial.params.get(name, "-")) for name in params),
+            f"{metrics.log_loss:.4f}" if metrics.log_loss is not None else "-",
+            f"{metrics.brier:.4f}" if metrics.brier is not None else "-",
+            f"{metrics.flat_yield:+.2f}%",
+            f"{metrics.roi:+.2f}%",
+            str(metrics.bets),
+            f"{trial.seasons}" + (" (parada)" if trial.stopped_early else ""),
+            style="dim" if trial.stopped_early else None,
+        )
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Búsqueda de hiperparámetros sobre datos históricos")
+    parser.add_argument("paths", nargs="*", help="CSV de temporadas (formato football-data.co.uk o canónico)")
+    parser.add_argument(
+        "--params", nargs="+", default=[], metavar="NOMBRE=VALORES",
+        help="Espacio de parámetros: a,b,c (opciones) o min:max (rango, con --random)",
+    )
+    parser.add_argument("--random", type=int, metavar="N", help="Muestrear N configuraciones en lugar de la rejilla")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de la búsqueda aleatoria")
+    parser.add_argument("--objective", choices=list(OBJECTIVES), default="log_loss", help="Métrica de ordenación")
+    parser.add_argument("--early-stop", type=float, help="Margen de parada temprana (0 = desactivada)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Procesos en paralelo")
+    parser.add_argument("--min-history", type=int, default=5, help="Partidos previos por equipo antes de puntuar")
+    parser.add_argument("--top", type=int, default=20, help="Filas mostradas")
+    parser.add_argument("--csv", type=Path, help="Guardar el ranking completo en CSV")
+    parser.add_argument("--synthetic", help="Generar LIGASxTEMPORADAS sintéticas (p. ej. 3x4)")
+    args = parser.parse_args()
+
+    space = parse_space(args.params) or {"matches_to_consider": [3, 5, 8], "home_advantage_factor": [1.0, 1.1]}
+    try:
+        points = random_points(space, args.random, args.seed) if args.random else grid_points(space)
+    except (TypeError, ValueError) as e:
+        parser.error(str(e))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [Path(path) for path in args.paths]
+        if args.synthetic:
+            leagues, seasons = (int(value) for value in args.synthetic.lower().split("x"))
+            for league in range(leagues):
+                for season in range(seasons):
+                    path = Path(tmp) / f"L{league}" / f"{2010 + season}.csv"
+                    path.parent.mkdir(exist_ok=True)
+                    write_synthetic_season(path, f"L{league}", 10 + season, seed=league * 100 + season)
+                    paths.append(path)
+
+        if not paths:
+            parser.error("indica archivos CSV o --synthetic")
+
+        sweep = HyperparameterSweep(
+            paths,
+            objective=args.objective,
+            workers=args.workers,
+            early_stop=args.early_stop,
+            min_history=args.min_history,
+        )
+        start = time.perf_counter()
+        result = sweep.run(points)
+        elapsed = time.perf_counter() - start
+
+    console.print(results_table(result, args.top))
+    stopped = sum(trial.stopped_early for trial in result.trials)
+    console.print(
+        f"\n{len(points)} configuraciones ({stopped} paradas antes de tiempo) "
+        f"en {elapsed:.2f}s ({args.workers} procesos)"
+    )
+
+    if args.csv:
+        result.to_csv(args.csv)
+        console.print(f"Ranking guardado en {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
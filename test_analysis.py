@@ -23,6 +23,7 @@ logging.basicConfig(
     format='%(levelname)s: %(message)s'
 )
 
+from bet_copilot.api.transport import close_transport
 from bet_copilot.services.match_analyzer import MatchAnalyzer
 
 
@@ -161,8 +162,12 @@ async def main():
     print("BET-COPILOT MATCH ANALYSIS TEST")
     print("="*60)
     
-    for home, away in matches[:1]:  # Test only first match
-        await test_match_analysis(home, away)
+    try:
+        for home, away in matches[:1]:  # Test only first match
+            await test_match_analysis(home, away)
+    finally:
+        # Clients share one connection pool; release it on exit
+        await close_transport()
 
 
 if __name__ == "__main__":